@@ -7,12 +7,41 @@ from __future__ import annotations
 
 import abc
 import argparse
+import asyncio
+import bisect
+import concurrent.futures
+import contextlib
+import cProfile
+import ctypes
 import difflib
+import functools
+import gzip
+import hashlib
+import heapq
+import http.server
+import io
 import json
+import math
+import mimetypes
+import multiprocessing
 import operator
+import os
 import pathlib
+import pstats
+import random
 import re
+import select
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
 import typing
+import unicodedata
+import urllib.parse
+import zlib
 from dataclasses import dataclass
 from datetime import date
 
@@ -24,6 +53,21 @@ from googleapiclient.discovery import build as build_google_api  # type: ignore
 from wikidata.client import Client as WikidataClient
 from wikidata.globecoordinate import GlobeCoordinate
 
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image  # type: ignore
+except ImportError:
+    Image = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 if typing.TYPE_CHECKING:
     from googleapiclient._apis.youtube.v3.resources import (  # type: ignore
         PlaylistItemListResponse,
@@ -36,10 +80,217 @@ if typing.TYPE_CHECKING:
 
 EXPORT_FILENAME = "arte-360-reportage"
 
+LEAFLET_POPUP_DIR = "karte"
+"""Directory next to ``karte.html`` that holds the lazy loaded popup chunks."""
+
+LEAFLET_POPUP_CHUNK_SIZE = 50
+"""Number of popups per chunk file, for example ``karte/popups-3.js``"""
+
+SNAPSHOT_DIR = "snapshots"
+
+THUMBNAIL_DIR = "snapshots/thumbnails"
+
+WIKI_BUDGET = 0.9
+"""Fraction of the Wikipedia template limits a generated page may use when
+the fallback to plain tables is asked for with ``--wiki-budget``"""
+
+WIKI_MAX_ARTICLE_SIZE = 2048 * 1024
+"""Bytes a Wikipedia page may have, ``$wgMaxArticleSize`` is 2048 KiB.
+
+https://www.mediawiki.org/wiki/Manual:$wgMaxArticleSize"""
+
+KARTOGRAPHER_BUDGET = WIKI_MAX_ARTICLE_SIZE - 1024
+"""Bytes of the GeoJSON data embedded in the ``<mapframe>``. The map page
+holds nothing but the ``<mapframe>``, so the data may use the page size
+limit except for 1 KiB that is left for the tag and its attributes."""
+
+COORDINATE_PRECISION = 4
+"""Decimal places of the coordinates on the maps, 4 places are about 10 m"""
+
+
+### profiling #################################################################
+
+
+class Profiler:
+    """Phase timers and counters for ``--profile``.
+
+    The counters (for example ``episodes``, ``http_requests``,
+    ``cache_hits``, ``bytes_written``) are attributed to the innermost
+    running phase. Outputs rendered in a process pool (``--jobs``) are
+    measured as one phase of the parent process."""
+
+    enabled: bool = False
+
+    use_cprofile: bool = False
+
+    use_tracemalloc: bool = False
+
+    phases: list[dict[str, typing.Any]]
+
+    __stack: list[dict[str, typing.Any]]
+
+    __origin: float
+
+    def __init__(self) -> None:
+        self.phases = []
+        self.__stack = []
+        self.__origin = time.perf_counter()
+
+    def count(self, name: str, value: int = 1) -> None:
+        if not self.enabled or not self.__stack:
+            return
+        counters = self.__stack[-1]["counters"]
+        counters[name] = counters.get(name, 0) + value
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """Record a phase that was measured before profiling was enabled,
+        for example loading the YAML file on import."""
+        self.phases.append(
+            {
+                "name": name,
+                "start": start - self.__origin,
+                "duration": duration,
+                "counters": {},
+            }
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        entry: dict[str, typing.Any] = {
+            "name": name,
+            "start": time.perf_counter() - self.__origin,
+            "counters": {},
+        }
+        self.__stack.append(entry)
+        profile: cProfile.Profile | None = None
+        if self.use_cprofile:
+            profile = cProfile.Profile()
+            profile.enable()
+        if self.use_tracemalloc:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            if self.use_tracemalloc:
+                _, entry["memory_peak"] = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            if profile:
+                profile.disable()
+                entry["profile"] = profile
+            entry["duration"] = time.perf_counter() - self.__origin - entry["start"]
+            self.__stack.pop()
+            self.phases.append(entry)
+
+    def print_summary(self) -> None:
+        names: list[str] = sorted(
+            set([key for phase in self.phases for key in phase["counters"]])
+        )
+        header = f"{'phase':<20} {'seconds':>9}"
+        if self.use_tracemalloc:
+            header += f" {'peak MB':>9}"
+        for name in names:
+            header += f" {name:>14}"
+        print(header)
+        for phase in self.phases:
+            row = f"{phase['name']:<20} {phase['duration']:9.3f}"
+            if self.use_tracemalloc:
+                row += f" {phase.get('memory_peak', 0) / 1e6:9.1f}"
+            for name in names:
+                row += f" {phase['counters'].get(name, 0):>14}"
+            print(row)
+
+    def write(self, file_path: str) -> None:
+        """Write the phases as JSON, which can also be opened as a trace in
+        ``chrome://tracing`` or https://ui.perfetto.dev. With cProfile the
+        statistics of each phase are saved next to it as
+        ``<file name without extension>.<phase>.prof``."""
+        phases: list[dict[str, typing.Any]] = []
+        events: list[dict[str, typing.Any]] = []
+        for phase in self.phases:
+            data = {
+                key: value for key, value in phase.items() if key != "profile"
+            }
+            phases.append(data)
+            events.append(
+                {
+                    "name": phase["name"],
+                    "ph": "X",
+                    "ts": round(phase["start"] * 1e6),
+                    "dur": round(phase["duration"] * 1e6),
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": phase["counters"],
+                }
+            )
+            if "profile" in phase:
+                pstats.Stats(phase["profile"]).dump_stats(
+                    f"{os.path.splitext(file_path)[0]}.{phase['name']}.prof"
+                )
+        Utils.write_json_file(file_path, {"phases": phases, "traceEvents": events})
+
+
+profiler = Profiler()
+
 
 ### utils #####################################################################
 
 
+class AtomicWriter:
+    """Stream text into a temporary file in the directory of the target file
+    and rename it to the target after a successful ``fsync``. An exception or
+    a ``KeyboardInterrupt`` while writing leaves the previous version of the
+    target untouched.
+
+    .. code-block:: python
+
+        with AtomicWriter("karte.html") as f:
+            f.write(chunk)
+    """
+
+    file_path: str
+
+    __temp_path: str
+
+    __file: typing.TextIO
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def __enter__(self) -> typing.TextIO:
+        directory, name = os.path.split(os.path.abspath(self.file_path))
+        fd, self.__temp_path = tempfile.mkstemp(
+            prefix=f".{name}.", suffix=".tmp", dir=directory
+        )
+        self.__file = os.fdopen(fd, "w", encoding="utf-8")
+        return self.__file
+
+    def __exit__(self, exc_type: typing.Any, exc_value: typing.Any, tb: typing.Any):
+        if exc_type is not None:
+            self.__file.close()
+            os.unlink(self.__temp_path)
+            return False
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        profiler.count("bytes_written", os.fstat(self.__file.fileno()).st_size)
+        self.__file.close()
+        mode = 0o644
+        if os.path.exists(self.file_path):
+            mode = os.stat(self.file_path).st_mode & 0o777
+        os.chmod(self.__temp_path, mode)
+        os.replace(self.__temp_path, self.file_path)
+        directory = os.open(
+            os.path.dirname(os.path.abspath(self.file_path)), os.O_RDONLY
+        )
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+        return False
+
+
 class Utils:
     @staticmethod
     def read_text_file(file_path: str) -> str:
@@ -48,20 +299,59 @@ class Utils:
 
     @staticmethod
     def write_text_file(file_path: str, content: str | list[str]) -> None:
-        if isinstance(content, list):
-            content = "\n".join(content)
-        with open(file_path, "w") as readme:
-            readme.write(content)
+        """Write atomically. A list is streamed line by line instead of being
+        joined into one string first."""
+        with AtomicWriter(file_path) as f:
+            if isinstance(content, list):
+                for i, line in enumerate(content):
+                    if i > 0:
+                        f.write("\n")
+                    f.write(line)
+            else:
+                f.write(content)
+
+    @staticmethod
+    def write_binary_file(file_path: str, content: bytes) -> None:
+        with AtomicWriter(file_path) as f:
+            f.buffer.write(content)
+
+    @staticmethod
+    def write_json_file(
+        file_path: str, data: typing.Any, minify: bool = False
+    ) -> None:
+        """Serialize in chunks (``json.dump`` uses ``iterencode``) directly into
+        an atomically renamed temporary file."""
+        with AtomicWriter(file_path) as j:
+            if minify:
+                json.dump(data, fp=j, separators=(",", ":"), ensure_ascii=False)
+            else:
+                json.dump(data, fp=j, indent=2, ensure_ascii=False)
 
     @staticmethod
-    def write_json_file(file_path: str, data: typing.Any) -> None:
-        with open(file_path, "w") as j:
-            json.dump(data, fp=j, indent=2, ensure_ascii=False)
+    def load_json(content: bytes) -> typing.Any:
+        """Parse with ``orjson`` if it is installed."""
+        if orjson:
+            return orjson.loads(content)
+        return json.loads(content)
 
     @staticmethod
-    def dump_json(data: typing.Any) -> str:
+    def dump_json(data: typing.Any, minify: bool = False) -> str:
+        if minify:
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
         return json.dumps(data, indent=2, ensure_ascii=False)
 
+    INDENTED_JSON_WHITESPACE = re.compile(r'\n *(?:("(?:[^"\\]|\\.)*"): )?')
+    """A line break with the indentation and, if the line starts with a key,
+    the space after its colon. Strings never contain a raw line break."""
+
+    @staticmethod
+    def minify_json(indented: str) -> str:
+        """Turn the output of ``dump_json(data)`` into the output of
+        ``dump_json(data, minify=True)`` without serializing again."""
+        return Utils.INDENTED_JSON_WHITESPACE.sub(
+            lambda match: match.group(1) + ":" if match.group(1) else "", indented
+        )
+
     @staticmethod
     def clean_title(title: str) -> str:
         title = title.replace("–", "-")
@@ -79,19 +369,39 @@ class Utils:
         title = title.replace(" - ", " ")
         return title.lower()
 
+    TRANSLITERATION = str.maketrans(
+        {"ß": "ss", "ä": "ae", "ö": "oe", "ü": "ue", "æ": "ae", "œ": "oe"}
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def title_key(title: str) -> str:
+        """A key for exact matching that ignores case, punctuation, prefixes
+        like ``GEO Reportage:`` and the spelling of umlauts and accents:
+        ``Die Schöne und das Biest`` and ``die schoene und das biest!`` have the
+        same key ``die schoene und das biest``."""
+        title = Utils.clean_title(title).casefold()
+        title = title.translate(Utils.TRANSLITERATION)
+        title = unicodedata.normalize("NFKD", title)
+        title = "".join([c for c in title if not unicodedata.combining(c)])
+        return " ".join(re.findall(r"\w+", title))
+
 
 ### yaml ######################################################################
 
 
 class Yaml:
     @staticmethod
-    def load(filepath: str) -> typing.Any:
+    def load(filepath: str | bytes) -> typing.Any:
+        """Load a file path or the already read content of a file."""
+        if isinstance(filepath, bytes):
+            return yaml.load(filepath, Loader=yaml.Loader)
         with open(filepath, mode="r") as y:
             return yaml.load(y, Loader=yaml.Loader)
 
     @staticmethod
     def save(filepath: str, data: typing.Any) -> None:
-        with open(filepath, mode="w") as y:
+        with AtomicWriter(filepath) as y:
             yaml.dump(
                 data,
                 stream=y,
@@ -137,6 +447,11 @@ class Template(abc.ABC):
     def caption(caption: str, text: str | None) -> str | None:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def image(src: str, alt: str) -> str:
+        pass
+
     @staticmethod
     def join(separator: str, *args: str | None) -> str:
         items = [i for i in args if i is not None]
@@ -179,6 +494,10 @@ class Markdown(Template):
             return None
         return f"{Markdown.bold(caption + ':')} {text}"
 
+    @staticmethod
+    def image(src: str, alt: str) -> str:
+        return f"![{alt}]({src})"
+
     @staticmethod
     def table(header: list[str], rows: list[list[str]]) -> str:
         def _format_row(cells: list[typing.Any]) -> str:
@@ -227,6 +546,10 @@ class Html(Template):
             return None
         return f"<strong>{caption}:</strong> {text}"
 
+    @staticmethod
+    def image(src: str, alt: str) -> str:
+        return f'<img src="{src}" alt="{alt}" loading="lazy" />'
+
     @staticmethod
     def paragraph(text: str | None) -> str | None:
         if text:
@@ -355,6 +678,11 @@ class Wiki(Template):
             return None
         return f"{Wiki.bold(caption + ':')} {text}"
 
+    @staticmethod
+    def image(src: str, alt: str) -> str:
+        """External images cannot be embedded in Wikipedia articles."""
+        return ""
+
     @staticmethod
     def paragraph(text: str | None) -> str | None:
         if text:
@@ -402,6 +730,7 @@ class YouTube:
 
     def get_video(self, video_id: str) -> VideoListResponse:
         """https://developers.google.com/youtube/v3/docs/videos"""
+        profiler.count("http_requests")
         result = (
             self.resource.videos()
             .list(id=video_id, part="contentDetails,snippet")
@@ -557,6 +886,7 @@ class Wikidata:
         self.client = WikidataClient()
 
     def get_coordinates(self, entity_id: typing.Any):
+        profiler.count("http_requests")
         entity = self.client.get(entity_id=entity_id, load=True)
         try:
             coordinate_location = self.client.get(
@@ -578,9 +908,15 @@ class Scraper:
 
     MARKER = "-*-*-*-"
 
-    def __init__(self, url: str) -> None:
-        page = requests.get(url)
-        self.__soup = bs4.BeautifulSoup(page.content, "lxml")
+    def __init__(self, url: str, content: bytes | None = None) -> None:
+        """Fetch ``url`` or parse the already fetched ``content``."""
+        page: bytes
+        if content is None:
+            profiler.count("http_requests")
+            page = requests.get(url).content
+        else:
+            page = content
+        self.__soup = bs4.BeautifulSoup(page, "lxml")
 
     def find(self, tag_name: str, **kwargs: typing.Any) -> bs4.Tag | None:
         tag = self.__soup.find(tag_name, **kwargs)
@@ -662,6 +998,777 @@ class DataAccessor:
         return result
 
 
+### imdb ######################################################################
+
+
+@dataclass
+class ImdbEpisode:
+    id: str
+    """for example ``tt10007904``"""
+
+    season_no: int | None
+
+    episode_no: int | None
+
+    titles: list[str]
+    """``primaryTitle`` and ``originalTitle``"""
+
+
+class ImdbDataset:
+    """Stream the non-commercial IMDb dumps ``title.episode.tsv.gz`` and
+    ``title.basics.tsv.gz`` (several gigabytes uncompressed) line by line
+    and keep only the episodes of one series.
+
+    https://developer.imdb.com/non-commercial-datasets/"""
+
+    NULL = "\\N"
+
+    GENERIC_TITLE = re.compile(r"^Episode #?\d+\.\d+$")
+    """Placeholder titles like ``Episode #1.5``"""
+
+    series_id: str
+
+    directory: str
+
+    def __init__(self, series_id: str, directory: str = ".") -> None:
+        self.series_id = series_id
+        self.directory = directory
+
+    @staticmethod
+    def series_id_from_url(url: str) -> str:
+        """``https://www.imdb.com/title/tt0457219`` -> ``tt0457219``"""
+        return url.rstrip("/").rsplit("/", 1)[-1]
+
+    def __lines(self, filename: str) -> typing.Iterator[str]:
+        with gzip.open(
+            os.path.join(self.directory, filename), "rt", encoding="utf-8"
+        ) as f:
+            next(f)  # header
+            for line in f:
+                yield line.rstrip("\n")
+
+    def __int(self, value: str) -> int | None:
+        if value == ImdbDataset.NULL:
+            return None
+        return int(value)
+
+    def episodes(self) -> list[ImdbEpisode]:
+        """Columns of ``title.episode.tsv.gz``: ``tconst parentTconst
+        seasonNumber episodeNumber``. Columns of ``title.basics.tsv.gz``:
+        ``tconst titleType primaryTitle originalTitle …``. Only the lines of
+        the series are split completely."""
+        episodes: dict[str, ImdbEpisode] = {}
+        for line in self.__lines("title.episode.tsv.gz"):
+            if self.series_id not in line:
+                continue
+            tconst, parent, season_no, episode_no = line.split("\t")
+            if parent == self.series_id:
+                episodes[tconst] = ImdbEpisode(
+                    tconst, self.__int(season_no), self.__int(episode_no), []
+                )
+        if episodes:
+            for line in self.__lines("title.basics.tsv.gz"):
+                tconst, rest = line.split("\t", 1)
+                if tconst not in episodes:
+                    continue
+                _, primary, original, _ = rest.split("\t", 3)
+                titles = episodes[tconst].titles
+                for title in (primary, original):
+                    if title != ImdbDataset.NULL and title not in titles:
+                        titles.append(title)
+        return list(episodes.values())
+
+    @staticmethod
+    def match(
+        tv_show: TvShow, imdb_episode: ImdbEpisode
+    ) -> tuple[Episode, str] | None:
+        """Find the episode by one of the titles. Otherwise fall back to the
+        season and episode number, but only if the title is a placeholder or
+        similar to the title of the episode with this number."""
+        for title in imdb_episode.titles:
+            index = tv_show.title_keys.get(Utils.title_key(title))
+            if index is not None:
+                return (tv_show.episodes[index], "title")
+        if imdb_episode.season_no is None or imdb_episode.episode_no is None:
+            return None
+        episode = tv_show.get_episode_by_number(
+            imdb_episode.season_no, imdb_episode.episode_no
+        )
+        if not episode:
+            return None
+        for title in imdb_episode.titles:
+            if ImdbDataset.GENERIC_TITLE.match(title):
+                return (episode, "number")
+            ratio = difflib.SequenceMatcher(
+                None, Utils.title_key(title), Utils.title_key(episode.title)
+            ).ratio()
+            if ratio >= 0.6:
+                return (episode, "number")
+        return None
+
+    def reconcile(self, tv_show: TvShow) -> dict[str, list[dict[str, typing.Any]]]:
+        """Match the episodes of the dump without changing any episode.
+        ``filled`` lists the ids that can be filled, contradicting or already
+        used ids are only reported as ``mismatches``."""
+        report: dict[str, list[dict[str, typing.Any]]] = {
+            "filled": [],
+            "mismatches": [],
+            "unmatched": [],
+        }
+
+        def entry(episode: Episode, **kwargs: typing.Any) -> dict[str, typing.Any]:
+            result: dict[str, typing.Any] = {
+                "overall_no": episode.overall_no,
+                "title": episode.title,
+            }
+            result.update(kwargs)
+            return result
+
+        # {overall_no: imdb id} of the episodes filled in this run
+        claimed: dict[int, str] = {}
+        for imdb_episode in self.episodes():
+            result = ImdbDataset.match(tv_show, imdb_episode)
+            if not result:
+                report["unmatched"].append(
+                    {
+                        "imdb_episode_id": imdb_episode.id,
+                        "season_no": imdb_episode.season_no,
+                        "episode_no": imdb_episode.episode_no,
+                        "titles": imdb_episode.titles,
+                    }
+                )
+                continue
+            episode, method = result
+            if episode.imdb_episode_id == imdb_episode.id:
+                continue
+            if episode.imdb_episode_id:
+                report["mismatches"].append(
+                    entry(
+                        episode,
+                        imdb_episode_id=imdb_episode.id,
+                        current=episode.imdb_episode_id,
+                    )
+                )
+                continue
+            owner = tv_show.get_episode_by("imdb_episode_id", imdb_episode.id)
+            if owner:
+                report["mismatches"].append(
+                    entry(episode, imdb_episode_id=imdb_episode.id, used_by=owner.title)
+                )
+                continue
+            if episode.overall_no in claimed:
+                report["mismatches"].append(
+                    entry(
+                        episode,
+                        imdb_episode_id=imdb_episode.id,
+                        claimed_by=claimed[episode.overall_no],
+                    )
+                )
+                continue
+            claimed[episode.overall_no] = imdb_episode.id
+            report["filled"].append(
+                entry(episode, imdb_episode_id=imdb_episode.id, method=method)
+            )
+        return report
+
+    def import_ids(self, tv_show: TvShow, dry_run: bool = False) -> None:
+        """Fill ``imdb_episode_id`` of all matched episodes that have none
+        yet and save the YAML file once. With ``dry_run`` only the report is
+        printed."""
+        report = self.reconcile(tv_show)
+        for item in report["filled"]:
+            print(f"{item['imdb_episode_id']} ({item['method']}) -> {item['title']}")
+        for item in report["mismatches"]:
+            details = ", ".join(
+                [
+                    f"{k}: {v}"
+                    for k, v in item.items()
+                    if k not in ("overall_no", "title", "imdb_episode_id")
+                ]
+            )
+            print(
+                f"{termcolor.colored(item['imdb_episode_id'], color='red')} "
+                f"{item['overall_no']} {item['title']} {details}"
+            )
+        for item in report["unmatched"]:
+            print(
+                f"No match found for: "
+                f"{termcolor.colored(item['imdb_episode_id'], color='yellow')} "
+                f"S{item['season_no'] or '?'}E{item['episode_no'] or '?'} "
+                f"{' / '.join(item['titles'])}"
+            )
+        print(", ".join([f"{len(items)} {key}" for key, items in report.items()]))
+        if not report["filled"] or dry_run:
+            return
+        for item in report["filled"]:
+            episode = tv_show.episodes[item["overall_no"] - 1]
+            episode.imdb_episode_id = item["imdb_episode_id"]
+        tv_show.reindex()
+        tv_show.export_to_yaml()
+
+
+### thetvdb ###################################################################
+
+
+@dataclass
+class TheTvdbEpisode:
+    id: int
+    """for example ``4641893``"""
+
+    season_episode: str | None
+    """for example ``S01E01``, ``None`` for specials without numbers"""
+
+    title: str
+
+
+class TheTvdbDump:
+    """A locally saved episode list of a series, either the response of
+    ``/series/{id}/episodes/default`` of the API v4 (``{"data": {"episodes":
+    […]}}``) or of ``/series/{id}/episodes`` of the API v3 (``{"data":
+    […]}``). Paginated responses can be passed as several files.
+
+    https://thetvdb.github.io/v4-api/"""
+
+    series_id: int
+
+    episodes: list[TheTvdbEpisode]
+
+    by_id: dict[int, TheTvdbEpisode]
+
+    by_season_episode: dict[str, TheTvdbEpisode]
+
+    by_title: dict[str, TheTvdbEpisode]
+    """``{Utils.title_key(title): episode}``"""
+
+    def __init__(self, series_id: int, paths: list[str]) -> None:
+        self.series_id = series_id
+        self.episodes = []
+        for path in paths:
+            with open(path, "r") as f:
+                self.__read(json.load(f))
+        self.by_id = {e.id: e for e in self.episodes}
+        self.by_season_episode = {
+            e.season_episode: e for e in self.episodes if e.season_episode
+        }
+        self.by_title = {}
+        for episode in self.episodes:
+            if episode.title:
+                self.by_title.setdefault(Utils.title_key(episode.title), episode)
+
+    @staticmethod
+    def series_id_from_url(url: str) -> int:
+        """``https://thetvdb.com/series/272599-show`` -> ``272599``"""
+        match = re.search(r"/series/(\d+)", url)
+        if not match:
+            raise Exception(f"No thetvdb series id in {url}")
+        return int(match.group(1))
+
+    def __read(self, dump: typing.Any) -> None:
+        data = dump["data"] if isinstance(dump, dict) and "data" in dump else dump
+        if isinstance(data, dict):
+            series = data.get("series")
+            if series and series.get("id") != self.series_id:
+                raise Exception(f"The dump is not of the series {self.series_id}")
+            data = data["episodes"]
+        for entry in data:
+            series_id = entry.get("seriesId")
+            if series_id is not None and int(series_id) != self.series_id:
+                continue
+            season_no = entry.get("seasonNumber", entry.get("airedSeason"))
+            episode_no = entry.get("number", entry.get("airedEpisodeNumber"))
+            # Specials can have no numbers, they are matched by title only.
+            season_episode = None
+            if season_no is not None and episode_no is not None:
+                season_episode = f"S{season_no:02}E{episode_no:02}"
+            self.episodes.append(
+                TheTvdbEpisode(
+                    id=int(entry["id"]),
+                    season_episode=season_episode,
+                    title=entry.get("name", entry.get("episodeName")) or "",
+                )
+            )
+
+    @staticmethod
+    def similar(a: str, b: str) -> bool:
+        a = Utils.title_key(a)
+        b = Utils.title_key(b)
+        return a == b or difflib.SequenceMatcher(None, a, b).ratio() >= 0.6
+
+    def reconcile(self, tv_show: TvShow) -> dict[str, list[dict[str, typing.Any]]]:
+        """Compare every episode once with the dump without changing any
+        episode. An existing id wins over an existing
+        ``thetvdb_season_episode``, which wins over the title. Missing values
+        are listed in ``filled``, contradicting values only reported. An id
+        of the dump is filled in at most one episode."""
+        report: dict[str, list[dict[str, typing.Any]]] = {
+            "filled": [],
+            "mismatches": [],
+            "unmatched": [],
+        }
+
+        def entry(episode: Episode, **kwargs: typing.Any) -> dict[str, typing.Any]:
+            result: dict[str, typing.Any] = {
+                "overall_no": episode.overall_no,
+                "title": episode.title,
+            }
+            result.update(kwargs)
+            return result
+
+        used: dict[int, Episode] = {}
+        for episode in tv_show.episodes:
+            tvdb: TheTvdbEpisode | None = None
+            if episode.thetvdb_episode_id:
+                tvdb = self.by_id.get(episode.thetvdb_episode_id)
+                if not tvdb:
+                    report["mismatches"].append(
+                        entry(episode, thetvdb_episode_id=episode.thetvdb_episode_id)
+                    )
+                    continue
+            elif episode.thetvdb_season_episode:
+                tvdb = self.by_season_episode.get(episode.thetvdb_season_episode)
+                if tvdb and not TheTvdbDump.similar(tvdb.title, episode.title):
+                    report["mismatches"].append(
+                        entry(
+                            episode,
+                            thetvdb_season_episode=episode.thetvdb_season_episode,
+                            thetvdb_title=tvdb.title,
+                        )
+                    )
+                    continue
+            else:
+                for title in (
+                    episode.title,
+                    episode.alias,
+                    episode.title_fr,
+                    episode.title_en,
+                ):
+                    if title and Utils.title_key(title) in self.by_title:
+                        tvdb = self.by_title[Utils.title_key(title)]
+                        break
+            if not tvdb:
+                report["unmatched"].append(entry(episode))
+                continue
+            if tvdb.id in used:
+                report["mismatches"].append(
+                    entry(
+                        episode,
+                        thetvdb_episode_id=tvdb.id,
+                        used_by=used[tvdb.id].title,
+                    )
+                )
+                continue
+            used[tvdb.id] = episode
+
+            if (
+                episode.thetvdb_season_episode
+                and tvdb.season_episode
+                and episode.thetvdb_season_episode != tvdb.season_episode
+            ):
+                report["mismatches"].append(
+                    entry(
+                        episode,
+                        thetvdb_season_episode=episode.thetvdb_season_episode,
+                        expected=tvdb.season_episode,
+                    )
+                )
+                continue
+
+            filled: dict[str, typing.Any] = {}
+            if not episode.thetvdb_episode_id:
+                owner = tv_show.get_episode_by("thetvdb_episode_id", tvdb.id)
+                if owner:
+                    report["mismatches"].append(
+                        entry(
+                            episode, thetvdb_episode_id=tvdb.id, used_by=owner.title
+                        )
+                    )
+                    continue
+                filled["thetvdb_episode_id"] = tvdb.id
+            if not episode.thetvdb_season_episode and tvdb.season_episode:
+                filled["thetvdb_season_episode"] = tvdb.season_episode
+            if filled:
+                report["filled"].append(entry(episode, **filled))
+
+        report["missing"] = [
+            {
+                "thetvdb_episode_id": e.id,
+                "season_episode": e.season_episode,
+                "title": e.title,
+            }
+            for e in self.episodes
+            if e.id not in used
+            and not tv_show.get_episode_by("thetvdb_episode_id", e.id)
+        ]
+        return report
+
+    def import_ids(self, tv_show: TvShow, dry_run: bool = False) -> None:
+        """Reconcile, print a summary, write the report to
+        ``arte-360-reportage_thetvdb.yml`` and save the YAML file once unless
+        ``dry_run``."""
+        report = self.reconcile(tv_show)
+        colors = {"filled": "green", "mismatches": "red", "unmatched": "yellow"}
+        for key, color in colors.items():
+            for item in report[key]:
+                details = ", ".join(
+                    [
+                        f"{k}: {v}"
+                        for k, v in item.items()
+                        if k not in ("overall_no", "title")
+                    ]
+                )
+                print(
+                    f"{termcolor.colored(key, color=color)} "
+                    f"{item['overall_no']} {item['title']} {details}"
+                )
+        print(", ".join([f"{len(items)} {key}" for key, items in report.items()]))
+        Yaml.save(EXPORT_FILENAME + "_thetvdb.yml", report)
+        if not report["filled"] or dry_run:
+            return
+        for item in report["filled"]:
+            episode = tv_show.episodes[item["overall_no"] - 1]
+            for key, value in item.items():
+                if key not in ("overall_no", "title"):
+                    setattr(episode, key, value)
+        tv_show.reindex()
+        tv_show.export_to_yaml()
+
+
+### enrich ####################################################################
+
+
+@dataclass
+class Enrichment:
+    episode: Episode
+    key: str
+    value: typing.Any
+    source: str
+
+
+class RateLimiter:
+    """At most ``concurrency`` requests at the same time and at most
+    ``rate`` requests per second."""
+
+    concurrency: int
+
+    rate: float
+
+    def __init__(self, concurrency: int, rate: float) -> None:
+        self.concurrency = concurrency
+        self.rate = rate
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__lock = asyncio.Lock()
+        self.__next_slot = 0.0
+
+    async def __aenter__(self) -> None:
+        await self.__semaphore.acquire()
+        async with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next_slot)
+            self.__next_slot = slot + 1 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        self.__semaphore.release()
+
+
+class TemporaryError(Exception):
+    """A request that can succeed when it is repeated: a connection error,
+    a timeout, HTTP 429 or 5xx"""
+
+
+class EnrichmentSource(abc.ABC):
+    """An external source that is asked for the missing values of the
+    episodes. A request can cover several episodes."""
+
+    name: str
+
+    concurrency: int = 4
+
+    rate: float = 5
+    """Requests per second"""
+
+    retries: int = 3
+    """How often a request is repeated after a ``TemporaryError``"""
+
+    backoff: float = 1
+    """Seconds before the first repetition, doubled for every further one"""
+
+    base_url: str | None = None
+    """Can be replaced, for example by a local stand-in server"""
+
+    def __init__(self, base_url: str | None = None) -> None:
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+
+    @abc.abstractmethod
+    def batches(self, tv_show: TvShow) -> list[tuple[str, list[Episode]]]:
+        """The requests to send, ``[(url, [episode, …]), …]``"""
+
+    @abc.abstractmethod
+    def parse(self, content: bytes, episodes: list[Episode]) -> list[Enrichment]:
+        pass
+
+    async def fetch(self, url: str) -> bytes:
+        profiler.count("http_requests")
+        try:
+            response = await asyncio.to_thread(requests.get, url, timeout=30)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise TemporaryError(e.__class__.__name__)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TemporaryError(f"HTTP {response.status_code}")
+        if not response.ok:
+            raise Exception(f"HTTP {response.status_code}")
+        return response.content
+
+
+class FernsehserienSource(EnrichmentSource):
+    name = "fernsehserien"
+
+    concurrency = 2
+
+    rate = 2
+
+    def batches(self, tv_show: TvShow) -> list[tuple[str, list[Episode]]]:
+        base_url = self.base_url or tv_show.data["databases"]["fernsehserien"]
+        result: list[tuple[str, list[Episode]]] = []
+        for episode in tv_show.episodes:
+            slug = episode.fernsehserien_episode_slug
+            if slug and not (episode.description_fernsehserien and episode.director):
+                result.append((f"{base_url}/folgen/{slug}", [episode]))
+        return result
+
+    def parse(self, content: bytes, episodes: list[Episode]) -> list[Enrichment]:
+        scraper = FernsehserienScraper("", content)
+        result: list[Enrichment] = []
+        for key, value in (
+            ("description_fernsehserien", scraper.description),
+            ("director", scraper.director),
+        ):
+            if value:
+                result.append(Enrichment(episodes[0], key, value, self.name))
+        return result
+
+
+class WikidataSource(EnrichmentSource):
+    """One request per entity, episodes at the same location share it.
+
+    https://www.wikidata.org/wiki/Special:EntityData/Q64.json"""
+
+    name = "wikidata"
+
+    concurrency = 4
+
+    rate = 10
+
+    base_url = "https://www.wikidata.org/wiki/Special:EntityData"
+
+    def batches(self, tv_show: TvShow) -> list[tuple[str, list[Episode]]]:
+        entities: dict[str, list[Episode]] = {}
+        for episode in tv_show.episodes:
+            entity_id = episode.location_wikidata
+            if entity_id and entity_id != "xxx" and not episode.coordinates:
+                entities.setdefault(entity_id, []).append(episode)
+        return [
+            (f"{self.base_url}/{entity_id}.json", episodes)
+            for entity_id, episodes in entities.items()
+        ]
+
+    def parse(self, content: bytes, episodes: list[Episode]) -> list[Enrichment]:
+        entities = json.loads(content)["entities"]
+        for entity in entities.values():
+            for claim in entity.get("claims", {}).get("P625", []):
+                value = claim["mainsnak"].get("datavalue", {}).get("value")
+                if value:
+                    coordinates = [value["latitude"], value["longitude"]]
+                    return [
+                        Enrichment(episode, "coordinates", coordinates, self.name)
+                        for episode in episodes
+                    ]
+        return []
+
+
+class YouTubeSource(EnrichmentSource):
+    """Up to 50 videos per request.
+
+    https://developers.google.com/youtube/v3/docs/videos/list"""
+
+    name = "youtube"
+
+    concurrency = 2
+
+    rate = 5
+
+    base_url = "https://www.googleapis.com/youtube/v3"
+
+    key: str | None = None
+
+    def __init__(self, base_url: str | None = None) -> None:
+        super().__init__(base_url)
+        path = pathlib.Path.home() / ".youtube-api.json"
+        # A stand-in server given as base URL needs no key.
+        if base_url and not path.exists():
+            return
+        with open(path, mode="r") as f:
+            self.key = json.load(f)["api_key"]
+
+    def batches(self, tv_show: TvShow) -> list[tuple[str, list[Episode]]]:
+        missing = [
+            e
+            for e in tv_show.episodes
+            if e.youtube_video_id
+            and not (e.duration_sec and e.description_youtube and e.director)
+        ]
+        result: list[tuple[str, list[Episode]]] = []
+        for i in range(0, len(missing), 50):
+            episodes = missing[i : i + 50]
+            ids = ",".join([typing.cast(str, e.youtube_video_id) for e in episodes])
+            url = f"{self.base_url}/videos?part=contentDetails,snippet&id={ids}"
+            if self.key:
+                url += f"&key={self.key}"
+            result.append((url, episodes))
+        return result
+
+    def parse(self, content: bytes, episodes: list[Episode]) -> list[Enrichment]:
+        by_id = {e.youtube_video_id: e for e in episodes}
+        result: list[Enrichment] = []
+        for item in json.loads(content).get("items", []):
+            episode = by_id.get(item.get("id"))
+            if not episode:
+                continue
+            video = YoutubeVideo(typing.cast("VideoListResponse", {"items": [item]}))
+            for key, value in (
+                ("duration_sec", video.duration_sec),
+                ("description_youtube", video.description),
+                ("director", video.director),
+            ):
+                if value:
+                    result.append(Enrichment(episode, key, value, self.name))
+        return result
+
+
+class Enricher:
+    """Ask all sources concurrently, each with its own limits. A single
+    consumer merges the results into the data: only missing values are
+    filled. The YAML file is written once at the end."""
+
+    SOURCES: dict[str, type[EnrichmentSource]] = {
+        "fernsehserien": FernsehserienSource,
+        "wikidata": WikidataSource,
+        "youtube": YouTubeSource,
+    }
+
+    tv_show: TvShow
+
+    sources: list[EnrichmentSource]
+
+    stats: dict[str, dict[str, int]]
+    """``{source: {"requests": …, "retries": …, "errors": …, "filled": …,
+    "kept": …}}``"""
+
+    def __init__(
+        self,
+        tv_show: TvShow,
+        names: list[str] | None = None,
+        base_urls: dict[str, str] | None = None,
+    ) -> None:
+        self.tv_show = tv_show
+        self.sources = []
+        self.stats = {}
+        for name in names if names else Enricher.SOURCES:
+            if name not in Enricher.SOURCES:
+                raise Exception(f"Unknown source {name}")
+            base_url = base_urls.get(name) if base_urls else None
+            try:
+                source = Enricher.SOURCES[name](base_url)
+            except OSError as e:
+                # Only sources that were not asked for explicitly are skipped.
+                if names:
+                    raise Exception(f"Source {name} is not available: {e}")
+                print(termcolor.colored(f"Skipping {name}: {e}", color="yellow"))
+                continue
+            self.sources.append(source)
+            self.stats[name] = {
+                "requests": 0,
+                "retries": 0,
+                "errors": 0,
+                "filled": 0,
+                "kept": 0,
+            }
+
+    async def __run_source(
+        self, source: EnrichmentSource, queue: asyncio.Queue[Enrichment | None]
+    ) -> None:
+        limiter = RateLimiter(source.concurrency, source.rate)
+        stats = self.stats[source.name]
+
+        async def request(url: str, episodes: list[Episode]) -> None:
+            attempt = 0
+            while True:
+                # Every attempt waits for a slot of the limiter, the backoff
+                # does not hold one.
+                async with limiter:
+                    stats["requests"] += 1
+                    try:
+                        content = await source.fetch(url)
+                        enrichments = source.parse(content, episodes)
+                        break
+                    except Exception as e:
+                        error = e
+                if isinstance(error, TemporaryError) and attempt < source.retries:
+                    stats["retries"] += 1
+                    await asyncio.sleep(source.backoff * 2**attempt)
+                    attempt += 1
+                    continue
+                stats["errors"] += 1
+                # Without the query string, it can contain an API key
+                path = url.split("?", 1)[0]
+                print(termcolor.colored(f"{source.name}: {path}: {error}", color="red"))
+                return
+            for enrichment in enrichments:
+                await queue.put(enrichment)
+
+        await asyncio.gather(
+            *[
+                request(url, episodes)
+                for url, episodes in source.batches(self.tv_show)
+            ]
+        )
+
+    async def __merge(self, queue: asyncio.Queue[Enrichment | None]) -> None:
+        while True:
+            enrichment = await queue.get()
+            if enrichment is None:
+                return
+            stats = self.stats[enrichment.source]
+            current = enrichment.episode.data.get(enrichment.key)
+            if current is not None and current != "":
+                stats["kept"] += 1
+                continue
+            setattr(enrichment.episode, enrichment.key, enrichment.value)
+            stats["filled"] += 1
+
+    async def run_async(self) -> None:
+        queue: asyncio.Queue[Enrichment | None] = asyncio.Queue()
+        merge = asyncio.create_task(self.__merge(queue))
+        await asyncio.gather(
+            *[self.__run_source(source, queue) for source in self.sources]
+        )
+        await queue.put(None)
+        await merge
+
+    def run(self, dry_run: bool = False) -> None:
+        asyncio.run(self.run_async())
+        self.tv_show.reindex()
+        for name, stats in self.stats.items():
+            print(
+                f"{name:<14}" + " ".join([f"{v:>5} {k}" for k, v in stats.items()])
+            )
+        filled = sum([stats["filled"] for stats in self.stats.values()])
+        if filled and not dry_run:
+            self.tv_show.export_to_yaml()
+
+
 ### dvd #######################################################################
 
 
@@ -850,6 +1957,10 @@ class EpisodeData(typing.TypedDict):
 class Episode(DataAccessor):
     tv_show: TvShowData
 
+    thumbnail: str | None = None
+    """Path of the thumbnail of the snapshot, for example
+    ``snapshots/thumbnails/s02e01_MXBz7QnU3Po.webp``"""
+
     def __init__(
         self,
         data: EpisodeData,
@@ -1077,12 +2188,20 @@ class Episode(DataAccessor):
             return None
         return self.data["thetvdb_season_episode"]
 
+    @thetvdb_season_episode.setter
+    def thetvdb_season_episode(self, season_episode: str) -> None:
+        self.data["thetvdb_season_episode"] = season_episode
+
     @property
     def thetvdb_episode_id(self) -> int | None:
         if "thetvdb_episode_id" not in self.data:
             return None
         return self.data["thetvdb_episode_id"]
 
+    @thetvdb_episode_id.setter
+    def thetvdb_episode_id(self, id: int) -> None:
+        self.data["thetvdb_episode_id"] = id
+
     @property
     def thetvdb_url(self) -> str | None:
         if not self.thetvdb_episode_id:
@@ -1111,6 +2230,10 @@ class Episode(DataAccessor):
             return self.data["imdb_episode_id"]
         return None
 
+    @imdb_episode_id.setter
+    def imdb_episode_id(self, imdb_episode_id: str) -> None:
+        self.data["imdb_episode_id"] = imdb_episode_id
+
     @property
     def imdb_url(self) -> str | None:
         if not self.imdb_episode_id:
@@ -1201,6 +2324,19 @@ class Episode(DataAccessor):
     def year(self) -> int:
         return int(self.data["air_date"][0:4])
 
+    @property
+    def stable_id(self) -> str:
+        """An id that does not change if episodes are inserted or reordered,
+        for example ``fs339116`` (fernsehserien.de), ``yt…`` (YouTube) or a
+        hash of the title as last resort."""
+        if self.fernsehserien_episode_id:
+            return f"fs{self.fernsehserien_episode_id}"
+        if self.youtube_video_id:
+            return f"yt{self.youtube_video_id}"
+        if self.thetvdb_episode_id:
+            return f"tvdb{self.thetvdb_episode_id}"
+        return "t" + hashlib.sha1(self.title.encode()).hexdigest()[:10]
+
     def generate_map_popup(
         self, tpl: Template, include_title: bool = True, full: bool = False
     ) -> str:
@@ -1210,6 +2346,9 @@ class Episode(DataAccessor):
         if include_title:
             output.append(tpl.heading(self.title, 2))
 
+        if self.thumbnail:
+            output.append(tpl.image(self.thumbnail, self.title))
+
         output.append(tpl.paragraph(f"({self.subtitle})"))
 
         if self.summary:
@@ -1271,6 +2410,1359 @@ class Season:
         return {"no": self.no, "year": self.year, "episodes": episodes}
 
 
+### map #######################################################################
+
+
+class Geohash:
+    """https://en.wikipedia.org/wiki/Geohash"""
+
+    BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+    @staticmethod
+    def encode(latitude: float, longitude: float, precision: int = 9) -> str:
+        """Encode a position into a geohash cell, for example ``u33dc0``
+        (Berlin, precision 6). A cell of precision 5 is about 5 km wide,
+        a cell of precision 3 about 150 km."""
+        latitude_range: list[float] = [-90.0, 90.0]
+        longitude_range: list[float] = [-180.0, 180.0]
+        geohash: list[str] = []
+        bits: int = 0
+        bit_count: int = 0
+        even: bool = True
+        while len(geohash) < precision:
+            if even:
+                value, interval = longitude, longitude_range
+            else:
+                value, interval = latitude, latitude_range
+            middle: float = (interval[0] + interval[1]) / 2
+            bits <<= 1
+            if value >= middle:
+                bits |= 1
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+            bit_count += 1
+            if bit_count == 5:
+                geohash.append(Geohash.BASE32[bits])
+                bits = 0
+                bit_count = 0
+        return "".join(geohash)
+
+
+class MapLocation:
+    """One marker on a map: all episodes that share the same coordinates or
+    the same geohash cell."""
+
+    coordinates: list[float]
+    """``[latitude, longitude]``, the mean position of the episodes"""
+
+    episodes: list[Episode]
+
+    def __init__(self, coordinates: list[float], episodes: list[Episode]) -> None:
+        self.coordinates = coordinates
+        self.episodes = episodes
+
+    @property
+    def title(self) -> str:
+        return " / ".join([episode.title for episode in self.episodes])
+
+    @property
+    def continent(self) -> str | None:
+        """The continent or ``gemischt`` if the episodes belong to different
+        continents."""
+        continents = set([e.continent for e in self.episodes if e.continent])
+        if len(continents) == 0:
+            return None
+        if len(continents) == 1:
+            return continents.pop()
+        return "gemischt"
+
+    @property
+    def color(self) -> str:
+        """The continent color or grey if the episodes belong to different
+        continents."""
+        colors = set(
+            [episode.continent_color for episode in self.episodes if episode.continent]
+        )
+        if len(colors) == 0:
+            return "#cccccc"
+        if len(colors) == 1:
+            return colors.pop()
+        return "#808080"
+
+    def generate_map_popup(
+        self, tpl: Template, include_title: bool = True, full: bool = False
+    ) -> str:
+        """The popups of all episodes, one after another. If the headings are
+        not included, the titles of co-located episodes are rendered bold, so
+        the episodes can be told apart."""
+        if len(self.episodes) == 1:
+            return self.episodes[0].generate_map_popup(tpl, include_title, full)
+        output: list[str | None] = []
+        for episode in self.episodes:
+            if not include_title:
+                output.append(tpl.paragraph(tpl.bold(episode.title)))
+            output.append(episode.generate_map_popup(tpl, include_title, full))
+        return tpl.join("", *output)
+
+    @staticmethod
+    def group(
+        episodes: list[Episode], precision: int | None = None
+    ) -> list[MapLocation]:
+        """Group the episodes with coordinates by identical coordinates or,
+        if ``precision`` is specified, by geohash cells of this precision."""
+        groups: dict[typing.Any, list[Episode]] = {}
+        for episode in episodes:
+            if not episode.coordinates:
+                continue
+            latitude, longitude = episode.coordinates
+            key: typing.Any
+            if precision:
+                key = Geohash.encode(latitude, longitude, precision)
+            else:
+                key = (latitude, longitude)
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(episode)
+
+        locations: list[MapLocation] = []
+        for group in groups.values():
+            if len(group) == 1:
+                coordinates = group[0].coordinates
+            else:
+                coordinates = [
+                    sum([e.coordinates[0] for e in group if e.coordinates])
+                    / len(group),
+                    sum([e.coordinates[1] for e in group if e.coordinates])
+                    / len(group),
+                ]
+            locations.append(MapLocation(typing.cast(list[float], coordinates), group))
+        return locations
+
+
+class CompactGeoJson:
+    """Minified GeoJSON features for Kartographer that fit into a byte
+    budget.
+
+    If the features are too large, they are degraded step by step, the
+    largest first and in a fixed order so that the output is reproducible:
+
+    1. the popup (``description``) is shortened to the YouTube links,
+    2. the popup is dropped,
+    3. the title is dropped and the marker joins the ``MultiPoint`` feature
+       of its style group (markers of the same color and size), which
+       carries the shared style properties only once.
+
+    https://www.mediawiki.org/wiki/Help:Extension:Kartographer"""
+
+    FULL = 0
+    SHORT = 1
+    TITLE = 2
+    GROUPED = 3
+
+    locations: list[MapLocation]
+
+    coordinate_precision: int | None
+
+    budget: int | None
+
+    levels: list[int]
+    """The degradation level of each location"""
+
+    def __init__(
+        self,
+        locations: list[MapLocation],
+        coordinate_precision: int | None = COORDINATE_PRECISION,
+        budget: int | None = KARTOGRAPHER_BUDGET,
+    ) -> None:
+        self.locations = locations
+        self.coordinate_precision = coordinate_precision
+        self.budget = budget
+        self.levels = [CompactGeoJson.FULL] * len(locations)
+        self.__fit()
+
+    def __round(self, value: float) -> float:
+        if self.coordinate_precision is None:
+            return value
+        return round(value, self.coordinate_precision)
+
+    def __point(self, location: MapLocation) -> list[float]:
+        return [
+            self.__round(location.coordinates[1]),
+            self.__round(location.coordinates[0]),
+        ]
+
+    @staticmethod
+    def __style(location: MapLocation) -> dict[str, str]:
+        return {"marker-color": location.color, "marker-size": "small"}
+
+    def __description(self, location: MapLocation, level: int) -> str | None:
+        described = [e for e in location.episodes if e.youtube_url]
+        if not described or level >= CompactGeoJson.TITLE:
+            return None
+        if level == CompactGeoJson.SHORT:
+            return Wiki.join(
+                ", ", *[e.link_youtube(Wiki(), short=True) for e in described]
+            )
+        return MapLocation(location.coordinates, described).generate_map_popup(
+            Wiki(), include_title=False, full=False
+        )
+
+    def feature(self, location: MapLocation, level: int) -> dict[str, typing.Any]:
+        properties: dict[str, typing.Any] = CompactGeoJson.__style(location)
+        properties["title"] = location.title
+        description = self.__description(location, level)
+        if description:
+            properties["description"] = description
+        return {
+            "type": "Feature",
+            "properties": properties,
+            "geometry": {"type": "Point", "coordinates": self.__point(location)},
+        }
+
+    @staticmethod
+    def __size(data: typing.Any) -> int:
+        return len(Utils.dump_json(data, minify=True).encode())
+
+    def __fit(self) -> None:
+        if self.budget is None:
+            return
+        # Every feature with its separator (a comma or the closing bracket)
+        # plus the opening bracket: exactly the size of dump()
+        sizes = [
+            CompactGeoJson.__size(self.feature(location, CompactGeoJson.FULL)) + 1
+            for location in self.locations
+        ]
+        total = 1 + sum(sizes)
+        grouped_styles: set[str] = set()
+        for level in (CompactGeoJson.SHORT, CompactGeoJson.TITLE):
+            order = sorted(range(len(sizes)), key=lambda i: (-sizes[i], i))
+            for i in order:
+                if total <= self.budget:
+                    return
+                size = CompactGeoJson.__size(self.feature(self.locations[i], level)) + 1
+                total += size - sizes[i]
+                sizes[i] = size
+                self.levels[i] = level
+        order = sorted(range(len(sizes)), key=lambda i: (-sizes[i], i))
+        for i in order:
+            if total <= self.budget:
+                return
+            location = self.locations[i]
+            style = location.color
+            if style not in grouped_styles:
+                grouped_styles.add(style)
+                total += self.__group_overhead(location)
+            total += self.__point_size(location) - sizes[i]
+            sizes[i] = 0
+            self.levels[i] = CompactGeoJson.GROUPED
+
+    def __point_size(self, location: MapLocation) -> int:
+        """Bytes of a point in a ``MultiPoint`` feature with its separator"""
+        return CompactGeoJson.__size(self.__point(location)) + 1
+
+    def __group_overhead(self, location: MapLocation) -> int:
+        """Bytes of the ``MultiPoint`` feature of the style group of
+        ``location`` without its points"""
+        return CompactGeoJson.__size(self.__group([location])) - (
+            self.__point_size(location) - 1
+        )
+
+    def __group(self, locations: list[MapLocation]) -> dict[str, typing.Any]:
+        return {
+            "type": "Feature",
+            "properties": CompactGeoJson.__style(locations[0]),
+            "geometry": {
+                "type": "MultiPoint",
+                "coordinates": [self.__point(location) for location in locations],
+            },
+        }
+
+    def features(self) -> list[dict[str, typing.Any]]:
+        features: list[dict[str, typing.Any]] = []
+        groups: dict[str, list[MapLocation]] = {}
+        for location, level in zip(self.locations, self.levels):
+            if level == CompactGeoJson.GROUPED:
+                groups.setdefault(location.color, []).append(location)
+            else:
+                features.append(self.feature(location, level))
+        for locations in groups.values():
+            features.append(self.__group(locations))
+        return features
+
+    def dump(self) -> str:
+        return Utils.dump_json(self.features(), minify=True)
+
+    def rows(self) -> dict[str, list[int]]:
+        """``{continent: [bytes, full, short, title, grouped]}``: the bytes of
+        the features and grouped points of each continent and the number of
+        markers of each level"""
+        rows: dict[str, list[int]] = {}
+        for location, level in zip(self.locations, self.levels):
+            row = rows.setdefault(location.continent or "-", [0, 0, 0, 0, 0])
+            if level == CompactGeoJson.GROUPED:
+                row[0] += self.__point_size(location)
+            else:
+                row[0] += CompactGeoJson.__size(self.feature(location, level)) + 1
+            row[1 + level] += 1
+        return dict(sorted(rows.items()))
+
+    def overhead(self) -> int:
+        """Bytes that belong to no continent: the opening bracket and the
+        shared parts of the style groups. Together with the bytes of
+        :meth:`rows` they make up the size of :meth:`dump`."""
+        overhead = 1
+        grouped_styles: set[str] = set()
+        for location, level in zip(self.locations, self.levels):
+            if level == CompactGeoJson.GROUPED and location.color not in grouped_styles:
+                grouped_styles.add(location.color)
+                overhead += self.__group_overhead(location)
+        return overhead
+
+    def report(self) -> None:
+        """Print the size and the number of degraded markers per continent."""
+        rows = self.rows()
+        print(f"{'':<20}{'bytes':>10}{'full':>7}{'short':>7}{'title':>7}{'group':>7}")
+        for continent, row in rows.items():
+            counts = "".join([f"{n:>7}" for n in row[1:]])
+            print(f"{continent:<20}{row[0]:>10}{counts}")
+        overhead = self.overhead()
+        print(f"{'brackets, groups':<20}{overhead:>10}")
+        size = overhead + sum([row[0] for row in rows.values()])
+        budget = f" of {self.budget}" if self.budget else ""
+        print(f"{'total':<20}{size:>10} bytes{budget}")
+
+
+### spatial index #############################################################
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class SpatialIndex:
+    """A k-d tree over the positions converted to 3D unit vectors.
+
+    The straight-line (chord) distance between two points on the unit sphere
+    grows monotonically with the great-circle distance, so Euclidean range
+    and nearest neighbour queries in 3D are exact haversine queries and
+    there is no special handling of the poles or the antimeridian."""
+
+    points: list[tuple[float, float, float]]
+
+    root: typing.Any
+    """Nested nodes ``(point index, axis, left node, right node)``"""
+
+    def __init__(self, positions: list[tuple[float, float]]) -> None:
+        self.points = [SpatialIndex.to_vector(lat, lon) for lat, lon in positions]
+        self.root = self.__build(list(range(len(self.points))), 0)
+
+    @staticmethod
+    def to_vector(latitude: float, longitude: float) -> tuple[float, float, float]:
+        lat = math.radians(latitude)
+        lon = math.radians(longitude)
+        return (
+            math.cos(lat) * math.cos(lon),
+            math.cos(lat) * math.sin(lon),
+            math.sin(lat),
+        )
+
+    @staticmethod
+    def km_to_chord(km: float) -> float:
+        return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+
+    @staticmethod
+    def chord_to_km(chord: float) -> float:
+        return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+    @staticmethod
+    def haversine(
+        latitude1: float, longitude1: float, latitude2: float, longitude2: float
+    ) -> float:
+        """The great-circle distance in kilometers"""
+        lat1 = math.radians(latitude1)
+        lat2 = math.radians(latitude2)
+        a = (
+            math.sin((lat2 - lat1) / 2) ** 2
+            + math.cos(lat1)
+            * math.cos(lat2)
+            * math.sin(math.radians(longitude2 - longitude1) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+    def __build(self, indexes: list[int], depth: int) -> typing.Any:
+        if not indexes:
+            return None
+        axis: int = depth % 3
+        indexes.sort(key=lambda i: self.points[i][axis])
+        median: int = len(indexes) // 2
+        return (
+            indexes[median],
+            axis,
+            self.__build(indexes[:median], depth + 1),
+            self.__build(indexes[median + 1 :], depth + 1),
+        )
+
+    def __distance(self, a: tuple[float, float, float], index: int) -> float:
+        b = self.points[index]
+        return math.sqrt(
+            (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+        )
+
+    def within(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> list[tuple[int, float]]:
+        """All ``(point index, distance in km)`` within the radius, the
+        nearest first."""
+        query = SpatialIndex.to_vector(latitude, longitude)
+        radius: float = SpatialIndex.km_to_chord(radius_km)
+        result: list[tuple[int, float]] = []
+        stack: list[typing.Any] = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            distance = self.__distance(query, index)
+            if distance <= radius:
+                result.append((index, SpatialIndex.chord_to_km(distance)))
+            delta: float = query[axis] - self.points[index][axis]
+            if delta <= radius:
+                stack.append(left)
+            if delta >= -radius:
+                stack.append(right)
+        result.sort(key=operator.itemgetter(1))
+        return result
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 10
+    ) -> list[tuple[int, float]]:
+        """The ``k`` nearest ``(point index, distance in km)``, the nearest
+        first."""
+        query = SpatialIndex.to_vector(latitude, longitude)
+        # max-heap of the k best candidates as (-distance, index)
+        heap: list[tuple[float, int]] = []
+
+        def search(node: typing.Any) -> None:
+            if node is None:
+                return
+            index, axis, left, right = node
+            distance = self.__distance(query, index)
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, index))
+            elif distance < -heap[0][0]:
+                heapq.heapreplace(heap, (-distance, index))
+            delta: float = query[axis] - self.points[index][axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            search(near)
+            if len(heap) < k or abs(delta) < -heap[0][0]:
+                search(far)
+
+        if k > 0:
+            search(self.root)
+        result = [(index, SpatialIndex.chord_to_km(-d)) for d, index in heap]
+        result.sort(key=operator.itemgetter(1))
+        return result
+
+
+### duplicates ################################################################
+
+
+class MinHash:
+    """MinHash signatures and locality-sensitive hashing (LSH) to find
+    similar shingle sets without comparing every pair.
+
+    https://en.wikipedia.org/wiki/MinHash
+
+    The signature of ``bands * rows`` values is cut into ``bands`` bands.
+    Two sets become a candidate pair if all rows of at least one band are
+    equal, which happens with probability ``1 - (1 - s^rows)^bands`` for
+    sets with the Jaccard similarity ``s``. With 16 bands of 4 rows the
+    threshold is about 0.5."""
+
+    PRIME = (1 << 61) - 1
+
+    bands: int
+
+    rows: int
+
+    permutations: list[tuple[int, int]]
+
+    def __init__(self, bands: int = 16, rows: int = 4, seed: int = 360) -> None:
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, MinHash.PRIME), rng.randrange(0, MinHash.PRIME))
+            for _ in range(bands * rows)
+        ]
+
+    @staticmethod
+    def shingle_characters(text: str, size: int = 4) -> set[str]:
+        text = f" {text} "
+        return set([text[i : i + size] for i in range(max(1, len(text) - size + 1))])
+
+    @staticmethod
+    def shingle_words(text: str, size: int = 3) -> set[str]:
+        words = re.findall(r"\w+", text.lower())
+        return set(
+            [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+        )
+
+    def signature(self, shingles: set[str]) -> list[int]:
+        hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+        prime = MinHash.PRIME
+        return [min([(a * h + b) % prime for h in hashes]) for a, b in self.permutations]
+
+    def candidates(self, sets: list[set[str]]) -> set[tuple[int, int]]:
+        """Index pairs ``(i, j)`` with ``i < j`` whose sets are probably
+        similar. Empty sets are skipped."""
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        for index, shingles in enumerate(sets):
+            if not shingles:
+                continue
+            signature = self.signature(shingles)
+            for band in range(self.bands):
+                key = (band, tuple(signature[band * self.rows : (band + 1) * self.rows]))
+                if key not in buckets:
+                    buckets[key] = []
+                buckets[key].append(index)
+
+        pairs: set[tuple[int, int]] = set()
+        for indexes in buckets.values():
+            for i in range(len(indexes)):
+                for j in range(i + 1, len(indexes)):
+                    pairs.add((indexes[i], indexes[j]))
+        return pairs
+
+    @staticmethod
+    def jaccard(a: set[str], b: set[str]) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+
+class DuplicateDetector:
+    """Find episodes that were probably aired twice under a (slightly)
+    different title. The titles (all language variants) and the
+    descriptions are compared separately, a pair is reported if either of
+    them is similar enough."""
+
+    episodes: list[Episode]
+
+    def __init__(self, episodes: list[Episode]) -> None:
+        self.episodes = episodes
+
+    @staticmethod
+    def __titles(episode: Episode) -> set[str]:
+        shingles: set[str] = set()
+        for title in (episode.title, episode.alias, episode.title_fr, episode.title_en):
+            if title:
+                shingles |= MinHash.shingle_characters(
+                    Utils.normalize_title(Utils.clean_title(title))
+                )
+        return shingles
+
+    def find(self, threshold: float = 0.5) -> list[tuple[float, Episode, Episode]]:
+        """Candidate pairs ``(similarity, earlier episode, later episode)``,
+        the most similar first."""
+        titles = [DuplicateDetector.__titles(e) for e in self.episodes]
+        descriptions = [
+            MinHash.shingle_words(e.description_plain) if e.description_plain else set()
+            for e in self.episodes
+        ]
+        minhash = MinHash()
+        pairs = minhash.candidates(titles) | minhash.candidates(descriptions)
+
+        result: list[tuple[float, Episode, Episode]] = []
+        for i, j in pairs:
+            similarity = max(
+                MinHash.jaccard(titles[i], titles[j]),
+                MinHash.jaccard(descriptions[i], descriptions[j]),
+            )
+            if similarity >= threshold:
+                result.append((similarity, self.episodes[i], self.episodes[j]))
+        result.sort(key=lambda r: (-r[0], r[1].overall_no, r[2].overall_no))
+        return result
+
+    def write_report(self, threshold: float = 0.5) -> None:
+        """Write the candidates in the format of ``duplicates.yml`` to
+        ``arte-360-reportage_duplicates.yml``: the later episode of each
+        pair, preceded by the similarity and the title of the earlier
+        episode."""
+        entries: list[dict[str, typing.Any]] = []
+        for similarity, earlier, later in self.find(threshold):
+            print(
+                f"{similarity:.2f} {earlier.overall_no} {earlier.title} <> "
+                + f"{later.overall_no} {later.title}"
+            )
+            entry: dict[str, typing.Any] = {
+                "similarity": round(similarity, 3),
+                "duplicate_of": earlier.title,
+            }
+            entry.update(later.export_data())
+            entries.append(entry)
+        Yaml.save(EXPORT_FILENAME + "_duplicates.yml", entries)
+
+
+### snapshots #################################################################
+
+
+class Snapshot:
+    """A still image of an episode, for example
+    ``snapshots/s03e25 Nepals verkaufte Töchter (YT zvAm_rmvynU)_title.jpg``"""
+
+    FILENAME = re.compile(
+        r"^s(?P<season>\d+)e(?P<episode>\d+) (?P<title>.*) "
+        + r"\(YT (?P<youtube>[\w-]{11})\)(?:_(?P<variant>\w+))?\.jpg$"
+    )
+
+    path: str
+
+    season_no: int
+
+    episode_no: int
+
+    title: str
+
+    youtube_video_id: str
+
+    variant: str | None
+    """for example ``title`` or ``director``"""
+
+    def __init__(self, path: str) -> None:
+        match = Snapshot.FILENAME.match(os.path.basename(path))
+        if not match:
+            raise Exception(f"Unknown snapshot file name {path}")
+        self.path = path
+        self.season_no = int(match["season"])
+        self.episode_no = int(match["episode"])
+        self.title = match["title"]
+        self.youtube_video_id = match["youtube"]
+        self.variant = match["variant"]
+
+    @property
+    def thumbnail_path(self) -> str:
+        variant = f"_{self.variant}" if self.variant else ""
+        return (
+            f"{THUMBNAIL_DIR}/s{self.season_no:02}e{self.episode_no:02}_"
+            + f"{self.youtube_video_id}{variant}.webp"
+        )
+
+    @property
+    def sha256(self) -> str:
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @staticmethod
+    def list(directory: str = SNAPSHOT_DIR) -> list[Snapshot]:
+        snapshots: list[Snapshot] = []
+        for name in sorted(os.listdir(directory)):
+            if Snapshot.FILENAME.match(name):
+                snapshots.append(Snapshot(os.path.join(directory, name)))
+        return snapshots
+
+
+def make_thumbnail(source: str, target: str, size: int) -> None:
+    """Resize a snapshot into a WebP thumbnail, runs in a worker process."""
+    if Image is None:
+        raise Exception("The package “pillow” is required to create thumbnails")
+    with Image.open(source) as image:
+        image.thumbnail((size, size))
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=80)
+    Utils.write_binary_file(target, buffer.getvalue())
+
+
+class SnapshotPipeline:
+    """Map the snapshots to their episodes and create thumbnails of them.
+
+    The SHA-256 hash of every snapshot and the size of its thumbnail are
+    stored in ``snapshots/thumbnails/manifest.json``. Snapshots whose hash
+    and thumbnail size are unchanged are skipped."""
+
+    MANIFEST = THUMBNAIL_DIR + "/manifest.json"
+
+    tv_show: TvShow
+
+    size: int
+
+    def __init__(self, tv_show: TvShow, size: int = 320) -> None:
+        self.tv_show = tv_show
+        self.size = size
+
+    def map_episode(self, snapshot: Snapshot) -> Episode | None:
+        """Find the episode by its season and episode number. The YouTube
+        id of the file name has to match the one of the episode."""
+        episode = self.tv_show.get_episode_by_number(
+            snapshot.season_no, snapshot.episode_no
+        )
+        if not episode:
+            print(f"No episode found for {snapshot.path}")
+            return None
+        if episode.youtube_video_id != snapshot.youtube_video_id:
+            print(
+                f"YouTube id mismatch: {snapshot.path} <> "
+                + f"{episode.youtube_video_id} {episode.title}"
+            )
+            return None
+        return episode
+
+    @staticmethod
+    def load_manifest() -> dict[str, typing.Any]:
+        if not os.path.exists(SnapshotPipeline.MANIFEST):
+            return {}
+        with open(SnapshotPipeline.MANIFEST, "r") as f:
+            return json.load(f)
+
+    def run(self, jobs: int = 1) -> None:
+        pathlib.Path(THUMBNAIL_DIR).mkdir(parents=True, exist_ok=True)
+        old_manifest = SnapshotPipeline.load_manifest()
+        manifest: dict[str, typing.Any] = {}
+        tasks: list[tuple[str, str, int]] = []
+        for snapshot in Snapshot.list():
+            episode = self.map_episode(snapshot)
+            if not episode:
+                continue
+            name = os.path.basename(snapshot.path)
+            sha256 = snapshot.sha256
+            manifest[name] = {
+                "sha256": sha256,
+                "size": self.size,
+                "thumbnail": snapshot.thumbnail_path,
+                "youtube_video_id": snapshot.youtube_video_id,
+                "variant": snapshot.variant,
+            }
+            if (
+                name in old_manifest
+                and old_manifest[name]["sha256"] == sha256
+                and old_manifest[name].get("size") == self.size
+                and os.path.exists(snapshot.thumbnail_path)
+            ):
+                profiler.count("cache_hits")
+                continue
+            tasks.append((snapshot.path, snapshot.thumbnail_path, self.size))
+
+        if tasks:
+            if not Image:
+                raise Exception("The package “pillow” is required to create thumbnails")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, jobs)
+            ) as executor:
+                futures = [executor.submit(make_thumbnail, *task) for task in tasks]
+                for future in futures:
+                    future.result()
+        print(
+            f"{len(tasks)} thumbnails created, {len(manifest) - len(tasks)} unchanged"
+        )
+        Utils.write_json_file(SnapshotPipeline.MANIFEST, manifest)
+
+    @staticmethod
+    def assign_thumbnails(tv_show: TvShow) -> None:
+        """Set ``Episode.thumbnail`` from the manifest. Snapshots without a
+        variant or of the variant ``title`` are preferred.
+
+        Only called for the outputs that show the thumbnails (the map and the
+        README), the other outputs do not depend on the local snapshots."""
+        for entry in SnapshotPipeline.load_manifest().values():
+            episode = tv_show.get_episode_by(
+                "youtube_video_id", entry["youtube_video_id"]
+            )
+            if not episode or not os.path.exists(entry["thumbnail"]):
+                continue
+            if not episode.thumbnail or entry["variant"] in (None, "title"):
+                episode.thumbnail = entry["thumbnail"]
+
+
+def compute_dhash(path: str) -> int:
+    """The 64 bit difference hash (dHash) of an image: the image is reduced
+    to 9x8 grey pixels and every bit states whether a pixel is brighter than
+    its right neighbour. Runs in a worker process.
+
+    https://www.hackerfactor.com/blog/index.php?/archives/529-Kind-of-Like-That.html"""
+    if Image is None:
+        raise Exception("The package “pillow” is required to hash images")
+    with Image.open(path) as image:
+        # one byte per pixel in the mode "L"
+        pixels = image.convert("L").resize((9, 8)).tobytes()
+    bits: int = 0
+    for row in range(8):
+        for column in range(8):
+            left = pixels[row * 9 + column]
+            right = pixels[row * 9 + column + 1]
+            bits = (bits << 1) | int(left > right)
+    return bits
+
+
+class BkTree:
+    """A BK-tree over 64 bit hashes with the Hamming distance as metric. A
+    query only descends into the children whose edge distance lies within
+    ``distance ± max_distance`` (triangle inequality).
+
+    https://en.wikipedia.org/wiki/BK-tree"""
+
+    root: list[typing.Any] | None
+    """Nodes ``[hash, items, {edge distance: child node}]``"""
+
+    def __init__(self) -> None:
+        self.root = None
+
+    @staticmethod
+    def distance(a: int, b: int) -> int:
+        return (a ^ b).bit_count()
+
+    def add(self, hash: int, item: typing.Any) -> None:
+        if self.root is None:
+            self.root = [hash, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = BkTree.distance(hash, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            if distance not in node[2]:
+                node[2][distance] = [hash, [item], {}]
+                return
+            node = node[2][distance]
+
+    def search(self, hash: int, max_distance: int) -> list[tuple[int, typing.Any]]:
+        result: list[tuple[int, typing.Any]] = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = BkTree.distance(hash, node[0])
+            if distance <= max_distance:
+                result.extend([(distance, item) for item in node[1]])
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return result
+
+
+class PerceptualHashIndex:
+    """The dHashes of all snapshots, stored in ``snapshots/phash.json``.
+    Only new or changed snapshots (SHA-256) are hashed again."""
+
+    FILE = SNAPSHOT_DIR + "/phash.json"
+
+    entries: dict[str, dict[str, typing.Any]]
+    """``{file name: {"sha256": …, "dhash": "<hex>", "youtube_video_id": …}}``"""
+
+    def __init__(self) -> None:
+        self.entries = {}
+        if os.path.exists(PerceptualHashIndex.FILE):
+            with open(PerceptualHashIndex.FILE, "r") as f:
+                self.entries = json.load(f)
+
+    def update(self, jobs: int = 1) -> None:
+        entries: dict[str, dict[str, typing.Any]] = {}
+        pending: list[tuple[str, Snapshot]] = []
+        for snapshot in Snapshot.list():
+            name = os.path.basename(snapshot.path)
+            sha256 = snapshot.sha256
+            old = self.entries.get(name)
+            if old and old["sha256"] == sha256:
+                profiler.count("cache_hits")
+                entries[name] = old
+                continue
+            entries[name] = {
+                "sha256": sha256,
+                "youtube_video_id": snapshot.youtube_video_id,
+            }
+            pending.append((name, snapshot))
+
+        if pending:
+            if not Image:
+                raise Exception("The package “pillow” is required to hash images")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, jobs)
+            ) as executor:
+                hashes = executor.map(
+                    compute_dhash, [snapshot.path for _, snapshot in pending]
+                )
+                for (name, _), hash in zip(pending, hashes):
+                    entries[name]["dhash"] = f"{hash:016x}"
+        print(
+            f"{len(pending)} snapshots hashed, "
+            + f"{len(entries) - len(pending)} unchanged"
+        )
+        self.entries = entries
+        Utils.write_json_file(PerceptualHashIndex.FILE, entries)
+
+    def find_conflicts(self, max_distance: int = 4) -> list[tuple[int, str, str]]:
+        """Pairs of visually (nearly) identical snapshots that are attached
+        to different YouTube videos: ``(distance, file name, file name)``."""
+        tree = BkTree()
+        conflicts: list[tuple[int, str, str]] = []
+        for name in sorted(self.entries):
+            entry = self.entries[name]
+            hash = int(entry["dhash"], 16)
+            for distance, other in tree.search(hash, max_distance):
+                if (
+                    self.entries[other]["youtube_video_id"]
+                    != entry["youtube_video_id"]
+                ):
+                    conflicts.append((distance, other, name))
+            tree.add(hash, name)
+        conflicts.sort()
+        return conflicts
+
+    def print_conflicts(self, max_distance: int = 4) -> None:
+        for distance, a, b in self.find_conflicts(max_distance):
+            print(f"{distance:2} {termcolor.colored(a, color='yellow')} <> {b}")
+
+
+### summary ###################################################################
+
+
+SUMMARY_TASK = "Fasse folgenden Text auf Deutsch in 75 Wörtern zusammen"
+
+
+class Summariser(abc.ABC):
+    """Answers a batch prompt with one ``[id] summary`` entry per text"""
+
+    @abc.abstractmethod
+    def summarise(self, prompt: str) -> str:
+        pass
+
+
+class LocalSummariser(Summariser):
+    """Stand-in for a language model: the “summary” is the beginning of
+    each text. Used to test the batching and the import."""
+
+    words: int
+
+    def __init__(self, words: int = 75) -> None:
+        self.words = words
+
+    def summarise(self, prompt: str) -> str:
+        answers: list[str] = []
+        for id, text in SummaryBatches.parse(prompt).items():
+            answers.append(f"[{id}] " + " ".join(text.split()[: self.words]))
+        return "\n\n".join(answers)
+
+
+SUMMARISERS: dict[str, type[Summariser]] = {"local": LocalSummariser}
+"""Summarisers for ``--summary-run``"""
+
+
+class SummaryBatches:
+    """Pack the descriptions of the episodes without a summary into prompts
+    that fit into a token budget.
+
+    Each text is preceded by the stable id of its episode (``[fs339116]``),
+    the answer has to use the same format, so the summaries can be merged
+    back in bulk. The batches are written to ``arte-360-reportage_summary/``,
+    ``batches.json`` tracks which of them are still pending."""
+
+    DIRECTORY = EXPORT_FILENAME + "_summary"
+
+    STATE = DIRECTORY + "/batches.json"
+
+    ANSWER_TOKENS = 120
+    """Tokens reserved per text for the answer (75 German words)"""
+
+    INSTRUCTION = (
+        SUMMARY_TASK.replace("folgenden Text", "jeden der folgenden Texte")
+        + ". Beginne jede Zusammenfassung mit der ID des Textes in eckigen "
+        + "Klammern, zum Beispiel [fs339116]."
+    )
+
+    ID = re.compile(r"^\[([\w-]+)\] ?", re.MULTILINE)
+
+    episodes: list[Episode]
+
+    budget: int
+
+    state: dict[str, dict[str, typing.Any]]
+    """``{"batch-001": {"ids": [...], "status": "pending"}}``"""
+
+    def __init__(self, episodes: list[Episode], budget: int = 4000) -> None:
+        self.episodes = episodes
+        self.budget = budget
+        self.state = {}
+        if os.path.exists(SummaryBatches.STATE):
+            with open(SummaryBatches.STATE, "r") as f:
+                self.state = json.load(f)
+        self.__update_status()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Rough estimate for German text: one token per three characters."""
+        return math.ceil(len(text) / 3)
+
+    @staticmethod
+    def parse(text: str) -> dict[str, str]:
+        """Split a prompt or an answer into ``{id: text}``"""
+        parts = SummaryBatches.ID.split(text)
+        # parts: [preamble, id, text, id, text, ...]
+        result: dict[str, str] = {}
+        for i in range(1, len(parts) - 1, 2):
+            result[parts[i]] = parts[i + 1].strip()
+        return result
+
+    @property
+    def pending(self) -> list[str]:
+        return [
+            name for name, batch in self.state.items() if batch["status"] == "pending"
+        ]
+
+    def __update_status(self) -> None:
+        """A batch is done if all its episodes have a summary. A batch that
+        was merged but whose summaries were never saved is pending again."""
+        summarised = set([e.stable_id for e in self.episodes if e.summary])
+        for batch in self.state.values():
+            if all([id in summarised for id in batch["ids"]]):
+                batch["status"] = "done"
+            else:
+                batch["status"] = "pending"
+
+    def write(self) -> None:
+        """Write new batches for all episodes without a summary that are not
+        part of a pending batch yet."""
+        self.__update_status()
+        batched = set(
+            [id for name in self.pending for id in self.state[name]["ids"]]
+        )
+        pathlib.Path(SummaryBatches.DIRECTORY).mkdir(exist_ok=True)
+
+        batches: list[list[Episode]] = []
+        tokens: int = 0
+        base: int = SummaryBatches.estimate_tokens(SummaryBatches.INSTRUCTION)
+        for episode in self.episodes:
+            if episode.summary or not episode.description_plain:
+                continue
+            if episode.stable_id in batched:
+                continue
+            cost = (
+                SummaryBatches.estimate_tokens(episode.description_plain)
+                + SummaryBatches.ANSWER_TOKENS
+            )
+            if not batches or tokens + cost > self.budget:
+                batches.append([])
+                tokens = base
+            batches[-1].append(episode)
+            tokens += cost
+
+        no = len(self.state)
+        for episodes in batches:
+            no += 1
+            name = f"batch-{no:03}"
+            lines: list[str] = [SummaryBatches.INSTRUCTION, ""]
+            for episode in episodes:
+                lines.append(f"[{episode.stable_id}] {episode.description_plain}")
+                lines.append("")
+            Utils.write_text_file(f"{SummaryBatches.DIRECTORY}/{name}.txt", lines)
+            self.state[name] = {
+                "ids": [episode.stable_id for episode in episodes],
+                "status": "pending",
+            }
+        Utils.write_json_file(SummaryBatches.STATE, self.state)
+        print(f"{len(batches)} new batches, {len(self.pending)} pending")
+
+    def merge(self, answer: str) -> int:
+        """Merge the summaries of an answer into the episodes. Returns the
+        number of updated episodes."""
+        by_id: dict[str, Episode] = {}
+        for episode in self.episodes:
+            by_id[episode.stable_id] = episode
+        count: int = 0
+        for id, summary in SummaryBatches.parse(answer).items():
+            if id not in by_id:
+                print(f"Unknown id {termcolor.colored(id, color='red')}")
+                continue
+            by_id[id].summary = re.sub(r"\s+", " ", summary)
+            count += 1
+        self.__update_status()
+        Utils.write_json_file(SummaryBatches.STATE, self.state)
+        return count
+
+    def run(
+        self,
+        summariser: Summariser,
+        save: typing.Callable[[], None] | None = None,
+    ) -> int:
+        """Send all pending batches to the summariser and merge the answers.
+        ``save`` is called after each batch, so an interrupted run loses at
+        most one batch and the next run continues with the pending ones."""
+        count: int = 0
+        for name in self.pending:
+            prompt = Utils.read_text_file(f"{SummaryBatches.DIRECTORY}/{name}.txt")
+            count += self.merge(summariser.summarise(prompt))
+            if save:
+                save()
+        return count
+
+
+### completeness ##############################################################
+
+
+class CompletenessReport:
+    """Which fields of ``EpisodeData`` are filled, computed in one pass over
+    all episodes.
+
+    For every field a presence bitmap (an ``int``) is built: bit ``i`` is set
+    if the episode with the index ``i`` has a non-empty value. Queries over
+    combinations of fields are bitwise operations on these bitmaps."""
+
+    episodes: list[Episode]
+
+    fields: list[str]
+
+    bitmaps: dict[str, int]
+
+    seasons: dict[int, int]
+    """``{season no: bitmap of the episodes of the season}``"""
+
+    def __init__(self, episodes: list[Episode]) -> None:
+        self.episodes = episodes
+        self.fields = list(EpisodeData.__annotations__)
+        self.bitmaps = {field: 0 for field in self.fields}
+        self.seasons = {}
+        for index, episode in enumerate(episodes):
+            bit = 1 << index
+            self.seasons[episode.season_no] = (
+                self.seasons.get(episode.season_no, 0) | bit
+            )
+            for key, value in episode.data.items():
+                if key in self.bitmaps and value is not None and value != "":
+                    self.bitmaps[key] |= bit
+
+    @property
+    def all(self) -> int:
+        return (1 << len(self.episodes)) - 1
+
+    def bitmap(self, field: str) -> int:
+        """The presence bitmap of a field of ``EpisodeData`` or, built on
+        first use, of any other attribute of ``Episode`` (for example
+        ``youtube_url``), which is present if it is truthy."""
+        if field not in self.bitmaps:
+            if not hasattr(Episode, field):
+                raise Exception(f"Unknown field {field}")
+            bitmap = 0
+            for index, episode in enumerate(self.episodes):
+                if getattr(episode, field):
+                    bitmap |= 1 << index
+            self.bitmaps[field] = bitmap
+        return self.bitmaps[field]
+
+    def select(self, expression: str) -> int:
+        """Bitmap of the episodes matching a comma separated list of fields
+        that have to be missing, or present with a leading ``+``, for example
+        ``duration_sec,+youtube_video_id``."""
+        bitmap = self.all
+        for field in expression.split(","):
+            field = field.strip()
+            if field.startswith("+"):
+                bitmap &= self.bitmap(field[1:])
+            else:
+                bitmap &= ~self.bitmap(field)
+        return bitmap
+
+    def episodes_of(self, bitmap: int) -> list[Episode]:
+        return [e for i, e in enumerate(self.episodes) if bitmap >> i & 1]
+
+    def coverage(self, field: str, season_no: int | None = None) -> float:
+        scope = self.all if season_no is None else self.seasons[season_no]
+        if scope == 0:
+            return 0.0
+        return (self.bitmaps[field] & scope).bit_count() / scope.bit_count()
+
+    def print_matrix(self) -> None:
+        """Coverage in percent, one row per field, one column per season."""
+        print(f"{'':<27}{'all':>4}" + "".join([f"{no:>4}" for no in self.seasons]))
+        for field in self.fields:
+            row = f"{field:<27}{round(self.coverage(field) * 100):>4}"
+            for no in self.seasons:
+                row += f"{round(self.coverage(field, no) * 100):>4}"
+            print(row)
+
+    def write_json(self, file_path: str) -> None:
+        report: dict[str, typing.Any] = {
+            "episodes": len(self.episodes),
+            "fields": {},
+        }
+        for field in self.fields:
+            report["fields"][field] = {
+                "count": self.bitmaps[field].bit_count(),
+                "coverage": round(self.coverage(field), 4),
+                "seasons": {
+                    no: round(self.coverage(field, no), 4) for no in self.seasons
+                },
+            }
+        Utils.write_json_file(file_path, report)
+
+
+### diff ######################################################################
+
+
+class DatasetDiff:
+    """Semantic diff between two versions of the YAML file.
+
+    Episodes are aligned by their external ids (in the order of
+    ``TvShow.ID_KEYS``) and then by the normalized title. Aligned episodes
+    whose hashes are equal are skipped, only the remaining ones are compared
+    field by field."""
+
+    POSITION_KEYS = ("overall_no", "season_no", "episode_no")
+    """Derived from the position in the file, not part of the data"""
+
+    old: TvShow
+
+    new: TvShow
+
+    pairs: list[tuple[Episode, Episode]]
+
+    added: list[Episode]
+
+    removed: list[Episode]
+
+    changed: list[tuple[Episode, Episode, dict[str, tuple[typing.Any, typing.Any]]]]
+    """``[(old, new, {field: (old value, new value)}), …]``"""
+
+    reordered: list[tuple[Episode, Episode]]
+    """Aligned episodes whose order relative to the others has changed"""
+
+    def __init__(self, old: TvShow, new: TvShow) -> None:
+        self.old = old
+        self.new = new
+        self.pairs, self.added, self.removed = self.__align()
+        self.changed = []
+        for old_episode, new_episode in self.pairs:
+            if DatasetDiff.hash(old_episode) != DatasetDiff.hash(new_episode):
+                self.changed.append(
+                    (
+                        old_episode,
+                        new_episode,
+                        DatasetDiff.compare(old_episode, new_episode),
+                    )
+                )
+        self.reordered = self.__find_reordered()
+
+    @staticmethod
+    def key(episode: Episode, key: str) -> typing.Any:
+        if key == "title":
+            return Utils.normalize_title(episode.title)
+        return episode.data.get(key)
+
+    @staticmethod
+    def hash(episode: Episode) -> str:
+        data = {
+            k: v for k, v in episode.data.items() if k not in DatasetDiff.POSITION_KEYS
+        }
+        dump = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(dump.encode()).hexdigest()
+
+    @staticmethod
+    def compare(
+        old: Episode, new: Episode
+    ) -> dict[str, tuple[typing.Any, typing.Any]]:
+        changes: dict[str, tuple[typing.Any, typing.Any]] = {}
+        for key in old.data.keys() | new.data.keys():
+            if key in DatasetDiff.POSITION_KEYS:
+                continue
+            old_value = old.data.get(key)
+            new_value = new.data.get(key)
+            if old_value != new_value:
+                changes[key] = (old_value, new_value)
+        return dict(sorted(changes.items()))
+
+    def __align(
+        self,
+    ) -> tuple[list[tuple[Episode, Episode]], list[Episode], list[Episode]]:
+        # One pass per key over all episodes, so that an episode matched by
+        # an id is never taken away by an earlier episode with the same title.
+        partners: dict[int, Episode] = {}  # {index of the new episode: old}
+        matched: set[int] = set()
+        for key in TvShow.ID_KEYS + ("title",):
+            index: dict[typing.Any, list[Episode]] = {}
+            for episode in self.old.episodes:
+                value = DatasetDiff.key(episode, key)
+                if value and id(episode) not in matched:
+                    index.setdefault(value, []).append(episode)
+            for i, episode in enumerate(self.new.episodes):
+                if i in partners:
+                    continue
+                value = DatasetDiff.key(episode, key)
+                if not value:
+                    continue
+                for candidate in index.get(value, []):
+                    if id(candidate) not in matched:
+                        matched.add(id(candidate))
+                        partners[i] = candidate
+                        break
+        pairs: list[tuple[Episode, Episode]] = []
+        added: list[Episode] = []
+        for i, episode in enumerate(self.new.episodes):
+            if i in partners:
+                pairs.append((partners[i], episode))
+            else:
+                added.append(episode)
+        removed = [e for e in self.old.episodes if id(e) not in matched]
+        return pairs, added, removed
+
+    def __find_reordered(self) -> list[tuple[Episode, Episode]]:
+        """The pairs outside of the longest subsequence that keeps the old
+        order. Insertions and removals shift the numbers of the following
+        episodes, but do not count as reorderings."""
+        positions = [old.overall_no for old, _ in self.pairs]
+        tails: list[int] = []
+        tail_indexes: list[int] = []
+        previous: list[int] = [-1] * len(positions)
+        for i, position in enumerate(positions):
+            j = bisect.bisect_left(tails, position)
+            if j == len(tails):
+                tails.append(position)
+                tail_indexes.append(i)
+            else:
+                tails[j] = position
+                tail_indexes[j] = i
+            previous[i] = tail_indexes[j - 1] if j > 0 else -1
+        in_order: set[int] = set()
+        i = tail_indexes[-1] if tail_indexes else -1
+        while i != -1:
+            in_order.add(i)
+            i = previous[i]
+        reordered: list[tuple[Episode, Episode]] = []
+        for i, (old, new) in enumerate(self.pairs):
+            if i not in in_order or old.season_no != new.season_no:
+                reordered.append((old, new))
+        return reordered
+
+    @staticmethod
+    def __format_no(episode: Episode) -> str:
+        return f"S{episode.season_no:02}E{episode.episode_no:02}"
+
+    def print(self) -> None:
+        for episode in self.added:
+            print(
+                f"{termcolor.colored('+', color='green')} "
+                f"{DatasetDiff.__format_no(episode)} {episode.title}"
+            )
+        for episode in self.removed:
+            print(
+                f"{termcolor.colored('-', color='red')} "
+                f"{DatasetDiff.__format_no(episode)} {episode.title}"
+            )
+        for old, new in self.reordered:
+            print(
+                f"{termcolor.colored('~', color='blue')} {new.title}: "
+                f"{DatasetDiff.__format_no(old)} -> {DatasetDiff.__format_no(new)}"
+            )
+        for old, new, changes in self.changed:
+            print(
+                f"{termcolor.colored('*', color='yellow')} "
+                f"{DatasetDiff.__format_no(new)} {new.title}"
+            )
+            for key, (old_value, new_value) in changes.items():
+                print(f"    {key}: {old_value!r} -> {new_value!r}")
+        print(
+            f"{len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.changed)} changed, {len(self.reordered)} reordered"
+        )
+
+
 ### main ######################################################################
 
 
@@ -1285,20 +3777,279 @@ class TvShow:
 
     titles: dict[str, int]
 
+    title_keys: dict[str, int]
+    """``{Utils.title_key(title): episode index}`` of all title variants"""
+
     episodes: list[Episode]
 
     seasons: list[Season]
 
     dvds: list[Dvd]
 
-    def __init__(self) -> None:
+    filepath: str
+    """The YAML (or JSON) file the data is loaded from"""
+
+    source_sha1: str | None = None
+    """SHA-1 of the YAML file the data was loaded from or last saved to"""
+
+    saved_sha1: str | None = None
+    """SHA-1 of the JSON export of the data as it was loaded or last saved.
+    Only a JSON export with this checksum mirrors the YAML file. Computed
+    when the JSON file is exported, see ``__write_mirror_checksums``."""
+
+    split: bool = False
+    """``True`` if the YAML file is only an index referencing one file per
+    season and a file with the DVDs, see :meth:`convert_layout`"""
+
+    SPLIT_INDEX = re.compile(rb"^seasons:[ \t]*\r?\n-[ \t]+\S+\.yml[ \t]*$", re.M)
+    """The first item of ``seasons`` is a file name instead of a mapping."""
+
+    __part_sha1s: dict[str, str]
+    """``{file path relative to the index: SHA-1 of the data}`` of the split
+    layout, to rewrite only the files whose data changed"""
+
+    loaded_from: str
+    """The file that was actually parsed, the YAML file or its JSON mirror"""
+
+    use_mirror: bool
+
+    ID_KEYS = (
+        "youtube_video_id",
+        "fernsehserien_episode_id",
+        "imdb_episode_id",
+        "thetvdb_episode_id",
+    )
+    """Keys that identify an episode in an external database"""
+
+    INVERTED_KEYS = ("director", "topic", "continent", "year")
+
+    ids: dict[str, dict[typing.Any, Episode]]
+    """``{"youtube_video_id": {"E_uSFyHf7BM": episode, …}, …}``"""
+
+    id_collisions: dict[str, dict[typing.Any, list[Episode]]]
+    """External ids that are used by more than one episode"""
+
+    inverted: dict[str, dict[typing.Any, list[Episode]]]
+    """``{"director": {"Ines Possemeyer": [episode, …], …}, "year": {1999: …}}``"""
+
+    numbers: dict[tuple[int, int], Episode]
+    """``{(season_no, episode_no): episode}``"""
+
+    number_collisions: dict[tuple[int, int], list[Episode]]
+    """Season and episode numbers that are used by more than one episode"""
+
+    __spatial_index: tuple[SpatialIndex, list[Episode]] | None = None
+
+    def __init__(
+        self, filepath: str | None = None, use_mirror: bool = True
+    ) -> None:
+        if not filepath:
+            filepath = EXPORT_FILENAME + ".yml"
+        self.filepath = filepath
+        self.use_mirror = use_mirror
+        self.__part_sha1s = {}
         self.data = self.__load()
         self.__generate_season_episodes()
         self.titles = self.__generate_title_list()
+        self.title_keys = self.__generate_title_keys()
         self.__generate_dvds()
+        self.reindex()
+
+    @property
+    def mirror_filepath(self) -> str:
+        """``arte-360-reportage.json`` next to ``arte-360-reportage.yml``"""
+        return os.path.splitext(self.filepath)[0] + ".json"
+
+    @property
+    def mirror_checksum_filepath(self) -> str:
+        """``arte-360-reportage.json.sha1`` in the format of ``sha1sum``"""
+        return self.mirror_filepath + ".sha1"
 
     def __load(self) -> TvShowData:
-        return Yaml.load(EXPORT_FILENAME + ".yml")
+        """Load the YAML file, or the JSON export instead if its checksum file
+        states that it was exported from exactly this YAML file and the JSON
+        file is unchanged as well. A JSON file can also be loaded directly."""
+        with open(self.filepath, "rb") as f:
+            content = f.read()
+        self.loaded_from = self.filepath
+        if self.filepath.endswith(".json"):
+            return Utils.load_json(content)
+        self.split = bool(TvShow.SPLIT_INDEX.search(content))
+        if not self.split:
+            self.source_sha1 = hashlib.sha1(content).hexdigest()
+            if self.use_mirror:
+                mirror = self.__load_mirror()
+                if mirror is not None:
+                    self.loaded_from = self.mirror_filepath
+                    return mirror
+            return Yaml.load(content)
+
+        index = Yaml.load(content)
+        paths: list[str] = index["seasons"] + [index["dvds"]]
+        parts = self.__read_parts(paths)
+        self.source_sha1 = TvShow.__sha1_source(content, parts)
+        if self.use_mirror:
+            mirror = self.__load_mirror()
+            if mirror is not None:
+                self.loaded_from = self.mirror_filepath
+                self.__part_sha1s = self.__sha1_parts(mirror)
+                return mirror
+        loaded = self.__parse_parts(parts)
+        data: TvShowData = index
+        data["seasons"] = loaded[:-1]
+        data["dvds"] = loaded[-1]
+        self.__part_sha1s = self.__sha1_parts(data)
+        return data
+
+    def __read_parts(self, paths: list[str]) -> list[bytes]:
+        parts: list[bytes] = []
+        for path in paths:
+            with open(self.__part_filepath(path), "rb") as f:
+                parts.append(f.read())
+        return parts
+
+    @staticmethod
+    def __parse_parts(parts: list[bytes]) -> list[typing.Any]:
+        """Parse the season files concurrently in forked worker processes.
+        The pure Python YAML parser holds the GIL, threads would not help."""
+        jobs = os.cpu_count() or 1
+        if jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return [Yaml.load(part) for part in parts]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(parts)),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            return list(executor.map(Yaml.load, parts))
+
+    @staticmethod
+    def __sha1_source(index: bytes, parts: list[bytes]) -> str:
+        """One SHA-1 over the index and all files it references, so that the
+        JSON mirror is invalidated by changing any of the files."""
+        sha1 = hashlib.sha1(index)
+        for part in parts:
+            sha1.update(part)
+        return sha1.hexdigest()
+
+    @staticmethod
+    def __sha1_data(data: typing.Any) -> str:
+        return hashlib.sha1(
+            json.dumps(data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def __split_paths(self, data: TvShowData) -> tuple[list[str], str]:
+        """``arte-360-reportage/season-01.yml`` … and
+        ``arte-360-reportage/dvds.yml``, relative to the index file"""
+        directory = os.path.splitext(os.path.basename(self.filepath))[0]
+        seasons = [
+            f"{directory}/season-{season['no']:02d}.yml" for season in data["seasons"]
+        ]
+        return seasons, f"{directory}/dvds.yml"
+
+    def __part_filepath(self, path: str) -> str:
+        return os.path.join(os.path.dirname(self.filepath), path)
+
+    @property
+    def source_filepaths(self) -> list[str]:
+        """The YAML file and, in the split layout, the season and DVD files
+        it references"""
+        if not self.split:
+            return [self.filepath]
+        return [self.__part_filepath(path) for path in self.__part_sha1s]
+
+    def __split_data(self, data: TvShowData) -> dict[str, typing.Any]:
+        """``{file path relative to the index: data}``, the index last"""
+        seasons, dvds = self.__split_paths(data)
+        parts: dict[str, typing.Any] = dict(zip(seasons, data["seasons"]))
+        parts[dvds] = data["dvds"]
+        index = dict(data)
+        index["seasons"] = seasons
+        index["dvds"] = dvds
+        parts[os.path.basename(self.filepath)] = index
+        return parts
+
+    def __sha1_parts(self, data: TvShowData) -> dict[str, str]:
+        return {
+            path: TvShow.__sha1_data(part)
+            for path, part in self.__split_data(data).items()
+        }
+
+    def __read_mirror_checksums(self) -> dict[str, str]:
+        """``{file name: SHA-1}``, empty if there is no checksum file"""
+        checksums: dict[str, str] = {}
+        try:
+            with open(self.mirror_checksum_filepath, "r") as f:
+                for line in f:
+                    fields = line.split(maxsplit=1)
+                    if len(fields) == 2:
+                        digest, name = fields
+                        checksums[name.strip()] = digest
+        except OSError:
+            pass
+        return checksums
+
+    def __load_mirror(self) -> TvShowData | None:
+        checksums = self.__read_mirror_checksums()
+        if not checksums:
+            return None
+        try:
+            with open(self.mirror_filepath, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        if checksums.get(os.path.basename(self.filepath)) != self.source_sha1:
+            return None
+        json_sha1 = hashlib.sha1(content).hexdigest()
+        if checksums.get(os.path.basename(self.mirror_filepath)) != json_sha1:
+            return None
+        self.saved_sha1 = json_sha1
+        return Utils.load_json(content)
+
+    @staticmethod
+    def __sha1_json(data: TvShowData) -> str:
+        """The SHA-1 of ``arte-360-reportage.json`` if it was exported from
+        this data."""
+        return hashlib.sha1(Utils.dump_json(data).encode()).hexdigest()
+
+    def __sha1_saved(self, json_sha1: str) -> str | None:
+        """The SHA-1 of the JSON export of the data as it is saved, ``None``
+        if the YAML file changed since it was loaded.
+
+        If the previous export was a mirror of the same YAML file and has the
+        same checksum as the new one, the saved data is unchanged. Otherwise
+        the YAML file is parsed again."""
+        checksums = self.__read_mirror_checksums()
+        if (
+            checksums.get(os.path.basename(self.filepath)) == self.source_sha1
+            and checksums.get(os.path.basename(self.mirror_filepath)) == json_sha1
+        ):
+            return json_sha1
+        saved = TvShow(self.filepath, use_mirror=False)
+        if saved.source_sha1 != self.source_sha1:
+            return None
+        return TvShow.__sha1_json(saved.export_data())
+
+    def __write_mirror_checksums(self, json_filepath: str) -> None:
+        """Mark the just written JSON export as mirror of the YAML file, but
+        only if it contains exactly the saved data. A JSON file exported
+        from changes that were not saved (for example with ``--dry-run``) is
+        not a mirror, an existing checksum file is removed."""
+        if not self.source_sha1 or self.filepath.endswith(".json"):
+            return
+        if os.path.abspath(json_filepath) != os.path.abspath(self.mirror_filepath):
+            return
+        with open(self.mirror_filepath, "rb") as f:
+            json_sha1 = hashlib.sha1(f.read()).hexdigest()
+        if not self.saved_sha1:
+            self.saved_sha1 = self.__sha1_saved(json_sha1)
+        if json_sha1 != self.saved_sha1:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.mirror_checksum_filepath)
+            return
+        Utils.write_text_file(
+            self.mirror_checksum_filepath,
+            f"{self.source_sha1}  {os.path.basename(self.filepath)}\n"
+            + f"{json_sha1}  {os.path.basename(self.mirror_filepath)}\n",
+        )
 
     def __generate_season_episodes(self) -> None:
         self.episodes: list[Episode] = []
@@ -1326,6 +4077,77 @@ class TvShow:
         for dvd_data in self.data["dvds"]:
             self.dvds.append(Dvd(dvd_data))
 
+    def reindex(self) -> None:
+        """Build the hash indexes of the external ids and the inverted
+        indexes. Has to be called again after ids, directors, topics,
+        continents, air dates or coordinates were changed."""
+        self.ids = {key: {} for key in TvShow.ID_KEYS}
+        self.id_collisions = {key: {} for key in TvShow.ID_KEYS}
+        self.inverted = {key: {} for key in TvShow.INVERTED_KEYS}
+        self.numbers = {}
+        self.number_collisions = {}
+        self.__spatial_index = None
+
+        def add(key: str, value: typing.Any, episode: Episode) -> None:
+            if value not in self.inverted[key]:
+                self.inverted[key][value] = []
+            self.inverted[key][value].append(episode)
+
+        for episode in self.episodes:
+            number = (episode.season_no, episode.episode_no)
+            if number in self.numbers:
+                if number not in self.number_collisions:
+                    self.number_collisions[number] = [self.numbers[number]]
+                self.number_collisions[number].append(episode)
+            else:
+                self.numbers[number] = episode
+            for key in TvShow.ID_KEYS:
+                value = episode.data.get(key)
+                if not value:
+                    continue
+                if value in self.ids[key]:
+                    collisions = self.id_collisions[key]
+                    if value not in collisions:
+                        collisions[value] = [self.ids[key][value]]
+                    collisions[value].append(episode)
+                else:
+                    self.ids[key][value] = episode
+            for director in episode.directors:
+                add("director", director, episode)
+            if episode.data.get("topic"):
+                add("topic", episode.data["topic"], episode)
+            if episode.continent:
+                add("continent", episode.continent, episode)
+            if episode.air_date:
+                add("year", episode.year, episode)
+
+    def get_episode_by(self, key: str, value: typing.Any) -> Episode | None:
+        """Look up an episode by an external id (see ``ID_KEYS``). On
+        collisions the first episode is returned."""
+        return self.ids[key].get(value)
+
+    def get_episodes_by(self, key: str, value: typing.Any) -> list[Episode]:
+        """All episodes of a director, topic, continent or year (see
+        ``INVERTED_KEYS``)."""
+        return self.inverted[key].get(value, [])
+
+    def get_episode_by_number(
+        self, season_no: int, episode_no: int
+    ) -> Episode | None:
+        """On collisions the first episode is returned."""
+        return self.numbers.get((season_no, episode_no))
+
+    def print_id_collisions(self) -> None:
+        def print_collision(key: str, value: str, episodes: list[Episode]) -> None:
+            titles = " <> ".join([f"{e.overall_no} {e.title}" for e in episodes])
+            print(f"{key} {termcolor.colored(value, color='red')}: {titles}")
+
+        for key, collisions in self.id_collisions.items():
+            for value, episodes in collisions.items():
+                print_collision(key, str(value), episodes)
+        for (season_no, episode_no), episodes in self.number_collisions.items():
+            print_collision("number", f"S{season_no:02}E{episode_no:02}", episodes)
+
     def __generate_title_list(self) -> dict[str, int]:
         titles: dict[str, int] = {}
         for episode in self.episodes:
@@ -1339,15 +4161,30 @@ class TvShow:
                 titles[episode.title_en] = index
         return titles
 
+    def __generate_title_keys(self) -> dict[str, int]:
+        """The first episode wins if two title variants have the same key."""
+        keys: dict[str, int] = {}
+        for title, index in self.titles.items():
+            keys.setdefault(Utils.title_key(title), index)
+        return keys
+
     def get_episode_by_title(
         self, title: str | None, debug: bool = False
     ) -> Episode | None:
         if not title:
             return None
-        found: list[str] = difflib.get_close_matches(title, self.titles.keys(), n=1)
         episode = None
-        if len(found) > 0:
-            episode = self.episodes[self.titles[found[0]]]
+        index = self.titles.get(title)
+        if index is None:
+            index = self.title_keys.get(Utils.title_key(title))
+        if index is not None:
+            episode = self.episodes[index]
+        else:
+            found: list[str] = difflib.get_close_matches(
+                title, self.titles.keys(), n=1
+            )
+            if len(found) > 0:
+                episode = self.episodes[self.titles[found[0]]]
 
         if debug:
             if not episode:
@@ -1359,7 +4196,56 @@ class TvShow:
 
         return episode
 
-    def generate_wikitext(self, language: typing.Literal["de", "fr"] = "de") -> None:
+    def episodes_near(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None = None,
+        k: int | None = None,
+    ) -> list[tuple[Episode, float]]:
+        """Episodes within ``radius_km`` and/or the ``k`` nearest episodes
+        together with their distance in km, the nearest first."""
+        if self.__spatial_index:
+            profiler.count("cache_hits")
+        else:
+            located: list[Episode] = []
+            positions: list[tuple[float, float]] = []
+            for episode in self.episodes:
+                if episode.coordinates:
+                    located.append(episode)
+                    positions.append(
+                        (episode.coordinates[0], episode.coordinates[1])
+                    )
+            self.__spatial_index = (SpatialIndex(positions), located)
+        index, located = self.__spatial_index
+
+        found: list[tuple[int, float]]
+        if radius_km is not None:
+            found = index.within(latitude, longitude, radius_km)
+            if k is not None:
+                found = found[:k]
+        else:
+            found = index.nearest(latitude, longitude, k if k is not None else 10)
+        return [(located[i], distance) for i, distance in found]
+
+    def generate_wikitext(
+        self,
+        language: typing.Literal["de", "fr"] = "de",
+        budget: float | None = None,
+    ) -> None:
+        Utils.write_text_file(
+            f"{EXPORT_FILENAME}_wiki-{language}.wikitext",
+            self.render_wikitext(language, budget),
+        )
+
+    def render_wikitext(
+        self,
+        language: typing.Literal["de", "fr"] = "de",
+        budget: float | None = None,
+    ) -> list[str]:
+        """One entry per season. If ``budget`` is given, seasons are rendered
+        with cheaper markup until the estimated expansion cost of the page is
+        at most this fraction of the template limits."""
         episode_entries: list[str] = []
         season_entries: list[str] = []
 
@@ -1369,6 +4255,7 @@ class TvShow:
         else:
             Template = typing.cast(WikiTemplate, DeWiki)
 
+        profiler.count("episodes", len(self.episodes))
         for season in self.seasons:
             episode_entries = []
             for episode in season.episodes:
@@ -1377,9 +4264,18 @@ class TvShow:
                 Template.season(season=season, episode_entries=episode_entries)
             )
 
-        Utils.write_text_file(
-            f"{EXPORT_FILENAME}_wiki-{language}.wikitext", season_entries
-        )
+        if language == "de" and budget:
+
+            def fallback(index: int) -> str:
+                season = self.seasons[index]
+                return DeWiki.season_plain(
+                    season, [DeWiki.episode_plain(e) for e in season.episodes]
+                )
+
+            season_entries = WikitextCostEstimator().fit(
+                season_entries, fallback, budget
+            )
+        return season_entries
 
     def list_directors(self) -> dict[str, int]:
         @dataclass
@@ -1389,21 +4285,11 @@ class TvShow:
 
         result: dict[str, int] = {}
         directors: list[Director] = []
-        for episode in self.episodes:
-            episode.director
-            for director in episode.directors:
-                if director in result:
-                    result[director] += 1
-                else:
-                    result[director] = 1
+        for name in sorted(self.inverted["director"]):
+            result[name] = len(self.inverted["director"][name])
+            print(name, result[name])
+            directors.append(Director(name, result[name]))
 
-        director_names = list(result.keys())
-        director_names.sort()
-        for director in director_names:
-            print(director, result[director])
-
-        for name, count in result.items():
-            directors.append(Director(name, count))
         directors.sort(key=operator.attrgetter("count"))
         for d in directors:
             print(d.name, d.count)
@@ -1413,17 +4299,41 @@ class TvShow:
     def generate_wikitext_dvd(
         self, language: typing.Literal["de", "fr"] = "de"
     ) -> None:
+        Utils.write_text_file(
+            f"{EXPORT_FILENAME}_wiki_de_DVD.wikitext", self.render_wikitext_dvd()
+        )
+
+    def render_wikitext_dvd(self) -> str:
         dvd_entries: list[str] = []
 
         for dvd in self.dvds:
             dvd_entries.append(WikiDvd.dvd(dvd=dvd))
 
+        return Wiki.unordered_list(dvd_entries)
+
+    def generate_kartographer(
+        self,
+        precision: int | None = None,
+        coordinate_precision: int | None = COORDINATE_PRECISION,
+        budget: int | None = KARTOGRAPHER_BUDGET,
+    ) -> None:
         Utils.write_text_file(
-            f"{EXPORT_FILENAME}_wiki_de_DVD.wikitext", Wiki.unordered_list(dvd_entries)
+            f"{EXPORT_FILENAME}_wiki_kartographer.wikitext",
+            self.render_kartographer(precision, coordinate_precision, budget),
         )
 
-    def generate_kartographer(self) -> None:
+    def render_kartographer(
+        self,
+        precision: int | None = None,
+        coordinate_precision: int | None = COORDINATE_PRECISION,
+        budget: int | None = KARTOGRAPHER_BUDGET,
+    ) -> str:
         """
+        Episodes with the same coordinates (or the same geohash cell of the
+        given ``precision``) are merged into one feature. The features are
+        written minified and are kept within ``budget`` bytes, see
+        ``CompactGeoJson``.
+
         https://www.mediawiki.org/wiki/Help:Extension:Kartographer
 
         {
@@ -1444,63 +4354,103 @@ class TvShow:
             }
         }
         """
-        features: list[typing.Any] = []
-        for episode in self.episodes:
-            if episode.coordinates:
-                feature: dict[str, typing.Any] = {
-                    "type": "Feature",
-                    "properties": {
-                        # "marker-symbol": "circle", # https://www.mediawiki.org/wiki/Help:Extension:Kartographer/Icons
-                        "marker-color": episode.continent_color,
-                        "marker-size": "small",
-                        "title": episode.title,
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [episode.coordinates[1], episode.coordinates[0]],
-                    },
-                }
-                if episode.youtube_url:
-                    feature["properties"]["description"] = episode.generate_map_popup(
-                        Wiki(), include_title=False, full=False
-                    )
-                features.append(feature)
-        json_dump: str = Utils.dump_json(features)
+        profiler.count("episodes", len(self.episodes))
+        # "marker-symbol": "circle", # https://www.mediawiki.org/wiki/Help:Extension:Kartographer/Icons
+        json_dump: str = CompactGeoJson(
+            MapLocation.group(self.episodes, precision), coordinate_precision, budget
+        ).dump()
         template: str = Utils.read_text_file(".kartographer.wikitext")
-        template = template.replace('"features": []', f'"features": {json_dump}')
-        Utils.write_text_file(f"{EXPORT_FILENAME}_wiki_kartographer.wikitext", template)
+        return template.replace('"features": []', f'"features": {json_dump}')
+
+    def generate_leaflet(self, precision: int | None = None) -> None:
+        """Write ``karte.html`` with a lean marker array ``[latitude,
+        longitude, color, [overall_no, ...]]``. Episodes with the same
+        coordinates (or the same geohash cell of the given ``precision``)
+        share one marker. The HTML popups are written minified into chunk
+        scripts (``karte/popups-<no>.js``) and are only loaded when a marker
+        is clicked. Scripts instead of JSON files, because ``fetch()`` is
+        blocked when ``karte.html`` is opened as a ``file://`` page."""
+        profiler.count("episodes", len(self.episodes))
+        locations = MapLocation.group(self.episodes, precision)
+        chunks: dict[int, dict[int, str]] = {}
+        for location in locations:
+            for episode in location.episodes:
+                chunk_no: int = episode.overall_no // LEAFLET_POPUP_CHUNK_SIZE
+                if chunk_no not in chunks:
+                    chunks[chunk_no] = {}
+                chunks[chunk_no][episode.overall_no] = episode.generate_map_popup(
+                    Html(), True
+                )
 
-    def generate_leaflet(self) -> None:
-        marker: list[typing.Any] = []
-        for episode in self.episodes:
-            if episode.coordinates:
-                marker_data = {
-                    "coordinates": episode.coordinates,
-                    "popup": episode.generate_map_popup(Html(), True),
-                    "color": episode.continent_color,
-                }
-                marker.append(marker_data)
-        json_dump: str = Utils.dump_json(marker)
+        pathlib.Path(LEAFLET_POPUP_DIR).mkdir(exist_ok=True)
+        written: set[str] = set()
+        for chunk_no, popups in chunks.items():
+            path = f"{LEAFLET_POPUP_DIR}/popups-{chunk_no}.js"
+            Utils.write_text_file(path, TvShow.render_popup_chunk(chunk_no, popups))
+            written.add(path)
+        for path in pathlib.Path(LEAFLET_POPUP_DIR).glob("popups-*"):
+            if path.as_posix() not in written:
+                path.unlink()
+
+        Utils.write_text_file("karte.html", self.render_leaflet(locations))
+
+    @staticmethod
+    def render_popup_chunk(chunk_no: int, popups: dict[int, str]) -> str:
+        """``popupChunkLoaded(3, {"150": "<b>…</b>", …})``"""
+        return f"popupChunkLoaded({chunk_no},{Utils.dump_json(popups, minify=True)})"
+
+    def render_leaflet(
+        self,
+        locations: list[MapLocation],
+        popup_dir: str = LEAFLET_POPUP_DIR,
+        popup_chunk_size: int = LEAFLET_POPUP_CHUNK_SIZE,
+    ) -> str:
+        markers: list[typing.Any] = []
+        for location in locations:
+            markers.append(
+                [
+                    location.coordinates[0],
+                    location.coordinates[1],
+                    location.color,
+                    [episode.overall_no for episode in location.episodes],
+                ]
+            )
+        json_dump: str = Utils.dump_json(markers, minify=True)
         template: str = Utils.read_text_file(".leaflet.html")
         template = template.replace(
             "const markers = []", f"const markers = {json_dump}"
         )
-        Utils.write_text_file("karte.html", template)
+        template = template.replace(
+            "const popupChunkSize = 1",
+            f"const popupChunkSize = {popup_chunk_size}",
+        )
+        return template.replace(
+            "const popupDir = '.'", f"const popupDir = '{popup_dir}'"
+        )
 
-    def show_missing_value(self, key: str) -> None:
-        for episode in self.episodes:
-            if not getattr(episode, key):
-                print(episode.title)
+    def show_missing_value(self, expression: str) -> None:
+        """Print the episodes in which all fields of a comma separated list
+        are missing, fields with a leading ``+`` have to be present instead,
+        see ``CompletenessReport.select``."""
+        report = CompletenessReport(self.episodes)
+        for episode in report.episodes_of(report.select(expression)):
+            print(episode.title)
+
+    def report_completeness(self, file_path: str) -> None:
+        report = CompletenessReport(self.episodes)
+        report.print_matrix()
+        report.write_json(file_path)
 
     def generate_summary_texts(self, inline: bool = False) -> None:
         descriptions: list[str] = []
 
-        task_text = "Fasse folgenden Text auf Deutsch in 75 Wörtern zusammen"
+        task_text = SUMMARY_TASK
 
         def add_line(line: str) -> None:
             descriptions.append(line)
             descriptions.append("")
 
+        profiler.count("episodes", len(self.episodes))
         for episode in self.episodes:
             if not episode.summary and episode.description_plain:
                 add_line("-" * 72)
@@ -1513,9 +4463,26 @@ class TvShow:
 
         Utils.write_text_file(EXPORT_FILENAME + "_summary.txt", descriptions)
 
+    def generate_summary_batches(self, budget: int) -> None:
+        SummaryBatches(self.episodes, budget).write()
+
+    def run_summary_batches(self, summariser: Summariser) -> None:
+        batches = SummaryBatches(self.episodes)
+        count = batches.run(summariser, self.export_to_yaml)
+        print(f"{count} summaries imported, {len(batches.pending)} batches pending")
+
+    def import_summaries(self, file_paths: list[str]) -> None:
+        batches = SummaryBatches(self.episodes)
+        count: int = 0
+        for file_path in file_paths:
+            count += batches.merge(Utils.read_text_file(file_path))
+        print(f"{count} summaries imported, {len(batches.pending)} batches pending")
+        self.export_to_yaml()
+
     def add_coordinates(self) -> None:
         wikidata = Wikidata()
 
+        profiler.count("episodes", len(self.episodes))
         for episode in self.episodes:
             if (
                 episode.location_wikidata
@@ -1526,11 +4493,13 @@ class TvShow:
                     episode.location_wikidata
                 )
 
-        tv_show.export_to_yaml()
+        self.reindex()
+        self.export_to_yaml()
 
     def export_data(self) -> TvShowData:
-        data: TvShowData = self.__load()
+        data = typing.cast(TvShowData, dict(self.data))
 
+        profiler.count("episodes", len(self.episodes))
         seasons: list[SeasonData] = []
         for season in self.seasons:
             seasons.append(season.export_data())
@@ -1547,15 +4516,141 @@ class TvShow:
         return data
 
     def export_to_yaml(self, filepath: str | None = None):
+        """Save the data to the YAML file it was loaded from, or to another
+        single YAML file. In the split layout only the files whose data
+        changed since loading or last saving are written."""
         if not filepath:
-            filepath = EXPORT_FILENAME + ".yml"
-        Yaml.save(filepath, self.export_data())
+            filepath = self.filepath
+        data = self.export_data()
+        if filepath != self.filepath:
+            Yaml.save(filepath, data)
+            return
+        if self.split:
+            self.__export_split(data)
+        else:
+            Yaml.save(filepath, data)
+            with open(filepath, "rb") as f:
+                self.source_sha1 = hashlib.sha1(f.read()).hexdigest()
+        self.saved_sha1 = TvShow.__sha1_json(data)
+
+    def __export_split(self, data: TvShowData) -> None:
+        parts = self.__split_data(data)
+        written: list[str] = []
+        for path, data in parts.items():
+            sha1 = TvShow.__sha1_data(data)
+            filepath = self.__part_filepath(path)
+            if self.__part_sha1s.get(path) == sha1 and os.path.exists(filepath):
+                continue
+            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+            Yaml.save(filepath, data)
+            self.__part_sha1s[path] = sha1
+            written.append(path)
+        profiler.count("yaml_files_written", len(written))
+        # Seasons that were removed or renumbered leave their files behind.
+        for path in list(self.__part_sha1s):
+            if path not in parts:
+                del self.__part_sha1s[path]
+        names = {os.path.basename(path) for path in parts}
+        directory = pathlib.Path(self.__part_filepath(list(parts)[-2])).parent
+        for obsolete in directory.glob("season-*.yml"):
+            if obsolete.name not in names:
+                obsolete.unlink()
+        with open(self.filepath, "rb") as f:
+            index = f.read()
+        self.source_sha1 = TvShow.__sha1_source(
+            index, self.__read_parts(list(parts)[:-1])
+        )
+
+    def convert_layout(self, split: bool) -> None:
+        """Migrate between the single YAML file and the split layout:
+
+        * ``arte-360-reportage.yml``: the index with all keys except the
+          seasons and DVDs, which are replaced by file names
+        * ``arte-360-reportage/season-01.yml`` …: one file per season
+        * ``arte-360-reportage/dvds.yml``: the DVDs
+
+        Converting back to a single file removes the season and DVD files."""
+        if split == self.split:
+            return
+        data = self.export_data()
+        obsolete = list(self.__split_data(data))[:-1]
+        self.split = split
+        self.__part_sha1s = {}
+        self.export_to_yaml()
+        if split:
+            return
+        for path in obsolete:
+            filepath = self.__part_filepath(path)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        with contextlib.suppress(OSError):
+            os.rmdir(os.path.dirname(self.__part_filepath(obsolete[0])))
 
     def export_to_json(self) -> None:
         Utils.write_json_file(EXPORT_FILENAME + ".json", self.export_data())
+        self.__write_mirror_checksums(EXPORT_FILENAME + ".json")
+
+    def export_to_json_variants(self) -> None:
+        """Export the data once and write it as
+
+        * ``arte-360-reportage.json``: indented
+        * ``arte-360-reportage.min.json``: minified
+        * ``arte-360-reportage.min.json.gz``: minified, gzip compressed
+        * ``arte-360-reportage.min.json.br``: minified, brotli compressed
+          (only if the ``brotli`` package is installed)
+        * ``arte-360-reportage.ndjson``: one episode per line
+
+        and print the size and the duration of each variant."""
+        data = self.export_data()
+
+        # Serialize every episode only once. The episodes are replaced by
+        # placeholders in the small remainder of the data and the indented
+        # and minified pieces are put in their place afterwards.
+        indented: list[str] = []
+        minified: list[str] = []
+        for season in data["seasons"]:
+            placeholders: list[str] = []
+            for episode in season["episodes"]:
+                piece = Utils.dump_json(episode)
+                indented.append(piece)
+                minified.append(Utils.minify_json(piece))
+                placeholders.append(f"\0{len(indented) - 1}")
+            season["episodes"] = typing.cast(list[EpisodeData], placeholders)
+
+        def assemble(skeleton: str, pieces: list[str]) -> bytes:
+            def replace(match: re.Match[str]) -> str:
+                indentation = match.group(1) or ""
+                piece = pieces[int(match.group(2))]
+                return indentation + piece.replace("\n", indentation)
+
+            return re.sub(r'(\n *)?"\\u0000(\d+)"', replace, skeleton).encode()
+
+        def write(suffix: str, produce: typing.Callable[[], bytes]) -> bytes:
+            start = time.perf_counter()
+            content = produce()
+            Utils.write_binary_file(EXPORT_FILENAME + suffix, content)
+            duration = time.perf_counter() - start
+            print(
+                f"{EXPORT_FILENAME + suffix:<32} {len(content):>10} bytes "
+                + f"{duration * 1000:8.1f} ms"
+            )
+            return content
+
+        write(".json", lambda: assemble(Utils.dump_json(data), indented))
+        self.__write_mirror_checksums(EXPORT_FILENAME + ".json")
+        minified_json = write(
+            ".min.json", lambda: assemble(Utils.dump_json(data, True), minified)
+        )
+        write(".min.json.gz", lambda: gzip.compress(minified_json, 9, mtime=0))
+        if brotli:
+            compress = brotli.compress
+            write(".min.json.br", lambda: compress(minified_json))
+        write(".ndjson", lambda: "".join([m + "\n" for m in minified]).encode())
 
 
+load_start = time.perf_counter()
 tv_show = TvShow()
+load_duration = time.perf_counter() - load_start
 
 
 class WikiTemplate(abc.ABC):
@@ -1648,6 +4743,37 @@ class DeWiki(WikiTemplate):
             + "\n}}"
         )
 
+    @staticmethod
+    def episode_plain(episode: Episode) -> str:
+        """A table row without templates, see ``season_plain``."""
+        cells = [
+            str(episode.overall_no),
+            str(episode.episode_no),
+            episode.title + DeWiki.ref(episode),
+            episode.title_fr or "-",
+            episode.director or "-",
+            episode.air_date_german or "-",
+        ]
+        row = "|-\n| " + " || ".join(cells)
+        if episode.summary:
+            row += f'\n|-\n| colspan="6" | {episode.summary}'
+        return row
+
+    @staticmethod
+    def season_plain(season: Season, episode_entries: list[str]) -> str:
+        """The cheaper markup of a season: a plain table instead of
+        ``Episodenlistentabelle`` and ``Episodenlisteneintrag``, which does
+        not count against the template limits."""
+        return (
+            Wiki.heading(f"Staffel {season.no} ({season.year})", 2)
+            + "\n"
+            + '{| class="wikitable" style="width:100%"\n'
+            + "! Nr. (gesamt) !! Nr. (Staffel) !! Deutscher Titel"
+            + " !! Französischer Titel !! Regie !! Erstausstrahlung\n"
+            + "\n".join(episode_entries)
+            + "\n|}"
+        )
+
 
 class WikiDvd:
     @staticmethod
@@ -1717,6 +4843,198 @@ class FrWiki(WikiTemplate):
         )
 
 
+### wikitext cost #############################################################
+
+
+@dataclass
+class WikitextCost:
+    """Estimated values of the parser limit report of MediaWiki.
+
+    https://de.wikipedia.org/wiki/Hilfe:Vorlagenbeschr%C3%A4nkungen"""
+
+    post_expand_include_size: int = 0
+    """Bytes of the output of all transclusions, nested ones counted again in
+    the output of the enclosing template"""
+
+    template_argument_size: int = 0
+    """Bytes of all template arguments after their expansion"""
+
+    node_count: int = 0
+    """Preprocessor visited node count"""
+
+    LIMITS: typing.ClassVar[dict[str, int]] = {
+        "post_expand_include_size": 2_097_152,
+        "template_argument_size": 2_097_152,
+        "node_count": 1_000_000,
+    }
+
+    def __add__(self, other: WikitextCost) -> WikitextCost:
+        return WikitextCost(
+            self.post_expand_include_size + other.post_expand_include_size,
+            self.template_argument_size + other.template_argument_size,
+            self.node_count + other.node_count,
+        )
+
+    def usage(self) -> dict[str, float]:
+        """Fraction of each limit, for example ``{"node_count": 0.42, …}``"""
+        return {
+            key: getattr(self, key) / limit
+            for key, limit in WikitextCost.LIMITS.items()
+        }
+
+    @property
+    def max_usage(self) -> float:
+        return max(self.usage().values())
+
+
+class WikitextCostEstimator:
+    """Estimate the expansion cost of generated wikitext without a wiki.
+
+    The wikitext is parsed into template calls (``{{Name|key=value}}``),
+    the output of a template is estimated as its expanded arguments plus the
+    size of the markup the template itself adds (``TEMPLATE_OUTPUT``,
+    measured on de.wikipedia.org)."""
+
+    TEMPLATE_OUTPUT: dict[str, int] = {
+        "Episodenlisteneintrag": 1300,
+        "Episodenlisteneintrag2": 1600,
+        "Episodenlistentabelle": 1500,
+        "Internetquelle": 400,
+    }
+    """Bytes of markup a template adds to its arguments"""
+
+    DEFAULT_TEMPLATE_OUTPUT = 500
+
+    EXTENSION_TAG = re.compile(r"<(ref|nowiki|references)\b")
+
+    def estimate(self, text: str) -> WikitextCost:
+        cost, _ = self.__expand(text)
+        return cost
+
+    BRACES = re.compile(r"\{\{|\}\}")
+
+    PART_TOKENS = re.compile(r"\{\{|\[\[|\}\}|\]\]|\|")
+
+    def __split_templates(self, text: str) -> list[str | list[str]]:
+        """Split into plain text and template calls. A template call is the
+        list of its parts (name and arguments) split at the pipes outside of
+        nested templates and links."""
+        result: list[str | list[str]] = []
+        depth = 0
+        start = 0
+        plain_start = 0
+        for match in WikitextCostEstimator.BRACES.finditer(text):
+            if match.group() == "{{":
+                if depth == 0:
+                    if match.start() > plain_start:
+                        result.append(text[plain_start : match.start()])
+                    start = match.end()
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+                if depth == 0:
+                    result.append(
+                        WikitextCostEstimator.__split_parts(text[start : match.start()])
+                    )
+                    plain_start = match.end()
+        if plain_start < len(text):
+            result.append(text[plain_start:])
+        return result
+
+    @staticmethod
+    def __split_parts(inner: str) -> list[str]:
+        parts: list[str] = []
+        depth = 0
+        start = 0
+        for match in WikitextCostEstimator.PART_TOKENS.finditer(inner):
+            token = match.group()
+            if token in ("{{", "[["):
+                depth += 1
+            elif token in ("}}", "]]"):
+                if depth > 0:
+                    depth -= 1
+            elif depth == 0:
+                parts.append(inner[start : match.start()])
+                start = match.end()
+        parts.append(inner[start:])
+        return parts
+
+    def __expand(self, text: str) -> tuple[WikitextCost, int]:
+        """The cost and the size of the expanded text."""
+        cost = WikitextCost()
+        size = 0
+        for item in self.__split_templates(text):
+            if isinstance(item, str):
+                size += len(item.encode())
+                cost.node_count += 1 + 2 * len(
+                    WikitextCostEstimator.EXTENSION_TAG.findall(item)
+                )
+                continue
+            name = item[0].strip()
+            output = WikitextCostEstimator.TEMPLATE_OUTPUT.get(
+                name, WikitextCostEstimator.DEFAULT_TEMPLATE_OUTPUT
+            )
+            # template, title and one part, name and value node per argument
+            cost.node_count += 2 + 3 * (len(item) - 1)
+            for argument in item[1:]:
+                inner, argument_size = self.__expand(argument)
+                cost = cost + inner
+                cost.template_argument_size += argument_size
+                output += argument_size
+            cost.post_expand_include_size += output
+            size += output
+        return cost, size
+
+    def report(self, pages: dict[str, list[str]]) -> None:
+        """Print the usage of the limits of each page, the pages are given
+        as lists of seasons."""
+        for name, seasons in pages.items():
+            cost = self.estimate("\n".join(seasons))
+            usage = " ".join(
+                [f"{key} {value * 100:5.1f} %" for key, value in cost.usage().items()]
+            )
+            color = "red" if cost.max_usage > 1 else None
+            print(termcolor.colored(f"{name:<10} {usage}", color=color))
+            print(
+                f"{'':<10} {cost.post_expand_include_size:>12} bytes "
+                + f"{cost.template_argument_size:>12} bytes "
+                + f"{cost.node_count:>10} nodes"
+            )
+
+    def fit(
+        self,
+        seasons: list[str],
+        fallback: typing.Callable[[int], str],
+        budget: float = 0.9,
+    ) -> list[str]:
+        """Replace seasons by their cheaper markup (``fallback(index)``), the
+        most expensive first, until the page uses at most ``budget`` of every
+        limit."""
+        costs = [self.estimate(season) for season in seasons]
+        total = WikitextCost()
+        for cost in costs:
+            total = total + cost
+        result = list(seasons)
+        order = sorted(
+            range(len(seasons)), key=lambda i: costs[i].max_usage, reverse=True
+        )
+        for i in order:
+            if total.max_usage <= budget:
+                break
+            result[i] = fallback(i)
+            cheaper = self.estimate(result[i])
+            total = WikitextCost(
+                total.post_expand_include_size
+                - costs[i].post_expand_include_size
+                + cheaper.post_expand_include_size,
+                total.template_argument_size
+                - costs[i].template_argument_size
+                + cheaper.template_argument_size,
+                total.node_count - costs[i].node_count + cheaper.node_count,
+            )
+        return result
+
+
 ### actions ###################################################################
 
 
@@ -1725,6 +5043,7 @@ def tmp() -> None:
 
 
 def scrape() -> None:
+    profiler.count("episodes", len(tv_show.episodes))
     for episode in tv_show.episodes:
         if episode.fernsehserien_url:
             scrapper = FernsehserienScraper(episode.fernsehserien_url)
@@ -1741,7 +5060,23 @@ def scrape() -> None:
         tv_show.export_to_yaml()
 
 
-def generate_readme() -> None:
+def print_episodes_near(
+    latitude: float,
+    longitude: float,
+    radius_km: float | None = None,
+    k: int | None = None,
+) -> None:
+    for episode, distance in tv_show.episodes_near(latitude, longitude, radius_km, k):
+        print(
+            f"{distance:8.1f} km  s{episode.season_no:02}e{episode.episode_no:02} {episode.title}"
+        )
+
+
+def generate_readme(show: TvShow | None = None) -> None:
+    Utils.write_text_file("README.md", render_readme(show))
+
+
+def render_readme(show: TvShow | None = None) -> str:
     #     header = """
     # # 360-geo-reportage
 
@@ -1768,6 +5103,8 @@ def generate_readme() -> None:
             title += f"<br>fr: *{episode.title_fr}*"
         if episode.title_en:
             title += f"<br>en: *{episode.title_en}*"
+        if episode.thumbnail:
+            title += "<br>" + tpl.image(episode.thumbnail, episode.title)
         return title
 
     def format_links(episode: Episode) -> str:
@@ -1793,36 +5130,895 @@ def generate_readme() -> None:
 
     rows: list[list[str]] = []
 
-    for episode in tv_show.episodes:
+    if not show:
+        show = tv_show
+
+    profiler.count("episodes", len(show.episodes))
+    for episode in show.episodes:
         rows.append(assemble_row(episode))
 
-    Utils.write_text_file(
-        "README.md",
-        tpl.table(
-            ["air_date", "title", "links"],
-            rows,
+    return tpl.table(
+        ["air_date", "title", "links"],
+        rows,
+    )
+
+
+OUTPUTS = (
+    "dvd",
+    "json",
+    "kartographer",
+    "leaflet",
+    "readme",
+    "wiki-de",
+    "wiki-fr",
+)
+"""Outputs that only read the data and are independent of each other"""
+
+
+@dataclass
+class RenderOptions:
+    """Settings of the outputs that can be changed on the command line"""
+
+    geohash_precision: int | None = None
+
+    wiki_budget: float | None = None
+
+    coordinate_precision: int | None = COORDINATE_PRECISION
+
+    kartographer_budget: int | None = KARTOGRAPHER_BUDGET
+
+    @staticmethod
+    def from_args(args: typing.Any) -> RenderOptions:
+        return RenderOptions(
+            args.geohash_precision,
+            args.wiki_budget,
+            args.coordinate_precision,
+            args.kartographer_budget,
+        )
+
+
+def render_output(name: str, options: RenderOptions | None = None) -> None:
+    if not options:
+        options = RenderOptions()
+    if name == "dvd":
+        tv_show.generate_wikitext_dvd()
+    elif name == "json":
+        tv_show.export_to_json()
+    elif name == "kartographer":
+        tv_show.generate_kartographer(
+            options.geohash_precision,
+            options.coordinate_precision,
+            options.kartographer_budget,
+        )
+    elif name == "leaflet":
+        SnapshotPipeline.assign_thumbnails(tv_show)
+        tv_show.generate_leaflet(options.geohash_precision)
+    elif name == "readme":
+        SnapshotPipeline.assign_thumbnails(tv_show)
+        generate_readme()
+    elif name == "wiki-de":
+        tv_show.generate_wikitext("de", options.wiki_budget)
+    elif name == "wiki-fr":
+        tv_show.generate_wikitext("fr", options.wiki_budget)
+    else:
+        raise Exception(f"Unknown output {name}")
+
+
+def render_outputs(
+    names: list[str], jobs: int = 1, options: RenderOptions | None = None
+) -> None:
+    """Render the outputs one after another or, if ``jobs`` is greater than
+    one, concurrently in a process pool. Forked workers share the already
+    loaded data of the parent process as a read-only snapshot."""
+    if jobs <= 1 or len(names) <= 1:
+        for name in names:
+            with profiler.phase(name):
+                render_output(name, options)
+        return
+
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    with profiler.phase("outputs"), concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, mp_context=context
+    ) as executor:
+        futures = [executor.submit(render_output, name, options) for name in names]
+        for future in futures:
+            future.result()
+
+
+### watch #####################################################################
+
+
+WATCHED_FILES: dict[str, tuple[str, ...]] = {
+    EXPORT_FILENAME + ".yml": OUTPUTS,
+    ".kartographer.wikitext": ("kartographer",),
+    ".leaflet.html": ("leaflet",),
+}
+"""``{watched file: outputs that depend on it}``"""
+
+
+def watched_files(show: TvShow) -> dict[str, tuple[str, ...]]:
+    """``WATCHED_FILES`` with absolute paths, in the split layout together
+    with the season and DVD files of ``show``"""
+    files = {os.path.abspath(path): outputs for path, outputs in WATCHED_FILES.items()}
+    for path in show.source_filepaths:
+        files[os.path.abspath(path)] = OUTPUTS
+    return files
+
+
+class FileWatcher:
+    """Wait for changes of some files, using inotify on Linux and polling
+    the modification times everywhere else.
+
+    The directories are watched instead of the files themselves, because
+    editors and ``AtomicWriter`` replace a file by renaming a new one over
+    it."""
+
+    # https://man7.org/linux/man-pages/man7/inotify.7.html
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    paths: list[str]
+
+    interval: float
+    """Seconds between two polls without inotify"""
+
+    __fd: int | None = None
+
+    __stats: dict[str, tuple[int, int] | None]
+
+    def __init__(self, paths: typing.Iterable[str], interval: float = 0.5) -> None:
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.interval = interval
+        self.__stats = {path: FileWatcher.__stat(path) for path in self.paths}
+        self.__fd = self.__init_inotify()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.__fd is not None
+
+    def __init_inotify(self) -> int | None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (AttributeError, OSError):
+            return None
+        fd: int = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = (
+            FileWatcher.IN_CLOSE_WRITE | FileWatcher.IN_MOVED_TO | FileWatcher.IN_CREATE
+        )
+        for directory in {os.path.dirname(path) for path in self.paths}:
+            if inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                os.close(fd)
+                return None
+        return fd
+
+    @staticmethod
+    def __stat(path: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def __read_inotify(self, timeout: float | None) -> set[str]:
+        """Collect the names of the inotify events. The event struct is
+        ``int wd; uint32_t mask, cookie, len; char name[len]``."""
+        assert self.__fd is not None
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if not readable:
+            return set()
+        buffer = os.read(self.__fd, 64 * 1024)
+        names: set[str] = set()
+        offset = 0
+        while offset < len(buffer):
+            _, _, _, length = struct.unpack_from("iIII", buffer, offset)
+            offset += 16
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            names.add(os.fsdecode(name))
+        return {path for path in self.paths if os.path.basename(path) in names}
+
+    def __poll(self, timeout: float | None) -> set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed: set[str] = set()
+            for path in self.paths:
+                stat = FileWatcher.__stat(path)
+                if stat != self.__stats[path]:
+                    self.__stats[path] = stat
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def __changes(self, timeout: float | None) -> set[str]:
+        if self.__fd is not None:
+            return self.__read_inotify(timeout)
+        return self.__poll(timeout)
+
+    def wait(self, debounce: float = 0.1) -> set[str]:
+        """Block until at least one file has changed and then until no more
+        changes arrive for ``debounce`` seconds. Return the changed paths."""
+        changed: set[str] = set()
+        while not changed:
+            changed = self.__changes(None)
+        while True:
+            more = self.__changes(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+
+def watch(
+    names: list[str], jobs: int = 1, options: RenderOptions | None = None
+) -> None:
+    """Keep the data loaded and render the outputs again each time one of
+    the YAML files or templates is saved. Only the outputs that depend on
+    the changed file are rendered."""
+    global tv_show
+    files = watched_files(tv_show)
+    watcher = FileWatcher(files)
+    method = "inotify" if watcher.uses_inotify else "polling"
+    print(f"Watching {len(files)} files ({method}), stop with Ctrl+C")
+    try:
+        while True:
+            changed = watcher.wait()
+            start = time.perf_counter()
+            affected: set[str] = set()
+            for path in changed:
+                affected.update(files.get(path, ()))
+            if changed & {os.path.abspath(p) for p in tv_show.source_filepaths}:
+                try:
+                    with profiler.phase("load"):
+                        tv_show = TvShow()
+                except Exception as e:
+                    print(termcolor.colored(f"Loading failed: {e}", color="red"))
+                    continue
+                # Seasons can have been added to or removed from the index.
+                if watched_files(tv_show) != files:
+                    files = watched_files(tv_show)
+                    watcher.close()
+                    watcher = FileWatcher(files)
+            selected = [name for name in names if name in affected]
+            render_outputs(selected, jobs, options)
+            names_changed = sorted(os.path.relpath(path) for path in changed)
+            print(
+                f"{', '.join(names_changed)} -> {', '.join(selected) or '-'} "
+                f"in {time.perf_counter() - start:.3f} s"
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+### serve #####################################################################
+
+
+class PreviewServer:
+    """A local HTTP server that renders the map, the README table and the
+    wikitext from the loaded data instead of from the written files.
+
+    The popups of the map are served one episode per request
+    (``/popups/popups-<overall_no>.js``). Every response carries an ETag.
+    When the YAML file or a template is saved, the data is reloaded and the
+    open pages are told to reload through server-sent events
+    (``/events``)."""
+
+    TEXTS: dict[str, typing.Callable[[TvShow, RenderOptions], str]] = {
+        "/README.md": lambda show, options: render_readme(show),
+        "/wiki-de.wikitext": lambda show, options: "\n".join(
+            show.render_wikitext("de", options.wiki_budget)
+        ),
+        "/wiki-fr.wikitext": lambda show, options: "\n".join(
+            show.render_wikitext("fr", options.wiki_budget)
+        ),
+        "/dvd.wikitext": lambda show, options: show.render_wikitext_dvd(),
+        "/kartographer.wikitext": lambda show, options: show.render_kartographer(
+            options.geohash_precision,
+            options.coordinate_precision,
+            options.kartographer_budget,
         ),
+    }
+
+    RELOAD_SCRIPT = (
+        "<script>new EventSource('/events').onmessage = () => "
+        "location.reload()</script>\n  </body>"
     )
 
+    port: int
+
+    options: RenderOptions
+
+    generation: int
+    """Incremented on each reload of the data or the templates"""
+
+    __changed: threading.Condition
+    """Guards ``generation``, the loaded data and ``__cache``"""
+
+    __cache: dict[str, tuple[str, bytes, str]]
+    """``{path: (content type, body, etag)}`` of the current generation"""
+
+    def __init__(self, port: int = 8000, options: RenderOptions | None = None) -> None:
+        self.port = port
+        self.options = options if options else RenderOptions()
+        self.generation = 0
+        self.__changed = threading.Condition()
+        self.__cache = {}
+
+    def render(self, path: str) -> tuple[str, bytes, str] | None:
+        """Return the content type, the body and the ETag of a path or
+        ``None`` if the path is unknown."""
+        with self.__changed:
+            cached = self.__cache.get(path)
+            if cached:
+                return cached
+            generation = self.generation
+            show = tv_show
+        content_type = "text/plain; charset=utf-8"
+        if path in ("/", "/karte.html"):
+            html = show.render_leaflet(
+                MapLocation.group(show.episodes, self.options.geohash_precision),
+                popup_dir="/popups",
+                popup_chunk_size=1,
+            )
+            body = html.replace("</body>", PreviewServer.RELOAD_SCRIPT, 1)
+            content_type = "text/html; charset=utf-8"
+        elif path in PreviewServer.TEXTS:
+            body = PreviewServer.TEXTS[path](show, self.options)
+        else:
+            match = re.fullmatch(r"/popups/popups-(\d+)\.js", path)
+            if not match:
+                return None
+            no = int(match.group(1))
+            if no < 1 or no > len(show.episodes):
+                return None
+            episode = show.episodes[no - 1]
+            body = TvShow.render_popup_chunk(
+                no, {no: episode.generate_map_popup(Html(), True)}
+            )
+            content_type = "text/javascript; charset=utf-8"
+        encoded = body.encode()
+        etag = f'"{hashlib.sha1(encoded).hexdigest()[:16]}"'
+        response = (content_type, encoded, etag)
+        with self.__changed:
+            # Rendered from the data of an older generation: serve it once,
+            # but do not cache it.
+            if generation == self.generation:
+                self.__cache[path] = response
+        return response
+
+    def reload(self, changed: set[str]) -> None:
+        """Load the data again if one of the ``changed`` paths (absolute) is
+        a file of it, and drop the cached renders in any case."""
+        global tv_show
+        show = tv_show
+        if changed & {os.path.abspath(path) for path in show.source_filepaths}:
+            show = TvShow()
+            SnapshotPipeline.assign_thumbnails(show)
+        with self.__changed:
+            tv_show = show
+            self.__cache = {}
+            self.generation += 1
+            self.__changed.notify_all()
+
+    def wait_for_reload(self, generation: int, timeout: float) -> bool:
+        with self.__changed:
+            return self.__changed.wait_for(
+                lambda: self.generation != generation, timeout
+            )
+
+    def __watch(self) -> None:
+        files = watched_files(tv_show)
+        watcher = FileWatcher(files)
+        while True:
+            changed = watcher.wait()
+            names = ", ".join(sorted(os.path.relpath(path) for path in changed))
+            try:
+                self.reload(changed)
+                print(f"Reloaded after saving {names}")
+            except Exception as e:
+                print(termcolor.colored(f"Reloading failed: {e}", color="red"))
+                continue
+            if watched_files(tv_show) != files:
+                files = watched_files(tv_show)
+                watcher.close()
+                watcher = FileWatcher(files)
+
+    def __handler(self) -> type[http.server.BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                path = self.path.split("?", 1)[0]
+                if path == "/events":
+                    return self.__send_events()
+                if path.startswith(f"/{SNAPSHOT_DIR}/"):
+                    return self.__send_file(urllib.parse.unquote(path[1:]))
+                response = server.render(path)
+                if not response:
+                    return self.send_error(404)
+                content_type, body, etag = response
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def __send_file(self, path: str) -> None:
+                if ".." in path.split("/") or not os.path.isfile(path):
+                    return self.send_error(404)
+                with open(path, "rb") as f:
+                    body = f.read()
+                content_type, _ = mimetypes.guess_type(path)
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", content_type or "application/octet-stream"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def __send_events(self) -> None:
+                """https://html.spec.whatwg.org/multipage/server-sent-events.html"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                generation = server.generation
+                try:
+                    while True:
+                        if server.wait_for_reload(generation, 15):
+                            self.wfile.write(b"data: reload\n\n")
+                            generation = server.generation
+                        else:
+                            self.wfile.write(b": keep-alive\n\n")
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format: str, *args: typing.Any) -> None:
+                pass
+
+        return Handler
+
+    def serve(self) -> None:
+        SnapshotPipeline.assign_thumbnails(tv_show)
+        threading.Thread(target=self.__watch, daemon=True).start()
+        httpd = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", self.port), self.__handler()
+        )
+        httpd.daemon_threads = True
+        print(f"Serving on http://127.0.0.1:{self.port}/, stop with Ctrl+C")
+        for path in PreviewServer.TEXTS:
+            print(f"  http://127.0.0.1:{self.port}{path}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+
+
+### benchmark #################################################################
+
+
+def benchmark_near(count: int = 100_000, queries: int = 100) -> None:
+    """Compare the k-d tree of ``TvShow.episodes_near`` with a linear
+    haversine scan on a synthetic catalogue of random positions."""
+    rng = random.Random(360)
+
+    def random_position() -> tuple[float, float]:
+        # uniformly distributed on the sphere
+        return (
+            math.degrees(math.asin(rng.uniform(-1, 1))),
+            rng.uniform(-180, 180),
+        )
+
+    positions = [random_position() for _ in range(count)]
+    targets = [random_position() for _ in range(queries)]
+
+    start = time.perf_counter()
+    index = SpatialIndex(positions)
+    print(f"build k-d tree ({count} points): {time.perf_counter() - start:.3f} s")
+
+    def linear_scan(latitude: float, longitude: float) -> list[tuple[int, float]]:
+        distances = [
+            (i, SpatialIndex.haversine(latitude, longitude, lat, lon))
+            for i, (lat, lon) in enumerate(positions)
+        ]
+        distances.sort(key=operator.itemgetter(1))
+        return distances
+
+    start = time.perf_counter()
+    linear_results = [linear_scan(lat, lon) for lat, lon in targets]
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    within_results = [index.within(lat, lon, 300) for lat, lon in targets]
+    within = time.perf_counter() - start
+
+    start = time.perf_counter()
+    nearest_results = [index.nearest(lat, lon, 10) for lat, lon in targets]
+    nearest = time.perf_counter() - start
+
+    for expected, radius_result, k_result in zip(
+        linear_results, within_results, nearest_results
+    ):
+        expected_within = [i for i, d in expected if d <= 300]
+        if [i for i, _ in radius_result] != expected_within:
+            raise Exception("Radius query differs from linear scan")
+        if [i for i, _ in k_result] != [i for i, _ in expected[:10]]:
+            raise Exception("Nearest query differs from linear scan")
+
+    print(f"linear scan:        {linear / queries * 1000:8.3f} ms per query")
+    print(f"k-d tree 300 km:    {within / queries * 1000:8.3f} ms per query")
+    print(f"k-d tree k=10:      {nearest / queries * 1000:8.3f} ms per query")
+
+
+def benchmark_write(factor: int = 20) -> None:
+    """Peak memory of the streaming writers compared with serializing the
+    whole export into one string first."""
+    data = tv_show.export_data()
+    seasons = data["seasons"]
+    data["seasons"] = [
+        typing.cast(SeasonData, json.loads(json.dumps(season)))
+        for _ in range(factor)
+        for season in seasons
+    ]
+    lines = Utils.dump_json(data).splitlines()
+
+    def measure(label: str, write: typing.Callable[[str], None]) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "export")
+            tracemalloc.start()
+            start = time.perf_counter()
+            write(file_path)
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size = os.path.getsize(file_path)
+        print(
+            f"{label:<28} {size / 1e6:7.1f} MB written, "
+            + f"peak {peak / 1e6:7.1f} MB, {duration:6.2f} s"
+        )
+
+    def json_in_memory(file_path: str) -> None:
+        with open(file_path, "w") as f:
+            f.write(Utils.dump_json(data))
+
+    def text_in_memory(file_path: str) -> None:
+        with open(file_path, "w") as f:
+            f.write("\n".join(lines))
+
+    measure("json: dumps + write", json_in_memory)
+    measure("json: streamed, atomic", lambda p: Utils.write_json_file(p, data))
+    measure("text: join + write", text_in_memory)
+    measure("text: streamed, atomic", lambda p: Utils.write_text_file(p, lines))
+
+
+class SyntheticCatalogue:
+    """Generate synthetic catalogues that are a multiple of the real one.
+
+    Every synthetic episode is a copy of a randomly picked real episode, so
+    the presence of the fields, their combinations and the lengths of the
+    texts follow the real distribution. Titles are recombined from the words
+    of real titles, the external ids are made unique and the coordinates
+    are jittered."""
+
+    data: TvShowData
+
+    words: list[str]
+
+    def __init__(self, data: TvShowData, seed: int = 360) -> None:
+        self.data = data
+        self.rng = random.Random(seed)
+        self.words = [
+            word
+            for season in data["seasons"]
+            for episode in season["episodes"]
+            for word in episode["title"].split()
+        ]
+
+    def __title(self) -> str:
+        return " ".join(self.rng.choices(self.words, k=self.rng.randint(2, 7)))
+
+    def __episode(self, template: EpisodeData, no: int) -> EpisodeData:
+        episode = typing.cast(
+            dict[str, typing.Any], json.loads(json.dumps(template))
+        )
+        episode["title"] = self.__title()
+        for key in ("title_fr", "title_en", "alias"):
+            if key in episode:
+                episode[key] = self.__title()
+        for key in (
+            "fernsehserien_episode_no",
+            "fernsehserien_episode_id",
+            "thetvdb_episode_id",
+        ):
+            if key in episode:
+                episode[key] = no
+        if "imdb_episode_id" in episode:
+            episode["imdb_episode_id"] = f"tt{90000000 + no}"
+        if "youtube_video_id" in episode:
+            episode["youtube_video_id"] = "".join(
+                self.rng.choices(
+                    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_",
+                    k=11,
+                )
+            )
+        if "coordinates" in episode:
+            latitude, longitude = episode["coordinates"]
+            episode["coordinates"] = [
+                max(-90.0, min(90.0, latitude + self.rng.uniform(-1, 1))),
+                (longitude + self.rng.uniform(-1, 1) + 180) % 360 - 180,
+            ]
+        return typing.cast(EpisodeData, episode)
+
+    def generate(self, factor: int) -> TvShowData:
+        templates: list[EpisodeData] = [
+            episode
+            for season in self.data["seasons"]
+            for episode in season["episodes"]
+        ]
+        data = typing.cast(
+            TvShowData, {key: value for key, value in self.data.items()}
+        )
+        seasons: list[SeasonData] = []
+        no: int = 1
+        for _ in range(factor):
+            for season in self.data["seasons"]:
+                episodes: list[EpisodeData] = []
+                for _ in season["episodes"]:
+                    episodes.append(self.__episode(self.rng.choice(templates), no))
+                    no += 1
+                seasons.append(
+                    {
+                        "no": len(seasons) + 1,
+                        "year": season["year"],
+                        "episodes": episodes,
+                    }
+                )
+        data["seasons"] = seasons
+        return data
+
+
+def benchmark_suite(
+    factors: list[int], baseline: str | None = None, title_queries: int = 20
+) -> None:
+    """Time loading, every generator, the title matching and the exports on
+    synthetic catalogues. The results are written to
+    ``benchmarks/<commit>.json``; with ``baseline`` the results are compared
+    with an earlier result file.
+
+    The factor 100 (about 95 000 episodes) takes hours with the pure Python
+    YAML parser and must be requested explicitly:
+    ``--benchmark-factors 1 10 100``."""
+    try:
+        commit: str | None = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    results: dict[str, typing.Any] = {
+        "commit": commit,
+        "date": date.today().isoformat(),
+        "catalogues": {},
+    }
+    catalogue = SyntheticCatalogue(tv_show.export_data())
+    cwd = os.getcwd()
+    for factor in factors:
+        timings: dict[str, float] = {}
+
+        def measure(name: str, run: typing.Callable[[], typing.Any]) -> typing.Any:
+            start = time.perf_counter()
+            result = run()
+            timings[name] = time.perf_counter() - start
+            print(f"{factor:>4}x {name:<24} {timings[name]:9.3f} s")
+            return result
+
+        with tempfile.TemporaryDirectory() as directory:
+            for template in (".leaflet.html", ".kartographer.wikitext"):
+                shutil.copy(template, directory)
+            os.chdir(directory)
+            try:
+                filepath = os.path.join(directory, f"{EXPORT_FILENAME}.yml")
+                Yaml.save(filepath, catalogue.generate(factor))
+                show: TvShow = measure("load", lambda: TvShow(filepath))
+
+                measure("wiki-de", lambda: show.generate_wikitext("de"))
+                measure("wiki-fr", lambda: show.generate_wikitext("fr"))
+                measure("dvd", lambda: show.generate_wikitext_dvd())
+                measure("kartographer", lambda: show.generate_kartographer())
+                measure("leaflet", lambda: show.generate_leaflet())
+                measure("readme", lambda: generate_readme(show))
+                measure("summary", lambda: show.generate_summary_texts(True))
+
+                rng = random.Random(factor)
+                queries = [
+                    episode.title.lower()[:-1]
+                    for episode in rng.sample(
+                        show.episodes, min(title_queries, len(show.episodes))
+                    )
+                ]
+                measure(
+                    "title-matching",
+                    lambda: [show.get_episode_by_title(q) for q in queries],
+                )
+                measure("export-json", lambda: show.export_to_json())
+                measure("export-yaml", lambda: show.export_to_yaml())
+            finally:
+                os.chdir(cwd)
+
+        results["catalogues"][str(factor)] = {
+            "episodes": len(show.episodes),
+            "title_queries": len(queries),
+            "timings": timings,
+        }
+
+    pathlib.Path("benchmarks").mkdir(exist_ok=True)
+    result_path = f"benchmarks/{commit if commit else 'results'}.json"
+    Utils.write_json_file(result_path, results)
+    print(f"Results written to {result_path}")
+
+    if baseline:
+        with open(baseline, "r") as f:
+            old = json.load(f)
+        for factor, entry in results["catalogues"].items():
+            if factor not in old["catalogues"]:
+                continue
+            old_timings = old["catalogues"][factor]["timings"]
+            for name, duration in entry["timings"].items():
+                if name in old_timings and old_timings[name] > 0:
+                    ratio = duration / old_timings[name]
+                    print(f"{factor:>4}x {name:<24} {ratio:6.2f}x of {old['commit']}")
+
 
 ### main ######################################################################
 
 
+def parse_enrich_base_url(value: str) -> tuple[str, str]:
+    """``SOURCE=URL`` of ``--enrich-base-url``"""
+    name, separator, url = value.partition("=")
+    if not separator or not url or name not in Enricher.SOURCES:
+        raise argparse.ArgumentTypeError(
+            f"expected SOURCE=URL with SOURCE one of {', '.join(Enricher.SOURCES)}"
+        )
+    return name, url
+
+
 def get_argument_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog=EXPORT_FILENAME)
+    # Both block until Ctrl+C, the preview server reloads by itself.
+    blocking = parser.add_mutually_exclusive_group()
     parser.add_argument("-a", "--all", action="store_true")
+    parser.add_argument("-B", "--benchmark", choices=("near", "suite", "write"))
+    parser.add_argument("--benchmark-baseline", metavar="JSON_FILE")
+    parser.add_argument(
+        "--benchmark-factors",
+        nargs="+",
+        type=int,
+        default=[1, 10],
+        metavar="FACTOR",
+    )
     parser.add_argument("-C", "--coordinates", action="store_true")
     parser.add_argument("-c", "--summary", action="store_true")
+    parser.add_argument(
+        "--completeness",
+        nargs="?",
+        const=EXPORT_FILENAME + "_completeness.json",
+        metavar="JSON_FILE",
+    )
+    parser.add_argument("--convert-layout", choices=("single", "split"))
+    parser.add_argument(
+        "--coordinate-precision",
+        type=int,
+        default=COORDINATE_PRECISION,
+        metavar="DIGITS",
+    )
     parser.add_argument("-D", "--directors", action="store_true")
     parser.add_argument("-d", "--dvd", action="store_true")
+    parser.add_argument("--diff", metavar="OLD_YAML_FILE")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--duplicates", nargs="?", type=float, const=0.5, metavar="THRESHOLD"
+    )
+    parser.add_argument(
+        "--enrich",
+        nargs="*",
+        choices=tuple(Enricher.SOURCES),
+        metavar="SOURCE",
+    )
+    parser.add_argument(
+        "--enrich-base-url",
+        action="append",
+        type=parse_enrich_base_url,
+        metavar="SOURCE=URL",
+        default=[],
+    )
+    parser.add_argument("-g", "--geohash-precision", type=int, metavar="PRECISION")
+    parser.add_argument("-i", "--id-collisions", action="store_true")
+    parser.add_argument(
+        "--imdb-import",
+        nargs="?",
+        const=".",
+        metavar="DIRECTORY",
+    )
+    parser.add_argument("-J", "--jobs", type=int, default=1, metavar="N")
     parser.add_argument("-j", "--json", action="store_true")
+    parser.add_argument("--json-variants", action="store_true")
     parser.add_argument("-k", "--kartographer", action="store_true")
+    parser.add_argument(
+        "--kartographer-budget",
+        type=int,
+        default=KARTOGRAPHER_BUDGET,
+        metavar="BYTES",
+    )
+    parser.add_argument("--kartographer-report", action="store_true")
     parser.add_argument("-l", "--leaflet", action="store_true")
-    parser.add_argument("-m", "--show-missing-value", metavar="KEY")
+    parser.add_argument("--limit", type=int, metavar="COUNT")
+    parser.add_argument("-m", "--show-missing-value", metavar="FIELDS")
+    parser.add_argument(
+        "-n", "--near", nargs=2, type=float, metavar=("LATITUDE", "LONGITUDE")
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        nargs="?",
+        const=EXPORT_FILENAME + "_profile.json",
+        metavar="JSON_FILE",
+    )
+    parser.add_argument(
+        "--phash", nargs="?", type=int, const=4, metavar="MAX_DISTANCE"
+    )
+    parser.add_argument("--profile-cprofile", action="store_true")
+    parser.add_argument("--profile-memory", action="store_true")
     parser.add_argument("-r", "--readme", action="store_true")
+    parser.add_argument("--radius", type=float, metavar="KM")
+    parser.add_argument("-S", "--snapshots", action="store_true")
     parser.add_argument("-s", "--scrape", action="store_true")
+    blocking.add_argument(
+        "--serve", nargs="?", const=8000, type=int, metavar="PORT"
+    )
+    parser.add_argument("--summary-budget", type=int, metavar="TOKENS")
+    parser.add_argument("--summary-import", nargs="+", metavar="ANSWER_FILE")
+    parser.add_argument("--summary-run", choices=tuple(SUMMARISERS))
     parser.add_argument("-t", "--tmp", action="store_true")
+    parser.add_argument("--thetvdb-import", nargs="+", metavar="JSON_FILE")
+    blocking.add_argument("-W", "--watch", action="store_true")
     parser.add_argument("-w", "--wiki", choices=("de", "fr"))
+    parser.add_argument(
+        "--wiki-budget",
+        nargs="?",
+        const=WIKI_BUDGET,
+        type=float,
+        metavar="FRACTION",
+    )
+    parser.add_argument("--wiki-cost", action="store_true")
     parser.add_argument("-y", "--yaml", action="store_true")
 
     return parser
@@ -1831,55 +6027,189 @@ def get_argument_parser() -> argparse.ArgumentParser:
 def main() -> None:
     args = get_argument_parser().parse_args()
 
+    if args.profile:
+        profiler.enabled = True
+        profiler.use_cprofile = args.profile_cprofile
+        profiler.use_tracemalloc = args.profile_memory
+        profiler.record("load", load_start, load_duration)
+
+    try:
+        run(args)
+    finally:
+        # Also after Ctrl+C, which ends --watch and --serve
+        if args.profile:
+            profiler.print_summary()
+            profiler.write(args.profile)
+
+
+def run(args: argparse.Namespace) -> None:
+    outputs: list[str] = []
+    options = RenderOptions.from_args(args)
+
     if args.all:
-        tv_show.add_coordinates()
-        tv_show.generate_summary_texts(True)
-        tv_show.generate_wikitext_dvd()
-        tv_show.export_to_json()
-        tv_show.generate_kartographer()
-        tv_show.generate_leaflet()
-        generate_readme()
-        tv_show.generate_wikitext("de")
-        tv_show.generate_wikitext("fr")
+        with profiler.phase("coordinates"):
+            tv_show.add_coordinates()
+        with profiler.phase("summary"):
+            tv_show.generate_summary_texts(True)
+        render_outputs(list(OUTPUTS), args.jobs, options)
+
+    if args.benchmark == "near":
+        benchmark_near()
+
+    if args.benchmark == "suite":
+        benchmark_suite(args.benchmark_factors, args.benchmark_baseline)
+
+    if args.benchmark == "write":
+        benchmark_write()
 
     if args.summary:
-        tv_show.generate_summary_texts(True)
+        with profiler.phase("summary"):
+            tv_show.generate_summary_texts(True)
+
+    if args.summary_budget:
+        with profiler.phase("summary-batches"):
+            tv_show.generate_summary_batches(args.summary_budget)
+
+    if args.summary_import:
+        with profiler.phase("summary-import"):
+            tv_show.import_summaries(args.summary_import)
+
+    if args.summary_run:
+        with profiler.phase("summary-run"):
+            tv_show.run_summary_batches(SUMMARISERS[args.summary_run]())
 
     if args.coordinates:
-        tv_show.add_coordinates()
+        with profiler.phase("coordinates"):
+            tv_show.add_coordinates()
+
+    if args.completeness:
+        with profiler.phase("completeness"):
+            tv_show.report_completeness(args.completeness)
+
+    if args.convert_layout:
+        with profiler.phase("convert-layout"):
+            tv_show.convert_layout(args.convert_layout == "split")
+
+    if args.diff:
+        with profiler.phase("diff-load"):
+            old_tv_show = TvShow(args.diff)
+        with profiler.phase("diff"):
+            DatasetDiff(old_tv_show, tv_show).print()
 
     if args.directors:
-        tv_show.list_directors()
+        with profiler.phase("directors"):
+            tv_show.list_directors()
+
+    if args.duplicates is not None:
+        with profiler.phase("duplicates"):
+            DuplicateDetector(tv_show.episodes).write_report(args.duplicates)
 
     if args.dvd:
-        tv_show.generate_wikitext_dvd()
+        outputs.append("dvd")
+
+    if args.id_collisions:
+        with profiler.phase("id-collisions"):
+            tv_show.print_id_collisions()
+
+    if args.enrich is not None:
+        with profiler.phase("enrich"):
+            Enricher(
+                tv_show,
+                args.enrich,
+                dict(args.enrich_base_url),
+            ).run(args.dry_run)
+
+    if args.imdb_import:
+        with profiler.phase("imdb-import"):
+            ImdbDataset(
+                ImdbDataset.series_id_from_url(tv_show.data["databases"]["imdb"]),
+                args.imdb_import,
+            ).import_ids(tv_show, args.dry_run)
 
     if args.json:
-        tv_show.export_to_json()
+        outputs.append("json")
+
+    if args.json_variants:
+        with profiler.phase("json-variants"):
+            tv_show.export_to_json_variants()
 
     if args.kartographer:
-        tv_show.generate_kartographer()
+        outputs.append("kartographer")
+
+    if args.kartographer_report:
+        with profiler.phase("kartographer-report"):
+            CompactGeoJson(
+                MapLocation.group(tv_show.episodes, options.geohash_precision),
+                options.coordinate_precision,
+                options.kartographer_budget,
+            ).report()
 
     if args.leaflet:
-        tv_show.generate_leaflet()
+        outputs.append("leaflet")
 
     if args.show_missing_value:
-        tv_show.show_missing_value(args.show_missing_value)
+        with profiler.phase("show-missing-value"):
+            tv_show.show_missing_value(args.show_missing_value)
+
+    if args.phash is not None:
+        with profiler.phase("phash"):
+            index = PerceptualHashIndex()
+            index.update(args.jobs)
+            index.print_conflicts(args.phash)
+
+    if args.near:
+        with profiler.phase("near"):
+            print_episodes_near(args.near[0], args.near[1], args.radius, args.limit)
 
     if args.readme:
-        generate_readme()
+        outputs.append("readme")
 
     if args.scrape:
-        scrape()
+        with profiler.phase("scrape"):
+            scrape()
+
+    if args.snapshots:
+        with profiler.phase("snapshots"):
+            SnapshotPipeline(tv_show).run(args.jobs)
+            SnapshotPipeline.assign_thumbnails(tv_show)
+
+    if args.thetvdb_import:
+        with profiler.phase("thetvdb-import"):
+            TheTvdbDump(
+                TheTvdbDump.series_id_from_url(tv_show.data["databases"]["thetvdb"]),
+                args.thetvdb_import,
+            ).import_ids(tv_show, args.dry_run)
 
     if args.tmp:
-        tmp()
+        with profiler.phase("tmp"):
+            tmp()
 
     if args.wiki:
-        tv_show.generate_wikitext(args.wiki)
+        outputs.append(f"wiki-{args.wiki}")
+
+    render_outputs(outputs, args.jobs, options)
+
+    if args.wiki_cost:
+        with profiler.phase("wiki-cost"):
+            budget = args.wiki_budget or WIKI_BUDGET
+            WikitextCostEstimator().report(
+                {
+                    "de": tv_show.render_wikitext("de"),
+                    f"de ({budget})": tv_show.render_wikitext("de", budget),
+                    "fr": tv_show.render_wikitext("fr"),
+                }
+            )
 
     if args.yaml:
-        tv_show.export_to_yaml()
+        with profiler.phase("yaml"):
+            tv_show.export_to_yaml()
+
+    # Both block until Ctrl+C and therefore come last.
+    if args.serve:
+        PreviewServer(args.serve, options).serve()
+
+    if args.watch:
+        watch(outputs if outputs else list(OUTPUTS), args.jobs, options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+popupChunkLoaded(0,{"1":"<h2>Beirut - die Milliarden-Dollar-Utopie</h2>\n<p>(Staffel 1 Nr. 1, Fortlaufende Nr. 1; Erstausstrahlung: 04.01.1999)</p>\n\n<p>Nach einem 15-jährigen Bürgerkrieg in Beirut entstehen täglich neue Marmorfassaden inmitten der Trümmerlandschaft. Die Baugesellschaft „Solidere“ enteignet Eigentümer und gibt ihnen Aktien, um der Stadt ein neues Gesicht zu geben. Die Flüchtlingsunterkünfte müssen weichen, während Premierminister Rafik Hairi von einem ehrgeizigen Projekt träumt, um Beirut als Finanz- und Dienstleistungszentrum wiederherzustellen. Während die Beiruter zwischen Müllbergen leben, stellt sich die Frage, wer den hohen Preis für die Umgestaltung der Stadt zahlen muss. Das Ziel von „Solidere“, aus der Asche eine neue Metropole zu schaffen, ist umstritten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=E_uSFyHf7BM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/1-traum-staedte-beirut-die-milliarden-dollar-utopie-339116\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641893\">thetvdb.com</a></p>\n","2":"<h2>Chandigarh - Leben im Beton</h2>\n<p>(Staffel 1 Nr. 2, Fortlaufende Nr. 2; Erstausstrahlung: 05.01.1999)</p>\n\n<p>Chandigarh, eine 1948 aus dem Nichts entstandene Stadt, ist ein politisches Manifest für das neue Indien. Le Corbusier entwarf sie als neue Wohn- und Arbeitsstätte, die den Wandel zur modernen Industriegesellschaft symbolisiert. Der Film zeigt jedoch, wie die Bewohner die Stadt für ihre eigenen Bedürfnisse nutzen und weniger nach den Visionen von Le Corbusier leben. Rechtsanwalt Gupta schwärmt von Chandigarh, obwohl die anfängliche strikte Trennung der Lebensbereiche gescheitert ist. Selbst die ärmsten Bewohner, wie Rikscha-Fahrer Satish, möchten nirgendwo anders leben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FGgrN8pRhTU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/2-traum-staedte-chandigarh-leben-im-beton-339117\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641894\">thetvdb.com</a></p>\n","3":"<h2>Brasilia - Metropole vom Reißbrett</h2>\n<p>(Staffel 1 Nr. 3, Fortlaufende Nr. 3; Erstausstrahlung: 06.01.1999)</p>\n\n<p>Die Gründung von Brasilia im Jahr 1960 zog Menschen an, die alle die Vision einer Stadt ohne soziale Unterschiede teilten. Der Städteplaner Lucio Costa gewann einen nationalen Wettbewerb und entwarf einen Grundriss mit einer kreuzförmigen Anordnung, symbolisch für Zeit, Raum und Ewigkeit. Brasilia wurde mitten in der Einöde des Landes gebaut. Doch der Militärputsch von 1964 beendete abrupt den Traum der Menschen, bevor die Utopie Wirklichkeit werden konnte. Heute sind die sozialen Gegensätze in Brasilia besonders stark, aber die Stadt gilt immer noch als Denkmaschine des Landes. Luiz Umberto, ein Architekt und Professor, der den Militärputsch erlebte, bleibt seiner Stadt treu.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_7Y2Y4bbw9s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/3-traum-staedte-brasilia-metropole-vom-reissbrett-339118\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641895\">thetvdb.com</a></p>\n","4":"<h2>Celebration - Leben in Harmonie</h2>\n<p>(Staffel 1 Nr. 4, Fortlaufende Nr. 4; Erstausstrahlung: 07.01.1999)</p>\n\n<p>Celebration ist eine von Disney geschaffene Stadt, die den modernen Städtebau verkörpern soll. Das Konzept des „New Urbanism“ zielt darauf ab, Vororte neues Leben einzuhauchen und amerikanische Tugenden wie Gemeinschaftssinn wiederzubeleben. Autos sind in den Hinterhöfen verbannt, während nostalgische Einfamilienhäuser mit offenen Veranden eine ruhige und harmonische Atmosphäre schaffen. Die Familie steht im Mittelpunkt, vernetzt mit der Nachbarschaft. Einwohner wie Pat und Ken Liles genießen die Gemeinschaft und akzeptieren die Führung eines Disney-Managers als Bürgermeister-Ersatz.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cA7vQS4fCTI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/4-traum-staedte-celebration-leben-in-harmonie-339119\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641896\">thetvdb.com</a></p>\n","5":"<h2>Die mächtigen Frauen von Juchitán</h2>\n<p>(Staffel 1 Nr. 5, Fortlaufende Nr. 5; Erstausstrahlung: 01.02.1999)</p>\n\n<p>Der Film zeigt die Stadt Juchitán in Mexiko, in der Frauen die Macht haben. Sie sind die Stammhalterinnen, erben den Besitz und kontrollieren den Handel. Ab ihrem fünfzehnten Geburtstag werden alle Frauen „Königinnen“ und feiern pompöse Feste. Männer sind eher Beobachter. Eine junge Frau in Juchitán ist unsicher über ihre Zukunft. Die Gesellschaft in Juchitán, in der Frauen im Mittelpunkt stehen, ist anders, aber ist sie auch besser?</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1mSDukDzpDM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/5-weibs-bilder-die-maechtigen-frauen-von-juchitan-339120\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3369154\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641897\">thetvdb.com</a></p>\n","6":"<h2>Hazeras Geschäfte</h2>\n<p>(Staffel 1 Nr. 6, Fortlaufende Nr. 6; Erstausstrahlung: 02.02.1999)</p>\n\n<p>„Women first“ ist ein Trend in der internationalen Entwicklungspolitik, bei dem Frauen als Zielgruppe von Hilfsorganisationen entdeckt werden. Aufgrund ihrer traditionellen Rollenverteilung sind Frauen leichter zu erreichen, da sie sich hauptsächlich im häuslichen Umfeld aufhalten. Sie haben auch subtile und weitreichende Einflussmöglichkeiten innerhalb der Familie in Bezug auf Hygiene, Gesundheit und Bildung. Die Grameen-Bank vergibt Kredite an Frauen in Bangladesh, die keine andere Sicherheit haben als vier andere Frauen, die für sie bürgen. Eine junge Frau nutzt einen solchen Kredit, um ein Handy zu kaufen und verdient nun als „Telefonzentrale“ ihres Dorfes den Familienunterhalt. Das Handy ist in ländlichen Gebieten eine bedeutende Einnahmequelle. Das Handy ist in Bangladesh kein Statussymbol, sondern ein Ausweg aus der Armutsspirale.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=R5rvxs4hX20\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/6-weibs-bilder-hazeras-geschaefte-339123\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641898\">thetvdb.com</a></p>\n","9":"<h2>Die Spurensucher</h2>\n<p>(Staffel 1 Nr. 9, Fortlaufende Nr. 9; Erstausstrahlung: 01.03.1999)</p>\n\n<p>Britische Klimaforscher prognostizieren, dass die Regenwälder, die als die Lungen der Erde gelten, Mitte des nächsten Jahrhunderts riesige Wüsten zurücklassen werden. Trotz internationaler Bemühungen, den Regenwald zu schützen, bleibt die Frage, ob der Pessimismus gerechtfertigt ist. Ein Forscher namens Philipp Gauchet arbeitet im Regenwald von Französisch-Guyana und sucht nach neuen Froscharten. Dort existiert eine einzigartige Artenvielfalt, die sich auf verschiedene Ebenen des Waldes verteilt. Die Vernichtung der Regenwälder schreitet jedoch rapide voran, und es besteht die Frage, ob genügend Zeit bleibt, um den Regenwald zu erforschen, bevor er verschwindet.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Lo0nKPEQ8Rw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/9-regenwald-die-spurensucher-339121\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641901\">thetvdb.com</a></p>\n","10":"<h2>Auf dem Holzweg</h2>\n<p>(Staffel 1 Nr. 10, Fortlaufende Nr. 10; Erstausstrahlung: 02.03.1999)</p>\n\n<p>Der Schweizer Fotograf Karl Amman setzt sich seit 25 Jahren für den Schutz des Regenwaldes und der Affen ein. Er möchte verhindern, dass die Primaten ausgerottet werden. Es ist jedoch schwierig, die lokale Bevölkerung davon zu überzeugen, da sie Affen traditionell als Nahrung betrachten. Internationale Holzkonzerne zerstören große Teile des Regenwaldes. Diese Zerstörung des Lebensraums gefährdet die Regenwald-Einwohner und ermöglicht Wilderern, weiterhin Tiere zu jagen und im kommerziellen Handel zu verkaufen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XAyYoAetjuQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/10-regenwald-auf-dem-holzweg-339125\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641902\">thetvdb.com</a></p>\n","11":"<h2>Der Geist des Vogels - Heilkraft aus dem Urwald</h2>\n<p>(Staffel 1 Nr. 11, Fortlaufende Nr. 11; Erstausstrahlung: 03.03.1999)</p>\n\n<p>Der 75-jährige Schamane Takuma im Xingú Nationalpark in Brasilien baut Vertrauen zum niederländischen Botaniker Marc von Roosmalen auf, der für das „Institut für Amazonenforschung“ arbeitet. Takuma teilt sein Wissen über die heilenden Eigenschaften von Pflanzen mit ihm. Die Völker des Regenwaldes nutzen seit Generationen die natürlichen Heilkräfte des Regenwaldes. Der Regenwald birgt reiche Schätze für die Pharmaindustrie.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NrEukDOS1EA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/11-regenwald-der-geist-des-vogels-heilkraft-aus-dem-urwald-339126\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641903\">thetvdb.com</a></p>\n","12":"<h2>Die Pille für den Wald</h2>\n<p>(Staffel 1 Nr. 12, Fortlaufende Nr. 12; Erstausstrahlung: 04.03.1999)</p>\n\n<p>Die Kindersterblichkeit in Bhujung, einem kleinen Himalaya-Dorf, ist hoch. Eltern bringen daher viele Kinder zur Welt, in der Hoffnung, dass zumindest einige überleben und zum Familienunterhalt beitragen können. Die Bevölkerung wächst, aber auch die Armut. Um zu überleben, nutzen die Menschen den Regenwald als Ressource, was zu dessen Zerstörung führt. Das „Annapurna Conservation Area Project“ (ACAP) bezieht die Bewohner von Bhujung in Entscheidungen ein, da der Schutz des Regenwaldes ohne ihre Unterstützung nicht funktionieren kann.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dLFIQxBpprQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/12-regenwald-die-pille-fuer-den-wald-339127\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641904\">thetvdb.com</a></p>\n","17":"<h2>Markt der Schönheit</h2>\n<p>(Staffel 1 Nr. 17, Fortlaufende Nr. 17; Erstausstrahlung: 03.05.1999)</p>\n\n<p>Die äthiopischen Model-Agentinnen Lina Kalifa und Natalina Pezzani kehren in ihre von Hungersnöten und Kriegen gebeutelte Heimat zurück, um neue Gesichter für die Model-Industrie zu finden. Der Markt für schwarze Models mit klassischen Gesichtszügen ist bereits übersättigt, daher suchen sie nach exotischeren Gesichtern. Obwohl einige äthiopische Schönheitsmerkmale international nicht gut ankommen, entdecken sie in Addis Abeba interessante Gesichter, die auch im Westen Erfolg haben könnten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=TNonjmeywIQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/17-schoenheit-markt-der-schoenheit-339310\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641909\">thetvdb.com</a></p>\n","18":"<h2>Cuba - Von der stillen Revolte der Schönheit</h2>\n<p>(Staffel 1 Nr. 18, Fortlaufende Nr. 18; Erstausstrahlung: 04.05.1999)</p>\n\n<p>Der Tropicana Club in Havanna war berühmt für seine schönen Tänzerinnen, aber nach der Revolution will der Club mit der Wiedereröffnung neue Schönheiten Kubas präsentieren. Der Andrang der Bewerberinnen ist groß, und ein perfekter Körper ist Voraussetzung. Früher bevorzugten die Kubaner üppige Frauen, doch jetzt sind die meisten Bewerberinnen schlanker. Die Frage ist, ob sie immer noch den gleichen Hüftschwung wie ihre Vorgängerinnen haben oder ob die Revolution das traditionelle Schönheitsideal des Landes beeinflusst hat.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=YKZbpc4kuSI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/18-schoenheit-kuba-von-der-stillen-revolte-der-schoenheit-339333\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641910\">thetvdb.com</a></p>\n","21":"<h2>Geniale Störenfriede</h2>\n<p>(Staffel 1 Nr. 21, Fortlaufende Nr. 21; Erstausstrahlung: 05.07.1999)</p>\n\n<p>Jessica war als Kind anders als die anderen: Sie sprach früh ganze Sätze, konnte mit zweieinhalb lesen und war intellektuell ihren Altersgenossen weit voraus. Ihre Mutter schickte sie auf das schottische Hochbegabten-Internat Cademuir, da sie von ihren Mitschülern als Streberin gemieden wurde. Etwa 2–5 % der Kinder haben einen IQ über 130 und gelten als hochbegabt. Oft wird Hochbegabung nicht erkannt, was zu Unterforderung und sozialer Ausgrenzung führt. Cademuir bietet diesen Kindern eine Chance für ein neues Leben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9N_DwJ2fymM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/21-intelligenz-geniale-stoerenfriede-339133\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824521\">thetvdb.com</a></p>\n","23":"<h2>„Think Tank“ - Die Schule der Affen</h2>\n<p>(Staffel 1 Nr. 23, Fortlaufende Nr. 23; Erstausstrahlung: 07.07.1999)</p>\n\n<p>Im Washingtoner Zoo gibt es den „Think Tank“, eine Sprachschule für Orang-Utans. Die Forscher wollen mit den Tieren kommunizieren, um ihre Denkstrukturen zu verstehen. Rob Shumaker nutzt einen Touch-Screen-Computer, um Sprachbarrieren zu überwinden. Er zeigt Azy einen Apfel und der Orang-Utan muss das Symbol dafür auf dem Bildschirm auswählen. Shumaker glaubt, dass er den Affen keine neuen Fähigkeiten beibringt, sondern vorhandene Fähigkeiten entdeckt. Das Ziel ist es, den Orang-Utans eine Symbolsprache beizubringen, um komplexe Ausdrücke zu ermöglichen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=P6QzAbgbxFg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/23-intelligenz-think-tank-die-schule-der-affen-339157\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824526\">thetvdb.com</a></p>\n","25":"<h2>Der Kaninchen-Krieg</h2>\n<p>(Staffel 1 Nr. 25, Fortlaufende Nr. 25; Erstausstrahlung: 06.09.1999)</p>\n\n<p>Vor 140 Jahren wurden in Australien zwei Dutzend wilde Kaninchen eingeführt, doch nun haben sie eine überdimensionale Plage verursacht. Die Bevölkerung begann die Kaninchen zu jagen, und 1951 wurde das Myxoma-Virus eingesetzt, das 99 Prozent der Tiere tötete. Die Überlebenden entwickelten jedoch Antikörper, und die Population wuchs in den 80er Jahren auf 400 Millionen an. Ein neues Virus wurde eingesetzt, das die Kaninchen innerhalb von zwei Tagen tötet.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jYrt-OPNDJM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/25-irren-ist-menschlich-der-kaninchen-krieg-339138\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824530\">thetvdb.com</a></p>\n","26":"<h2>Countdown ins Desaster</h2>\n<p>(Staffel 1 Nr. 26, Fortlaufende Nr. 26; Erstausstrahlung: 07.09.1999)</p>\n\n<p>1990 startete die NASA das Hubble-Weltraum-Teleskop, das nach 20 Jahren Forschung und 3,6 Milliarden Mark Investitionen ins All geschickt wurde. Leider waren die Aufnahmen unscharf, was das Prestige-Objekt der NASA zu einem Fiasko machte. Die beauftragten Konstruktionsfirmen hatten niedrigere Kosten berechnet, um das Projekt zu genehmigen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Re2So-kXO2E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/26-irren-ist-menschlich-countdown-ins-desaster-339139\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824531\">thetvdb.com</a></p>\n","33":"<h2>Hunger nach Sonne</h2>\n<p>(Staffel 1 Nr. 33, Fortlaufende Nr. 33; Erstausstrahlung: 01.11.1999)</p>\n\n<p>Forscher haben einen Weg gefunden, die dunkle Jahreszeit zu überwinden: Sie entwickelten Lampen, die 20-mal heller strahlen als eine Glühbirne. Diese „Bright Lights“ sollen Depressionen lindern. Sie wurden ursprünglich für die klinische Behandlung entwickelt, sind aber mittlerweile auch im Alltag beliebt. Ein Café in Helsinki bietet seinen Besuchern die Möglichkeit, neben dem Essen auch das strahlende Licht dieser Lampen zu genießen. Die Frage bleibt, ob die Sonne in Zukunft durch solche Lampen ersetzt werden könnte.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WicPXmsDRC8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/33-universum-des-lichts-hunger-nach-sonne-339137\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824539\">thetvdb.com</a></p>\n","34":"<h2>Die Leuchtkraft der Natur</h2>\n<p>(Staffel 1 Nr. 34, Fortlaufende Nr. 34; Erstausstrahlung: 02.11.1999)</p>\n\n<p>Auf der Insel Vieque in der Karibik gibt es ein nächtliches Phänomen: Beim Baden im Meer verwandelt sich der Sprung ins Wasser in ein Lichterbad. Früher glaubte man, dass der Teufel dafür verantwortlich sei, aber die Wissenschaft hat herausgefunden, dass es von einer leuchtenden Alge stammt. Biolumineszenz ist die Fähigkeit einiger Pflanzen und Tiere, ihr eigenes Licht zu erzeugen. Es dient zur Tarnung, Abschreckung, Anlockung von Partnern oder Beute und ermöglicht ihnen das Sehen. Der Biologe Gerhard Jarms aus Hamburg und ein internationales Wissenschaftlerteam erforschen dieses Naturphänomen mit einer Unterwasserkamera im norwegischen Lurje-Fjord.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=epuV5ouQ7OA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/34-universum-des-lichts-die-leuchtkraft-der-natur-339146\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824541\">thetvdb.com</a></p>\n","35":"<h2>Die Seele des Lichts</h2>\n<p>(Staffel 1 Nr. 35, Fortlaufende Nr. 35; Erstausstrahlung: 03.11.1999)</p>\n\n<p>Wissenschaftler nähern sich dem Rätsel des Lichts an. Licht ist sowohl Teilchen als auch Welle und könnte als Datenträger mit hoher Kapazität dienen. Bisherige Nutzung wurde durch die hohe Geschwindigkeit von Licht behindert. Forscher in Boston haben nun erstmals Licht auf eine Geschwindigkeit von 50 km/h abgebremst. Die Entwicklung eines Photonen-Beamers eröffnet möglicherweise neue Science-Fiction-ähnliche Möglichkeiten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gFoyqUu_hAU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/35-universum-des-lichts-die-seele-des-lichts-339147\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824542\">thetvdb.com</a></p>\n","37":"<h2>Eine Liebe auf Bali</h2>\n<p>(Staffel 1 Nr. 37, Fortlaufende Nr. 37; Erstausstrahlung: 06.12.1999)</p>\n\n<p>Auf der indonesischen Insel Bali, die für ihre romantischen Strände bekannt ist, existiert bei den Einheimischen kein Verständnis für romantische Liebe. Die Gemeinschaft steht über den individuellen Wünschen, was auch im Hinblick auf Ehepartner und Traditionen gilt. Vor 21 Jahren wagte ein balinesischer Prinz namens Tjok Raka gegen den Willen seiner Familie die Heirat mit einer Australierin namens Jane Gillespie. Obwohl die Gemeinschaft entsetzt war, hält ihre Liebe bis heute an. Im Gegensatz dazu unterwarf sich Tjok Abi, der schwule Neffe des Prinzen, den Erwartungen seiner Familie und bereut dies nun zutiefst.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kf8zhso0u4s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/37-im-namen-der-liebe-eine-liebe-auf-bali-339149\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824545\">thetvdb.com</a></p>\n","41":"<h2>Ernstfall Erdbeben</h2>\n<p>(Staffel 2 Nr. 1, Fortlaufende Nr. 41; Erstausstrahlung: 10.01.2000)</p>\n\n<p>Freiwillige Helfer des Technischen Hilfswerks in Deutschland werden nach einem starken Erdbeben in der Türkei mobilisiert. Die SEEBA-Einheit ist rund um die Uhr einsatzbereit und kann innerhalb von sechs Stunden mit großer Ausrüstung anreisen. Ihr Hauptziel ist die Rettung von Menschenleben, wobei Suchhunde eingesetzt werden, um Überlebende unter den Trümmern zu finden. Modernste Technik wird verwendet, um die Befreiung der Überlebenden schnell und sicher durchzuführen, obwohl dies im Durchschnitt 12 Personen etwa 6 Stunden pro geretteter Person dauert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MXBz7QnU3Po\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/41-naturgewalten-ernstfall-erdbeben-339153\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641913\">thetvdb.com</a></p>\n","42":"<h2>Tsunami - Die tödliche Welle</h2>\n<p>(Staffel 2 Nr. 2, Fortlaufende Nr. 42; Erstausstrahlung: 11.01.2000)</p>\n\n<p>Tsunamis sind hohe Wellen, die mit Geschwindigkeiten von bis zu 700 km/h auf Küsten treffen. In Japan erforscht der Wissenschaftler Prof. Nobuo Shuto diese Phänomene und entwickelt effektive Frühwarnsysteme. Jedes Jahr trifft ein Tsunami auf die Region. Tsunamis entstehen durch Seebeben, Unterwasservulkane oder Erdrutsche am Meeresboden. Sie werden erst in Küstengewässern zu gefährlichen Riesenwellen. Das Frühwarnsystem von Prof. Shuto alarmiert gefährdete Küstenabschnitte bereits 5 Minuten nach einem Seebeben. Manchmal ist selbst diese schnelle Warnung jedoch nicht ausreichend.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=DUxn9Li2rcU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/42-naturgewalten-tsunami-die-todeswelle-339159\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641914\">thetvdb.com</a></p>\n","44":"<h2>Im Schatten des Vulkans</h2>\n<p>(Staffel 2 Nr. 4, Fortlaufende Nr. 44; Erstausstrahlung: 13.01.2000)</p>\n\n<p>Vulkan „La Soufrière“ auf Montserrat brach nach fast 400 Jahren Ruhe aus. Asche, Lava und pyroklastische Ströme verursachten massive Zerstörung auf der Insel. Das Montserrat Volcano Observatory, geleitet von Simon Young, überwacht den Vulkan und arbeitet an einem Frühwarnsystem. Die Forscher mussten ihren Standort mehrmals verlegen, um der Gefahr zu entgehen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=VGLT3ZeQwR0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/44-naturgewalten-im-schatten-des-vulkans-339161\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641916\">thetvdb.com</a></p>\n","45":"<h2>Casino der Häuptlinge</h2>\n<p>(Staffel 2 Nr. 5, Fortlaufende Nr. 45; Erstausstrahlung: 07.02.2000)</p>\n\n<p>In Connecticut gibt es das Foxwoods Casino, das als Schloss der Illusionen bezeichnet wird. Es gehört den Mashantucket Pequot Indianern, die das größte Casino der Welt besitzen. Eine Pequot-Frau, die im Reservat lebte, bat kurz vor ihrem Tod ihren Neffen, die verstreuten Pequots zurückzubringen und den Stamm zu erhalten. Ihre ersten Versuche waren erfolglos, aber mit den Einnahmen einer Pizzeria konnten sie eine kleine Bingo-Halle finanzieren, die den Grundstein für ihr heutiges Spiel-Imperium legte. Die weißen Bewohner von Ledyards, die in der Nähe leben, fühlen sich benachteiligt, da die Pequot-Indianer heute der größte Arbeitgeber der Region sind. Außerdem konkurrieren die Pequots ständig mit den Mohikanern, die in der Nachbarschaft ein eigenes Casino betreiben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=aONYl3VUqW4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/45-spiele-des-lebens-casino-der-haeuptlinge-339162\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641917\">thetvdb.com</a></p>\n","49":"<h2>Beruf Grabräuber</h2>\n<p>(Staffel 2 Nr. 9, Fortlaufende Nr. 49; Erstausstrahlung: 06.03.2000)</p>\n\n<p>Mitten in der Nacht treiben Räuber auf dem antiken Friedhof von Morgantina in Sizilien ihr Unwesen. Mit Metalldetektoren durchsuchen sie die über 2000 Jahre alten Gräber nach wertvollen Fundstücken, um sie an ausländische Sammler zu verkaufen. Morgantina war ein kulturelles Zentrum der Griechen in der Antike und ist heute eine wichtige Ausgrabungsstätte. Obwohl eine spezielle Polizeieinheit gegen die sogenannten „Tombaroli“ vorgeht, floriert der Schmuggelhandel. Viele der antiken Artefakte gelangen über die Schweiz in Museen und Privatsammlungen in Westeuropa und den USA, was den Verlust wichtiger kultureller Zeugnisse zur Folge hat. Die Räuber zerstören dabei oft Informationen über die Vergangenheit und werfen wertlose Objekte achtlos weg.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=lpcnsH66igQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/49-die-schatzjaeger-beruf-grabraeuber-339166\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641921\">thetvdb.com</a></p>\n"})
\ No newline at end of file
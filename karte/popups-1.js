@@ -0,0 +1 @@
+popupChunkLoaded(1,{"50":"<h2>Schätze aus dem All</h2>\n<p>(Staffel 2 Nr. 10, Fortlaufende Nr. 50; Erstausstrahlung: 07.03.2000)</p>\n\n<p>Meteoritenjäger durchforsten stundenlang die Wüste Arizonas, um Meteoriten aus dem Mond, Mars oder fernen Galaxien zu finden. Bob Haag, bekannt als „Meteorite Man“, erfüllt seinen Kindheitstraum, indem er diese außerirdischen Gesteinsbrocken sammelt. Die Meteoriten können nur in trockenen Gebieten überleben, daher nutzen die Sammler Metalldetektoren, um sie aufzuspüren. Sowohl Sammler als auch Wissenschaftler sind an den Funden interessiert, da sie Informationen über fremde Planeten liefern. Die Zusammenarbeit zwischen den Sammlern und Wissenschaftlern ist wichtig, da die Funde dokumentiert und der Wissenschaft zur Untersuchung überlassen werden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=auISYpA2psM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/50-die-schatzjaeger-schaetze-aus-dem-all-339167\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641922\">thetvdb.com</a></p>\n","51":"<h2>Die Taucher der Goldküste</h2>\n<p>(Staffel 2 Nr. 11, Fortlaufende Nr. 51; Erstausstrahlung: 08.03.2000)</p>\n\n<p>Moderne Schatzjäger suchen mit High-Tech-Geräten nach versunkenen Schätzen. Ein Beispiel ist Mo Molinar und seine Crew, die seit über 30 Jahren als Schatzjäger arbeiten. Sie sind auf der Suche nach den Wracks spanischer Schiffe, die 1715 vor der Küste Floridas gesunken sind. Mit akribischer Recherche und hochtechnisierten Geräten wie einem Peilungsgerät, das Magnetfelder misst, suchen sie nach eisenhaltigen Gegenständen wie Schiffsankern und Kanonen, um die potenzielle Lage der Wracks zu ermitteln.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Jsm-8wxKxDo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/51-die-schatzjaeger-die-taucher-der-goldkueste-339168\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641923\">thetvdb.com</a></p>\n","52":"<h2>Im Bann der Rubine</h2>\n<p>(Staffel 2 Nr. 12, Fortlaufende Nr. 52; Erstausstrahlung: 09.03.2000)</p>\n\n<p>Die Dörfer sind verlassen und die Straßen gefährlich. Nur Juwelenhändler suchen im Niemandsland zwischen Thailand und Kambodscha nach Rubinen. Chantaburi in Thailand war einst das Zentrum des Rubinhandels, aber die Minen sind erschöpft. Die wenigen verbliebenen Rubine sind von schlechter Qualität und müssen zu niedrigen Preisen verkauft werden. Händler wie Sanga Duangprapai müssen nun täglich nach Kambodscha reisen, um Edelsteine zu erwerben. Pailin, die Handelsstadt in Kambodscha, ist unsicher aufgrund der Roten Khmer und Landminen. Viele Händler und Minenarbeiter sterben auf der Suche nach dem perfekten Stein.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hYYAObzGdVs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/52-die-schatzjaeger-im-bann-der-rubine-339169\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641924\">thetvdb.com</a></p>\n","53":"<h2>Die Klinik der Schamanen</h2>\n<p>(Staffel 2 Nr. 13, Fortlaufende Nr. 53; Erstausstrahlung: 01.05.2000)</p>\n\n<p>In Tuwa, einer Republik im Herzen Asiens, leitet der Schamane Nikolai Orschak eine einzigartige Schamanenklinik in der Hauptstadt Kyzyl. Durch Tanz, Gesang, Trommeln und eine symbolische Mahlzeit versucht er, die Geister der sibirischen Steppe zu besänftigen und ihre spirituelle Kraft zu nutzen, um anderen zu helfen. Die Klinik behandelt die Ursachen von Krankheiten in der menschlichen Seele. Die Wirksamkeit der traditionellen Behandlungen hat auch das Interesse der westlichen Medizin geweckt, wobei Wissenschaftler der Universität Gießen veränderte Bewusstseinszustände erforschen, wie sie von Schamanen erlebt werden. In Wien praktizieren bereits seit 20 Jahren Neo-Schamanen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BsUR1lHoDNA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/53-medizin-der-zukunft-die-klinik-der-schamanen-339171\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641925\">thetvdb.com</a></p>\n","55":"<h2>Die Jäger des Lassa-Virus</h2>\n<p>(Staffel 2 Nr. 15, Fortlaufende Nr. 55; Erstausstrahlung: 03.05.2000)</p>\n\n<p>Dr. Jan ter Meulen, ein Mediziner vom Bernhard-Nocht-Institut in Hamburg, forscht zusammen mit einheimischen Wissenschaftlern in Guinea zum Lassa-Fieber. Er betrachtet Fälle wie den von Annegret V. als tragische Einzelschicksale und glaubt, dass es keine Gefahr für Menschen in der Ersten Welt gibt. Das Lassa-Fieber wird von Mastomys natalensis, einer kleinen Rattenart, verbreitet, die das Virus im Urin und anderen Körperflüssigkeiten ausscheidet. Nur wenn diese Ratten in Europa als Erregerreservoir etabliert würden und grundlegende Hygienemaßnahmen vernachlässigt würden, gäbe es eine ernsthafte Bedrohung. Das gesteigerte Medieninteresse könnte jedoch dazu führen, dass die Erforschung von Tropenkrankheiten mehr Beachtung findet.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8ALpHNqxoL0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/55-medizin-der-zukunft-die-jaeger-des-lassa-virus-339173\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641927\">thetvdb.com</a></p>\n","56":"<h2>Chirurgen am Joystick</h2>\n<p>(Staffel 2 Nr. 16, Fortlaufende Nr. 56; Erstausstrahlung: 04.05.2000)</p>\n\n<p>Im OP-Saal sind Roboter auf dem Vormarsch. Sie assistieren bei Orthopädie und Herzoperationen und sollen bald auch im Gehirn eingesetzt werden. Das Virchow-Klinikum in Berlin hat den ersten Roboter für Mund-, Kiefer- und Gesichtschirurgie namens „Otto von Decke“. Otto kann Instrumente reichen und Knochenbohrungen durchführen. Er übertrifft den Chirurgen vor allem durch seine Genauigkeit. Tim Lüth, Deutschlands erster Professor für High-Tech-Medizin, hat Otto entwickelt. Bislang werden Roboter hauptsächlich in der Orthopädie eingesetzt, aber ihre Anwendung wird kontinuierlich erweitert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GlPBNbgtNpE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/56-medizin-der-zukunft-chirurgen-am-joystick-339174\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641928\">thetvdb.com</a></p>\n","57":"<h2>Die Hightech-Polizei</h2>\n<p>(Staffel 2 Nr. 17, Fortlaufende Nr. 57; Erstausstrahlung: 05.06.2000)</p>\n\n<p>Der Polizist des 21. Jahrhunderts ist mit fortschrittlichen Technologien ausgestattet, um potenzielle Angreifer frühzeitig zu entdecken. Mithilfe von Wärmekameras kann er sie identifizieren und mit nicht-tödlichen Schusswaffen außer Gefecht setzen. David Boyd vom „National Institute of Justice“ entwickelt kontinuierlich neue Technologien, um die Arbeit der Polizei effektiver und sicherer zu machen. An der Grenze zu Mexiko in San Diego werden bereits viele dieser Technologien eingesetzt, darunter auch die direkte Untersuchung von DNA-Proben am Tatort. Die amerikanische Polizei forscht zudem an nicht-tödlichen Waffen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=OeQIgSeBN5k\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/57-dem-taeter-auf-der-spur-die-hightech-polizei-339170\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641929\">thetvdb.com</a></p>\n","58":"<h2>Die Kunst des Fälschens</h2>\n<p>(Staffel 2 Nr. 18, Fortlaufende Nr. 58; Erstausstrahlung: 06.06.2000)</p>\n\n<p>Der größte Skandal in der Kunstgeschichte begann mit einer Anzeige: „Authentische Fälschungen (19. und 20. Jahrhundert) für 150 Pfund“. John Myatt, ein Kunstlehrer in finanzieller Notlage, verkaufte kopierte Kunstwerke. John Drewe, ein genialer Hochstapler, wurde auf ihn aufmerksam und sah eine Chance. Über Jahre hinweg überzeugte Drewe Myatt, berühmte Kunstwerke zu fälschen. Er verkaufte sie zu hohen Preisen an Sammler und manipulierte als Kunsthistoriker die Archive der Tate Gallery und des Victoria & Albert Museums, um Myatts Werken eine gefälschte Geschichte zu verleihen. Scotland Yard deckte den Betrug schließlich auf.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CuJOick2_ZY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/58-dem-taeter-auf-der-spur-die-kunst-des-faelschens-339175\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641930\">thetvdb.com</a></p>\n","59":"<h2>Geheimnisse der Toten</h2>\n<p>(Staffel 2 Nr. 19, Fortlaufende Nr. 59; Erstausstrahlung: 07.06.2000)</p>\n\n<p>Die berühmte amerikanische Autorin Patricia Cornwell ist für ihre detaillierten Beschreibungen in Kriminalromanen bekannt. Ihre Hauptfigur, Kay Scarpetta, ist eine Gerichtsmedizinerin, die in einer männerdominierten Welt arbeitet. Cornwells Inspiration für Scarpetta, Dr. Marcella Fierro, arbeitet am forensischen Institut in Richmond, Virginia. Die forensischen Untersuchungen enthüllen mehr Informationen über die Leiche, als der Täter erwartet. Ballistikexperten bestimmen den Winkel und die verwendete Waffe beim Schuss auf das Opfer. Pathologen der „Body Farm“ rekonstruieren den genauen Zeitpunkt des Todes. Molekularbiologen extrahieren DNA aus winzigen Proben wie Blut oder Speichel und entschlüsseln den genetischen Fingerabdruck des Täters.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bA5xe1HPaLw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/59-dem-taeter-auf-der-spur-geheimnisse-der-toten-339308\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641931\">thetvdb.com</a></p>\n","60":"<h2>Psycho-Detektive</h2>\n<p>(Staffel 2 Nr. 20, Fortlaufende Nr. 60; Erstausstrahlung: 08.06.2000)</p>\n\n<p>Die FBI-Agentin Clarice Starling wurde durch den Film „Das Schweigen der Lämmer“ berühmt, in dem sie die Psyche von Serienmördern erforschte. Die Methode des Profiling, die sie anwendete, wurde jedoch schon in den 70er Jahren vom FBI-Agenten Robert Ressler etabliert. In diesem Zusammenhang wurde Ressler von den Ermittlern eines grauenhaften Verbrechens um Hilfe gebeten. Er erstellte ein psychologisches Profil des Täters und half bei der Ausbildung von Profilern an der FBI-Akademie in Quantico, Virginia. Ressler warnte auch davor, selbst zum Monster zu werden, während man gegen Monster kämpft.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8yaQbw9XjbQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/60-dem-taeter-auf-der-spur-psycho-detektive-339309\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641932\">thetvdb.com</a></p>\n","61":"<h2>Das Fenster zum Meer</h2>\n<p>(Staffel 2 Nr. 21, Fortlaufende Nr. 61; Erstausstrahlung: 04.09.2000)</p>\n\n<p>Sydneys modernes Großaquarium bietet eine faszinierende Erfahrung für wasserunwillige Besucher. Es beherbergt über 650 heimische Tier- und Pflanzenarten in 50 Großbecken auf 4.000 Quadratmetern. Tierpfleger wie Adam Kassi kümmern sich um Haie, Schnabeltiere, Pinguine, Meeresschildkröten, Krokodile und den größten australischen Süßwasserfisch. Das Aquarium setzt auf ein „No Shows!“-Motto, um den Besuchern ein Verständnis für die natürliche Tierwelt zu vermitteln. Die erfolgreiche Fortpflanzung einiger Tiere wie Pinguine zeigt die artgerechte Haltung im Aquarium.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pr77EnZFwug\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/61-im-reich-der-meere-das-fenster-zum-meer-im-grossaquarium-von-sydney-339341\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824557\">thetvdb.com</a></p>\n","62":"<h2>Schwarze Brandung</h2>\n<p>(Staffel 2 Nr. 22, Fortlaufende Nr. 62; Erstausstrahlung: 05.09.2000)</p>\n\n<p>Im Dezember 1999 ereignete sich die Tankerhavarie der „Erika“ vor der bretonischen Küste. Trotz einer dramatischen Rettungsaktion erstickten Hunderttausende Seevögel im Öl. Die französische Tourismusindustrie gab bereits nach einigen Monaten Entwarnung, doch die langfristigen Auswirkungen auf Mensch und Tier blieben unklar. In der Vergangenheit ereigneten sich ähnliche Unglücke vor der Bretagne, wie 1978 mit der „Amoco Cadiz“. Die Erholung der Umwelt damals verlief schneller als erwartet. Meeresbiologen untersuchen nun, wie lange die natürliche Abbauzeit des Öls der „Erika“ in der Umwelt dauern wird. Sie erforschen die verantwortlichen Organismen für die Selbstreinigung des Meeres und erstellen Prognosen für die betroffenen Gebiete in der Bretagne.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MQNTxheCFSw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/62-im-reich-der-meere-schwarze-brandung-nach-der-oelkatastrophe-an-der-bretonischen-kueste-339342\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824558\">thetvdb.com</a></p>\n","63":"<h2>Durst nach Meer</h2>\n<p>(Staffel 2 Nr. 23, Fortlaufende Nr. 63; Erstausstrahlung: 06.09.2000)</p>\n\n<p>Täglich sterben weltweit 13.000 Menschen an Durst oder verschmutztem Wasser. Kriege um Trinkwasser nehmen zu. Wissenschaftler und Ingenieure arbeiten daran, die riesigen Wasserreserven der Erde anzuzapfen. 1,4 Milliarden Kubikkilometer Wasser existieren, aber 99,3 % sind salziges Meerwasser oder Eis. Die Lösungen zur Gewinnung von Trinkwasser aus den Ozeanen variieren. Auf der Arabischen Halbinsel versorgen Entsalzungsanlagen die Reichen mit Wasser. In Puerto Rico hat José Pichardo mit Unterstützung eines deutschen Ingenieurs solarbetriebene Wasserentsalzungsanlagen entwickelt. Er hofft, dass sie bald auch die Bewohner der Armenviertel von San Juan versorgen können.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WAjs-VrhFNs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/63-im-reich-der-meere-durst-nach-meer-neue-methoden-der-trinkwassergewinnung-339343\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824559\">thetvdb.com</a></p>\n","64":"<h2>SOS auf hoher See</h2>\n<p>(Staffel 2 Nr. 24, Fortlaufende Nr. 64; Erstausstrahlung: 07.09.2000)</p>\n\n<p>Die „Deutsche Gesellschaft zur Rettung Schiffbrüchiger“ (DGzRS) bietet seit 1865 organisierte Hilfe bei Schiffsunglücken an. Heutzutage verfügt die deutsche Flotte über eine der modernsten technischen Ausstattungen weltweit. Der Rettungskreuzer „Alfried Krupp“ unter dem Kommando von Karl-Friedrich Brückner ist nahezu unsinkbar und 27 Meter lang. Trotzdem gibt es immer noch Gefahren für die Besatzung. Die Deutsche Handelsmarine hat ein umfangreiches Trainingsprogramm entwickelt. Die Seenotleitung in Bremen empfängt Notrufe aus der ganzen Welt und kann auf Notfälle in weit entfernten Ozeanen reagieren. Ein spektakuläres Beispiel für eine ferngesteuerte Rettungsaktion war der Einsatz für die Verunglückten des Passagierschiffs „Achille Lauro“ im Jahr 1995.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qVKSXlGRLbU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/64-im-reich-der-meere-sos-auf-hoher-see-moderne-rettungstechnik-im-einsatz-339344\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824560\">thetvdb.com</a></p>\n","65":"<h2>Die Feuerpatrouille</h2>\n<p>(Staffel 2 Nr. 25, Fortlaufende Nr. 65; Erstausstrahlung: 02.10.2000)</p>\n\n<p>Jeden Sommer toben verheerende Brände im Süden Frankreichs. Nur Ortskundige können rechtzeitig warnen, da das Gelände bergig und unübersichtlich ist. Serge Abbes ist seit fast zwanzig Jahren Förster bei der staatlichen Waldbehörde „ONF - Office National de Forêt“. Täglich überwacht er einen Waldabschnitt in der Nähe seines Heimatorts im Département Bouches-du-Rhône, einem beliebten Urlaubsgebiet. Er schlägt Alarm und führt im Ernstfall die Feuerwehr direkt in die Gefahrenzone. Im Département gibt es insgesamt 125 „Waldretter“, die Feuerwehrmann und Förster zugleich sind. Die Feuerwachzentrale in Avignon koordiniert die Einsätze. Serge Abbes’ Arbeit bleibt trotz aller Technik und Vorsicht gefährlich, denn nur seine Ortskenntnis, das Funkgerät und etwas Glück helfen ihm, wenn er in einen Brand gerät.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4dlXEbKTnKA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/65-die-geheimnisse-des-waldes-die-feuerpatrouille-339345\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824561\">thetvdb.com</a></p>\n","66":"<h2>Der letzte Märchenwald</h2>\n<p>(Staffel 2 Nr. 26, Fortlaufende Nr. 66; Erstausstrahlung: 03.10.2000)</p>\n\n<p>Der Böhmerwald in Tschechien, ein wilder Ort in Europa, ist bedroht. Borkenkäfer vernichten seit den 90er Jahren große Flächen des letzten Märchenwaldes des Kontinents. Die Nationalparkverwaltung wird von der Bevölkerung für die Käferplage verantwortlich gemacht, da die Idee, den Wald nicht wirtschaftlich zu nutzen und die Wildnis nicht zu ordnen, in Tschechien auf Unverständnis stößt. Einige Kommunen haben bereits Waldflächen zurückbekommen und dürfen dort wieder Bäume fällen. Förster Michael Valenta sieht den Böhmerwald in Gefahr, wenn Teile des Parks touristisch genutzt werden, da dies die einzigartige Natur beeinträchtigen könnte.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=vDFuRMVhqKA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/66-die-geheimnisse-des-waldes-der-letzte-maerchenwald-339339\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824562\">thetvdb.com</a></p>\n","67":"<h2>Chinas grüne Mauer</h2>\n<p>(Staffel 2 Nr. 27, Fortlaufende Nr. 67; Erstausstrahlung: 04.10.2000)</p>\n\n<p>In China kämpft die Bevölkerung verzweifelt gegen die Ausbreitung der Wüste an. Sogar Peking wird immer häufiger von Sandstürmen heimgesucht, weshalb Pläne für eine neue Hauptstadt existieren. Dennoch ist der Kampf nicht verloren. China errichtet eine etwa 700 Kilometer lange „grüne Mauer“ aus Bäumen, die die nordwestlichen Provinzen und Peking schützen soll. Bereits 22 Millionen Hektar Schutzwälder, vergleichbar mit der Fläche Großbritanniens, wurden angelegt. Die Aufforstung zeigt erste Erfolge, jedoch breitet sich die Wüste weiter aus.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hPQpzybAEIU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/67-die-geheimnisse-des-waldes-chinas-gruene-mauer-339346\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007044\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824563\">thetvdb.com</a></p>\n","68":"<h2>Die Waldfabrik</h2>\n<p>(Staffel 2 Nr. 28, Fortlaufende Nr. 68; Erstausstrahlung: 05.10.2000)</p>\n\n<p>In Finnland wird intensiv Holzwirtschaft betrieben, um den Wald als wichtigen Wirtschaftsfaktor zu nutzen. Früher wurde der Wald ähnlich wie Felder bewirtschaftet, was zu einheitlichen, leblosen Baumplantagen führte, die anfällig für Brände und Schädlinge sind. Naturschützer protestieren dagegen, aber die finnische Forstindustrie ist eng mit der Forstbehörde, den Zelluloseherstellern und der Maschinenindustrie verbunden. Daher verkauft ein Waldbesitzer nicht das Holz, sondern nur das Recht zur Holzernte. Dieses System wird „Holzcluster“ genannt. Die effektive und profitorientierte Holzwirtschaft hat in Finnland eine lange Tradition, wobei ein Holzfäller etwa vier Minuten braucht, um eine Kiefer umzulegen und 90 Bäume pro Tag zu fällen, während ein Harvester die gleiche Arbeit in nur einer Minute erledigt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=i4IRpDalTSM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/68-die-geheimnisse-des-waldes-die-waldfabrik-339347\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824564\">thetvdb.com</a></p>\n","69":"<h2>Himalaja - Tödliche Höhe</h2>\n<p>(Staffel 2 Nr. 29, Fortlaufende Nr. 69; Erstausstrahlung: 06.11.2000)</p>\n\n<p>Im Himalaya-Gebirge machen sich jährlich mehr Expeditionen auf, um die Gipfel zu besteigen. Eine deutsche Gruppe unter der Leitung von Olaf Rieck möchte den Cho Oyu bezwingen, einen der Giganten mit 8201 Metern. Mit zunehmender Höhe sinkt der Sauerstoffgehalt im Blut, was zu Übelkeit und Austrocknung führt. Um die Gefahren zu minimieren, nehmen die Teilnehmer an einem Experiment teil, bei dem ihre psychische und physische Verfassung durch Sensoren aufgezeichnet wird. Die Daten werden an den Psychologen Markus Stück in Deutschland übertragen, der die verbleibenden körperlichen Reserven berechnet. Die meisten Expeditionsteilnehmer geben auf, aber Olaf Rieck und Kameraassistent Thomas Türpe kämpfen weiter. Die Daten sind alarmierend, doch Rieck will den Gipfel unbedingt erreichen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=c1KAS1kahk8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/69-leben-am-limit-grenzen-des-koerpers-himalaja-toedliche-hoehe-339348\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007053\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824565\">thetvdb.com</a></p>\n","71":"<h2>Radrennen - Ewiger Endspurt</h2>\n<p>(Staffel 2 Nr. 31, Fortlaufende Nr. 71; Erstausstrahlung: 08.11.2000)</p>\n\n<p>Andreas Klöden, ein 25-jähriger Radrennprofi des Teams Telekom, hat bei verschiedenen Rennen wie Paris-Nizza und der Baskenlandrundfahrt Erfolge erzielt. Durch intensives Training und den Einsatz moderner Sportwissenschaft hat er seine körperlichen Grenzen ausgereizt. Professor Zschorlich von der Universität Rostock erforscht den optimalen Tretzyklus von Radfahrern und erstellt individuelle Trainingsprogramme, indem er die Beschleunigung während der Kurbelbewegung misst. Damit werden Leistungssteigerungen erreicht und der Einsatz neuer Ausrüstung wird immer wichtiger.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gqUU0m2KVqg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/71-leben-am-limit-grenzen-des-koerpers-radrennen-ewiger-endspurt-339350\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824567\">thetvdb.com</a></p>\n","72":"<h2>Sadhus - Heilige Aussteiger</h2>\n<p>(Staffel 2 Nr. 32, Fortlaufende Nr. 72; Erstausstrahlung: 09.11.2000)</p>\n\n<p>Die Sadhus sind heilige Männer des Hinduismus in Nepal und anderen asiatischen Ländern. Sie leben asketisch und sind ständig auf Wanderschaft. Ihre Rituale sind ungewöhnlich, von lebenslangem Stehen bis hin zur Unterdrückung der Lust mit schweren Steinen an Hoden und Penis. Hanuman Das ist mit 17 Jahren von zu Hause weggelaufen, um ein Sadhu zu werden. Jetzt ist er 70 und glaubt, sein Ziel erreicht zu haben. Er lebt von Spenden und opfert für andere Menschen. Sein Schüler Om Das war ein drogensüchtiges Straßenkind, aber Hanuman Das ist überzeugt, dass Gott auch für ihn sorgt, wenn er an seine Grenzen geht.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xI5D3TCuoYM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/72-leben-am-limit-grenzen-des-koerpers-sadhus-heilige-aussteiger-339351\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824568\">thetvdb.com</a></p>\n","73":"<h2>Die Elefantenschule</h2>\n<p>(Staffel 2 Nr. 33, Fortlaufende Nr. 73; Erstausstrahlung: 04.12.2000)</p>\n\n<p>Im südlichen Afrika existiert eine Elefantenschule namens „Camp Abu“, die vor zehn Jahren von Randall Moore gegründet wurde. Diese Schule bildet afrikanische Elefanten aus und ermöglicht es ihnen, für Menschen zu arbeiten. Moore hat damit Erfolg gehabt, was bisher nur bei asiatischen Elefanten möglich war. Die Elefanten werden im Camp auf natürliche Weise trainiert und das erfordert viel Geduld im Umgang mit den Tieren. Neben Elefanten werden auch passende Elefantenführer, sogenannte „Mahouts“, in der Einrichtung ausgebildet. Durch diese Ausbildung wird der einheimischen Bevölkerung nahegebracht, dass Elefanten als Nutztiere dienen können, anstatt sie nur als Landplage zu betrachten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=l6ciOHdMwlI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/73-tiere-im-rampenlicht-die-elefantenschule-339352\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824569\">thetvdb.com</a></p>\n","74":"<h2>Der Rentier-Trek</h2>\n<p>(Staffel 2 Nr. 34, Fortlaufende Nr. 74; Erstausstrahlung: 05.12.2000)</p>\n\n<p>Im Norden Skandinaviens haben die Sami, ein Nomadenvolk, seit Jahrtausenden eine enge Partnerschaft mit den großen Rentierherden. Früher folgten sie den Herden zu Fuß, heute nutzen sie Schneemobile. Trotz Anpassungen ist ihre Lebensweise gefährdet, da Waldbesitzer gegen ihre alten Weiderechte klagen. Nils Peter Gaup ist einer von 4000 modernen norwegischen Sami, die von der Rentierzucht leben. Durch intensive Züchtung ist die Anzahl der Tiere zu hoch, sodass die Hauptnahrung, Flechten, nicht ausreichend nachwachsen kann. Der Staat fordert die Hirten auf, ihre Herden zu verkleinern, was die Existenz der Sami bedroht.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kw2Mk9Su7zg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/74-tiere-im-rampenlicht-der-rentier-trek-339353\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4824570\">thetvdb.com</a></p>\n","77":"<h2>Timbuktu</h2>\n<p>(Staffel 3 Nr. 1, Fortlaufende Nr. 77; Erstausstrahlung: 02.01.2001)</p>\n\n<p>Timbuktu war einst eine blühende Stadt mit mehr als 120.000 Einwohnern und 20.000 Studenten. Heute leben weniger als 30.000 Menschen dort. Die Bewohner fürchten politische Unruhen und das Vorrücken der Sahara, die jedes Jahr 10 bis 20 Meter näher kommt. Trotzdem haben sie einen Schutzwall aus Bäumen und Sträuchern um die Stadt errichtet. Die Regierung von Mali hat jedoch Timbuktu anscheinend aufgegeben, was die größte Sorge der Menschen dort ist.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=u1QLrA-PNrs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/77-ueberleben-in-der-wueste-timbuktu-339356\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641935\">thetvdb.com</a></p>\n","78":"<h2>„Die Frucht, die aus der Dürre kam“</h2>\n<p>(Staffel 3 Nr. 2, Fortlaufende Nr. 78; Erstausstrahlung: 03.01.2001)</p>\n\n<p>Die Wüste Namib im Südwesten Afrikas beherbergt die Topnaar, eines der letzten Wüstenvölker der Welt. Ihre traditionelle Lebensweise ist bedroht, aber die Nara-Melone, eine Frucht, die in der Wüste wächst, könnte ihre Rettung sein. Rudolf Dauseb von den Topnaar möchte die Melone kultivieren und eine Industrie aufbauen, um Arbeitsplätze zu schaffen. Die Frucht hat vielfältige Verwendungsmöglichkeiten, und ihr Samenöl hat einen hohen Nährwert. Die Melone könnte auch in der Kosmetikindustrie genutzt werden, und die Bewässerung der Pflanzen könnte durch Feuchtigkeitskollektoren aus der Luft erfolgen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=L1bcEWTOHm4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/78-ueberleben-in-der-wueste-die-frucht-die-aus-der-duerre-kam-339357\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641936\">thetvdb.com</a></p>\n","79":"<h2>Baumeister der Wüste</h2>\n<p>(Staffel 3 Nr. 3, Fortlaufende Nr. 79; Erstausstrahlung: 04.01.2001)</p>\n\n<p>In der jordanischen Wüste liegt das antike Petra, die Hauptstadt eines Nomadenvolks aus Nordarabien vor über 2000 Jahren. Wissenschaftler erforschen die Wüstenarchitektur und nutzen die nabatäische Baukunst für das moderne Leben in der Wüste. Architekten vom israelischen „Jacob Blaustein Institut“ entdeckten die antike Stadt Petra und begannen architektonische Experimente auf dem Campus. Sie waren so begeistert von ihren Modellhäusern, dass sie und ihre Familien dort einzogen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=r6iPQL1WZ_I\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/79-ueberleben-in-der-wueste-baumeister-der-wueste-339358\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641937\">thetvdb.com</a></p>\n","80":"<h2>„Wüste auf Bewährung“</h2>\n<p>(Staffel 3 Nr. 4, Fortlaufende Nr. 80; frz. Titel “Les Prisonniers du Désert”; Erstausstrahlung: 05.01.2001)</p>\n\n<p>Im Südwesten der USA erhalten kriminelle und schwererziehbare Jugendliche eine zweite Chance. Die „Anasazi Foundation“ führt therapeutische Survivalkurse in der ausgedörrten Wüste Arizonas durch. Die Temperaturen erreichen bis zu 43 Grad, und das Überleben hängt davon ab, wie man Nahrung und Wasser findet. Zwei Monate lang müssen sich straffällig gewordene Jugendliche behaupten und werden von einem Totonac-Indianer namens Ezekiel Sanchez unterrichtet. Der Kontakt zur Außenwelt ist verboten, und täglich legen sie eine 15 Kilometer lange Strecke in der Wüste zurück. Die Rückfallquote beträgt nur 52 %, im Vergleich zu herkömmlichen Strafvollzugsmaßnahmen ist dies zehnmal höher.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GA9d8JNQ0aY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/80-ueberleben-in-der-wueste-wueste-auf-bewaehrung-339359\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641938\">thetvdb.com</a></p>\n","81":"<h2>Die Baustelle des Herrn</h2>\n<p>(Staffel 3 Nr. 5, Fortlaufende Nr. 81; Erstausstrahlung: 05.03.2001)</p>\n\n<p>Der 75-jährige Spanier Justo Gallego Martinez baut seit fast 40 Jahren an einer riesigen Kirche in Mejorada del Campo, einer Vorstadt von Madrid. Die Kathedrale, die größtenteils ohne fremde Hilfe entsteht, ist bereits 25 Meter breit, 55 Meter lang und 35 Meter hoch. Martinez arbeitet täglich mit Begeisterung und Motivation an dem Projekt und nutzt recycelte Materialien und Spenden von Baufirmen. Obwohl er gelegentlich von Jugendlichen unterstützt wird, erledigt Martinez den Großteil der Arbeit alleine. Das Bauwerk und sein Erbauer sind zu einer Attraktion geworden, und Martinez hat bereits ein Testament verfasst, in dem er die Kirche dem Bischof vermacht.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_1Ka_gTLjUw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/81-die-baustelle-des-herrn-339363\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641939\">thetvdb.com</a></p>\n","82":"<h2>Im Einsatz für den Nebelwald</h2>\n<p>(Staffel 3 Nr. 6, Fortlaufende Nr. 82; Erstausstrahlung: 06.03.2001)</p>\n\n<p>Die Halbinsel Paria in Venezuela bietet traumhafte Strände, einzigartige Nebelwälder und eine vielfältige Tier- und Pflanzenwelt. Wilfried Merle und Klaus Müller, Entwicklungshelfer in dem Land, haben ihr eigenes Paradies gefunden. Jedoch sind die Menschen dort so arm, dass sie die intakte Umwelt für ihre grundlegenden Bedürfnisse zerstören. Der Haupterwerb der Bevölkerung liegt in der Landwirtschaft, aber der Anbau von Mais erschöpft den Boden und macht ihn unfruchtbar. Um ihren Bedarf zu decken, brennen die Bauern immer mehr Flächen des Regenwaldes ab. Merle und Müller setzen sich entschlossen dafür ein, das Nebelwaldparadies zu retten. Merle hat mit einer Straßenbaufirma finanzielle Mittel gesammelt und ein Netzwerk von Projekten aufgebaut, während Müller ökologisch nachhaltige Anbaumethoden fördert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gcOIjyneLdc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/82-retter-des-nebelwaldes-339364\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641940\">thetvdb.com</a></p>\n","83":"<h2>Hollywood auf dem Trockenen</h2>\n<p>(Staffel 3 Nr. 7, Fortlaufende Nr. 83; Erstausstrahlung: 07.03.2001)</p>\n\n<p>Los Angeles hat erfolgreich sein Wassermanagement verbessert und dient als Vorbild für andere Millionenstädte, die unter Wasserknappheit leiden. Die Stadt importiert Wasser aus umliegenden Gebieten, reinigt es und leitet es gechlort ins Wassernetz für die Verbraucher. Früher führte Los Angeles einen aggressiven Wasserkrieg mit dem Umland, der beinahe den Mono Lake zerstört hätte. Heute ist der See ein Naturschutzgebiet. Ade Adeneji von der Non-Profit-Organisation ADRO entwickelte eine Wasserspartoilette, die den Verbrauch von 20 auf 6 Liter reduzierte. Dadurch spart Los Angeles jährlich 36 Millionen Kubikmeter Trinkwasser.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1Xs3akVZkZA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/83-hollywood-auf-dem-trockenen-339361\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641941\">thetvdb.com</a></p>\n","84":"<h2>Die Adern von Berlin</h2>\n<p>(Staffel 3 Nr. 8, Fortlaufende Nr. 84; Erstausstrahlung: 08.03.2001)</p>\n\n<p>In Berlin sind Millionen Menschen täglich in der Stadt unterwegs. Die „Mauern“ in der Kanalisation wurden entfernt, und die Trinkwassernetze wurden auf 7700 Kilometer erweitert. Bent Regulla und sein Team von den Berliner Wasserbetrieben überwachen das Abwassersystem, reparieren Schäden und kontrollieren täglich Schwachstellen. Allerdings bereiten die vielen Schadstoffe im Abwasser, von Hundekot über Motoröl bis hin zu Medikamenten, große Probleme. Der Abwassercocktail kann gefährliche Gase freisetzen, die in Kombination explosiv sind. Das Betreten der Kanalisation ist daher risikoreich. Die Berliner können jedoch dank der Arbeit von Regulla und seinem Team weiterhin bedenkenlos Wasser nutzen und täglich etwa 130 Liter pro Kopf verbrauchen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rh-tBQxi6Ro\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/84-die-adern-von-berlin-der-wasserkreislauf-einer-metropole-339366\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641942\">thetvdb.com</a></p>\n","85":"<h2>Operation Alpentunnel</h2>\n<p>(Staffel 3 Nr. 9, Fortlaufende Nr. 85; Erstausstrahlung: 09.04.2001)</p>\n\n<p>In der Schweiz wird seit 1995 der längste Eisenbahntunnel der Welt am Gotthard-Massiv gebaut. Die 57 Kilometer lange Strecke durch die Alpen wird die Reisezeit zwischen Zürich und Mailand von fünf auf zweieinhalb Stunden verkürzen. Spezialisten aus der ganzen Welt arbeiten an diesem gigantischen Projekt, bei dem tausende Menschen Meter um Meter aus dem Berg herausholen, um den ehrgeizigen Gotthard-Basistunnel zu verwirklichen. Maschinen fressen sich an den Eingängen des Tunnels in den Fels, während 24 Millionen Tonnen Abraum anfallen. Der Urner See wird mit dem Abraum aufgefüllt, um das ökologische Gleichgewicht wiederherzustellen. Der erste Hochgeschwindigkeitszug soll 2017 durch den Tunnel fahren - eine nur 16 Minuten lange Fahrt für 57 Kilometer.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9DqxNEBmpd8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/85-operation-alpentunnel-339367\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007056\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641943\">thetvdb.com</a></p>\n","86":"<h2>Brücke in den Orient</h2>\n<p>(Staffel 3 Nr. 10, Fortlaufende Nr. 86; Erstausstrahlung: 10.04.2001)</p>\n\n<p>Istanbul, eine Metropole zwischen Europa und Asien, plant den Bau einer dritten Brücke über den Bosporus, um den chronischen Verkehrsstau zu lindern. Die bestehenden Brücken führen täglich zu massiven Staus, aber viele Einwohner bevorzugen die höhere Lebensqualität auf der asiatischen Seite der Stadt. Die Stadtverwaltung hat versucht, flexiblere Arbeitszeiten einzuführen, um das Verkehrsproblem anzugehen, jedoch ohne Erfolg. Ein erfahrener Bauingenieur namens Celalettin Dursun, der an den bisherigen Brücken beteiligt war, arbeitet auch am Bau der geplanten dritten Brücke. Aufgrund häufiger Erdbeben ist ein Tunnelbau keine realistische Alternative.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=X_u4jC40L_Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/86-bruecke-in-den-orient-339368\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007042\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641944\">thetvdb.com</a></p>\n","87":"<h2>Die letzten Nixen</h2>\n<p>(Staffel 3 Nr. 11, Fortlaufende Nr. 87; Erstausstrahlung: 11.04.2001)</p>\n\n<p>In Istanbul, einer Metropole zwischen Europa und Asien, gibt es nur zwei Brücken über den Bosporus. Täglich gibt es dort massive Staus, was die höhere Lebensqualität auf der asiatischen Seite der Stadt erschwert. Die Stadtverwaltung hat versucht, flexiblere Arbeitszeiten einzuführen, um das Verkehrsproblem zu lösen, aber ohne Erfolg. Daher soll nun der Bau einer dritten Brücke Abhilfe schaffen. Celalettin Dursun, ein 67-jähriger Bauingenieur, hat bereits an den bestehenden Brücken gearbeitet und ist auch am Bau der geplanten dritten Brücke beteiligt. Aufgrund der Erdbebenaktivität in der Region ist ein Tunnelbau keine Option.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=a_MPCOQDmZE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/87-die-letzten-nixen-die-taucherinnen-von-cheju-339401\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641945\">thetvdb.com</a></p>\n","88":"<h2>Die Fischer vom Rio Negro</h2>\n<p>(Staffel 3 Nr. 12, Fortlaufende Nr. 88; Erstausstrahlung: 12.04.2001)</p>\n\n<p>Die Haenyo auf der südkoreanischen Insel Jeju-do sind Meeresfrauen, die bis zu 3 Minuten ohne Atemgerät tauchen können. Sie suchen nach Muscheln und anderen Meeresfrüchten in bis zu 20 Metern Tiefe. Dieser 1500 Jahre alte Beruf wird immer unbeliebter, besonders bei jungen Frauen. Obwohl die Haenyo traditionell die Familie ernähren, hat sich ihre Zahl seit 1950 halbiert. Die Taucherinnen verbringen täglich rund 4 Stunden im kalten Wasser mit Temperaturen um die 8 Grad. Trotz der Anstrengungen, Gefahren und Haiattacken nehmen sie gesundheitliche Risiken auf sich, da die gesammelten Meeresfrüchte einen hohen Marktpreis erzielen. Die noch aktiven Haenyo könnten die letzten ihrer Art sein.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WU516e1cZ2E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/88-die-fischer-vom-rio-negro-339403\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007049\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641946\">thetvdb.com</a></p>\n","89":"<h2>Anatomie einer Lawine</h2>\n<p>(Staffel 3 Nr. 13, Fortlaufende Nr. 89; Erstausstrahlung: 30.04.2001)</p>\n\n<p>Schweizer Forscher des Eidgenössischen Instituts für Schnee- und Lawinenforschung in Davos arbeiten daran, die Gefahr von Schneelawinen in den Alpen vorherzusagen. Oftmals sind Unwissenheit und Leichtsinn Auslöser dieser Naturgefahren. Werner Munter und sein Team entwickeln Konzepte zur Lawinenprognose und testen verschiedene Rettungsgeräte wie den Lawinenairbag und den Piepser zur Ortung von Verschütteten. Nur 6 von 100 Menschen überleben Lawinenunfälle, daher sind präventive Schutzmaßnahmen von großer Bedeutung.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=q9NdtLN4tHo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/89-anatomie-einer-lawine-339407\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007041\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641947\">thetvdb.com</a></p>\n","90":"<h2>Die Erbin Gandhis</h2>\n<p>(Staffel 3 Nr. 14, Fortlaufende Nr. 90; Erstausstrahlung: 01.05.2001)</p>\n\n<p>Der Sardar Sarovar Damm, Indiens größte Staumauer, wird um über hundert Meter erhöht. Dies führt jedoch zum Verlust von Lebensraum entlang des Narmada-Flusses. Die Menschen im Narmadatal weigern sich zu gehen und ziehen es vor, im Wasser des Flusses zu ertrinken. Zahlreiche Bauern haben sich der Organisation NBA angeschlossen, die gegen das Stauprojekt kämpft. Der Staudamm wächst täglich, während das Land und die Ressourcen verschwinden. Die Abholzung aller Bäume vor der Flut nimmt den Adivasi, den Ureinwohnern Indiens, ihre wichtigste Lebensgrundlage. Die Regierung bezeichnet die Umsiedlung als „Rehabilitation“, aber die Menschen betrachten sich nur als Vertriebene.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qoO1ZxQk_iQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/90-die-erbin-gandhis-widerstand-gegen-einen-staudamm-339408\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007047\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641948\">thetvdb.com</a></p>\n","91":"<h2>Die Spur der Wüstenkrokodile</h2>\n<p>(Staffel 3 Nr. 15, Fortlaufende Nr. 91; Erstausstrahlung: 02.05.2001)</p>\n\n<p>In der Sahara in Mauretanien wurden Wüstenkrokodile entdeckt, die seit Jahrzehnten als ausgestorben galten. Tara Shine, eine Umweltpädagogin, entdeckte sie im Winter 2000 in der mauretanischen Wüste. Sie informierte eine Gruppe von Wissenschaftlern, darunter der Biologe Hemmo Nickel vom Alexander-Koenig-Museum in Bonn. Gemeinsam erforschen sie nun das Verhalten dieser ungewöhnlichen Wüstenbewohner. Die Tiere werden mit Sendern ausgestattet, um ihren Aufenthaltsort genau zu verfolgen. Obwohl ihre Population klein ist, haben sie gute Überlebenschancen, obwohl Mensch und Reptil um begrenzte Wasserressourcen konkurrieren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MFuattuR9DA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/91-die-spur-der-wuestenkrokodile-339409\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007050\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641949\">thetvdb.com</a></p>\n","92":"<h2>Invasion der Biber</h2>\n<p>(Staffel 3 Nr. 16, Fortlaufende Nr. 92; Erstausstrahlung: 03.05.2001)</p>\n\n<p>In den siebziger Jahren verschwanden Biber aus großen Teilen Europas, wurden dann aber wieder eingeführt. Heute gibt es etwa 1200 Biber in der Nähe von Wien, die alle von einer ausgesetzten Population von 42 Tieren stammen. Die österreichische Zoologin Johanna Sieber begleitet die Biber wissenschaftlich und setzt sich als ihre wichtigste Fürsprecherin ein. Sie fängt und markiert die Tiere und siedelt Problemfälle um, um die Sorgen der Waldbesitzer zu lindern. Begegnungen zwischen Mensch und Tier sind selten, aber der Biberexperte Tomaš Hulik aus Bratislava hat das Vertrauen der Tiere gewonnen. Es bleibt jedoch fraglich, ob es gelingt, den Lebensraum mit den Bibern zu teilen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1lZYASab-T4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/92-invasion-der-biber-339410\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007054\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641950\">thetvdb.com</a></p>\n","93":"<h2>Kumbh Mela - Das größte Fest der Welt</h2>\n<p>(Staffel 3 Nr. 17, Fortlaufende Nr. 93; Erstausstrahlung: 04.06.2001)</p>\n\n<p>Das Maha Kumbh Mela, ein religiöses Fest in Nordindien, findet alle 12 Jahre statt. Innerhalb von zwei Monaten reisen 70 Millionen Menschen zu einer Flusskreuzung, um im heiligen Wasser des Ganges zu baden. Alok Sharma, ein 35-jähriger Mann, überblickt die Menschenmenge von seinem Pferd aus und koordiniert die 20.000 Polizisten, die für Sicherheit sorgen. Die Sterne stehen seit 144 Jahren günstig, und das Flusswasser gilt drei Tage lang als besonders heilig. Am heiligsten ist der Tag des Neumonds, an dem alle zur Flusskreuzung strömen, die nur wenig größer als ein Schwimmbecken ist. Sharma entscheidet, wer wann baden darf, um Massenpaniken zu vermeiden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GygKg1HaK3U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/93-kumbh-mela-das-groesste-fest-der-welt-339411\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007055\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641951\">thetvdb.com</a></p>\n","94":"<h2>Buzkashi - Spiel der Steppenreiter</h2>\n<p>(Staffel 3 Nr. 18, Fortlaufende Nr. 94; Erstausstrahlung: 05.06.2001)</p>\n\n<p>Die Tchovandoz sind mutige Reiter mit einer alten Erbschaft - dem Buzkashi-Spiel. Umaralli Haidarovitch, ein Lehrer und Bauer, ist der geschickteste Kämpfer in Tadschikistan. Vermummte Männer nähern sich mit nervösen Pferden und einer enthaupteten Ziege. Der Kreis schließt sich um den Kadaver, Staub wirbelt auf. Umaralli versucht im Galopp die Ziege zu ergreifen, während er von allen Seiten angegriffen wird. Seine Söhne trainieren ebenfalls, um Tchovandoz zu werden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6PKOPZ6vHfw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/94-buzkashi-spiel-der-steppenreiter-339413\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007043\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641952\">thetvdb.com</a></p>\n","95":"<h2>Wasserstoff im Tank</h2>\n<p>(Staffel 3 Nr. 19, Fortlaufende Nr. 95; Erstausstrahlung: 06.06.2001)</p>\n\n<p>Die größten Automobilkonzerne der Welt erforschen in Sacramento das zukünftige Wasserstoffauto, das nur Wasser ausstößt. Es bleibt jedoch noch viel zu tun, um sicherzustellen, dass das Auto auch auf langen Strecken funktioniert und überall auf der Welt Wasserstoff getankt werden kann. In Kalifornien wird ein marktreifes Auto entwickelt, das ausschließlich mit Wasserstoff fährt. DaimlerChrysler, Honda, Ford und Volkswagen forschen alle auf demselben Gelände in Sacramento und sind sich einig, dass Wasserstoff der Energieträger der Zukunft ist.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=H-U9h4gjRpQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/95-wasser-im-tank-339414\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007059\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641953\">thetvdb.com</a></p>\n","96":"<h2>Stau am Himmel</h2>\n<p>(Staffel 3 Nr. 20, Fortlaufende Nr. 96; Erstausstrahlung: 07.06.2001)</p>\n\n<p>Etwa 10.000 Flugzeuge sind weltweit im Einsatz. Allein in Europa gibt es jährlich knapp 9 Millionen Flüge, was zu überfüllten Flughäfen führt. Der gefährlichste Moment ist der Start. Der Kapitän Günter Neppach befindet sich auf einem Flug von London-Heathrow nach Frankfurt am Main. Die Besorgnis vor Kollisionen verschwindet erst, wenn sie hoch genug sind. Die Kontrolle über Start und Landung haben jedoch die Kollegen im Tower. In Frankfurt landen stündlich über 80 Maschinen. Um die Kapazität zu erhöhen, wurde in der Flugleitzentrale in Langen ein Satelliten-Navigationssystem eingeführt, das eine um etwa 30 Prozent höhere Flugkapazität im deutschen Luftraum ermöglichen soll. Doch führt dies auch zu mehr Sicherheit?</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dvHVBW4rOLY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/96-stau-am-himmel-339415\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007058\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641954\">thetvdb.com</a></p>\n","97":"<h2>Das Waisenhaus der Affen</h2>\n<p>(Staffel 3 Nr. 21, Fortlaufende Nr. 97; Erstausstrahlung: 03.09.2001)</p>\n\n<p>Auf der Insel Ngamba im Victoriasee leben dreißig junge Schimpansen, die ohne den Schutz der Insel und die Hilfe ihrer menschlichen Betreuer sterben würden. Sie sind Waisen, da ihre Eltern von Jägern getötet wurden. Bushmeat, das Affenfleisch aus dem Dschungel, wird als Delikatesse illegal verkauft. Die Insel fungiert als Waisenhaus und wird vom Jane Goodall Institut unterstützt. Die Schimpansenkinder leiden ähnlich wie Menschenkinder unter dem Verlust ihrer Eltern und müssen nun von Menschen lernen, was ihre Eltern ihnen nicht mehr beibringen konnten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bnV-Ze-vAZA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/97-das-waisenhaus-der-affen-339416\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007045\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641955\">thetvdb.com</a></p>\n","98":"<h2>Die Bisonwächter</h2>\n<p>(Staffel 3 Nr. 22, Fortlaufende Nr. 98; Erstausstrahlung: 04.09.2001)</p>\n\n<p>Bei Temperaturen von minus 40°C überwacht Mike Mease die Grenzen des Yellowstone Nationalparks, um die Bisons vor der Jagd außerhalb des Parks zu schützen. In der Nähe eines Wäldchens entdeckt er einen Bisonbullen im Schnee, der Atemwolken in den Morgen bläst. Vor drei Jahren erlebte Mike mit, wie eine der letzten Bisonherden Nordamerikas abgeschlachtet wurde, was zur Gründung der „Buffalo Field Campaign“ führte. Die Jäger argumentieren jedoch mit der Brucellose, obwohl diese Krankheit nur selten von Wildbisons auf Weidevieh übertragen wurde, und kein einziges Mal war ein Bison Überträger.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1Bf6xUJ2jJ0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/98-die-bisonwaechter-339418\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007046\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641956\">thetvdb.com</a></p>\n","99":"<h2>Die Farm der Schmetterlinge</h2>\n<p>(Staffel 3 Nr. 23, Fortlaufende Nr. 99; Erstausstrahlung: 05.09.2001)</p>\n\n<p>Costa Rica, ein Land von der Größe Niedersachsens, beheimatet fünf Prozent der weltweiten Artenvielfalt. Über 25 Prozent des Landes sind Nationalparks und Schutzgebiete, in denen die Menschen im Einklang mit der Natur leben. In Schmetterlingsfarmen wie der von Edgar Corrales werden wertvolle Schmetterlinge gezüchtet und weltweit verschickt. Corrales kümmert sich liebevoll um die Schmetterlinge, von der Aufzucht der Raupen bis zur Versorgung der Puppen. Zoos und botanische Gärten unterstützen die Züchter, indem sie die Puppen kaufen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bxBVKiUHOpE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/99-die-farm-der-schmetterlinge-339419\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007048\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641957\">thetvdb.com</a></p>\n"})
\ No newline at end of file
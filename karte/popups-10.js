@@ -0,0 +1 @@
+popupChunkLoaded(10,{"510":"<h2>Kushti, Indiens uralter Kampfsport</h2>\n<p>(Staffel 21 Nr. 1, Fortlaufende Nr. 510; frz. Titel “Inde, la lutte à mains nues”; Erstausstrahlung: 05.01.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=J9JyIhycLnU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/512-kushti-indiens-uralter-kampfsport-1254457\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6977226\">thetvdb.com</a></p>\n","520":"<h2>Hongkongs magisches Neonlicht</h2>\n<p>(Staffel 21 Nr. 11, Fortlaufende Nr. 520; frz. Titel “Hong Kong, la magie des néons”; Erstausstrahlung: 07.09.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=queiVaVuhg4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/522-hongkongs-magisches-neonlicht-1314341\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16352144\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7350925\">thetvdb.com</a></p>\n","537":"<h2>Die Zedernuss, die Königin der Taiga</h2>\n<p>(Staffel 22 Nr. 4, Fortlaufende Nr. 537; frz. Titel “Les Pignons de Cèdre, l'Or de la Taïga”; Erstausstrahlung: 09.02.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0kvHCK0011o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/539-die-zedernuss-die-koenigin-der-taiga-1352887\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21203618\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7581810\">thetvdb.com</a></p>\n","511":"<h2>Georgiens himmlische Klöster</h2>\n<p>(Staffel 21 Nr. 2, Fortlaufende Nr. 511; frz. Titel “Monastères, les Trésors Cachés de la Géorgie”; Erstausstrahlung: 19.01.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FBdpBp3eRm8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/513-georgiens-himmlische-kloester-1258177\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20190180\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6982371\">thetvdb.com</a></p>\n","523":"<h2>Auf Schlangenjagd in Bangkok</h2>\n<p>(Staffel 21 Nr. 14, Fortlaufende Nr. 523; frz. Titel “Bangkok, les Chasseurs de Serpents”; Erstausstrahlung: 12.10.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/525-auf-schlangenjagd-in-bangkok-1322905\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23643218\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7398590\">thetvdb.com</a></p>\n","500":"<h2>Argentinien - Der Jaguar ist zurück</h2>\n<p>(Staffel 20 Nr. 21, Fortlaufende Nr. 500; frz. Titel “Argentine, le Retour du Jaguar”; Erstausstrahlung: 27.10.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=paOkViJRTpg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/502-argentinien-der-jaguar-ist-zurueck-1235360\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14429962\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6881859\">thetvdb.com</a></p>\n","501":"<h2>Rooibos, der rote Tee Südafrikas</h2>\n<p>(Staffel 20 Nr. 22, Fortlaufende Nr. 501; frz. Titel “Rooibos — Le Thé Rouge d'Afrique du Sud”; Erstausstrahlung: 03.11.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GocBm5fcRKY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/503-rooibos-der-rote-tee-suedafrikas-1237427\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt9232664\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6894111\">thetvdb.com</a></p>\n","502":"<h2>Ankaras gerettete Bücher - Die Müll-Bibliothek von Cankaya</h2>\n<p>(Staffel 20 Nr. 23, Fortlaufende Nr. 502; frz. Titel “Ankara, une Deuxième Vie Pour les Livres”; Erstausstrahlung: 07.11.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=90iygjnd5KE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/504-die-muell-bibliothek-von-cankaya-1239188\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21139774\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6897060\">thetvdb.com</a></p>\n","503":"<h2>Äthiopiens gefräßige Hochland-Affen</h2>\n<p>(Staffel 20 Nr. 24, Fortlaufende Nr. 503; frz. Titel “Éthiopie — La Guerre des Singes”; Erstausstrahlung: 17.11.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JJXFy9S8b1M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/505-aethiopiens-gefraessige-hochland-affen-1240712\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6908214\">thetvdb.com</a></p>\n","504":"<h2>Sibirien - Im Reich des Amur-Tigers</h2>\n<p>(Staffel 20 Nr. 25, Fortlaufende Nr. 504; frz. Titel “Dans la Taïga, Sur les Traces du Tigre de Sibérie”; Erstausstrahlung: 12.11.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3NDivz33wdc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/506-sibirien-im-reich-des-amur-tigers-1243697\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20771558\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6902553\">thetvdb.com</a></p>\n","505":"<h2>Peru, das Goldhaar der Vikunjas</h2>\n<p>(Staffel 20 Nr. 26, Fortlaufende Nr. 505; frz. Titel “Pérou, une Laine Qui Vaut de l’Or”; Erstausstrahlung: 01.12.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=vrYNhC0APiQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/507-peru-das-goldhaar-der-vikunjas-1244960\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21928460\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6923991\">thetvdb.com</a></p>\n","506":"<h2>Jonathan, der Flugakrobat</h2>\n<p>(Staffel 20 Nr. 27, Fortlaufende Nr. 506; frz. Titel “Jonathan, Acrobate du Ciel”; Erstausstrahlung: 08.12.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=KxXSeCjQQQk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/508-jonathan-der-flugakrobat-1247061\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15101606\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6923990\">thetvdb.com</a></p>\n","507":"<h2>Harris Tweed - Rückkehr einer Legende</h2>\n<p>(Staffel 20 Nr. 28, Fortlaufende Nr. 507; frz. Titel “En Écosse, sur la route du tweed”; Erstausstrahlung: 15.12.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5uVU3J4oXak\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/509-harris-tweed-rueckkehr-einer-legende-1249761\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt11369594\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6941816\">thetvdb.com</a></p>\n","508":"<h2>Kenia, Let's Dance</h2>\n<p>(Staffel 20 Nr. 29, Fortlaufende Nr. 508; frz. Titel “Kenya, alors on danse”; Erstausstrahlung: 22.12.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NOHyqcrRSIo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/510-kenia-lets-dance-1251215\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20231942\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6952756\">thetvdb.com</a></p>\n","509":"<h2>Crémant, der feine Elsässer zum Fest</h2>\n<p>(Staffel 20 Nr. 30, Fortlaufende Nr. 509; frz. Titel “Crémant d'Alsace - Des bulles fines et festives”; Erstausstrahlung: 31.12.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1YcWaJWv8ZE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/511-cremant-der-feine-elsaesser-zum-fest-1253307\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26914689\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6970951\">thetvdb.com</a></p>\n","512":"<h2>Mexiko - Die edlen Reiterinnen</h2>\n<p>(Staffel 21 Nr. 3, Fortlaufende Nr. 512; frz. Titel “Mexique, les Cavalières de l'Escaramuza”; Erstausstrahlung: 26.01.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XDTrO7FnzAM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/514-mexiko-die-edlen-reiterinnen-1260727\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7010223\">thetvdb.com</a></p>\n","513":"<h2>Kroatien, Das Paradies der Trüffeljäger</h2>\n<p>(Staffel 21 Nr. 4, Fortlaufende Nr. 513; frz. Titel “Croatie, l'Autre Pays de la Truffe”; Erstausstrahlung: 09.02.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=yGvN68pp1xU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/515-kroatien-das-paradies-der-trueffeljaeger-1264723\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7017416\">thetvdb.com</a></p>\n","514":"<h2>Arnika - Von der Kraft einer Heilpflanze</h2>\n<p>(Staffel 21 Nr. 5, Fortlaufende Nr. 514; frz. Titel “Arnica, la Reine des Vosges”; Erstausstrahlung: 23.02.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Clpi_2hAmtA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/516-arnika-von-der-kraft-einer-heilpflanze-1266625\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt9874214\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7055450\">thetvdb.com</a></p>\n","515":"<h2>Simbabwe - Leben für den Augenblick</h2>\n<p>(Staffel 21 Nr. 6, Fortlaufende Nr. 515; frz. Titel “Lueurs d'Espoir au Zimbabwe”; Erstausstrahlung: 07.04.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=TDnqHD4GaEM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/517-simbabwe-leben-fuer-den-augenblick-1277291\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7122902\">thetvdb.com</a></p>\n","516":"<h2>Äthiopien - Heimat des Kaffees</h2>\n<p>(Staffel 21 Nr. 7, Fortlaufende Nr. 516; frz. Titel “Éthiopie, le berceau du café”; Erstausstrahlung: 01.06.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=u9JhD7R2818\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/518-aethiopien-heimat-des-kaffees-1290612\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16793592\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7217846\">thetvdb.com</a></p>\n","517":"<h2>Indien, ein Himmel voller bunter Drachen</h2>\n<p>(Staffel 21 Nr. 8, Fortlaufende Nr. 517; frz. Titel “Inde, la Magie des Cerfs-Volants”; Erstausstrahlung: 08.06.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-i-Jx_dF9kY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/519-indien-ein-himmel-voller-bunter-drachen-1292055\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7221261\">thetvdb.com</a></p>\n","518":"<h2>Norwegen, die Rentierprinzessin</h2>\n<p>(Staffel 21 Nr. 9, Fortlaufende Nr. 518; frz. Titel “Norvège, la princess des rennes”; Erstausstrahlung: 15.07.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=C-yvU6oUQks\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/520-norwegen-die-rentierprinzessin-1299992\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20854414\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7284824\">thetvdb.com</a></p>\n","543":"<h2>Huskys, am Start!</h2>\n<p>(Staffel 22 Nr. 10, Fortlaufende Nr. 543; frz. Titel “Huskies, top départ!”; Erstausstrahlung: 28.06.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3XyG82_dG-0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/545-huskys-am-start-1384225\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt17077618\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7818444\">thetvdb.com</a></p>\n","519":"<h2>Thaimassage, die Heilkunst der Buddhisten</h2>\n<p>(Staffel 21 Nr. 10, Fortlaufende Nr. 519; frz. Titel “Le Massage, une Tradition Thaïlandaise”; Erstausstrahlung: 25.08.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RR47fu7V2iU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/521-thaimassage-die-heilkunst-der-buddhisten-1310639\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23851456\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7334026\">thetvdb.com</a></p>\n","521":"<h2>Tibetische Medizin - Heilkraft für die Seele</h2>\n<p>(Staffel 21 Nr. 12, Fortlaufende Nr. 521; frz. Titel “La Médecine Tibétaine, l'Art de Guérir”; Erstausstrahlung: 29.09.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kMxhTVEXK5M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/523-tibetische-medizin-heilkraft-fuer-die-seele-1319247\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18938838\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7378725\">thetvdb.com</a></p>\n","522":"<h2>Sibirien, die Eisschneider von Jakutsk</h2>\n<p>(Staffel 21 Nr. 13, Fortlaufende Nr. 522; frz. Titel “Sibérie, les Découpeurs de Glace”; Erstausstrahlung: 05.10.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_pzMXsISUPU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/524-sibirien-die-eisschneider-von-jakutsk-1321009\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7397819\">thetvdb.com</a></p>\n","524":"<h2>Die blinde Primaballerina von São Paulo</h2>\n<p>(Staffel 21 Nr. 15, Fortlaufende Nr. 524; frz. Titel “La Grâce des Danseuses Aveugles de São Paulo”; Erstausstrahlung: 19.10.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NXWsLpDP-Mc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/526-die-blinde-primaballerina-von-sao-paulo-1324329\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27123058\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7412295\">thetvdb.com</a></p>\n","525":"<h2>Slowenien, Land des Honigs</h2>\n<p>(Staffel 21 Nr. 16, Fortlaufende Nr. 525; frz. Titel “Slovénie, le royaume des abeilles”; Erstausstrahlung: 26.10.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=QxhQbpP57PM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/527-slowenien-land-des-honigs-1328522\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21406216\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7423109\">thetvdb.com</a></p>\n","526":"<h2>Japan, der Meister des Zen-Gartens</h2>\n<p>(Staffel 21 Nr. 17, Fortlaufende Nr. 526; frz. Titel “Japon, l'Art du Jardin Zen”; Erstausstrahlung: 27.10.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CA-DwIr8lA4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/528-japan-der-meister-des-zen-gartens-1328528\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7423122\">thetvdb.com</a></p>\n","527":"<h2>Finnland, die rasenden Schrottkisten</h2>\n<p>(Staffel 21 Nr. 18, Fortlaufende Nr. 527; frz. Titel “Fous du Volant en Laponie”; Erstausstrahlung: 09.11.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=AR9cNhlECyA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/529-finnland-die-rasenden-schrottkisten-1330934\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7444447\">thetvdb.com</a></p>\n","528":"<h2>Heilende Schwingungen der Klangschalen</h2>\n<p>(Staffel 21 Nr. 19, Fortlaufende Nr. 528; frz. Titel “Bols tibétains, la thérapie par les Sons”; Erstausstrahlung: 10.11.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0JQRSU8Gzc0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/530-heilende-schwingungen-der-klangschalen-1330935\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22411134\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7444458\">thetvdb.com</a></p>\n","529":"<h2>Harpyien, die größten Greifvögel des Regenwaldes</h2>\n<p>(Staffel 21 Nr. 20, Fortlaufende Nr. 529; frz. Titel “La Harpie Féroce, le Plus Puissant Rapace du Monde”; Erstausstrahlung: 23.11.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rpnZILRBjaw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/531-harpyien-die-groessten-greifvoegel-des-regenwaldes-1334458\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15157400\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7457468\">thetvdb.com</a></p>\n","530":"<h2>Island: Von strickenden Männern und Pullovern</h2>\n<p>(Staffel 21 Nr. 21, Fortlaufende Nr. 530; frz. Titel “Islande — Le Tricot, une Affaire d'Hommes”; Erstausstrahlung: 08.12.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4lAHP0Q8908\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/532-island-von-strickenden-maennern-und-pullovern-1339073\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18413912\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7486315\">thetvdb.com</a></p>\n","531":"<h2>Kentucky - Die Schlacht von Sacramento</h2>\n<p>(Staffel 21 Nr. 22, Fortlaufende Nr. 531; frz. Titel “Kentucky, la Bataille de Sacramento”; Erstausstrahlung: 14.12.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BM7Tyu59rrI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/533-kentucky-die-schlacht-von-sacramento-1339867\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7496325\">thetvdb.com</a></p>\n","532":"<h2>Die letzten Walfänger der Beringsee</h2>\n<p>(Staffel 21 Nr. 23, Fortlaufende Nr. 532; frz. Titel “Les derniers chasseurs de baleines du détroit de Béring”; Erstausstrahlung: 21.12.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=IlG92mvmCEI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/534-die-letzten-walfaenger-der-beringsee-1341480\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7496340\">thetvdb.com</a></p>\n","533":"<h2>Kaviar, das schwarze Gold Italiens</h2>\n<p>(Staffel 21 Nr. 24, Fortlaufende Nr. 533; frz. Titel “Le Caviar, l'Or Noir de l'Italie”; Erstausstrahlung: 22.12.2019)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Opg00LWco4s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/535-kaviar-das-schwarze-gold-italiens-1341482\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16675680\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7496351\">thetvdb.com</a></p>\n","534":"<h2>Die Vespa-Rebellen in Indonesien</h2>\n<p>(Staffel 22 Nr. 1, Fortlaufende Nr. 534; frz. Titel “Indonésie, la Passion des Deux-Roues Trafiqués”; Erstausstrahlung: 05.01.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=T882pntN-Jo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/536-die-vespa-rebellen-in-indonesien-1344883\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7517155\">thetvdb.com</a></p>\n","535":"<h2>Costa Rica, das größte Hundeheim der Welt</h2>\n<p>(Staffel 22 Nr. 2, Fortlaufende Nr. 535; frz. Titel “Au Costa Rica, un Paradis Pour les Chiens Abandonnés”; Erstausstrahlung: 12.01.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5N1mFKBBFLg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/537-costa-rica-das-groesste-hundeheim-der-welt-1346786\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7542877\">thetvdb.com</a></p>\n","536":"<h2>Die Herren des Lavendels</h2>\n<p>(Staffel 22 Nr. 3, Fortlaufende Nr. 536; frz. Titel “Les Seigneurs de le Lavande”; Erstausstrahlung: 26.01.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=KEOwqcBWE2s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/538-die-herren-des-lavendels-1348630\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt11854728\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7557995\">thetvdb.com</a></p>\n","538":"<h2>Die Ostsee, Sehnsuchtsort der Kraniche</h2>\n<p>(Staffel 22 Nr. 5, Fortlaufende Nr. 538; frz. Titel “Mer Baltique, Voyage au Pays des Grues Cendrées”; Erstausstrahlung: 16.02.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=p-f4YVXnycM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/540-die-ostsee-sehnsuchtsort-der-kraniche-1352888\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21243234\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7594851\">thetvdb.com</a></p>\n","539":"<h2>Kapverden: Zwei Hunde als Schildkrötenretter</h2>\n<p>(Staffel 22 Nr. 6, Fortlaufende Nr. 539; frz. Titel “Cap-Vert, les Chiens au Secours des Tortues”; Erstausstrahlung: 23.02.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/541-kapverden-zwei-hunde-als-schildkroetenretter-1353321\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27123062\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7619012\">thetvdb.com</a></p>\n","540":"<h2>Die Schwestern der Erde</h2>\n<p>(Staffel 22 Nr. 7, Fortlaufende Nr. 540; frz. Titel “Grèce, les Petites Sœurs de la Terre”; Erstausstrahlung: 01.03.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=nfNQ5wCTWlQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/542-die-schwestern-der-erde-1355292\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14388672\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7619535\">thetvdb.com</a></p>\n","541":"<h2>Argentinien, von wilden Pferden und sanfter Hand</h2>\n<p>(Staffel 22 Nr. 8, Fortlaufende Nr. 541; frz. Titel “Oscar ou l'Art d'Apprivoiser les Chevaux”; Erstausstrahlung: 08.03.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UTT1hwyKwrw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/543-argentinien-von-wilden-pferden-und-sanfter-hand-1357300\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14706520\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7624143\">thetvdb.com</a></p>\n","542":"<h2>Indiens Kurkuma - Heilsam und heilig</h2>\n<p>(Staffel 22 Nr. 9, Fortlaufende Nr. 542; frz. Titel “Curcuma, une épice en or”; Erstausstrahlung: 14.06.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Qx7wwbJDDdE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/544-indiens-kurkuma-heilsam-und-heilig-1381765\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7793491\">thetvdb.com</a></p>\n","544":"<h2>Schignano, ein uralter Karneval in Italiens Bergen</h2>\n<p>(Staffel 22 Nr. 11, Fortlaufende Nr. 544; frz. Titel “Le carnaval de Schignano étrange et archaïque”; Erstausstrahlung: 25.07.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UBhl_XT1ixY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/546-schignano-ein-uralter-karneval-in-italiens-bergen-1388813\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18291258\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7859337\">thetvdb.com</a></p>\n","545":"<h2>Ring frei für Sambias Boxerinnen!</h2>\n<p>(Staffel 22 Nr. 12, Fortlaufende Nr. 545; frz. Titel “Zambie, les championnes du ring”; Erstausstrahlung: 16.08.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MmBs2InkDl0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/547-ring-frei-fuer-sambias-boxerinnen-1397612\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7890793\">thetvdb.com</a></p>\n","546":"<h2>Singvögel - Die goldenen Stimmen von Singapur</h2>\n<p>(Staffel 22 Nr. 13, Fortlaufende Nr. 546; frz. Titel “Singapour, quand les oiseaux chantent”; Erstausstrahlung: 13.09.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=nqHruOs-dqE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/548-singvoegel-die-goldenen-stimmen-von-singapur-1404279\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7933483\">thetvdb.com</a></p>\n","547":"<h2>Italiens Kapern - Der Geschmack des Südens</h2>\n<p>(Staffel 22 Nr. 14, Fortlaufende Nr. 547; frz. Titel “Les câpres de sicile, la saveur de la méditerranée”; Erstausstrahlung: 25.10.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wriortwg56E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/549-italiens-kapern-der-geschmack-des-suedens-1414438\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21801660\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8023022\">thetvdb.com</a></p>\n","548":"<h2>Der letzte Rheinfischer</h2>\n<p>(Staffel 22 Nr. 15, Fortlaufende Nr. 548; frz. Titel “Le dernier pêcheur du rhin”; Erstausstrahlung: 22.11.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1JPQTQtsjyA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/550-der-letzte-rheinfischer-1420915\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21139796\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8076150\">thetvdb.com</a></p>\n","549":"<h2>Mit Volldampf durch Kärnten</h2>\n<p>(Staffel 22 Nr. 16, Fortlaufende Nr. 549; frz. Titel “En autriche avec des mordus du rail”; Erstausstrahlung: 29.11.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0HrxXJsDky4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/551-mit-volldampf-durch-kaernten-1422151\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14188714\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8122019\">thetvdb.com</a></p>\n"})
\ No newline at end of file
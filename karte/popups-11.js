@@ -0,0 +1 @@
+popupChunkLoaded(11,{"597":"<h2>Indien - Kampf den Scharlatanen</h2>\n<p>(Staffel 24 Nr. 21, Fortlaufende Nr. 597; frz. Titel “Inde, vaincre les gourous”; Erstausstrahlung: 17.09.2022)</p>\n\n<p>In Indien kämpfen Rationalisten gegen gefährlichen Aberglauben und Geschäftemacherei mit Spiritualität. Mit ihrem Science-Van reisen sie durch das Land, um aufzuklären. Rationalisten glauben an Vernunft und Wissenschaft statt an Götter und Geister. Die Organisation hat fast 10.000 ehrenamtliche Mitglieder aus verschiedenen Berufen. Opfer reichen von Trickbetrügereien bis hin zu seelischer Misshandlung und ruinöser Abhängigkeit. Frauen sind besonders gefährdet aufgrund ihrer geringen Bildung.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-Clpkb3JdkI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/599-der-science-van-on-tour-indien-kampf-den-scharlatanen-1581860\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9352688\">thetvdb.com</a></p>\n","595":"<h2>Las Fallas - Valencias feurige Fiesta</h2>\n<p>(Staffel 24 Nr. 19, Fortlaufende Nr. 595; frz. Titel “Las fallas de Valencia, l’insolence à l’honneur”; Erstausstrahlung: 16.07.2022)</p>\n\n<p>Die Las Fallas de Valencia sind eine jährliche Feier in der drittgrößten Stadt Spaniens. Künstler wie Mario Gual del Olmo schaffen beeindruckende Straßenskulpturen, die im März traditionell verbrannt werden. Die Feierlichkeiten dauern eine Woche und beinhalten Spielmannsumzüge, Fanfaren, Feuerwerk und Böller. Ursprünglich im Mittelalter entstanden, wurden die Holzreste der Zimmerleute auf den Straßen verbrannt, um den Winter zu vertreiben. Heute haben die Fallas einen satirischen und sozialkritischen Aspekt. Es gibt rund 120 Künstler, die von diesem Handwerk leben, und die meisten haben ihre Werkstätten in einem eigenen Stadtviertel, der Ciudad Fallera. Jährlich entstehen fast 780 Skulpturen, die am Ende kollektiv verbrannt werden, außer einer „begnadigten Puppe“, die ins Museum wandert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ug2XFpN43CU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/597-las-fallas-valencias-feurige-fiesta-1569286\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21352210\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9254701\">thetvdb.com</a></p>\n","564":"<h2>Pelikane, die Könige des Donaudeltas</h2>\n<p>(Staffel 23 Nr. 12, Fortlaufende Nr. 564; frz. Titel “Le delta du danube, dernier refuge des pélicans”; Erstausstrahlung: 04.04.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ZgBcESvfvYA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/566-pelikane-die-koenige-des-donaudeltas-1456045\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14434664\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8355928\">thetvdb.com</a></p>\n","581":"<h2>Haute Couture - Federn, Falten, Seidenblumen</h2>\n<p>(Staffel 24 Nr. 5, Fortlaufende Nr. 581; Erstausstrahlung: 05.02.2022)</p>\n\n<p>Paris ist das Zentrum der Haute Couture für edlen Roben und extravaganten Designs. Séverina Lartigue und Eric Charles-Donatien sind Kunsthandwerker, die für namhafte Designer wie Jean Paul Gaultier und Christophe Josse arbeiten. Diese Künstler, darunter auch Karen Grigorian, verbindet die bedingungslose Leidenschaft für ihr Handwerk, das sie durch berühmte Lehrmeister und unzählige Stunden in einsamen Ateliers auf höchstem Niveau perfektioniert haben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=2MTSdkn22a4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/583-haute-couture-federn-falten-seidenblumen-1531089\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18228046\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949824\">thetvdb.com</a></p>\n","570":"<h2>Die heilenden Delfine von Curaçao</h2>\n<p>(Staffel 23 Nr. 18, Fortlaufende Nr. 570; frz. Titel “Curaçao, des dauphins thérapeutes”; Erstausstrahlung: 11.09.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wc4y3QIarAU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/572-die-heilenden-delfine-von-curacao-1492740\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15529128\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8634491\">thetvdb.com</a></p>\n","550":"<h2>Das Elsass, Heimat der Störche</h2>\n<p>(Staffel 22 Nr. 17, Fortlaufende Nr. 550; frz. Titel “L'Alsace, terre de cigognes”; Erstausstrahlung: 06.12.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BZaILC2jnoM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/552-das-elsass-heimat-der-stoerche-1426023\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt13616848\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8092659\">thetvdb.com</a></p>\n","551":"<h2>Lichterglanz im Norden - Winter in Stockholm und den Schären</h2>\n<p>(Staffel 22 Nr. 18, Fortlaufende Nr. 551; frz. Titel “Les lumières scandinaves : un hiver autour de Stockholm”; Erstausstrahlung: 13.12.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=uE8XcPEKQIo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/553-lichterglanz-im-norden-winter-in-stockholm-und-in-den-schaeren-1427055\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt13814040\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8103945\">thetvdb.com</a></p>\n","552":"<h2>Chartres, die Farben des Himmels</h2>\n<p>(Staffel 22 Nr. 19, Fortlaufende Nr. 552; frz. Titel “Chartres, l'art du vitrail”; Erstausstrahlung: 20.12.2020)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qPLtZngzS10\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/554-chartres-die-farben-des-himmels-1429102\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15105296\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8112897\">thetvdb.com</a></p>\n","553":"<h2>Bretagne, die raue Schönheit</h2>\n<p>(Staffel 23 Nr. 1, Fortlaufende Nr. 553; frz. Titel “La Bretagne entre terre et mer”; Erstausstrahlung: 03.01.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=o6cVARiIZGA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/555-bretagne-die-raue-schoenheit-1434440\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16316762\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8131737\">thetvdb.com</a></p>\n","554":"<h2>Pelota, die baskische Leidenschaft</h2>\n<p>(Staffel 23 Nr. 2, Fortlaufende Nr. 554; frz. Titel “Pays basque, l'âme en Pelote”; Erstausstrahlung: 10.01.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pDf_DqGQAJU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/556-pelota-die-baskische-leidenschaft-1436236\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18413904\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8145486\">thetvdb.com</a></p>\n","555":"<h2>Estland und das kleine Königreich der Seto</h2>\n<p>(Staffel 23 Nr. 3, Fortlaufende Nr. 555; frz. Titel “En estonie, le petit royaume de setomaa”; Erstausstrahlung: 31.01.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=zgv8oZfn-Sk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/557-estland-und-das-kleine-koenigreich-der-seto-1440392\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8209429\">thetvdb.com</a></p>\n","556":"<h2>Puerto Rico: Ein Krankenhaus für Seekühe</h2>\n<p>(Staffel 23 Nr. 4, Fortlaufende Nr. 556; frz. Titel “Porto Rico - Un hôpital pour les lamantins”; Erstausstrahlung: 07.02.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=B2ODRBt1BTI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/558-puerto-rico-ein-krankenhaus-fuer-seekuehe-1442086\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8209430\">thetvdb.com</a></p>\n","557":"<h2>Dem Wolf auf der Spur - Schnüffeln für den Artenschutz</h2>\n<p>(Staffel 23 Nr. 5, Fortlaufende Nr. 557; frz. Titel “Des chiens sur la piste des loups”; Erstausstrahlung: 14.02.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8zqR15KTGN4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/559-dem-wolf-auf-der-spur-schnueffeln-fuer-den-artenschutz-1442841\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14056190\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8228076\">thetvdb.com</a></p>\n","558":"<h2>Die Eifel und ihre Eulen-Hüter</h2>\n<p>(Staffel 23 Nr. 6, Fortlaufende Nr. 558; frz. Titel “Sauver les hiboux, c'est chouette”; Erstausstrahlung: 21.02.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=DGL9tZwu9z4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/560-die-eifel-und-ihre-eulen-hueter-1443627\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21073780\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8230361\">thetvdb.com</a></p>\n","559":"<h2>Percheron, das Kraftpaket mit einer Pferdestärke</h2>\n<p>(Staffel 23 Nr. 7, Fortlaufende Nr. 559; frz. Titel “Percheron, le retour du cheval de trait”; Erstausstrahlung: 28.02.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fr7QjYkoqf0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/561-percheron-das-kraftpaket-mit-einer-pferdestaerke-1444769\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14143482\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8270994\">thetvdb.com</a></p>\n","560":"<h2>Kalkstein - Das weiße Gold von Brač</h2>\n<p>(Staffel 23 Nr. 8, Fortlaufende Nr. 560; frz. Titel “Croatie, les trailleurs de pierre de Brač”; Erstausstrahlung: 07.03.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=sx5ieaeHnUs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/562-kalkstein-das-weisse-gold-von-brac-1446848\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8271000\">thetvdb.com</a></p>\n","561":"<h2>Hamburg - Welthafen mit schwimmender Kirche</h2>\n<p>(Staffel 23 Nr. 9, Fortlaufende Nr. 561; frz. Titel “Port d'Hambourg, un bateau-église insolite”; Erstausstrahlung: 14.03.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=p43Ug9kO7WQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/563-hamburg-welthafen-mit-schwimmender-kirche-1449045\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14429944\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8285562\">thetvdb.com</a></p>\n","562":"<h2>Tradition am Steilhang - Die Schweiz und ihre Wildheuer</h2>\n<p>(Staffel 23 Nr. 10, Fortlaufende Nr. 562; frz. Titel “La fenaison en montagne, une tradition Suisse”; Erstausstrahlung: 21.03.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FsESCsAehtk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/564-tradition-am-steilhang-die-schweiz-und-ihre-wildheuer-1451154\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14434674\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8320384\">thetvdb.com</a></p>\n","563":"<h2>Biber, die Baumeister an der Elbe</h2>\n<p>(Staffel 23 Nr. 11, Fortlaufende Nr. 563; frz. Titel “La revanche du castor”; Erstausstrahlung: 28.03.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=X8fy7jZl_rE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/565-biber-die-baumeister-an-der-elbe-1453165\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14338900\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8320385\">thetvdb.com</a></p>\n","565":"<h2>Frankreichs Winzer - Tradition trifft Passion</h2>\n<p>(Staffel 23 Nr. 13, Fortlaufende Nr. 565; frz. Titel “Le renouveau du vignoble français”; Erstausstrahlung: 18.04.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pQaBkRIgRk0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/567-frankreichs-winzer-tradition-trifft-passion-1457511\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14477970\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8375958\">thetvdb.com</a></p>\n","566":"<h2>Notruf Nordseeküste - Die Robben-Retter</h2>\n<p>(Staffel 23 Nr. 14, Fortlaufende Nr. 566; frz. Titel “Mer du Nord, sauvons les bébés phoques”; Erstausstrahlung: 25.04.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ltSG2rftqu8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/568-notruf-nordseekueste-die-robben-retter-1459069\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8375959\">thetvdb.com</a></p>\n","567":"<h2>Australien - Wenn Kunst auf Silos trifft</h2>\n<p>(Staffel 23 Nr. 15, Fortlaufende Nr. 567; frz. Titel “Australie, le street art s'invite sur les silos”; Erstausstrahlung: 09.05.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=G8JDOqwLGog\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/569-australien-wenn-kunst-auf-silos-trifft-1462468\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8375960\">thetvdb.com</a></p>\n","568":"<h2>Der Wüstenzug - die Lebensader Mauretaniens</h2>\n<p>(Staffel 23 Nr. 16, Fortlaufende Nr. 568; frz. Titel “Mauritanie, le train du désert”; Erstausstrahlung: 28.08.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=k9jFka2IecU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/570-der-wuestenzug-die-lebensader-mauretaniens-1489640\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8634489\">thetvdb.com</a></p>\n","569":"<h2>Escobars Erbe - Kolumbiens Kokain-Hippos</h2>\n<p>(Staffel 23 Nr. 17, Fortlaufende Nr. 569; frz. Titel “Les hippopotames de Pablo Escobar”; Erstausstrahlung: 04.09.2021)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=T8zWiccuv0w\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/571-escobars-erbe-kolumbiens-kokain-hippos-1491102\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15529088\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8634490\">thetvdb.com</a></p>\n","571":"<h2>Der Traum vom Gold - Tirols Überfliegerinnen</h2>\n<p>(Staffel 23 Nr. 19, Fortlaufende Nr. 571; frz. Titel “Le saut à ski féminin prend son envol”; Erstausstrahlung: 11.09.2021)</p>\n\n<p>Frauen erobern die Skisprungschanze und kämpfen sich in diese einst männliche Domäne. Das österreichische Skigymnasium Stams ist eine renommierte Talentschmiede und bildet junge Nachwuchsspringerinnen aus, die das Ziel haben, an die Spitze der Welt zu gelangen. Paula von Lamberg war eine Pionierin des Damenskisprungs und stellte 1911 einen Weltrekord auf. Obwohl es fast hundert Jahre dauerte, bis das Skispringen der Frauen anerkannt wurde, kämpfen sie heute immer noch um mediale Aufmerksamkeit. Julia Mühlbacher und Martina Ambrosi gehören zu den vielversprechendsten Nachwuchshoffnungen und wollen das Frauen-Skispringen stärker in den Fokus rücken. Martina muss ihre persönlichen Ängste überwinden, um ihre langersehnte Chance auf eine Teilnahme an der Weltmeisterschaft zu nutzen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9z8Eer2KngU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/573-der-traum-vom-gold-tirols-ueberfliegerinnen-1494060\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15455872\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8692435\">thetvdb.com</a></p>\n","572":"<h2>Schweiz: Gletscherflieger - Faszination in Weiß</h2>\n<p>(Staffel 23 Nr. 20, Fortlaufende Nr. 572; frz. Titel “Suisse, en vol avec des pilotes des glaciers”; Erstausstrahlung: 25.09.2021)</p>\n\n<p>In der Schweiz rettet die Rega, die Schweizer Rettungsflugwacht, täglich Leben in den Tälern und Bergen. Die Gletscherfliegerei gilt als anspruchsvolle Königsdisziplin für Piloten und hat schon vielen Menschen geholfen. Isabel Menzi, eine Pilotin bei einer Fluggesellschaft, möchte Gletscherpilotin werden und absolviert eine intensive Ausbildung. Die Gletscherfliegerei ermöglichte den Bau von Berghütten und ist schwierig aufgrund des schwierigen Geländes. Die Ausbildung erfordert Hunderte von Flugstunden. Notarzt Joachim Koppenberg verlässt sich auf die Erfahrung seines Piloten, um schnell zu Unfallorten in den Bergen zu gelangen. Die Gletscherfliegerei entstand aus einem schweren Unglück im Jahr 1946, als ein Schweizer Pilot Kufen an zwei Flugzeugen anbrachte, um Überlebende in den eisigen Höhen zu bergen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jEZT_6_qloo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/574-schweiz-gletscherflieger-faszination-in-weiss-1495977\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16590496\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8692436\">thetvdb.com</a></p>\n","573":"<h2>Koh Panyee - Thailands fußballverrückte Insel</h2>\n<p>(Staffel 23 Nr. 21, Fortlaufende Nr. 573; frz. Titel “Thaïlande, un terrain de football insolite”; Erstausstrahlung: 02.10.2021)</p>\n\n<p>Die kleine Insel Koh Panyee in Thailand, umgeben von hohen Karstfelsen, hat ein schwimmendes Fußballstadion. Das Stadion ist jedoch in einem schlechten Zustand und muss vor einem großen Turnier renoviert werden. Die Bewohner der Insel leben auf Stelzen über dem Wasser und sind hauptsächlich Fischer. Trotzdem sind sie fußballbegeistert und wollen ihr Dorf wieder zu einer Fußballhochburg machen. Mit Spenden und harter Arbeit soll das Stadion spielbereit gemacht werden. Das Team der Insel ist hochmotiviert und trainiert sogar auf einer Sandbank, um beim Heimturnier erfolgreich zu sein.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RC_j7QQ1r5U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/575-koh-panyee-thailands-fussballverrueckte-insel-1497505\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15535426\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8692437\">thetvdb.com</a></p>\n","574":"<h2>Stromboli - Zwischen Feuer und Meer</h2>\n<p>(Staffel 23 Nr. 22, Fortlaufende Nr. 574; frz. Titel “Stromboli, terre de feu”; Erstausstrahlung: 09.10.2021)</p>\n\n<p>Auf der Insel Stromboli leben etwa 300 Menschen am Fuße eines aktiven Vulkans. Die Bewohner sind Künstler, Bauern, Bergführer und vor allem Fischer. Trotz geringem Profit fischen sie nachhaltig ohne moderne Technik und scheinen von der modernen Welt entrückt zu sein. Einige junge Menschen, wie der 22-jährige Andrea, kehren zurück, um die Fischerei von ihrem Vater zu erlernen. Der Vulkan bedroht die Insel regelmäßig, doch die Anziehungskraft und der Zauber der Insel halten an. Vulkanologe Giovanni besteigt den Vulkan, um neue Messgeräte zu installieren und die Gefahr einzuschätzen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_z29qS0mTjY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/576-stromboli-zwischen-feuer-und-meer-1499263\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15610994\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8692438\">thetvdb.com</a></p>\n","575":"<h2>Italien - Die Igel-Retter aus dem Piemont</h2>\n<p>(Staffel 23 Nr. 23, Fortlaufende Nr. 575; frz. Titel “Italie, un refuge pour hérissons”; Erstausstrahlung: 16.10.2021)</p>\n\n<p>Dr. Massimo Vacchetta leitet die einzige Igelklinik Italiens. Er kümmert sich mit seinem Team um verletzte Igel, die Opfer von Unfällen mit Autos oder Gartengeräten wurden. Mit viel Feingefühl und unkonventionellen Methoden werden die stacheligen Patienten wochenlang gepflegt, um sie fit für ein Leben in der Natur zu machen. Alles begann mit einem winzigen Igelmädchen namens Ninna, das Dr. Massimo tief berührte. Gesunde Igel werden sorgfältig in die Freiheit entlassen, was für den „Igel-Doktor“ jedes Mal ein glücklicher, aber auch wehmütiger Moment ist.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FN8ybVCWbVw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/577-italien-die-igel-retter-aus-dem-piemont-1501091\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt17043702\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8788087\">thetvdb.com</a></p>\n","576":"<h2>Dolomiten: Die Bergführer von San Martino</h2>\n<p>(Staffel 23 Nr. 24, Fortlaufende Nr. 576; frz. Titel “Dolomites, la passion de l'alpinisme”; Erstausstrahlung: 30.10.2021)</p>\n\n<p>Die Sendung erzählt von Aquile di San Martino, dem bekanntesten und ältesten Bergsteigerverein in den Dolomiten. Zwei Bergführer, Rocco und der junge Livio, stellen sich einer herausfordernden Expedition an einer Extremwand der Pale di San Martino. Rocco führt erfahrene Kletterer an der Wand entlang und beschützt sie, während Livio diese Expedition als letzten Test bestehen muss.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rqDUm-WpZJ0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/578-dolomiten-die-bergfuehrer-von-san-martino-1508252\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15746990\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8814843\">thetvdb.com</a></p>\n","577":"<h2>Die Lowrider-Ladies von L.A.</h2>\n<p>(Staffel 24 Nr. 1, Fortlaufende Nr. 577; frz. Titel “Los Angeles, les reines du lowriding”; Erstausstrahlung: 08.01.2022)</p>\n\n<p>Der Lowrider-Motorsport ist ein Hobby der „Chicanos“ mit mexikanischen Wurzeln. Die Autos sind extrem tief gelegt und können mithilfe von Hydraulikmotoren sogar springen. Die „First Class Ladies“ sind ein Frauenclub, der das Image der Lowrider verbessern möchte und Spenden für Obdachlose in L.A. sammelt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3ql7jtqylzU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/579-die-lowrider-ladies-von-la-1523102\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949820\">thetvdb.com</a></p>\n","578":"<h2>Tapire - Die Dschungel-Gärtner</h2>\n<p>(Staffel 24 Nr. 2, Fortlaufende Nr. 578; frz. Titel “Le tapir, jardinier des forêts tropicales”; Erstausstrahlung: 15.01.2022)</p>\n\n<p>Tapire, einst im gesamten amerikanischen Kontinent beheimatet, sind heute nur noch in wenigen Regionen Mittel- und Südamerikas anzutreffen. Menschliche Aktivitäten wie Abholzung, Wilderei und der Bau von Autobahnen haben zu einem drastischen Rückgang der Tiere geführt. In Costa Rica und Nicaragua versuchen Biologen das Überleben der Tapire zu sichern. Ein Zuchtprogramm im Zoo von Managua hat bereits Erfolge erzielt, sodass zwei Tiere zur Auswilderung vorbereitet werden. In Costa Rica widmet sich die Organisation Nai Conservation dem Schutz der wildlebenden Tapire. Die Wissenschaftler verwenden GPS-Halsbänder, um mehr über das Verhalten und die Gefahren für die Tiere zu erfahren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bQXxzQjmPvo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/580-tapire-die-dschungel-gaertner-1526120\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949821\">thetvdb.com</a></p>\n","579":"<h2>Faszination Elbrus - Der Ritt zum Gipfel</h2>\n<p>(Staffel 24 Nr. 3, Fortlaufende Nr. 579; frz. Titel “Caucase, chevauchèe vers le mont elbrouz”; Erstausstrahlung: 22.01.2022)</p>\n\n<p>Karachai-Pferde sind legendäre Nutztiere im Süden Russlands, die fast ausgestorben waren, aber von lokalen Züchtern gerettet wurden. Sie sind ein wichtiger Teil der kaukasischen Kultur und wurden einst für die Eroberung des Kaukasus genutzt. Der Pferdezüchter Hassan Salpagarow plant nun, den Elbrus mit diesen Pferden zu besteigen. Die Karachai-Pferde finden ausreichend Nahrung auf den saftigen Hochweiden im Nordkaukasus. Die Pferderasse war in den 30er Jahren von Stalins Säuberungspolitik betroffen, doch durch die Rückbesinnung auf die kaukasische Identität erleben sie ein Comeback. Trotz der extremen Bedingungen am Elbrus hofft man, dass der Gipfel des Elbrus erneut mit Pferden erklommen werden kann.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FgNR3JW-QbE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/581-faszination-elbrus-der-ritt-zum-gipfel-1526526\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949822\">thetvdb.com</a></p>\n","580":"<h2>Namibias Geparden - Hoffnung für die Raubkatzen</h2>\n<p>(Staffel 24 Nr. 4, Fortlaufende Nr. 580; frz. Titel “Namibie, l'espoir renait pour les guépards”; Erstausstrahlung: 29.01.2022)</p>\n\n<p>Namibia hat zahlreiche Schutzgebiete und Tierreservate, die fast 40 Prozent der Landesfläche umfassen. Die Gepardenpopulation in Namibia ist auf etwa 8.000 geschätzt, wobei mehr als ein Drittel von ihnen dort lebt. Trockenheit, Wilderei und der Wettbewerb mit Leoparden haben den Gepardenbestand reduziert. Tierschützer, Veterinäre und engagierte Menschen kämpfen um das Überleben der Raubkatzen. Die Geparden leben hauptsächlich auf fruchtbarem Farmland, wo sie eine Bedrohung für das Vieh der Bauern darstellen. Tierschutzorganisationen bieten den Bauern alternative Lösungen an, um Konflikte zu vermeiden. Mobile Teams fangen Geparden ein und versehen sie mit Sendern, um ihre Positionen zu verfolgen. Fährtenleser wie Debe unterstützen bei der Suche und dem Fangen der Tiere, insbesondere des Gepardenweibchens Amber.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=s9UPirsiFbA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/582-namibias-geparden-hoffnung-fuer-die-raubkatzen-1528457\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949823\">thetvdb.com</a></p>\n","582":"<h2>Die Odyssee der Mönchsrobbe</h2>\n<p>(Staffel 24 Nr. 6, Fortlaufende Nr. 582; frz. Titel “L'Odyssèe du phoque moine”; Erstausstrahlung: 19.02.2022)</p>\n\n<p>Ein Forschungsteam der Octopus Foundation reist nach Griechenland, um autonome Kameras zu installieren und die Mönchsrobben im Mittelmeer zu studieren. Die scheuen Meeressäuger verstecken sich in unzugänglichen Höhlen, um sich vor Menschen zu schützen. Früher wurden sie gejagt, aber jetzt sind sie stark gefährdet. Das Team hofft, mehr über die Robben zu erfahren und ihren Lebensraum zu schützen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=IrOfUxc812k\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/584-die-odyssee-der-moenchsrobbe-1531389\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18279912\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949825\">thetvdb.com</a></p>\n","583":"<h2>Elsass - Land der Orgeln</h2>\n<p>(Staffel 24 Nr. 7, Fortlaufende Nr. 583; frz. Titel “Alsace, terre d'orgues”; Erstausstrahlung: 26.02.2022)</p>\n\n<p>Patrick Armand ist ein renommierter Orgelbauer und Besitzer der ältesten Orgelbau-Manufaktur, der Firma Muhleisen, in Eschau im Elsass. Das Elsass beherbergt die meisten Orgeln in Frankreich, mit 1.250 von insgesamt 8.000 im ganzen Land. Die Manufaktur widmet sich der Wartung, Restaurierung, dem Neubau und der Ausreinigung von Orgeln. Die Orgelbauer sind sowohl musikalisch qualifiziert als auch handwerklich geschickt und arbeiten mit verschiedenen Materialien wie Holz, Eisen und Metalllegierungen. Die Projekte dauern oft mehrere Jahre. Aktuell plant die Manufaktur den Bau einer Orgel für eine Kirche in Köln, die Ausreinigung eines Instruments in Versailles und die vollständige Überholung der Orgel in der Kathedrale Notre-Dame in Amiens.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Ef81fAqnuJs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/585-elsass-land-der-orgeln-1533617\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18335884\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8949826\">thetvdb.com</a></p>\n","584":"<h2>Wilde Waterkant - Nordfriesland und seine Gänse</h2>\n<p>(Staffel 24 Nr. 8, Fortlaufende Nr. 584; frz. Titel “Mer du nord, le retour des oies sauvages”; Erstausstrahlung: 12.03.2022)</p>\n\n<p>Vor 50 Jahren waren Nonnengänse vom Aussterben bedroht, aber heute gibt es Hunderttausende von ihnen. Sie brüten nicht mehr nur in den Polargebieten, sondern auch an der Ostsee und an der Westküste Norddeutschlands. Während Biologen und Naturschützer sich darüber freuen, sind viele Landwirte besorgt, da die Vögel große Schäden auf ihren Feldern verursachen. Einige Gänse bleiben den ganzen Sommer in Nordfriesland und vermehren sich aufgrund von Schutzmaßnahmen stark. Bauern fordern eine Bejagung, während Naturschützer und Vogelliebhaber dies verhindern wollen. Die Suche nach einem Kompromiss für beide Seiten ist aktuell eine Herausforderung.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=p33T3S0tqBA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/586-wilde-waterkant-nordfriesland-und-seine-gaense-1537573\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18603248\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/8993022\">thetvdb.com</a></p>\n","585":"<h2>Die Puppen tanzen! - Litauens rollendes Theater</h2>\n<p>(Staffel 24 Nr. 9, Fortlaufende Nr. 585; frz. Titel “Lituanie, l'art des marionnettes”; Erstausstrahlung: 26.03.2022)</p>\n\n<p>Das Marionettenkutschentheater aus Panevezys führt jedes Jahr im Sommer seine Kunst in abgelegenen litauischen Dörfern auf. Mit einem motorisierten, aber als Dampflok dekorierten Fahrzeug fährt das Ensemble in entlegene Gegenden. Die meisten Bewohner haben keinen Zugang zu modernen Einrichtungen wie Kinos oder Schwimmbädern. Der 23-jährige Puppenspieler Daniel begleitet die Gruppe zum ersten Mal auf Tour und hofft, eine größere Rolle übernehmen zu dürfen. Allerdings hat er Schwierigkeiten bei den Proben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=axKuA1qBWGQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/587-die-puppen-tanzen-litauens-rollendes-theater-1540410\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22300542\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9075607\">thetvdb.com</a></p>\n","586":"<h2>Südkorea - die Nonne der Tempelküche</h2>\n<p>(Staffel 24 Nr. 10, Fortlaufende Nr. 586; frz. Titel “Temple Food, l’âme de la cuisine coréenne”; Erstausstrahlung: 07.05.2022)</p>\n\n<p>Wookwan Sunim bevorzugt natürliche Zutaten, die saisonal und regional gewachsen sind. Im Kloster werden wilde Pflanzen aus dem Gemüsegarten, Blumenbeeten, dem Wald und Schotterwegen verwendet. Die Nonnen nutzen Blüten für Tee, Blätter für Salate und trocknen und frittieren frisch ausgegrabene Wurzeln. Im Winter suchen sie nach nährstoffreichen Wurzeln im Wald. Die Äbtissin bereitet die Wurzeln mit selbst gemachten Pasten und Soßen zu, um unerwünschte Bitter- und Giftstoffe zu entfernen. Die Tempelküche basiert auf Sojasoße, Chilipaste und Sojabohnenpaste. Neben dem gesundheitlichen Aspekt werden die aromatischen Geschmackskreationen international anerkannt. Die Tempelküche und tägliche Gebete sind eine vitale Symbiose im Zen-Buddhismus Südkoreas.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=if6OhSEjkxM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/588-suedkorea-die-nonne-der-tempelkueche-1557485\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158123\">thetvdb.com</a></p>\n","587":"<h2>Schwerelos im Windkanal</h2>\n<p>(Staffel 24 Nr. 11, Fortlaufende Nr. 587; frz. Titel “Portès par le vent, le vol en soufflerie”; Erstausstrahlung: 14.05.2022)</p>\n\n<p>Im größten Indoor-Windtunnel Europas bei Mailand wird der Traum vom Fliegen wahr. Ursprünglich für die Luft- und Raumfahrt entwickelt, sind Freifallsimulatoren nun auch Freizeitspaß und Bühne für Leistungssportler wie Laurie Lubbe. Sie ist eine Freestylerin, die hart für die französischen Meisterschaften trainiert. Als Teil der französischen Nationalmannschaft fliegt sie im Windkanal in der künstlerischen Disziplin Freestyle. Mit einer Geschwindigkeit von 200 km/h muss sie ihren Körper kontrollieren und jede Bewegung hat große Auswirkungen. Laurie hofft, mit ihrer Anmut und Eleganz die Preisrichter in Lyon zu überzeugen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jp5BDv9KCzY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/589-schwerelos-im-windkanal-1551765\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20231988\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158124\">thetvdb.com</a></p>\n","588":"<h2>Frankreichs Gärten - Die kleinen Schätze</h2>\n<p>(Staffel 24 Nr. 12, Fortlaufende Nr. 588; frz. Titel “Le trèsor du jardinier”; Erstausstrahlung: 21.05.2022)</p>\n\n<p>Serge Denoix und Laurence Beaufils sind leidenschaftliche Gärtner und interessieren sich auch für alte Gartenwerkzeuge. Sie sammeln Fundstücke, deren Zweck und Herkunft sie mühsam recherchieren müssen. Unterstützt werden sie dabei von Landwirten, Handwerkern und Antiquitätenhändlern. Viele der Werkzeuge sind beschädigt und abgenutzt, daher müssen sie aufwendig von Hand restauriert werden. Ein besonders wertvolles Stück, ein alter Blumenpflücker, soll von einem Goldschmied repariert werden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6eWUfGWASTA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/590-frankreichs-gaerten-die-kleinen-schaetze-1553064\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20190184\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158125\">thetvdb.com</a></p>\n","589":"<h2>Europas Urwälder - Ein Schatz der Natur</h2>\n<p>(Staffel 24 Nr. 13, Fortlaufende Nr. 589; frz. Titel “Forêts primaires, le poumon vert de l'europe”; Erstausstrahlung: 04.06.2022)</p>\n\n<p>Martin Mikolas, ein slowakischer Waldökologe und Naturschützer, leitet wissenschaftliche Expeditionen in die letzten Urwälder Europas. Sein aktuelles Ziel ist ein abgelegener Buchenwald in den Albanischen Alpen. Das Team wandert stundenlang, um den Urwald zu erreichen, und sammelt Daten über Bäume und Bodenproben. Die Forschungsergebnisse werden in Prag ausgewertet und könnten wertvolle Informationen über die Anpassungsfähigkeit von Bäumen und den Klimawandel liefern. Das Urwaldarchiv enthält bereits Tausende von Bohrkernen aus Primärwäldern.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JXN5lNsTZCI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/591-europas-urwaelder-ein-schatz-der-natur-1556566\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20854434\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158126\">thetvdb.com</a></p>\n","590":"<h2>Panzer, Wölfe, Rothirsche - Bayerns wilder Übungsplatz</h2>\n<p>(Staffel 24 Nr. 14, Fortlaufende Nr. 590; frz. Titel “Loups et cerfs à l'ombre des blindès”; Erstausstrahlung: 11.06.2022)</p>\n\n<p>Im oberpfälzischen Grafenwöhr, auf dem Truppenübungsplatz der US-Streitkräfte, hat sich ein einzigartiges Naturrefugium entwickelt. Trotz des ständigen Schießens leben dort zahlreiche Tierarten ungestört. Nun wird der Einfluss des Wolfs auf die Rotwild-Bestände untersucht. Das Wildbiologische Institut Göttingen und Dresden führt das Projekt mit einer Sondergenehmigung der US-Armee durch. Marcus Meißner und Maria Zetsche erforschen das Verhalten der Rothirsche mittels GPS-Sendern. Die Tiere werden erneut gefangen und mit Sendern ausgestattet, um den Einfluss der Wölfe zu untersuchen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kyrHUKDiyck\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/592-panzer-woelfe-rothirsche-bayerns-wilder-uebungsplatz-1559229\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21030816\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158127\">thetvdb.com</a></p>\n","591":"<h2>Kastiliens Kämpfer - Ritterspiele an der Burg Belmonte</h2>\n<p>(Staffel 24 Nr. 15, Fortlaufende Nr. 591; frz. Titel “Le béhourd, l'art du combat médiéval”; Erstausstrahlung: 18.06.2022)</p>\n\n<p>Der mittelalterliche Turniersport erlebt in Spanien einen Boom. Jedes Jahr findet ein großes Turnier am Fuße der Burg Belmonte in Kastilien-La Mancha statt. Die Teilnehmer treten in historischer Ritterrüstung mit Schwertern, Äxten und Hellebarden in Duellen oder als Mannschaft gegeneinander an. Die Kämpfe sind hart und anstrengend, dauern bis zu eineinhalb Minuten und erfordern physische und mentale Stärke. Die Waffen sind aus Sicherheitsgründen ohne Spitze und scharfe Klinge.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wZgpqRaV7Ik\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/593-kastiliens-kaempfer-ritterspiele-an-der-burg-belmonte-1560073\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21073772\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9158128\">thetvdb.com</a></p>\n","592":"<h2>Nopal, der Alleskönner aus Mexiko</h2>\n<p>(Staffel 24 Nr. 16, Fortlaufende Nr. 592; frz. Titel “Cactus, l'or vert du mexique”; Erstausstrahlung: 25.06.2022)</p>\n\n<p>Der mexikanische Feigenkaktus Nopal wird als Superfood und Inspiration für Modeideen verwendet. Junge Unternehmerinnen und Unternehmer haben veganes Leder aus dieser Pflanze entwickelt. Es könnte eine Revolution in der Lederindustrie bedeuten. Consuelo Lara besitzt Kaktusfelder in Milpa Alta, Mexiko-Stadt, und hat eine Kooperative gegründet, um Frauen Arbeit zu bieten. Sie plant, ihren Bio-Nopal unter einer eigenen Marke mit regionalem Herkunftslabel zu vermarkten. Adrián López und Marte Cázarez haben eine umweltfreundliche Alternative zu tierischem und synthetischem Leder entwickelt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MkXx_8rac_M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/594-nopal-der-alleskoenner-aus-mexiko-1564718\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21203634\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9254698\">thetvdb.com</a></p>\n","593":"<h2>Tempo und Leidenschaft - Argentiniens Polo-Spielerinnen</h2>\n<p>(Staffel 24 Nr. 17, Fortlaufende Nr. 593; frz. Titel “Argentine, le polo au féminin”; Erstausstrahlung: 02.07.2022)</p>\n\n<p>Die Polosportwelt dreht sich um Pferde und engagierte Fachleute wie Tierärzte, Pferdepfleger, Trainer und Hufschmiede. In Argentinien, dem Land der Pferde, haben Frauen den männerdominierten Sport erobert und sind sehr erfolgreich. Eine herausragende Spielerin ist Clarita Cassino, die den Sport seit ihrer Kindheit betreibt. Silvina Casadedio ist eine weitere starke Frau in der Szene, die Rinder züchtet und als Pferdezähmerin arbeitet. Sie hat viel geopfert, um ihren Traum zu leben und ihre Zeit den Pferden zu widmen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Y-eQibAkbmo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/595-tempo-und-leidenschaft-argentiniens-polo-spielerinnen-1570263\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21243244\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9254699\">thetvdb.com</a></p>\n","594":"<h2>Kourou: Palmen, Raketen, Gefängnisinseln</h2>\n<p>(Staffel 24 Nr. 18, Fortlaufende Nr. 594; frz. Titel “Kourou, des bagnes et des fusées”; Erstausstrahlung: 09.07.2022)</p>\n\n<p>Europäische Raketen und Satelliten starten regelmäßig vom Raumfahrtzentrum in Französisch-Guayana. Drei vorgelagerte Inseln, einst Gefängnisinseln, müssen vor jedem Countdown aus Sicherheitsgründen evakuiert werden. Die verfallenen Gebäude wurden von der Natur überwuchert, doch Frankreich beginnt nun mit der Sanierung, um das historische Erbe zu bewahren. Aurélie Schneider ist für die Renovierung beauftragt, damit die Anlagen bald Besuchern offenstehen können.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=LckZ2_Lw88E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/596-kourou-palmen-raketen-gefaengnisinseln-1567103\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21294972\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9254700\">thetvdb.com</a></p>\n","596":"<h2>Das Gerichtsschiff vom Amazonas</h2>\n<p>(Staffel 24 Nr. 20, Fortlaufende Nr. 596; frz. Titel “Le tribunal flottant de l'amazone”; Erstausstrahlung: 06.08.2022)</p>\n\n<p>Die Initiative „Justicia Itinerante“ wurde von der Richterin Sueli Pini ins Leben gerufen, um den Menschen im abgelegenen Amazonas-Delta Zugang zur Justiz zu ermöglichen. Mit einem Justizschiff namens „Joao Bruno II“ reisen brasilianische Richter seit vielen Jahren zu den entlegenen Dörfern, in denen Menschen ohne Pass oder Geburtsurkunde leben. Durch diese Maßnahme sollen staatliche Dienstleistungen für die Bevölkerung bereitgestellt und ihre rechtlichen Bedürfnisse erfüllt werden. Der genaue Bevölkerungsstand am Amazonas ist jedoch immer noch unbekannt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XodDaAUnwqY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/598-das-gerichtsschiff-vom-amazonas-1579010\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22023194\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9254702\">thetvdb.com</a></p>\n","598":"<h2>Ahornsirup - Kanadas süßer Schatz</h2>\n<p>(Staffel 24 Nr. 22, Fortlaufende Nr. 598; frz. Titel “Canada, le pays du sirop d'erable”; Erstausstrahlung: 24.09.2022)</p>\n\n<p>Félix Sabourin betreibt eine Ahornsirupfarm in Ripon, zwei Autostunden nordwestlich von Montréal. Gemeinsam mit Freunden und Nachbarn sammelt er im Frühjahr den Saft der Ahornbäume, um den weltweit beliebten Sirup herzustellen. Die Saison beginnt dieses Jahr spät, daher bleibt Félix nur wenig Zeit zum Ernten. Ahornsirup ist ein lukratives Zusatzeinkommen für viele Farmer und wird hauptsächlich in Zentral- und Ostkanada produziert. Die Produktion könnte jedoch langfristig durch den Klimawandel gefährdet sein. Félix arbeitet hart, um seine Farm zu erhalten und hofft auf ein großes Abschlussfest am Ende der Saison.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HlFRnPw6Y04\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/600-ahornsirup-kanadas-suesser-schatz-1583564\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22299618\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9352689\">thetvdb.com</a></p>\n","599":"<h2>Estland - Krötenretter im Einsatz</h2>\n<p>(Staffel 24 Nr. 23, Fortlaufende Nr. 599; frz. Titel “Estonie, au secours des grenouilles”; Erstausstrahlung: 01.10.2022)</p>\n\n<p>Die Biologin Katerina Pesocki und der Estnische Naturfonds organisieren eine Rettungsaktion für die jährliche Krötenwanderung im Frühjahr. Freiwillige Helferinnen und Helfer transportieren Tausende von Kröten und Fröschen sicher über Straßen, um sie vor dem Verkehrstod zu bewahren. Katerinas Fachkenntnisse sind für die Planung der Aktion unerlässlich. Die Tiere kehren zu ihren Heimatteichen zurück, um sich fortzupflanzen. Die größeren Weibchen werden von vielen Männchen umworben, oft schon während der Wanderung. Der Autoverkehr stellt die größte Herausforderung dar, weshalb der Einsatz von Katerina und den Helfenden wichtig ist, um die Amphibien zu schützen. Sogar die Polizei unterstützt die Aktion, um Estlands Naturschätze zu bewahren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xzfFqvblS34\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/601-estland-kroetenretter-im-einsatz-1586757\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22805294\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9352690\">thetvdb.com</a></p>\n"})
\ No newline at end of file
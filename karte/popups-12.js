@@ -0,0 +1 @@
+popupChunkLoaded(12,{"600":"<h2>Sardiniens wertvolle Muschelseide</h2>\n<p>(Staffel 24 Nr. 24, Fortlaufende Nr. 600; frz. Titel “La soie de mer, trésor de Sardaigne”; Erstausstrahlung: 29.10.2022)</p>\n\n<p>Assuntina und Giuseppina Pes bereiten sich auf die große Prozession zu Ehren des heiligen Antiochus vor, dem Schutzpatron Sardiniens. Die jährliche Festa Manna, eine 15 Tage nach Ostern stattfindende Feier, bringt die Einwohner der gesamten Insel zusammen. Die Schwestern stellen Altartücher her oder reparieren alte Tücher. Sie verwenden Reste der seltenen Muschelseide, die aus der Pinna nobilis gewonnen wird, einer vom Aussterben bedrohten Riesenmuschel. Doch die Muschelpopulation ist stark dezimiert. Die Einwohner müssen sich an alternative Materialien wie Maulbeerseide gewöhnen. Assuntina und Giuseppina arbeiten mit großer Sorgfalt, um rechtzeitig fertig zu werden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xUcNlVSeby4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/602-sardiniens-wertvolle-muschelseide-1590045\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23159150\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9352691\">thetvdb.com</a></p>\n","601":"<h2>Cordoba, die Stadt der Patios</h2>\n<p>(Staffel 24 Nr. 25, Fortlaufende Nr. 601; frz. Titel “Cordoue et ses patios fleuris”; Erstausstrahlung: 05.11.2022)</p>\n\n<p>Die andalusischen Patios sind Ruheoasen in den heißen Sommermonaten und eine architektonische Antwort auf die brütende Hitze. Ursprünglich aus der römischen Antike stammend, wurden sie während der muslimischen Herrschaft um Pflanzen, Brunnen und typischen Farben erweitert. Córdoba ist stolz auf über 3.000 traditionelle Patios, die 2012 von der UNESCO zum immateriellen Weltkulturerbe erklärt wurden. Im Frühjahr findet ein großer Wettbewerb statt, bei dem die Besitzer ihre Innenhöfe aufwändig gestalten, um den ersten Preis zu gewinnen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XrEtMdxF76c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/603-cordoba-die-stadt-der-patios-1602011\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23368470\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524022\">thetvdb.com</a></p>\n","602":"<h2>Marquesas-Inseln, das Comeback der Tattoos</h2>\n<p>(Staffel 24 Nr. 26, Fortlaufende Nr. 602; frz. Titel “Îles Marquises, le tatouage dans la peau”; Erstausstrahlung: 19.11.2022)</p>\n\n<p>Heretu Tetahiotupa und Teiki Huukena sind Pioniere der neuen Tattoo-Bewegung auf den Marquesas-Inseln. Sie gründeten eine Tätowierschule, um das alte Wissen über Marquesas-Motive zu bewahren. Die Bedeutung der Tattoos ging verloren, aber Heretu und Teiki erforschen den Dschungel nach Hinweisen. Die Symbole sind Fenster in die Vergangenheit und stammen von früheren Inselstämmen. Die Marquesas sind heute politisch und wirtschaftlich an Frankreich angebunden. Heretus hat sich Gesichtstattoo stechen und gehört damit zur Avantgarde der neuen Tattoo-Bewegung. Die Zukunft der martialisch anmutenden Tattoos in der modernen Welt bleibt abzuwarten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=TNPWHJBDCCM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/604-marquesas-inseln-das-comeback-der-tattoos-1596812\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23747588\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524023\">thetvdb.com</a></p>\n","603":"<h2>Die Schweizergarde - Ein Leben für den Papst</h2>\n<p>(Staffel 24 Nr. 27, Fortlaufende Nr. 603; frz. Titel “Vatican, en coulisse avec les Gardes suisses”; Erstausstrahlung: 03.12.2022)</p>\n\n<p>Die Schweizer Garde schützt seit über 700 Jahren den Papst und den Vatikan. Sie sichern die Eingänge zum Vatikan und begleiten den Papst bei Gottesdiensten und Audienzen. Tag und Nacht stehen sie in Uniform und Rüstung auf ihren Posten. Lukas und Dominique sind Gardisten aus der Schweiz und haben eine strenge Ausbildung absolviert. Sie haben sich dem Schutz des Papstes verschrieben und sind bereit, ihr Leben dafür zu geben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=P_FnkF7s1aA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/605-die-schweizergarde-ein-leben-fuer-den-papst-1602010\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23985080\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524024\">thetvdb.com</a></p>\n","604":"<h2>Island, die wertvollsten Daunen der Welt</h2>\n<p>(Staffel 24 Nr. 28, Fortlaufende Nr. 604; frz. Titel “Islande, des plumes qui valent de l'or”; Erstausstrahlung: 10.12.2022)</p>\n\n<p>Im Loðmundarfjörður auf Island sammeln Farmer Eiderenten-Daunen, die zu wertvollen Kissen und Decken verarbeitet werden. Óðinn Logi rettet gefährdete Enteneier und züchtet die Küken in seiner Garage. Íris Birgisdóttir hat die Farm ihres Onkels zur Eiderentenfarm umgewandelt und betreibt sie allein mit ihrer Tochter. Ólafur erntet in dieser Saison über 300 Kilogramm Daunen, ohne den Enten Schaden zuzufügen. Die Zukunft der Branche bleibt ungewiss.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FZutRZN50LQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/606-island-die-wertvollsten-daunen-der-welt-1602943\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt24220972\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524025\">thetvdb.com</a></p>\n","605":"<h2>Zuflucht in den Anden - Kolumbiens indigene Transfrauen</h2>\n<p>(Staffel 24 Nr. 29, Fortlaufende Nr. 605; frz. Titel “Colombie, le refuge des cueilleuses de café trans”; Erstausstrahlung: 17.12.2022)</p>\n\n<p>Die Emberá Chamí leben in den kolumbianischen Anden, wo Kaffee angebaut wird. Transfrauen wie Bella Wasorna finden auf den Kaffeefeldern nicht nur Arbeit, sondern auch Schutz. Die Frauen bereiten sie sich auf einen großen Tanzauftritt in der Provinzhauptstadt vor, um Aufmerksamkeit auf sich und ihr Schicksal zu lenken.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=IUfHYdLf9ik\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/607-zuflucht-in-den-anden-kolumbiens-indigene-transfrauen-1605209\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt24636850\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524026\">thetvdb.com</a></p>\n","606":"<h2>Kristall - Die magische Kunst aus den Vogesen</h2>\n<p>(Staffel 24 Nr. 30, Fortlaufende Nr. 606; frz. Titel “Vosges, la magie du cristal”; Erstausstrahlung: 24.12.2022)</p>\n\n<p>Die nördlichen Vogesen gelten als Wiege der Kristallherstellung in Europa, mit weltberühmten Manufakturen wie Saint-Louis, Lalique und dem Internationalen Zentrum für Glaskunst in Meisenthal. Die Region bietet eine malerische Landschaft, die die Glasmacher inspiriert, kunstvolle Kristallkörper und Tannenbaumkugeln von hoher Qualität zu schaffen, insbesondere zur Weihnachtszeit.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=lcmXLHs5OhE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/608-kristall-die-magische-kunst-aus-den-vogesen-1607754\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt25051572\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524027\">thetvdb.com</a></p>\n","607":"<h2>Montenegro - Der Eselretter</h2>\n<p>(Staffel 25 Nr. 1, Fortlaufende Nr. 607; frz. Titel “Monténégro, pour l'amour des ánes”; Erstausstrahlung: 07.01.2023)</p>\n\n<p>Darko Saveljic betreibt eine Eselfarm in den Bergen Montenegros, auf der mehrere Stuten und ein Hengst ein neues Zuhause gefunden haben. Seine Mission ist es, die Esel vor dem Aussterben zu bewahren und ein Modell für artgerechten Tierschutz zu schaffen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-T-jOraqZ9U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/609-montenegro-der-eselretter-1609765\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt25786568\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524036\">thetvdb.com</a></p>\n","608":"<h2>Der Bergkristall - Schatz in den Schweizer Alpen</h2>\n<p>(Staffel 25 Nr. 2, Fortlaufende Nr. 608; Erstausstrahlung: 21.01.2023)</p>\n\n<p>In den Schweizer Alpen riskieren Mineralien- und Kristallsucher, auch „Strahler“ genannt, ihr Leben, während sie mit Werkzeugen wie Spitzhacke und Meißel Bergkristalle in tiefen Felsspalten und Hohlräumen abbauen. Das Schmelzen der Gletscher aufgrund des Klimawandels eröffnet neue Möglichkeiten, birgt jedoch auch Gefahren für die Schatzsucher.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kwjMzSWd5Qo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/610-der-bergkristall-schatz-in-den-schweizer-alpen-1612863\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26422175\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524038\">thetvdb.com</a></p>\n","609":"<h2>Maine - Hummer oder Wale?</h2>\n<p>(Staffel 25 Nr. 3, Fortlaufende Nr. 609; frz. Titel “Pêcher le homard ou protéger les baleines?”; Erstausstrahlung: 28.01.2023)</p>\n\n<p>Die traditionelle Hummerfischerei in Maine ist bedroht, da sich der Golf von Maine erwärmt und die Hummer weiter gen Norden ziehen, während Wale durch die Hummerfallen gefährdet werden. Fischer stehen vor der Entscheidung, aufzuhören oder alternative Methoden und Einnahmequellen zu finden, während Wissenschaftler nach Lösungen suchen, um sowohl die Wale zu schützen als auch die Hummerfischerei fortzusetzen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=S_ZPCN7EYXY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/611-maine-hummer-oder-wale-1613685\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26898737\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/9524040\">thetvdb.com</a></p>\n","610":"<h2>Albanien - Die Stimmen der Schäfer</h2>\n<p>(Staffel 25 Nr. 4, Fortlaufende Nr. 610; frz. Titel “Albanie, une vie de berger”; Erstausstrahlung: 25.02.2023)</p>\n\n<p>Bastri Limoj, ein Hirte in dem südalbanischen Bergdorf Vranisht, hofft, dass sein Sohn Lucjano ihn beim Auftrieb der Herde zur Sommerweide begleitet und dadurch die Schäfertradition weiterführt. Die Wiederbelebung der traditionellen polyphonen Gesänge weckt auch bei der jüngeren Generation Interesse und könnte eine Chance für den Erhalt des Schäferberufs bieten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_5HmdkyxmnE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/612-albanien-die-stimmen-der-schaefer-1618464\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26898737\">imdb.com</a></p>\n","611":"<h2>Laos - Futterblöcke und Büffel-Leasing</h2>\n<p>(Staffel 25 Nr. 5, Fortlaufende Nr. 611; frz. Titel “Les buffles, l’avenir pour le Laos ?”; Erstausstrahlung: 04.03.2023)</p>\n\n<p>Ein junges Team von Tierspezialisten bietet den Büffeln in Laos Nahrungsergänzung durch Futterblöcke an, wodurch die Tiere gesünder werden und mehr Milch geben. Sie nutzen die Milch von Wasserbüffeln und Ziegen, um unterernährten Kindern zu helfen und irreversible Schäden durch Mangelernährung abzuwenden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-P44t5KcvnU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/613-laos-futterbloecke-und-bueffel-leasing-1620347\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27005233\">imdb.com</a></p>\n","612":"<h2>Freiheit auf Pferderücken - Der lange Weg der Nez Perce</h2>\n<p>(Staffel 25 Nr. 6, Fortlaufende Nr. 612; frz. Titel “Nez-Percés, chevauchée pour la liberté”; Erstausstrahlung: 11.03.2023)</p>\n\n<p>Über zwei Dutzend Mitglieder des Stammes der Nez Perce reiten durch den Yellowstone-Nationalpark, um den langen Fluchtweg ihrer Vorfahren nachzuerleben und die Freiheit auf Pferderücken zu spüren. Sie begegnen imposanten Wildtieren wie Bisons und Grizzlybären und entdecken Orte, die noch heute die Namen und Spuren ihrer Ahnen tragen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=DfNr1Uu8gB8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/614-freiheit-auf-pferderuecken-der-lange-weg-der-nez-perce-1621705\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27110800\">imdb.com</a></p>\n","613":"<h2>Peloponnes - Rückkehr zur Erde</h2>\n<p>(Staffel 25 Nr. 7, Fortlaufende Nr. 613; frz. Titel “Péloponnèse, la pasionaria de l'agroforesterie”; Erstausstrahlung: 18.03.2023)</p>\n\n<p>Sheila Darmos, eine junge Deutsch-Griechin, hat den Hof ihres Vaters übernommen und einen Waldgarten geschaffen, der eine hohe Biodiversität ermöglicht. Sie unterstützt einheimische junge Bauern mit ihrer Organisation „The Southern Lights“ dabei, dieses Modell in ganz Griechenland zu verbreiten und neue Möglichkeiten für die Landwirtschaft zu schaffen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tghXc4mZKBY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/615-peloponnes-rueckkehr-zur-erde-1623768\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27170463\">imdb.com</a></p>\n","614":"<h2>Handgemacht in Laos - Rares aus Rattan</h2>\n<p>(Staffel 25 Nr. 8, Fortlaufende Nr. 614; frz. Titel “Laos, la vannerie dans tous ses états”; Erstausstrahlung: 25.03.2023)</p>\n\n<p>Rattan wird in Asien vielseitig verwendet und ist seit dem 19. Jahrhundert auch in Europa beliebt. Das Schrumpfen der Wälder in Südostasien hat zu steigenden Preisen geführt, weshalb in Laos Rattan wieder aufgeforstet wird. Eine junge Frau aus einem Dorf in Zentral-Laos reist durch das Land, um Kontakte zu knüpfen, neue Techniken zu erlernen und eine Rattanschälmaschine zu kaufen, um die Produktivität der Rattanfertigung ihres Dorfes zu erhöhen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=TGo1sAI9SbY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/616-handgemacht-in-laos-rares-aus-rattan-1625195\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27252897\">imdb.com</a></p>\n","615":"<h2>Leben mit dem Tod - Ahnenkult auf Sulawesi</h2>\n<p>(Staffel 25 Nr. 9, Fortlaufende Nr. 615; frz. Titel “Toraja, le peuple qui fait vivre ses morts”; Erstausstrahlung: 06.05.2023)</p>\n\n<p>Isac und seine Familie auf Sulawesi sind seit Wochen damit beschäftigt, ein provisorisches Dorf für die Bestattungsfeierlichkeiten seiner Mutter zu bauen, doch aufgrund der immensen Kosten können sie erst jetzt, 21 Jahre nach ihrem Tod, die erforderliche Summe aufbringen. In der Zwischenzeit hat eine andere Familie in der Nähe alle Hürden überwunden und ihre Verstorbene in einer aufwendigen Zeremonie ins Jenseits geleitet.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tZ-4ILBzxEU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/617-leben-mit-dem-tod-ahnenkult-auf-sulawesi-1634635\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27704539\">imdb.com</a></p>\n","625":"<h2>Werft unter Palmen - Indonesiens Pinisis</h2>\n<p>(Staffel 25 Nr. 19, Fortlaufende Nr. 625; Erstausstrahlung: 18.11.2023)</p>\n\n<p>Pinisis, kleine wendige Frachtensegler, verkehrten bereits zu Zeiten der niederländischen Kolonialisierung zwischen den indonesischen Inseln. Noch immer werden sie wie damals gebaut, am Strand, ohne schriftlichen Bauplan. Eine Einzigartigkeit, die inzwischen zum immateriellen Weltkulturerbe der UNESCO gehört.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=s0Ohg9vxi1U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/627-indonesien-werft-unter-palmen-indonesiens-pinisis-1678086\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30049489\">imdb.com</a></p>\n","616":"<h2>Die Waschbären von Berlin</h2>\n<p>(Staffel 25 Nr. 10, Fortlaufende Nr. 616; frz. Titel “Les ratons laveurs, nos nouveaux voisins?”; Erstausstrahlung: 20.05.2023)</p>\n\n<p>Der Verein „Hauptsache Waschbär“ in Berlin setzt sich für den Schutz und die Regulierung der Waschbärenpopulation ein, indem er wild lebende Waschbären einfängt, kastriert und wieder in die Natur entlässt. Ziel ist es, Schäden in menschlichen Siedlungen zu reduzieren und eine friedliche Koexistenz zwischen Mensch und Waschbär zu ermöglichen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dYP_3p6zrEw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/618-die-waschbaeren-von-berlin-1640104\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29964475\">imdb.com</a></p>\n","617":"<h2>Rapa Nui - Gladiatoren der Südsee</h2>\n<p>(Staffel 25 Nr. 11, Fortlaufende Nr. 617; frz. Titel “Île de Pâques, les olympiades de Rapa Nui”; Erstausstrahlung: 24.06.2023)</p>\n\n<p>Während der Coronapandemie erlebten die Rapanui zwei Jahre der Abschottung, in denen sie sich auf alte Selbstversorgungsmethoden besannen und erfolgreich Obst und Gemüse anbauten. Das Tapati-Fest wird wieder in vollem Umfang gefeiert, inklusive der Krönung einer neuen Festkönigin, während die amtierende Königin sich auf den Tau'a-Triathlon konzentriert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=G9a4wBoUGtg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/619-rapa-nui-gladiatoren-der-suedsee-1645452\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt28201824\">imdb.com</a></p>\n","618":"<h2>Kambodschas schwimmende Dörfer - Umzug am Tonle Sap</h2>\n<p>(Staffel 25 Nr. 12, Fortlaufende Nr. 618; frz. Titel “Cambodge, les pêcheurs nomades du Tonlé Sap”; Erstausstrahlung: 01.07.2023)</p>\n\n<p>Der Wasserstand des Tonle Sap-Sees schwankt um bis zu acht Meter. Während der Trockenzeit im Februar und März zieht sich das Wasser zurück und ermöglicht Renovierungen in den schwimmenden Dörfern, während die Bewohner vom Fischfang und der Landwirtschaft leben.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9rm2itnB7M8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/620-kambodschas-schwimmende-doerfer-umzug-am-tonle-sap-1646559\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29041334\">imdb.com</a></p>\n","619":"<h2>Istanbul - Stadt der Katzen</h2>\n<p>(Staffel 25 Nr. 13, Fortlaufende Nr. 619; Erstausstrahlung: 28.06.2023)</p>\n\n<p>Ayten verlässt täglich ihr Zuhause, um rund 100 Streunerkatzen in ihrer Nachbarschaft zu füttern. Gemeinsam mit vielen anderen engagierten Bürgern in Istanbul pflegt sie eine außergewöhnliche Liebe und Fürsorge für diese Tiere, indem sie ihnen Unterkünfte, Futter und Wasser zur Verfügung stellen, obwohl es in der Kultur nicht üblich ist, Tiere in den eigenen Wohnungen zu halten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SlSVDn45hvE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/621-istanbul-stadt-der-katzen-1658784\">fernsehserien.de</a></p>\n","620":"<h2>Georgien - Welcome Teacher!</h2>\n<p>(Staffel 25 Nr. 14, Fortlaufende Nr. 620; Erstausstrahlung: 09.09.2023)</p>\n\n<p>Swanetien ist eine der faszinierendsten und auch abgelegensten Regionen Georgiens. Doch viele Bergbewohner verlassen ihre Heimat, um in den Städten ein besseres Leben zu suchen. Betroffen ist auch Kala, ein kleines, fast 2000 Meter hoch gelegenes Dorf. Der örtliche Schuldirektor befindet sich in einer heiklen Lage. Nur noch 17 Schüler besuchen seine Schule …</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_wCHrOlEBtM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/622-georgien-die-dorfschule-im-kaukasus-1661786\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29041334\">imdb.com</a></p>\n","621":"<h2>Island - Seltsame Schätze aus dem Meer</h2>\n<p>(Staffel 25 Nr. 15, Fortlaufende Nr. 621; Erstausstrahlung: 16.09.2023)</p>\n\n<p>Auf den Meeren Islands haben die Fischer jahrhundertelang mit ihren Booten und Schiffen nach immer demselben Schatz gesucht: dem Kabeljau. Seit einigen Jahren aber weckt ein weiterer Meeresschatz Begehrlichkeiten – es ist ein seltsames, unbekanntes und eher hässlich aussehendes Tier: die Seegurke, auch Holothurie genannt. Sie ist der neue Star in den isländischen Gewässern.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=nez0RgvTkHQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/623-island-seltsame-schaetze-aus-dem-meer-1664145\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29169170\">imdb.com</a></p>\n","622":"<h2>Argentinien - Die Winzerinnen von Mendoza</h2>\n<p>(Staffel 25 Nr. 16, Fortlaufende Nr. 622; Erstausstrahlung: 30.09.2023)</p>\n\n<p>Mendoza ist die wichtigste Weinregion Argentiniens. Hier wächst die Malbec-Traube, aus der der berühmte Rotwein gekeltert wird. Dieser Wein wird seit jeher hauptsächlich von Männern produziert. Doch eine Gruppe engagierter Frauen erfüllt sich nun den Traum vom eigenen Wein. Der Weg dahin war steinig, doch in der starken Gemeinschaft ist aus dem Traum Realität geworden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=YJUk9tTub8s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/624-argentinien-die-winzerinnen-von-mendoza-1668117\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29347087\">imdb.com</a></p>\n","623":"<h2>Australien: Mission Schnabeltier</h2>\n<p>(Staffel 25 Nr. 17, Fortlaufende Nr. 623; Erstausstrahlung: 21.10.2023)</p>\n\n<p>Sie gehören zu den bekanntesten Tieren Australiens: die Schnabeltiere. Ausgestattet mit einem Schnabel und gleichzeitig einem dichten Pelz, eierlegend und trotzdem ihre Jungen säugend, wurden die Tiere wegen ihres Pelzes gejagt und fast ausgerottet. Zwischenzeitlich hatte sich ihr Bestand erholt. Doch neue Bedrohungen setzen den eigentümlichen Tieren erneut zu.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gY-5SWOME9A\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/625-australien-mission-schnabeltier-1670887\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt29964475\">imdb.com</a></p>\n","624":"<h2>Färöer: Zu Hause im Nordatlantik</h2>\n<p>(Staffel 25 Nr. 18, Fortlaufende Nr. 624; frz. Titel “Les îles Féroé, un air de bout du monde”; Erstausstrahlung: 04.11.2023)</p>\n\n<p>Hoch im Norden, im stürmischen Nordatlantik, liegen die Färöer, ein Archipel von 18 Inseln. Die Natur, rau und urtümlich, hat das Leben der Bewohner stark geprägt. Schon als die Wikinger aus dem heutigen Norwegen die Färöer bevölkerten, war der Bootsverkehr zwischen den Inseln überlebenswichtig. Er sicherte vor allem die Grundversorgung der Bewohner durch die Fischerei. Rudern ist heute Nationalsport, und Frauen sind schon lange mit am Start.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SFfii7XzU3E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/626-faeroeer-zu-hause-im-nordatlantik-aus-liebe-zur-schoenheit-1674399\">fernsehserien.de</a></p>\n","626":"<h2>Yabusame - Japans Samurai-Ladys</h2>\n<p>(Staffel 25 Nr. 20, Fortlaufende Nr. 626; Erstausstrahlung: 25.11.2023)</p>\n\n<p>Die legendären japanischen Samurai sind lange ausgestorben, doch ihre Kunst des Yabusame, des berittenen Bogenschießens, hat überlebt. Bisher war das eine reine Männerwelt, doch jetzt haben einige engagierte Frauen eine Revolution angezettelt. Die Reitstallbesitzerin Ayuko Kamimura will Yabusame zu einem internationalen Trendsport des 21. Jahrhunderts auch für Frauen machen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Qr21-51Z_vM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/628-yabusame-japans-samurai-ladys-1679266\">fernsehserien.de</a></p>\n","627":"<h2>Das weiße Gold von Noirmoutier</h2>\n<p>(Staffel 25 Nr. 21, Fortlaufende Nr. 627; frz. Titel “L’or blanc de Noirmoutier”; Erstausstrahlung: 02.12.2023)</p>\n\n<p>Die Insel Noirmoutier liegt an der Atlantikküste, im Golf von Biskaya. Mit ihren langen, feinen Sandstränden, ihren Pinienwäldern und den weißen Häusern ist sie als kleines Paradies beliebt, weit weg vom Trubel des Großstadtlebens. Noirmoutier steht aber auch für das weltweit berühmte Salz, das hier in den Salzgärten noch fast mittelalterlich geerntet wird.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ILwQDgLDi-c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/629-das-weisse-gold-von-noirmoutier-1681709\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30798859\">imdb.com</a></p>\n","628":"<h2>Neufundland - Bleiben oder gehen?</h2>\n<p>(Staffel 25 Nr. 22, Fortlaufende Nr. 628; Erstausstrahlung: 16.12.2023)</p>\n\n<p>Ein Fischerdorf an der abgelegenen Südküste Neufundlands steht vor der letzten großen Entscheidung: Seine 75 Bewohner müssen wählen, ob sie bleiben oder alle zusammen ihre Heimat für immer verlassen sollen. Die Provinzverwaltung unterstützt die Umsiedlung mit bis zu 270.000 Dollar pro Haushalt, denn die Aufrechterhaltung der öffentlichen Infrastruktur wäre noch teurer …</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cIyBqf4S0io\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/630-neufundland-bleiben-oder-gehen-1692534\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30631392\">imdb.com</a></p>\n","629":"<h2>Paris, Hauptstadt der Bienen</h2>\n<p>(Staffel 25 Nr. 23, Fortlaufende Nr. 629; frz. Titel “Paris, un jardin pour les abeilles”; Erstausstrahlung: 27.12.2023)</p>\n\n<p>Paris zieht nicht nur Menschen an, die Stadt ist auch für Honigbienen ein Zuhause. Etwa 2.000 Bienenvölker halten Imker heute auf den Dächern und in den Gärten der französischen Hauptstadt. Kein Wunder, denn historische Gärten und baumreiche Alleen haben eine enorme Anzahl unterschiedlicher Pflanzen zu bieten. Das Ziel vieler Imker: Sie wollen die so wichtige Honigbiene erhalten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=eCPoZupaFWE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/631-paris-hauptstadt-der-bienen-1692535\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30631392\">imdb.com</a></p>\n","630":"<h2>Vietnam: Brücken für bedrohte Affen</h2>\n<p>(Staffel 26 Nr. 1, Fortlaufende Nr. 630; frz. Titel “Vietnam, des ponts pour sauver les singes”; Erstausstrahlung: 06.01.2024)</p>\n\n<p>Die Rotschenkligen Kleideraffen gelten als die schönsten Primaten der Welt. Doch Wilderei und illegaler Tierhandel haben fast zu ihrer Ausrottung geführt. Nur wenige Tiere konnten in Vietnam überleben. Engagierte Tierschutzaktivist*innen versuchen nun zu retten, was noch zu retten ist.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=uy5BR-8L4N8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/632-vietnam-bruecken-bauen-fuer-bedrohte-affen-1692536\">fernsehserien.de</a></p>\n","631":"<h2>Connemara: Wie das Land, so das Pony</h2>\n<p>(Staffel 26 Nr. 2, Fortlaufende Nr. 631; frz. Titel “Le poney Connemara, une légende irlandaise”; Erstausstrahlung: 07.01.2024)</p>\n\n<p>Das Connemara-Pony ist in Irland seit Generationen Kult. Voller Leidenschaft werden rund um diese robuste Pony-Rasse eigene Shows und Reitwettbewerbe abgehalten. Hier treten die edelsten Tiere gegeneinander an – Highlight der Shows ist die in Clifden, der Hauptstadt von Connemara. In diesem Jahr feiert der austragende Verband sein hundertjähriges Jubiläum.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Vtlv_-OBj5M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/633-connemara-wie-das-land-so-das-pony-1692537\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30730384\">imdb.com</a></p>\n","632":"<h2>Normandie: Flache Wasser, reiche Natur</h2>\n<p>(Staffel 26 Nr. 3, Fortlaufende Nr. 632; Erstausstrahlung: 13.01.2024)</p>\n\n<p>Die Sümpfe von Cotentin und Bessin in der Normandie sind ausgedehnte Feuchtgebiete aus Sümpfen und Poldern – eingedeichten, flachen Landzungen. Die Landschaft ist im Winter überschwemmt und im Sommer ausgetrocknet, dazu ein Zufluchtsort für Zugvögel, ein riesiges Reservoir biologischer Vielfalt. Doch das Ökosystem ist durch die Dürren und starken Regenfälle der letzten Jahren geschwächt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fxaXRwjaosk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/634-normandie-flache-wasser-reiche-natur-1692538\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt30853211\">imdb.com</a></p>\n","633":"<h2>Cholitas – Die fliegenden Frauen Boliviens</h2>\n<p>(Staffel 26 Nr. 4, Fortlaufende Nr. 633; frz. Titel “Bolivie : cholitas et skateboardeuses”; Erstausstrahlung: 20.01.2024)</p>\n\n<p>Mit ihren gewagten Sprüngen und Pirouetten brettern sie gegen hartnäckig fortbestehende Klischees. Ihre Tracht soll provozieren und zeigen, dass den Cholitas heute alles offensteht. Dass sie sich dabei ausgerechnet auf Skateboards schwingen, löst Erstaunen aus. Doch die jungen Bolivianerinnen haben diesen Sport mit Bedacht gewählt …</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cGbP73aIii0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/635-cholitas-die-fliegenden-frauen-boliviens-1692539\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt31067495\">imdb.com</a></p>\n","634":"<h2>New York, die Foodtruck-Könige von Astoria</h2>\n<p>(Staffel 26 Nr. 5, Fortlaufende Nr. 634; frz. Titel “New York et ses food trucks”; Erstausstrahlung: 27.01.2024)</p>\n\n<p>Foodtrucks haben New York im Sturm erobert. Vor allem den Stadtteil Astoria in Queens, denn mehr noch als in anderen Bezirken New Yorks lebt hier bis heute die Idee vom Einwanderungsland Amerika. Stolz behaupten die Bewohner, dass nirgendwo sonst so viele Menschen verschiedener Kulturen und Sprachen eng beieinander leben. Und mit ihnen Speisen und Rezepte aus aller Welt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=mPcAr-50yTs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/636-new-york-die-foodtruck-koenige-von-astoria-1692540\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt31067495\">imdb.com</a></p>\n","635":"<h2>Malediven, im Rhythmus der Riffmantas</h2>\n<p>(Staffel 26 Nr. 6, Fortlaufende Nr. 635; Erstausstrahlung: 17.02.2024)</p>\n\n<p>Die Malediven – der Archipel im Indischen Ozean ist nicht nur ein Sehnsuchtsort für Urlauber, sondern vor allem gibt es hier einen weltweit einzigartigen Ort, an dem man den gigantischen Mantarochen in großer Zahl hautnah begegnen kann: die Hanifaru-Bucht im Baa-Atoll. Die Riesenrochen sind hier streng geschützt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_I9U3FCyFEE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/638-malediven-im-rhythmus-der-riffmantas-1696890\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt31356155\">imdb.com</a></p>\n","636":"<h2>Brasiliens Regenwald, zurück in die Zukunft</h2>\n<p>(Staffel 26 Nr. 7, Fortlaufende Nr. 636; frz. Titel “Amazonie, nourrir le lien à la terre”; Erstausstrahlung: 24.02.2024)</p>\n\n<p>Die Amazonasregion ist Heimat Tausender Tier- und Pflanzenarten – und mehrerer indigener Völker. Enttäuscht vom modernen Leben, besinnen sie sich auf ihre alte Lebensweise, bauen Maniok und Kakao an und forsten gerodete Flächen mit einheimischen Pflanzenarten auf. Ist die alte Lebensweise ein Weg, um dem drohenden Verschwinden des Regenwaldes entgegenzuwirken?</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Y3VexYvH_oY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/639-brasiliens-regenwald-zurueck-in-die-zukunft-1697573\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt31459205\">imdb.com</a></p>\n","638":"<h2>Das teuerste Stroh der Welt</h2>\n<p>(Staffel 26 Nr. 9, Fortlaufende Nr. 638; Erstausstrahlung: 16.03.2024)</p>\n\n<p>Roggenstroh galt in Frankreich lange Zeit als Baumaterial armer Leute. Mit ihm wurden Möbel bespannt oder Dächer gedeckt. Als die maschinelle Massenproduktion neue, dauerhaftere Materialien hervorbrachte, geriet das Stroh in Vergessenheit. Inzwischen wird es von engagierten Handwerkern wiederentdeckt und erlebt eine Renaissance – als teure Einlegearbeit oder prunkvolle Dekoration.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UZfngvSQveI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/641-das-teuerste-stroh-der-welt-1702644\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt31789749\">imdb.com</a></p>\n","639":"<h2>Hati Bondhu, die Elefantenschützer von Assam</h2>\n<p>(Staffel 26 Nr. 10, Fortlaufende Nr. 639; frz. Titel “Inde, les éléphants de la discorde”; Erstausstrahlung: 20.04.2024)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SALlndp7hAA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/642-hati-bondhu-die-elefantenschuetzer-von-assam-1710832\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt32165577\">imdb.com</a></p>\n","640":"<h2>Piemont - Mit Mulis über Stock und Stein</h2>\n<p>(Staffel 26 Nr. 11, Fortlaufende Nr. 640; frz. Titel “Le mulet en montagne, une alternative”; Erstausstrahlung: 07.06.2024)</p>\n\n<p>Es gibt ihn noch, den Beruf des Säumers: In den Seealpen, im italienischen Piemont, liegt auf 2.300 Meter Höhe die Schutzhütte Morelli Buzzi. Drei Monate im Jahr muss der Betreiber der Hütte Wanderern Kost und Logis anbieten. Doch Wege und Straßen gibt es hier keine. Da kommen Luciano Ellena und seine Mulis ins Spiel. Er ist der letzte Säumer und versorgt die Hütte mit Lebensmitteln.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9lSM-soPWHo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/643-piemont-mit-mulis-ueber-stock-und-stein-1721175\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt32059594\">imdb.com</a></p>\n","642":"<h2>Lappland – Gemeinsam einsam und doch nicht allein</h2>\n<p>(Staffel 26 Nr. 13, Fortlaufende Nr. 642; Erstausstrahlung: 31.08.2024)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qMIlkI5LlHs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/645-lappland-gemeinsam-einsam-und-doch-nicht-allein-1739050\">fernsehserien.de</a></p>\n","643":"<h2>La Réunion: Die Wiederbelebung der kreolischen Gärten</h2>\n<p>(Staffel 26 Nr. 14, Fortlaufende Nr. 643; frz. Titel “La Réunion, le renouveau des jardins créoles”; Erstausstrahlung: 14.09.2024)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=mJEmTpPV8wM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/646-la-reunion-die-wiederbelebung-der-kreolischen-gaerten-1741707\">fernsehserien.de</a></p>\n","645":"<h2>Der Duft Indiens</h2>\n<p>(Staffel 26 Nr. 16, Fortlaufende Nr. 645; frz. Titel “L’Inde, l’autre pays du parfum”; Erstausstrahlung: 28.09.2024)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bOJ6BPYbHUo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/648-der-duft-indiens-1745423\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt33507348\">imdb.com</a></p>\n"})
\ No newline at end of file
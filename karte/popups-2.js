@@ -0,0 +1 @@
+popupChunkLoaded(2,{"100":"<h2>Fährtensucher online</h2>\n<p>(Staffel 3 Nr. 24, Fortlaufende Nr. 100; Erstausstrahlung: 06.09.2001)</p>\n\n<p>Die Buschmänner der Kalahari-Wüste nutzen den Cybertracker, einen kleinen Computer, um Spuren aufzuzeichnen. Sie geben ihre Beobachtungen mithilfe von Symbolen ein, da sie nicht lesen können. Ihr einzigartiges Wissen und ihre Fähigkeit, die Zeichen ihrer Umgebung zu interpretieren, könnten für die Wissenschaft von großer Bedeutung sein, um frühzeitig Klimaveränderungen und Umweltbelastungen zu erkennen. Louis Liebenberg, ein Naturwissenschaftler aus Kapstadt, hat den Cybertracker entwickelt, der es den Ureinwohnern ermöglicht, ihre Beobachtungen festzuhalten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=OWZJehCh4hk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/100-faehrtensucher-online-339420\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007052\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641958\">thetvdb.com</a></p>\n","101":"<h2>Nepals verkaufte Töchter</h2>\n<p>(Staffel 3 Nr. 25, Fortlaufende Nr. 101; Erstausstrahlung: 01.10.2001)</p>\n\n<p>In Nepal glauben jedes Jahr etwa 10.000 Mädchen an das Märchen von gut bezahlter Arbeit in den indischen Großstädten. Schlepperbanden nutzen dies vor allem in den traditionellen Bergregionen aus, und die Mädchen landen als Prostituierte in den großen Rotlichtvierteln. Die Hilfsorganisation Maiti Nepal ist ihre einzige Hoffnung. Bobita Lama, 26, wurde vor vier Jahren von Maiti Nepal gerettet und arbeitet heute selbst für die Organisation. Sie und ihre Kolleginnen befreien verschleppte Mädchen aus den Bordellen, doch die Arbeit ist Sisyphusarbeit: Für jedes gerettete Mädchen gibt es neue, die zur „Einarbeitung“ bereitstehen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=zvAm_rmvynU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/101-nepals-verkaufte-toechter-339421\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042939\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641959\">thetvdb.com</a></p>\n","102":"<h2>Die Stadt der Diamanten</h2>\n<p>(Staffel 3 Nr. 26, Fortlaufende Nr. 102; Erstausstrahlung: 03.10.2001)</p>\n\n<p>Die Namdeb Diamond Corporation betreibt eine große Diamantenmine in Oranjemund, Namibia. In dieser Region ist Diamantenschmuggel weit verbreitet, wobei Brieftauben als Transportmittel verwendet werden. Die Haltung von Tauben wurde jedoch streng verboten, nachdem eine flugunfähige Taube auf dem Minengelände mit schweren Rohdiamanten entdeckt wurde. Schätzungen zufolge werden bis zu 30 % der Diamantenausbeute gestohlen. Das Sperrgebiet in der Namibwüste wurde bereits 1908 von den deutschen Kolonialherren eingerichtet und ist seitdem für die Öffentlichkeit unzugänglich.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5G9nvOInLfA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/102-die-stadt-der-diamanten-339422\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042933\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641960\">thetvdb.com</a></p>\n","103":"<h2>Gaucho auf Lebenszeit</h2>\n<p>(Staffel 3 Nr. 27, Fortlaufende Nr. 103; Erstausstrahlung: 04.10.2001)</p>\n\n<p>Argentinien erstreckt sich von den Eisfeldern im südlichen Patagonien über die endlosen Pampas bis hin zu den staubigen Wüsten der Anden. Gauchos haben dieses Land für die Einwanderer erschlossen und gelten als Relikte vergangener Zeiten. Eleuterio Flores, ein echter Gaucho im Alter von 72 Jahren, lebt mit seiner Frau Ana in einer einfachen Hütte ohne Strom und fließendes Wasser.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cJKLHLFDYXU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/103-gaucho-auf-lebenszeit-339423\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042936\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641961\">thetvdb.com</a></p>\n","104":"<h2>Der Großvater der Massai</h2>\n<p>(Staffel 3 Nr. 28, Fortlaufende Nr. 104; Erstausstrahlung: 05.10.2001)</p>\n\n<p>Titi Tamporu, der älteste und mächtigste Mann der Kisongo Massai in Kenia, betet morgens um sechs inmitten seiner Kühe. Mit seiner 16-köpfigen Familie lebt er in traditionellen Hütten, geschützt vor Raubtieren. Die Existenz der Familie hängt von den Tieren ab, während die Massai-Kultur von alten Männern wie Titi Tamporu am Leben gehalten wird. Allerdings verlieren die Älteren zunehmend ihre Autorität, da jüngere Männer bereits Regierungsposten besetzen und die Weiderechte kontrollieren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=oHFU1aOHGr0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/104-der-grossvater-der-massai-339424\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042926\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641962\">thetvdb.com</a></p>\n","105":"<h2>Cunahá - Tod im Regenwald</h2>\n<p>(Staffel 4 Nr. 1, Fortlaufende Nr. 105; Erstausstrahlung: 04.02.2002)</p>\n\n<p>Die Suruahà-Indianer im Urwald Amazoniens sind ein Volk von Witwen, Witwern und Waisen. Selbstmord ist Teil ihrer Kultur, und sie machen sich auf die Reise zu ihren Vorfahren. Ein deutscher Zahnarzt und ein brasilianischer Psychologe erreichen ihr Gebiet und behandeln die Suruahà auf improvisierten Zahnarztstühlen. Die Indianer sind schmerzunempfindlich aufgrund der Droge Kumady, die sie schnupfen. Cunahá, eine weitere Substanz, wird von allen über 12 Jahren ausprobiert, oft mit tödlichen Folgen. Für die Suruahà ist der Tod jedoch ein willkommenes Mittel, um ins Jenseits zu gelangen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=yzGLrkcry6c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/105-cunaha-tod-im-regenwald-339426\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042924\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641963\">thetvdb.com</a></p>\n","106":"<h2>Walverwandtschaften</h2>\n<p>(Staffel 4 Nr. 2, Fortlaufende Nr. 106; Erstausstrahlung: 05.02.2002)</p>\n\n<p>William und Susanne Megill haben das Forschungsschiff „Stardust“ zu einem Labor umgebaut, um das Verhalten der faszinierenden Grauwale vor der kanadischen Westküste zu erforschen. Sie gründeten die „Coastal Ecosystems Research Foundation“ und bieten Naturliebhabern und Walfreunden die Möglichkeit, eine Woche lang als Hobby-Biologen mitzuhelfen. Eine Gruppe sucht vom Strand aus mit Ferngläsern nach den Walen, während eine andere Gruppe in Kajaks näher heranpaddelt, um sie zu fotografieren. William erwähnt, dass es manchmal scheint, als ob die Wale sie erforschen. Das Projekt vereint ökologisches Interesse, Abenteuerlust und die Begeisterung für die Meeresriesen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=h5_HKyfGWqk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/106-walverwandtschaften-339427\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042945\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641964\">thetvdb.com</a></p>\n","107":"<h2>Wildreis - Der grüne Schatz der kanadischen Ojibwa-Indianer</h2>\n<p>(Staffel 4 Nr. 3, Fortlaufende Nr. 107; Erstausstrahlung: 06.02.2002)</p>\n\n<p>Ontario ist das Land der tausend Seen und der kanadische Wildreis ist der wertvolle Schatz der Ojibwa-Indianer. Seit Jahrtausenden sichert dieser Samen namens Manomin ihr Überleben. Joe Pitchenese, der Sohn des Häuptlings, gleitet mit seinem Kanu leise durch den Wabigoon See und erntet die grünen Reispflanzen. Seine Frau hilft ihm dabei, die reifen Körner zu ernten und die Saat zu sichern. Obwohl weiße Farmer mit Maschinen den Reis ernten wollten und dabei großen Schaden anrichteten, haben die Ojibwa-Indianer erfolgreich ihr Recht auf die Seen verteidigt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JZX6YmRRFkE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/107-wildreis-der-gruene-schatz-der-kanadischen-ojibwa-indianer-339428\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042927\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641965\">thetvdb.com</a></p>\n","108":"<h2>Party für eine Leiche</h2>\n<p>(Staffel 4 Nr. 4, Fortlaufende Nr. 108; Erstausstrahlung: 07.02.2002)</p>\n\n<p>In Madagaskar findet alle sieben Jahre das Fest der Ahnen, die Famadihana, statt. Zum Leben erweckte Tote dienen als Vermittler zwischen der menschlichen Welt und der Götterwelt. Rakoto freut sich auf das Fest, denn sein Vater kehrt an diesem Tag aus dem Reich der Toten zurück. Die dreitägige Leichenwendfeier beginnt früh am Morgen, wenn Rakoto das Grab seines Vaters ausgräbt. Danach wäscht er die Leiche und kleidet sie in kostbare Seidentücher. In einem feierlichen Umzug wird die Leiche zurück ins Dorf gebracht. Die Grabstätte wird gereinigt und neu gestrichen. Der Höhepunkt des Festes ist am Abend, wo Lieder den Ahnen gewidmet sind und der erste Schluck aus einer neuen Flasche für sie auf den Boden gegossen wird.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rw8zynFSFJo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/108-party-fuer-eine-leiche-das-fest-der-ahnen-in-madagaskar-339429\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042940\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641966\">thetvdb.com</a></p>\n","134":"<h2>Die Frachtensegler von Madagaskar</h2>\n<p>(Staffel 4 Nr. 30, Fortlaufende Nr. 134; Erstausstrahlung: 06.11.2002)</p>\n\n<p>An den Küsten von Madagaskar sind die Straßen in einem verheerenden Zustand, wodurch viele Ortschaften nicht über Land erreichbar sind. Glücklicherweise spielen Frachtschiffer eine wichtige Rolle bei der Versorgung der madagassischen Bauern und der Belieferung von außen. Kapitän Donné ist ein herausragender Frachtschiffer, der ohne Seekarte, Sextanten oder Kompass navigiert. Er kennt alle Gefahren und sicheren Ankerplätze entlang der Küste. Neben alltäglichen Gebrauchsgegenständen transportiert er auch Passagiere, wenn Platz vorhanden ist. Aufgrund der schwierigen wirtschaftlichen und politischen Lage wird der Ausbau der Verkehrswege in den wenig besiedelten Küstengebieten Madagaskars auf absehbare Zeit nicht möglich sein.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MOxGnaDNqe4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/134-die-frachtensegler-von-madagaskar-339459\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641992\">thetvdb.com</a></p>\n","109":"<h2>Filmstars im Pelz</h2>\n<p>(Staffel 4 Nr. 5, Fortlaufende Nr. 109; Erstausstrahlung: 04.03.2002)</p>\n\n<p>In der Nähe von Budapest leitet Zoltán Horkai, 28 Jahre alt, ein Tierasyl, das Tiere aus ganz Osteuropa aufnimmt. Das Asyl wurde ursprünglich für Tiere aus ungarischen Tierfilmen der kommunistischen Ära gebaut. Die World Society for the Protection of Animals (WSPA) unterstützt den Bau der Gehege und einen Teil der Kosten. Horkai finanziert den Rest durch Auftritte seiner tierischen Stars in Filmen. Im Gegensatz zu Hollywood-Tiertrainern ist es ihm wichtig, dass die Tiere in ihrer natürlichen Umgebung zu sehen sind und sich natürlich verhalten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gMcu-RgppR8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/109-filmstars-im-pelz-339430\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042935\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641967\">thetvdb.com</a></p>\n","110":"<h2>Hongkongs fliegende Küchen</h2>\n<p>(Staffel 4 Nr. 6, Fortlaufende Nr. 110; Erstausstrahlung: 05.03.2002)</p>\n\n<p>In Hongkong öffnen die Nachtmärkte in den beleuchteten Straßen rund um die Temple Street, begleitet von den fliegenden Küchen. Sie verwandeln das Viertel schnell in ein großes Schnellrestaurant. Kim Sing Yiung schiebt seine fahrbare Küche und verkauft duftenden Tofu, den seine Frau frisch zubereitet. Obwohl er keine Lizenz hat, ist er immer dort, wo das Geschäft boomt. Die Hygienepolizei ist gegen die mobilen Garküchen und könnte Kims Wagen jederzeit beschlagnahmen. Trotzdem spielt Kim Sing Yiung ein nervenaufreibendes Katz-und-Maus-Spiel, um seine Familie zu ernähren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tsr8CmfJ4cY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/110-hongkongs-fliegende-kuechen-339431\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042937\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641968\">thetvdb.com</a></p>\n","112":"<h2>Safran - Ein blühendes Geschäft</h2>\n<p>(Staffel 4 Nr. 8, Fortlaufende Nr. 112; Erstausstrahlung: 07.03.2002)</p>\n\n<p>In einem kleinen Laden hinter der Pariser Oper verkauft die Familie Thiercellin Safran und andere Gewürze. Jedes Jahr werden hier 4000 Kilo des teuersten Gewürzes der Welt an die besten Restaurants und Privatpersonen verkauft. Marokko gilt neben dem Iran als bekannter Safranproduzent, und Jean-Marie Thiercellin besucht direkt die Erzeuger in der Region Talioune, die für ihren hochwertigen Safran bekannt ist. Da Safran häufig gefälscht wird, verlässt sich Thiercellin auf sein Gespür und seine Erfahrung beim Einkauf auf den Märkten. Im Labor kann er anhand der Farbkomponenten die Herkunft des Safrans bestimmen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=a-LwN0C_I3U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/112-safran-ein-bluehendes-geschaeft-339434\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042942\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641970\">thetvdb.com</a></p>\n","113":"<h2>Der Dreh mit den Havannas - Die Zigarrenfälschung</h2>\n<p>(Staffel 4 Nr. 9, Fortlaufende Nr. 113; Erstausstrahlung: 01.04.2002)</p>\n\n<p>Auf Kuba gibt es viele gefälschte Luxuszigarren, die von professionellen Fälschern in Hinterzimmern hergestellt werden. In Miguels Werkstatt arbeiten geschickte Hände daran, aus Tabakblättern gefälschte Havannas herzustellen. Diese sehen und schmecken echt aus, wurden aber nicht in staatlichen Drehereien produziert. Armando Rodrigues Chil ist ein staatlicher Experte für Fälschungen und sucht nach illegalen Werkstätten. Viele der Fälscher haben ihr Handwerk in staatlichen Fabriken gelernt und nutzen nach Feierabend ihr Wissen, um illegal Zigarren herzustellen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kGDRh9FmLw4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/113-der-dreh-mit-den-havannas-die-zigarrenfaelschung-339435\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042925\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641971\">thetvdb.com</a></p>\n","114":"<h2>Ein göttlicher Zug - das rollende Gotteshaus in Russland</h2>\n<p>(Staffel 4 Nr. 10, Fortlaufende Nr. 114; Erstausstrahlung: 02.04.2002)</p>\n\n<p>In einer einsamen Gegend macht der russisch-orthodoxe Vater Sergej mit seinem Zug für einen Tag Halt. Der Zug dient als rollende Kirche und ermöglicht den Gläubigen in dieser Region, Gottesdienste zu besuchen. Während der Zug durch die verschneite Winterlandschaft rattert, warten die Priester andächtig auf den nächsten Halt, da der Zug ihr Zuhause ist. Nach der Zeit der Sowjetmacht gibt es in Russland nur noch wenige Kirchen. Die russisch-orthodoxe Kirche hat dieses rollende Gotteshaus geschaffen, um den Bedürftigen zu helfen. Die vier Priester und ein Mönchschor bieten Trost und geistlichen Beistand, obwohl ihre Aufenthalte kurz sind. Dennoch gelingt es ihnen, den wiederauflebenden Glauben zu stärken.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UA8kICaAY_Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/114-ein-goettlicher-zug-das-rollende-gotteshaus-in-russland-339436\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641972\">thetvdb.com</a></p>\n","115":"<h2>Sinfonie der Straße</h2>\n<p>(Staffel 4 Nr. 11, Fortlaufende Nr. 115; Erstausstrahlung: 03.04.2002)</p>\n\n<p>In Caracas, der Hauptstadt Venezuelas, leben fast die Hälfte der Menschen in den Elendsvierteln, den „barrios“. Ein einzigartiges Musikprogramm ermöglicht einigen Kindern jedoch den Ausbruch aus dieser Situation. Gustavo, 19 Jahre alt, leitet als Dirigent das nationale Kinderorchester, nachdem er selbst jahrelang darin gespielt hat. Ohne die Aufmerksamkeit einer nationalen Organisation hätte er wie viele andere sein Leben auf der Straße verbracht. Die Stiftung wurde 1975 vom ehemaligen Kulturminister José Abreu gegründet und betreut über 110.000 Kinder in 180 Nachwuchsensembles, unterstützt von mehr als 1000 Mitarbeitern.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XqG2GkP4BqI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/115-sinfonie-der-strasse-kinderorchester-in-venezuela-339437\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042943\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641973\">thetvdb.com</a></p>\n","116":"<h2>Ticket in ein neues Leben - Der Lifeline Express in Indien</h2>\n<p>(Staffel 4 Nr. 12, Fortlaufende Nr. 116; Erstausstrahlung: 06.05.2002)</p>\n\n<p>Silaras Füße wurden erfolgreich operiert, aber sie leidet unter Schmerzen. Ihre Eltern waren verzweifelt, da sie keine Möglichkeit zur Operation sahen. Der Lifeline Express erreicht den kleinen Ort Jasidhi und wird von Tausenden Menschen belagert. Das Projekt bietet medizinische Hilfe in abgelegenen Gebieten, wo normalerweise keine Ärzte verfügbar sind. Tata Steel, eines der größten indischen Unternehmen, finanziert den Aufenthalt in Jasidhi. Der Zug, der einen Operationssaal enthält, reist seit zehn Jahren durch unterentwickelte Regionen und hat bereits über 300.000 Menschen, darunter viele Kinder, kostenlos behandelt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pi9fUEg6QJs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/116-ticket-in-ein-neues-leben-der-lifeline-express-in-indien-339439\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641974\">thetvdb.com</a></p>\n","117":"<h2>Die Bernsteintaucher</h2>\n<p>(Staffel 4 Nr. 13, Fortlaufende Nr. 117; Erstausstrahlung: 07.05.2002)</p>\n\n<p>In der Ostsee vor Kaliningrad werden die meisten Bernsteinvorkommen weltweit gefördert. Taucher wie Pawel Fedotov suchen dort nach den begehrten Steinen. Mit einem Echolot auf seinem Boot kann er die senkenartigen Stellen im Meer finden, wo sich der Bernstein ansammelt. Obwohl die meisten Steine wertlose Krümel sind, können einige zu Schmuck verarbeitet werden. Obwohl es nur dem Staat erlaubt ist, Bernstein zu fördern und zu verkaufen, toleriert die schlecht bezahlte Polizei Bestechungsgelder. Die Ostsee ist für viele zur wichtigen Einkommensquelle geworden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fGA6Fgc5tgQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/117-die-bernsteintaucher-339440\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042928\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641975\">thetvdb.com</a></p>\n","118":"<h2>Mumien im Ausverkauf</h2>\n<p>(Staffel 4 Nr. 14, Fortlaufende Nr. 118; Erstausstrahlung: 08.05.2002)</p>\n\n<p>Peruanische „Huaqueros“ sind tagsüber Bauern oder Fischer, doch nachts werden sie zu Mumienjägern, die nach vorkolumbianischen Artefakten graben. Historische Reliquien werden seit der Kolonialzeit an westliche Kunstsammler und Museen verkauft. Der Archäologe Pablo De La Vera Cruz ist besessen davon, den kulturellen Ausverkauf seines Landes zu stoppen. Er gibt sich als potenzieller Käufer aus und ermittelt auf dem Markt von Chiclayo, wo sich hinter den Ständen der Händler oft verbotene Ware verbirgt.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=T_VG6xORqgI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/118-mumien-im-ausverkauf-339441\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042938\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641976\">thetvdb.com</a></p>\n","119":"<h2>Die Minensucher von Kabul</h2>\n<p>(Staffel 4 Nr. 15, Fortlaufende Nr. 119; Erstausstrahlung: 09.05.2002)</p>\n\n<p>Die deutsche Schäferhündin Cora schnüffelt mit Abdul, ihrem afghanischen Halter, über einen kargen Feldboden. Plötzlich setzt sie sich hin, da sie eine vergrabene Landmine entdeckt hat. In Afghanistan liegen mehr versteckte Sprengkörper als irgendwo sonst auf der Welt. Mario Boers Kompanie hat bereits über 2000 von den Sowjets hinterlassene Landminen gefunden und entschärft, aber nach dem Angriff der USA mussten alle Gebiete erneut durchsucht werden. Die Hunde aus Deutschland werden in Afghanistan hoch geschätzt, da sie Sprengstoff aufspüren können. Das Räumungspersonal gräbt die Minen von Hand aus und entschärft sie.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3wLFTh60fW8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/119-die-minensucher-von-kabul-339442\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042931\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641977\">thetvdb.com</a></p>\n","120":"<h2>Bermuda: Schatzsuche in der Tiefsee</h2>\n<p>(Staffel 4 Nr. 16, Fortlaufende Nr. 120; Erstausstrahlung: 03.06.2002)</p>\n\n<p>Das russische Forschungsschiff „Akademik Keldysh“ hat modernste Technologie an Bord, darunter die Tiefseeboote MIR1 und MIR2 mit High-Tech-Kameras, Lampen und Roboterarmen. Anstatt nur Wissenschaftler, begleitet der australische Abenteurer Mike McDowell die Mannschaft. Sie planen, zur Sargassosee zu fahren, wo das Wrack einer spanischen Gold-Galeone vermutet wird. Dies könnte einen unermesslichen Reichtum bedeuten.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/120-bermuda-schatzsuche-in-der-tiefsee-339443\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042923\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641978\">thetvdb.com</a></p>\n","121":"<h2>Die Legende von den Killerbienen</h2>\n<p>(Staffel 4 Nr. 17, Fortlaufende Nr. 121; frz. Titel “Les Abeilles Tueuses”; Erstausstrahlung: 04.06.2002)</p>\n\n<p>Im Jahr 1956 brachte der Genetiker Warwick Estavam Kerr im Auftrag der brasilianischen Regierung afrikanische Bienenköniginnen nach Brasilien, um die Honigproduktion zu steigern. Durch die Kreuzung mit europäischen Honigbienen entstanden aggressive und vitale „afrikanisierte Bienen“. Ein Jahr später entkamen 26 dieser Hybridvölker und breiteten sich rasant aus, bis nach Nordamerika. Dort wurden sie als „Killerbienen“ bekannt, griffen Menschen und Tiere an und verdrängten einheimische Bienenarten. Gerald Kastberger, ein österreichischer Bienenforscher, erforscht diese Insekten in den USA und Brasilien, um ihre Angriffsbereitschaft zu verstehen und zu entmystifizieren.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rw9kCLRBqS4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/121-die-legende-von-den-killerbienen-339405\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1042930\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641979\">thetvdb.com</a></p>\n","126":"<h2>Nashörner unter dem Hammer</h2>\n<p>(Staffel 4 Nr. 22, Fortlaufende Nr. 126; Erstausstrahlung: 04.09.2002)</p>\n\n<p>Bei einer Tierauktion im Hluhluwe-Umfolozi-Nationalpark in Südafrika wurde ein Breitmaulnashorn für 320.000 Rand verkauft. Das Wettbieten um überzählige Tiere, die das Gleichgewicht im Park gefährden, war ein Höhepunkt der Veranstaltung. Parkmitarbeiter fangen die Tiere mit Helikoptern und Jeeps ein, Tierarzt Dave Cooper untersucht und betreut sie. Durch die Auktion und jährliche Inventur sollen Platz für die verbleibenden Tiere geschaffen und der Fortbestand einiger Arten nicht allein vom Park abhängig gemacht werden.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NcnIjv7NEEg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/126-nashoerner-unter-dem-hammer-339450\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051732\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641984\">thetvdb.com</a></p>\n","127":"<h2>Warten auf den Monsun</h2>\n<p>(Staffel 4 Nr. 23, Fortlaufende Nr. 127; Erstausstrahlung: 05.09.2002)</p>\n\n<p>In Mumbai, Indien, gibt es neun Monate lang keinen Regen und hohe Temperaturen von 40 Grad. Der lang ersehnte Monsun bricht im Juni aus und bringt Abkühlung, aber auch Überschwemmungen. Der Hotelfeger Boleram Haldar kämpft sich auf dem Weg zur Arbeit durch überflutete Straßen. Männer beseitigen den Müll aus den Abflüssen, um eine Zusammenbruch der Kanalisation und die Vermischung von Abwasser mit Trinkwasser zu verhindern. Der Regen bestimmt das Leben in der Stadt für drei Monate, bringt Chaos, Krankheiten und neues Grün zwischen den Straßen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dei00bjPwvA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/127-warten-auf-den-monsun-339451\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051735\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641985\">thetvdb.com</a></p>\n","128":"<h2>Palmasola - Dorf hinter Gittern</h2>\n<p>(Staffel 4 Nr. 24, Fortlaufende Nr. 128; Erstausstrahlung: 07.10.2002)</p>\n\n<p>Palmasola in Bolivien ist eine Stadt im Osten des Landes, in der 1047 Gefangene leben, darunter viele mit ihren Familien. Die Wächter bewachen nur das Tor. Geld ermöglicht es den Insassen, Zimmer oder Häuser zu mieten, Respekt und Leibwächter zu kaufen, Geschäfte zu eröffnen oder mit Kokain zu handeln. Carlos Cambia, ein Autodieb und Herausgeber der Gefängniszeitung, kennt alle Gefängnisse Boliviens, aber nur hier fühlt er sich nicht seiner Würde beraubt. Das Gefängnis ist wie sein Stadtviertel, nur brutaler.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UwCJCZPcEL0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/128-palmasola-dorf-hinter-gittern-339453\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051733\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641986\">thetvdb.com</a></p>\n","129":"<h2>Bilder hören - Die blinden Kinder von Tibet</h2>\n<p>(Staffel 4 Nr. 25, Fortlaufende Nr. 129; Erstausstrahlung: 08.10.2002)</p>\n\n<p>Die blinde deutsche Lehrerin Sabriye Tenberken lebt in Lhasa, Tibet, und unterrichtet blinde Kinder. Das Leben der Menschen in Tibet ist hart, und Blindheit wird als Bestrafung für vergangene Sünden betrachtet. Dennoch hat Tenberken es sich zur Aufgabe gemacht, blinden Kindern zu helfen und sie zu unterrichten. In ihrer Schule lehrt sie 28 Kinder Lesen, Schreiben und die Orientierung mit dem Blindenstock.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=LTq7SwlTjaU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/129-bilder-hoeren-die-blinden-kinder-von-tibet-339454\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051730\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641987\">thetvdb.com</a></p>\n","130":"<h2>Der Blechmusik-Oscar</h2>\n<p>(Staffel 4 Nr. 26, Fortlaufende Nr. 130; Erstausstrahlung: 09.10.2002)</p>\n\n<p>Das Blechmusik-Festival in Guca verwandelt das kleine serbische Dorf in einen Ausnahmezustand. Das einzige Hotel ist schnell ausgebucht, daher schlafen die meisten Musiker und Gäste in Bussen, Zelten oder ihren Autos. Die Einheimischen vermieten ihre Zimmer und nutzen die Küche als Ersatz. Der begehrte Preis „Prva Truba“ lockt die Musiker an, darunter der dreifache Gewinner Milan Mladanovic, der nun seinen Enkel Ekrim den Sieg wünscht. Bei einem Gewinn will Milan die Leitung des Familienorchesters abgeben. Drei Tage lang wird das Festival Guca mit einer schwitzenden, brodelnden und tanzwütigen Atmosphäre erfüllen.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=mw6CLMWS17k\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/130-der-blechmusik-oscar-339455\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051728\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641988\">thetvdb.com</a></p>\n","131":"<h2>Die Riesenflöße vom Jenissej - Ein Floßschiffer auf seiner Fahrt zum Polarmeer</h2>\n<p>(Staffel 4 Nr. 27, Fortlaufende Nr. 131; Erstausstrahlung: 10.10.2002)</p>\n\n<p>Im Juli und August steigt das Frühlingshochwasser des Jenissej. Dann startet die abenteuerliche Reise der 700 Meter langen Holzflöße flussabwärts. Ganze Wälder werden in Bewegung gesetzt und bis zu 25.000 Baumstämme zu Paketen verschnürt. Auf den Flößen befinden sich Hütten, in denen die Flößer zwei Wochen lang leben werden. Einer von ihnen ist Alexander Otzenko, dessen Familie seit über 30 Jahren in der Forstwirtschaft tätig ist. Alexander und seine Kollegen haben noch 1200 Flusskilometer vor sich. Die Fahrt von den Holzfällerdörfern zum Polarmeer und zurück dauert über einen Monat. Sie müssen Stromschnellen passieren, das Floß vor Stürmen schützen und schließlich den Polarkreis überqueren. Dann erreichen sie ihr Ziel - den Polarhafen von Dudinka.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=85nISbMK9ng\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/131-die-riesenfloesse-vom-jenissej-ein-flossschiffer-auf-seiner-fahrt-zum-polarmeer-339456\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1051729\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641989\">thetvdb.com</a></p>\n","132":"<h2>Heiratsmarkt in Marokko</h2>\n<p>(Staffel 4 Nr. 28, Fortlaufende Nr. 132; Erstausstrahlung: 04.11.2002)</p>\n\n<p>Der Markttag in Ilmichil auf einer Hochebene zwischen dem Mittleren und dem Hohen Atlas vereint das Jahresfest zu Ehren des lokalen Stammesheiligen Marabouts mit dem traditionellen Erntedankfest der Ait-Haddidou-Berber und einem Heiratsmarkt. Es gibt typische Tänze und Gesänge der verschiedenen Stammesfamilien. Frauen, geschmückt mit dicken Bernsteinketten, stehen Seite an Seite und wiegen sich zum rhythmischen Klatschen. Das Jahrestreffen bietet den nomadisierenden Stämmen die Möglichkeit, sich für den Winter zu versorgen und potenzielle Ehepartner zu finden. Henou und Hassan werden sich dieses Jahr bei den kollektiven Eheschließungen in Imilchil vermählen. Die verschleierte Henou wird auf einem Esel über den Festplatz geführt, wo Hassan sie empfängt und zum Standesbeamten führt. Anschließend wird in den Zelten bis spät in die Nacht gefeiert.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5mwI8g-fagQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/132-heiratsmarkt-in-marokko-339457\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641990\">thetvdb.com</a></p>\n","133":"<h2>Die türkischen Hochzeitsmacher</h2>\n<p>(Staffel 4 Nr. 29, Fortlaufende Nr. 133; Erstausstrahlung: 05.11.2002)</p>\n\n<p>In Berlin-Kreuzberg findet eine Hochzeitsfeier statt, bei der 600 Gäste auf das Brautpaar warten. Die Zeremonie wird vom 37-jährigen Mehmet Gemici organisiert, einem bekannten „Hochzeitsmacher“ der türkischen Gemeinschaft in Berlin. Heute heiratet der jüngste Sohn seines Freundes Musa Coskun. Das Brautpaar betritt den Saal und die Gäste bilden einen Tunnel, durch den sie zur Tanzfläche gelangen. Die Feier wird von türkischen Dienstleistern wie Caterern, Floristen, Juwelieren, Bäckern, Musikern, Friseuren, Möbelgeschäften und Fotografen unterstützt. Die türkische Hochzeitsbranche boomt in Berlin aufgrund der jungen türkischen Bevölkerung, die früh heiratet. Mehmet Gemici hat viel Arbeit und keinen Grund zur Klage.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Nhy3yuYYp5s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/133-die-tuerkischen-hochzeitsmacher-339458\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2069998\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641991\">thetvdb.com</a></p>\n","135":"<h2>Die Abalone-Wilderer</h2>\n<p>(Staffel 4 Nr. 31, Fortlaufende Nr. 135; Erstausstrahlung: 07.11.2002)</p>\n\n<p>Abalones sind teure Meeresdelikatessen und ihre Perlmutt-Schalen werden als Schmuck begehrt. Der Bestand der Abalones ist weltweit gefährdet, auch in Südafrika. Die Polizei und Eben Groenewald, ein Officer von „Operation Neptune“, einer Spezialeinheit des südafrikanischen Umweltministeriums, Polizei und Armee, kämpfen gegen Wilderer und Schmuggler. In Hermanus kontrollieren die Polizisten Autos und finden tatsächlich eine Kiste mit Abalones. Der 45-jährige Groenewald setzt sich leidenschaftlich für den Schutz des Naturerbes seines Landes ein.</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kF1VEBBmF0A\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/135-die-abalone-wilderer-der-kampf-um-den-erhalt-einer-seeschneckenart-339460\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641993\">thetvdb.com</a></p>\n","136":"<h2>Die Mörderinnen von Targsor - Das einzige Frauengefängnis in Rumänien</h2>\n<p>(Staffel 5 Nr. 1, Fortlaufende Nr. 136; Erstausstrahlung: 06.01.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=KYbUkoxaOyo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/136-die-moerderinnen-von-targsor-das-einzige-frauengefaengnis-in-rumaenien-339461\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641994\">thetvdb.com</a></p>\n","137":"<h2>Das Metall aus dem Vulkan</h2>\n<p>(Staffel 5 Nr. 2, Fortlaufende Nr. 137; Erstausstrahlung: 07.01.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RGqCVo2c3pQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/137-das-metall-aus-dem-vulkan-339462\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt6753230\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641995\">thetvdb.com</a></p>\n","138":"<h2>Die Söldner der Perlen</h2>\n<p>(Staffel 5 Nr. 3, Fortlaufende Nr. 138; Erstausstrahlung: 08.01.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/138-die-soeldner-der-perlen-der-lebensgefaehrliche-job-339463\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641996\">thetvdb.com</a></p>\n","139":"<h2>Hongkongs Bambusakrobaten</h2>\n<p>(Staffel 5 Nr. 4, Fortlaufende Nr. 139; Erstausstrahlung: 09.01.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BSIqpsZHcSw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/139-hongkongs-bambusakrobaten-339464\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641997\">thetvdb.com</a></p>\n","140":"<h2>Mission Nordkorea</h2>\n<p>(Staffel 5 Nr. 5, Fortlaufende Nr. 140; Erstausstrahlung: 03.02.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=PcX598GUNXw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/140-mission-nordkorea-339465\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641998\">thetvdb.com</a></p>\n","141":"<h2>Radios gegen Kalaschnikows</h2>\n<p>(Staffel 5 Nr. 6, Fortlaufende Nr. 141; Erstausstrahlung: 04.02.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fsFFXBhSG6Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/141-radios-gegen-kalaschnikows-339466\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4641999\">thetvdb.com</a></p>\n","142":"<h2>Die Hightech-Oase</h2>\n<p>(Staffel 5 Nr. 7, Fortlaufende Nr. 142; Erstausstrahlung: 05.02.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8gLLh2teor4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/142-die-hightech-oase-auf-der-groessten-milchfarm-der-welt-339467\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1623060\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642000\">thetvdb.com</a></p>\n","143":"<h2>Videofabrik Nigeria</h2>\n<p>(Staffel 5 Nr. 8, Fortlaufende Nr. 143; Erstausstrahlung: 06.02.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Tej9cR-hQ7o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/143-videofabrik-nigeria-339468\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642001\">thetvdb.com</a></p>\n","145":"<h2>Hongkong - Pferde und Millionen</h2>\n<p>(Staffel 5 Nr. 10, Fortlaufende Nr. 145; Erstausstrahlung: 04.03.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3qb2dXghgjg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/145-hongkong-pferde-und-millionen-339473\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642003\">thetvdb.com</a></p>\n","148":"<h2>Samoa Queens - Männer, die als Frauen leben</h2>\n<p>(Staffel 5 Nr. 13, Fortlaufende Nr. 148; Erstausstrahlung: 07.04.2003)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=2jz1Lozi4dU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/148-samoa-queens-maenner-die-als-frauen-leben-339476\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642006\">thetvdb.com</a></p>\n"})
\ No newline at end of file
@@ -0,0 +1 @@
+popupChunkLoaded(3,{"153":"<h2>Die Waldbahn der Karpaten</h2>\n<p>(Staffel 6 Nr. 2, Fortlaufende Nr. 153; frz. Titel “Le Train des Carpates”; Erstausstrahlung: 28.02.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=oglBMMjahqg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/153-die-waldbahn-der-karpaten-339481\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1045684\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642021\">thetvdb.com</a></p>\n","154":"<h2>Das Vermächtnis der Marquesas-Inseln</h2>\n<p>(Staffel 6 Nr. 3, Fortlaufende Nr. 154; frz. Titel “Cargo pour les marquises”; Erstausstrahlung: 27.03.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7FS3M6gwn2g\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/154-das-vermaechtnis-der-marquesas-inseln-339482\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt5000242\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642022\">thetvdb.com</a></p>\n","156":"<h2>Johannesburg - Eine Stadt macht dicht</h2>\n<p>(Staffel 6 Nr. 5, Fortlaufende Nr. 156; frz. Titel “Johannesburg, le Repli Sur Soi”; Erstausstrahlung: 29.05.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CyD4tnGwcxs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/156-johannesburg-eine-stadt-macht-dicht-339486\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642024\">thetvdb.com</a></p>\n","157":"<h2>Paco Pacos - Die Knatterkisten vom Amazonas</h2>\n<p>(Staffel 6 Nr. 6, Fortlaufende Nr. 157; frz. Titel “Paco Pacos, Belles Bagnoles du Brésil”; Erstausstrahlung: 26.06.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SWt30v35IdA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/157-paco-pacos-die-knatterkisten-vom-amazonas-339417\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642025\">thetvdb.com</a></p>\n","158":"<h2>Das Parlament der Kinder</h2>\n<p>(Staffel 6 Nr. 7, Fortlaufende Nr. 158; frz. Titel “Le Parlement des Enfants du”; Erstausstrahlung: 10.07.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1I5rUoMUmwA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/158-das-parlament-der-kinder-339433\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642026\">thetvdb.com</a></p>\n","159":"<h2>Die Bogenschützin von Bhutan</h2>\n<p>(Staffel 6 Nr. 8, Fortlaufende Nr. 159; frz. Titel “L'Himalaya — La Jeune Fille à l'Arc”; Erstausstrahlung: 31.07.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wyIXpjaP9VM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/159-die-bogenschuetzin-von-bhutan-339447\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642027\">thetvdb.com</a></p>\n","160":"<h2>Überleben am Manila Express</h2>\n<p>(Staffel 6 Nr. 9, Fortlaufende Nr. 160; frz. Titel “Manille, la Vie le Long du Train”; Erstausstrahlung: 04.09.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0uMJ3IZ2_FI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/160-ueberleben-am-manila-express-339484\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642028\">thetvdb.com</a></p>\n","161":"<h2>Das Mysterium der sibirischen Mumie</h2>\n<p>(Staffel 6 Nr. 10, Fortlaufende Nr. 161; frz. Titel “Le Mystère de la Momie de Sibérie”; Erstausstrahlung: 11.09.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=DXk26Rs6ev8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/161-das-mysterium-der-sibirischen-mumie-339471\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642029\">thetvdb.com</a></p>\n","162":"<h2>Razzia im Regenwald</h2>\n<p>(Staffel 6 Nr. 11, Fortlaufende Nr. 162; frz. Titel “Razzia Dans la Forêt Amazonienne”; Erstausstrahlung: 18.09.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ExA03zKchVc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/162-razzia-im-regenwald-339488\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642031\">thetvdb.com</a></p>\n","181":"<h2>Das schwimmende Krankenhaus vom Amazonas</h2>\n<p>(Staffel 7 Nr. 11, Fortlaufende Nr. 181; frz. Titel “L'Hôpital Flottant du Fleuve Amazone”; Erstausstrahlung: 08.10.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0Xz-nWoBhUQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/183-das-schwimmende-krankenhaus-vom-amazonas-339657\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642160\">thetvdb.com</a></p>\n","163":"<h2>In acht Meilen um die Welt</h2>\n<p>(Staffel 6 Nr. 12, Fortlaufende Nr. 163; frz. Titel “New-York, le tour de monde en 13 kms”; Erstausstrahlung: 16.10.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=t59ghH7Ant8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/163-in-acht-meilen-um-die-welt-339489\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642033\">thetvdb.com</a></p>\n","164":"<h2>Alphadi und die Farben der Wüste</h2>\n<p>(Staffel 6 Nr. 13, Fortlaufende Nr. 164; frz. Titel “Alphadi, le prince de la haute couture”; Erstausstrahlung: 30.10.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=y9UDkxFqr0s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/164-alphadi-modedesigner-aus-der-wueste-339490\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642034\">thetvdb.com</a></p>\n","165":"<h2>Die Verwandlungskünstler von Dakar</h2>\n<p>(Staffel 6 Nr. 14, Fortlaufende Nr. 165; frz. Titel “Dakar, les Rois de la Récup”; Erstausstrahlung: 06.11.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jjnY-79AN_s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/165-die-verwandlungskuenstler-von-dakar-339491\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642036\">thetvdb.com</a></p>\n","166":"<h2>Kalifornien auf die harte Tour</h2>\n<p>(Staffel 6 Nr. 15, Fortlaufende Nr. 166; frz. Titel “Tourisme de choc en californie”; Erstausstrahlung: 13.11.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qIx8uIMxDIM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/166-kalifornien-auf-die-harte-tour-339492\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1029217\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642037\">thetvdb.com</a></p>\n","167":"<h2>Der Polarflieger - Ein Pilot in Sibirien</h2>\n<p>(Staffel 6 Nr. 16, Fortlaufende Nr. 167; frz. Titel “Le Cercle Polaire en Hélico”; Erstausstrahlung: 20.11.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JudMONhb6p0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/167-der-polarflieger-ein-pilot-in-sibirien-339493\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642038\">thetvdb.com</a></p>\n","168":"<h2>Dagestan - Land über den Wolken</h2>\n<p>(Staffel 6 Nr. 17, Fortlaufende Nr. 168; frz. Titel “La Montagne Sacrée du Daghestan”; Erstausstrahlung: 27.11.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=E0QU7u1xbFM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/168-dagestan-land-ueber-den-wolken-339494\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642039\">thetvdb.com</a></p>\n","169":"<h2>Die versunkenen Flugzeuge</h2>\n<p>(Staffel 6 Nr. 18, Fortlaufende Nr. 169; frz. Titel “avions portès disparus”; Erstausstrahlung: 04.12.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=2wbl4SWQ3q8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/169-die-versunkenen-flugzeuge-339495\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642040\">thetvdb.com</a></p>\n","170":"<h2>Ein Traum von Schokolade</h2>\n<p>(Staffel 6 Nr. 19, Fortlaufende Nr. 170; frz. Titel “100 % chocolat”; Erstausstrahlung: 30.12.2004)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BxUtrDZX1FI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/170-ein-traum-von-schokolade-339496\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1350548\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642041\">thetvdb.com</a></p>\n","171":"<h2>Die rasenden Engel der Línea 5</h2>\n<p>(Staffel 7 Nr. 1, Fortlaufende Nr. 171; frz. Titel “Les Anges Fous de la Linea 5”; Erstausstrahlung: 08.01.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=svJ9c2nluQ4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/171-die-rasenden-engel-der-linea-5-339497\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642146\">thetvdb.com</a></p>\n","172":"<h2>Das Dschungel-Orchester</h2>\n<p>(Staffel 7 Nr. 2, Fortlaufende Nr. 172; frz. Titel “Les Virtuoses de la Jungle”; Erstausstrahlung: 22.01.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Q1sjNpil_Fw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/172-das-dschungel-orchester-339498\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642147\">thetvdb.com</a></p>\n","173":"<h2>Der Wüstendoktor</h2>\n<p>(Staffel 7 Nr. 3, Fortlaufende Nr. 173; frz. Titel “Le Toubib Touareg”; Erstausstrahlung: 26.02.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FxPvLeQmgok\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/174-der-wuestendoktor-339501\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642149\">thetvdb.com</a></p>\n","174":"<h2>Die Kichwa-Krieger und das Öl</h2>\n<p>(Staffel 7 Nr. 4, Fortlaufende Nr. 174; frz. Titel “Les Indiens Contre les Rois du Pétrole”; Erstausstrahlung: 09.04.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=t3Kiy1Iz69k\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/175-die-kichwa-krieger-und-das-oel-339502\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642150\">thetvdb.com</a></p>\n","175":"<h2>Honeymoon auf Hainan</h2>\n<p>(Staffel 7 Nr. 5, Fortlaufende Nr. 175; frz. Titel “Lune de Miel en Chine”; Erstausstrahlung: 21.05.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WUwS5Yac1PY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/176-honeymoon-auf-hainan-339505\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642152\">thetvdb.com</a></p>\n","176":"<h2>Kambodscha - Die Seele der Seide</h2>\n<p>(Staffel 7 Nr. 6, Fortlaufende Nr. 176; frz. Titel “Cambodge, le Cri de la Soie”; Erstausstrahlung: 25.06.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ZWSMXpf-EQc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/177-kambodscha-die-seele-der-seide-339506\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642153\">thetvdb.com</a></p>\n","177":"<h2>Das Postschiff zum Ende der Welt</h2>\n<p>(Staffel 7 Nr. 7, Fortlaufende Nr. 177; frz. Titel “Le Bateau Postal d'Ouessant”; Erstausstrahlung: 09.07.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hnuma6p1K08\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/178-das-postschiff-zum-ende-der-welt-339507\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642154\">thetvdb.com</a></p>\n","179":"<h2>Die Mutter der Bonobos</h2>\n<p>(Staffel 7 Nr. 9, Fortlaufende Nr. 179; frz. Titel “La Maman des Bonobos”; Erstausstrahlung: 17.09.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GoiCEwbQxA0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/180-die-mutter-der-bonobos-339653\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642156\">thetvdb.com</a></p>\n","182":"<h2>Der weiße Berg von Feuerland</h2>\n<p>(Staffel 7 Nr. 12, Fortlaufende Nr. 182; frz. Titel “Le Géant Blanc de Patagonie”; Erstausstrahlung: 22.10.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=N1vjuQX9RyY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/184-der-weisse-berg-von-feuerland-339658\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642161\">thetvdb.com</a></p>\n","183":"<h2>Mecaniqueros - Nichts ist unmöglich in</h2>\n<p>(Staffel 7 Nr. 13, Fortlaufende Nr. 183; frz. Titel “Mecaniqueros: Impossible n’Est Pas Cubain”; Erstausstrahlung: 12.11.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=80vkFm7tzCM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/185-mecaniqueros-nichts-ist-unmoeglich-in-havanna-339659\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642162\">thetvdb.com</a></p>\n","184":"<h2>Eremitage - Palast der Katzen</h2>\n<p>(Staffel 7 Nr. 14, Fortlaufende Nr. 184; frz. Titel “Des Chats au Pays des Tsars”; Erstausstrahlung: 10.12.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_hiU5OzkNQ0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/186-eremitage-palast-der-katzen-339660\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642163\">thetvdb.com</a></p>\n","185":"<h2>Traumberuf Schäfer</h2>\n<p>(Staffel 7 Nr. 15, Fortlaufende Nr. 185; frz. Titel “Pyrénées, à l'École des Bergers”; Erstausstrahlung: 17.12.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=J6auo5M-mxI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/187-traumberuf-schaefer-339661\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642164\">thetvdb.com</a></p>\n","186":"<h2>Die Kinder des Vater Nikolai</h2>\n<p>(Staffel 7 Nr. 16, Fortlaufende Nr. 186; frz. Titel “Les Petits Choristes de l'Oural”; Erstausstrahlung: 24.12.2005)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/188-die-kinder-des-vater-nikolai-339662\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642165\">thetvdb.com</a></p>\n","188":"<h2>Polen - Ärger im Revier</h2>\n<p>(Staffel 8 Nr. 2, Fortlaufende Nr. 188; frz. Titel “La Pologne des Braconniers”; Erstausstrahlung: 04.02.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=YMQMvv9gl4A\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/190-polen-aerger-im-revier-339665\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642168\">thetvdb.com</a></p>\n","189":"<h2>Lust auf Liebe in Lisdoonvarna</h2>\n<p>(Staffel 8 Nr. 3, Fortlaufende Nr. 189; frz. Titel “Irlande, Célibataire Cherche Amoureuse”; Erstausstrahlung: 25.03.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MlM93JHkIU4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/191-lust-auf-liebe-in-lisdoonvarna-339503\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1045683\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642169\">thetvdb.com</a></p>\n","190":"<h2>Kung-Fu - Chinas neue Kämpferinnen</h2>\n<p>(Staffel 8 Nr. 4, Fortlaufende Nr. 190; frz. Titel “Chine - Les Filles Aussi Font du Kung-fu”; Erstausstrahlung: 08.04.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rzkqoL0_cEw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/192-kung-fu-chinas-neue-kaempferinnen-339669\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642170\">thetvdb.com</a></p>\n","191":"<h2>Highway durch die Arktis</h2>\n<p>(Staffel 8 Nr. 5, Fortlaufende Nr. 191; frz. Titel “Vivre au-Delà de l'Arctique”; Erstausstrahlung: 22.04.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dx2YI4of1wU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/193-highway-durch-die-arktis-339670\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2046172\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642171\">thetvdb.com</a></p>\n","192":"<h2>Churubamba - Frauen am Ball</h2>\n<p>(Staffel 8 Nr. 6, Fortlaufende Nr. 192; frz. Titel “Footballeuses des Andes”; Erstausstrahlung: 27.05.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4S_yDEomrcY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/194-churubamba-frauen-am-ball-339674\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642172\">thetvdb.com</a></p>\n","193":"<h2>Chicagos Stahlmänner - Abriss und Wiederaufbau eines Hochofens</h2>\n<p>(Staffel 8 Nr. 7, Fortlaufende Nr. 193; frz. Titel “Les Métallos de Chicago”; Erstausstrahlung: 29.07.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Nz8O4PT5AbI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/195-chicagos-stahlmaenner-abriss-und-wiederaufbau-eines-hochofens-339676\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642173\">thetvdb.com</a></p>\n","194":"<h2>Die schwimmenden Dörfer der Ha Long Bucht</h2>\n<p>(Staffel 8 Nr. 8, Fortlaufende Nr. 194; frz. Titel “Villages Flottants de la Baie d'Along”; Erstausstrahlung: 29.07.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=At-Ei18eK_8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/196-die-schwimmenden-doerfer-der-ha-long-bucht-339509\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642174\">thetvdb.com</a></p>\n","195":"<h2>Von Männern und Mustangs</h2>\n<p>(Staffel 8 Nr. 9, Fortlaufende Nr. 195; frz. Titel “Des Mustangs et des Hommes”; Erstausstrahlung: 26.08.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=vEQecvaogb8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/197-von-maennern-und-mustangs-339511\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642175\">thetvdb.com</a></p>\n","196":"<h2>Tasmanien: Wächterin im Paradies</h2>\n<p>(Staffel 8 Nr. 10, Fortlaufende Nr. 196; frz. Titel “La Gardienne du Paradis de Tasmanie”; Erstausstrahlung: 09.09.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=df1G1ZN2OdM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/198-tasmanien-waechterin-im-paradies-339666\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642176\">thetvdb.com</a></p>\n","197":"<h2>Die Teebahn von Darjeeling</h2>\n<p>(Staffel 8 Nr. 11, Fortlaufende Nr. 197; frz. Titel “Le Train du Darjeeling”; Erstausstrahlung: 16.09.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=htD-vlXaVcw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/199-die-teebahn-von-darjeeling-339668\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2166468\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642177\">thetvdb.com</a></p>\n","198":"<h2>Die Millionen-Dollar-Hirsche</h2>\n<p>(Staffel 8 Nr. 12, Fortlaufende Nr. 198; frz. Titel “Les Cerfs aux Bois de Velours”; Erstausstrahlung: 07.10.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=b96BcyI9T9M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/200-die-millionen-dollar-hirsche-339671\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642178\">thetvdb.com</a></p>\n","199":"<h2>Die Dächer von Kairo</h2>\n<p>(Staffel 8 Nr. 13, Fortlaufende Nr. 199; frz. Titel “Sur les Toits du Caire”; Erstausstrahlung: 14.10.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6rS22dz6_7o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/201-die-daecher-von-kairo-339672\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642179\">thetvdb.com</a></p>\n"})
\ No newline at end of file
@@ -0,0 +1 @@
+popupChunkLoaded(4,{"200":"<h2>Die Trommler von Burundi</h2>\n<p>(Staffel 8 Nr. 14, Fortlaufende Nr. 200; frz. Titel “Tambours du Burundi”; Erstausstrahlung: 21.10.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jgIQx6w8oN8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/202-die-trommler-von-burundi-339677\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3032950\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642180\">thetvdb.com</a></p>\n","201":"<h2>Saphir-Fieber auf Madagaskar</h2>\n<p>(Staffel 8 Nr. 15, Fortlaufende Nr. 201; frz. Titel “Les Mines de Saphir de Madagascar”; Erstausstrahlung: 04.11.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gSR8zp3hLgQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/203-saphir-fieber-auf-madagaskar-339673\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642181\">thetvdb.com</a></p>\n","202":"<h2>Auf den Spuren der Wikinger</h2>\n<p>(Staffel 8 Nr. 16, Fortlaufende Nr. 202; frz. Titel “Sur la Route des Vikings”; Erstausstrahlung: 18.11.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Zsj8iSV3nQE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/204-auf-den-spuren-der-wikinger-339683\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642182\">thetvdb.com</a></p>\n","204":"<h2>Buddhas Kinder im Goldenen Dreieck</h2>\n<p>(Staffel 8 Nr. 18, Fortlaufende Nr. 204; frz. Titel “Le Triangle d'Or et les Enfants de Bouddha”; Erstausstrahlung: 16.12.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5_SK0AFJqfQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/206-buddhas-kinder-im-goldenen-dreieck-339686\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642184\">thetvdb.com</a></p>\n","205":"<h2>Eritrea - Ein Esel für die Zukunft</h2>\n<p>(Staffel 8 Nr. 19, Fortlaufende Nr. 205; frz. Titel “Érythrée, l'Âne de la Dernière Chance”; Erstausstrahlung: 23.12.2006)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=deTDbCTBKtA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/207-eritrea-ein-esel-fuer-die-zukunft-339687\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642185\">thetvdb.com</a></p>\n","206":"<h2>Hai-Alarm in Polynesien</h2>\n<p>(Staffel 9 Nr. 1, Fortlaufende Nr. 206; frz. Titel “L'Homme Qui Aimait les Requins”; Erstausstrahlung: 06.01.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kwuqkmG7z_M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/208-hai-alarm-in-polynesien-339688\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642205\">thetvdb.com</a></p>\n","207":"<h2>Sumatra - Ettis Schönheitssalon</h2>\n<p>(Staffel 9 Nr. 2, Fortlaufende Nr. 207; frz. Titel “Sumatra Vénus Beauté”; Erstausstrahlung: 27.01.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0JguIiABfw8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/209-sumatra-ettis-schoenheitssalon-339689\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642206\">thetvdb.com</a></p>\n","208":"<h2>Kenia: Das Dorf der Frauen</h2>\n<p>(Staffel 9 Nr. 3, Fortlaufende Nr. 208; frz. Titel “Kenya, le Village des Femmes”; Erstausstrahlung: 10.02.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CGJ9nKH4zFw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/210-kenia-das-dorf-der-frauen-339690\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642207\">thetvdb.com</a></p>\n","209":"<h2>Boliviens junge Wilde</h2>\n<p>(Staffel 9 Nr. 4, Fortlaufende Nr. 209; frz. Titel “L'Arche de Noé en Bolivie”; Erstausstrahlung: 03.03.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SfnqxRXIJSo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/211-boliviens-junge-wilde-339692\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3843720\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642208\">thetvdb.com</a></p>\n","210":"<h2>Ein Dorfladen reist durch Lettland</h2>\n<p>(Staffel 9 Nr. 5, Fortlaufende Nr. 210; frz. Titel “L'Épicier Volant de Lettonie”; Erstausstrahlung: 24.03.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wHc_aS93aZc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/212-ein-dorfladen-reist-durch-lettland-339693\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642209\">thetvdb.com</a></p>\n","211":"<h2>Miyako: Die Insel des langen Lebens</h2>\n<p>(Staffel 9 Nr. 6, Fortlaufende Nr. 211; frz. Titel “Miyako — Vivre Cent Ans, Vivre Heureux!”; Erstausstrahlung: 07.04.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=04TrtARWfGA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/213-miyako-die-insel-des-langen-lebens-339694\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642210\">thetvdb.com</a></p>\n","212":"<h2>Die Sandmenschen von Schoina</h2>\n<p>(Staffel 9 Nr. 7, Fortlaufende Nr. 212; frz. Titel “Choïna, Sous le Sable”; Erstausstrahlung: 21.04.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=EdPZhBjtBas\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/214-die-sandmenschen-von-schoina-339696\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642211\">thetvdb.com</a></p>\n","213":"<h2>Bangkoks krabbelnde Delikatessen</h2>\n<p>(Staffel 9 Nr. 8, Fortlaufende Nr. 213; frz. Titel “Bangkok, Insectes Frits à Toute Heure”; Erstausstrahlung: 05.05.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Cxe2KMNhjG0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/215-bangkoks-krabbelnde-delikatessen-339697\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642212\">thetvdb.com</a></p>\n","214":"<h2>Die Windreiter der Anden</h2>\n<p>(Staffel 9 Nr. 9, Fortlaufende Nr. 214; frz. Titel “Les Enragés du Vol à Voile”; Erstausstrahlung: 12.05.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xkVql_Bm6FM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/216-die-windreiter-der-anden-339698\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642213\">thetvdb.com</a></p>\n","215":"<h2>Der Lachszähler von Kamtschatka</h2>\n<p>(Staffel 9 Nr. 10, Fortlaufende Nr. 215; frz. Titel “Alexeï, les Saumons et les Ours”; Erstausstrahlung: 02.06.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_1z6gndFCQg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/217-der-lachszaehler-von-kamtschatka-339700\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642214\">thetvdb.com</a></p>\n","216":"<h2>Kamtschatka: Kochende Erde</h2>\n<p>(Staffel 9 Nr. 11, Fortlaufende Nr. 216; frz. Titel “Katmtchatka, Là où la Terre Tremble”; Erstausstrahlung: 09.06.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9Nbz_igMCmM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/218-kamtschatka-kochende-erde-339701\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642215\">thetvdb.com</a></p>\n","217":"<h2>Venezuela: Die alte Frau und das Meer</h2>\n<p>(Staffel 9 Nr. 12, Fortlaufende Nr. 217; frz. Titel “Venezuela, la vieille dame et la mer”; Erstausstrahlung: 30.06.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=sOtopRXixzg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/219-venezuela-die-alte-frau-und-das-meer-339703\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1169292\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642216\">thetvdb.com</a></p>\n","218":"<h2>Die Krabbenflut</h2>\n<p>(Staffel 9 Nr. 13, Fortlaufende Nr. 218; frz. Titel “Les Crabes Attaques”; Erstausstrahlung: 11.08.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Unop9XcUC7g\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/220-die-krabbenflut-339704\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642217\">thetvdb.com</a></p>\n","220":"<h2>Kolumbien: Ein Riesenrad auf Reisen</h2>\n<p>(Staffel 9 Nr. 15, Fortlaufende Nr. 220; frz. Titel “Colombie, le Manège Enchanté”; Erstausstrahlung: 08.09.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=l0tgOGBbI7M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/222-kolumbien-ein-riesenrad-auf-reisen-339706\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642246\">thetvdb.com</a></p>\n","221":"<h2>Rio: Vom Strich auf den Laufsteg</h2>\n<p>(Staffel 9 Nr. 16, Fortlaufende Nr. 221; frz. Titel “Rio, le Trottoir Fait Sa Mode”; Erstausstrahlung: 15.09.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=lONevE9h_GM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/223-rio-vom-strich-auf-den-laufsteg-339707\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642247\">thetvdb.com</a></p>\n","222":"<h2>Oman: Die Rosen der Wüste</h2>\n<p>(Staffel 9 Nr. 17, Fortlaufende Nr. 222; frz. Titel “Oman, les Roses du Désert”; Erstausstrahlung: 22.09.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=LwijL77IF3c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/224-oman-die-rosen-der-wueste-339708\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642248\">thetvdb.com</a></p>\n","228":"<h2>Wenzhou, die Schuh-Stadt von China</h2>\n<p>(Staffel 9 Nr. 23, Fortlaufende Nr. 228; frz. Titel “Chaussures Made in Wenzhou”; Erstausstrahlung: 08.12.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BlMBuBYO0IQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/230-wenzhou-die-schuh-stadt-von-china-339717\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642254\">thetvdb.com</a></p>\n","229":"<h2>Alligatorjagd in Florida</h2>\n<p>(Staffel 9 Nr. 24, Fortlaufende Nr. 229; frz. Titel “Alerte aux Alligators”; Erstausstrahlung: 15.12.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Ky2m06TY8NY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/231-alligatorjagd-in-florida-339718\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642255\">thetvdb.com</a></p>\n","230":"<h2>Russlands Zirkusschule auf Tour</h2>\n<p>(Staffel 9 Nr. 25, Fortlaufende Nr. 230; frz. Titel “Le Cirque de Moscou en Balade”; Erstausstrahlung: 22.12.2007)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5dS2nHbEqsM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/232-russlands-zirkusschule-auf-tour-339719\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642256\">thetvdb.com</a></p>\n","232":"<h2>Hexenwahn in Tansania</h2>\n<p>(Staffel 10 Nr. 1, Fortlaufende Nr. 232; frz. Titel “Chasse aux Sorcières en Tanzanie”; Erstausstrahlung: 21.01.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8K_unhDEPJo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/234-hexenwahn-in-tansania-339722\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642259\">thetvdb.com</a></p>\n","233":"<h2>Die Kämpferinnen von Mexiko</h2>\n<p>(Staffel 10 Nr. 2, Fortlaufende Nr. 233; frz. Titel “Les Catcheuses de Mexico”; Erstausstrahlung: 25.01.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HDZDyBBnqDs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/235-die-kaempferinnen-von-mexiko-339724\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642260\">thetvdb.com</a></p>\n","234":"<h2>Die Minenratten von Tansania</h2>\n<p>(Staffel 10 Nr. 3, Fortlaufende Nr. 234; frz. Titel “Les Rats Démineurs de Tanzanie”; Erstausstrahlung: 25.02.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BYPBaBKHjpM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/236-die-minenratten-von-tansania-339727\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642261\">thetvdb.com</a></p>\n","235":"<h2>Philippinen: Rendezvous mit einem Adler</h2>\n<p>(Staffel 10 Nr. 4, Fortlaufende Nr. 235; frz. Titel “Philippines, Pour l’Amour d’un Aigle”; Erstausstrahlung: 28.02.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Qr9EvRRTYLo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/237-philippinen-rendezvous-mit-einem-adler-339725\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3781424\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642262\">thetvdb.com</a></p>\n","236":"<h2>Die Köchin von Bahia</h2>\n<p>(Staffel 10 Nr. 5, Fortlaufende Nr. 236; frz. Titel “Les Petits Plats de Bahia”; Erstausstrahlung: 25.03.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=U0f-lOEyArs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/238-die-koechin-von-bahia-339728\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642263\">thetvdb.com</a></p>\n","237":"<h2>Der Kräutergarten von Java</h2>\n<p>(Staffel 10 Nr. 6, Fortlaufende Nr. 237; frz. Titel “Le Jardin de Java”; Erstausstrahlung: 27.03.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=n_GzJ5oxdSQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/239-der-kraeutergarten-von-java-339730\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642264\">thetvdb.com</a></p>\n","238":"<h2>An den Ufern der Loire</h2>\n<p>(Staffel 10 Nr. 7, Fortlaufende Nr. 238; frz. Titel “Mon Bout de Loire”; Erstausstrahlung: 21.04.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=u-rV3o70aFs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/240-an-den-ufern-der-loire-339684\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642265\">thetvdb.com</a></p>\n","239":"<h2>Rom - Das Leben der Komparsen</h2>\n<p>(Staffel 10 Nr. 8, Fortlaufende Nr. 239; frz. Titel “Rome, les Petits Rôles de Cinecitta”; Erstausstrahlung: 22.04.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-M2Nf4GPbHg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/241-rom-das-leben-der-komparsen-339691\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642266\">thetvdb.com</a></p>\n","240":"<h2>Kanadas Buschpiloten im Einsatz</h2>\n<p>(Staffel 10 Nr. 9, Fortlaufende Nr. 240; frz. Titel “Pilotes du Nunavik”; Erstausstrahlung: 26.05.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dr7OQ8XcdXA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/242-kanadas-buschpiloten-im-einsatz-339695\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642267\">thetvdb.com</a></p>\n","241":"<h2>Mauretanien: Aufstand der Fischerfrauen</h2>\n<p>(Staffel 10 Nr. 10, Fortlaufende Nr. 241; frz. Titel “Pêcheurs de Mauritanie”; Erstausstrahlung: 26.07.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=eRzhzWVRgns\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/243-mauretanien-aufstand-der-fischerfrauen-339731\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642268\">thetvdb.com</a></p>\n","242":"<h2>Vom Klassenzimmer in die Kalahari</h2>\n<p>(Staffel 10 Nr. 11, Fortlaufende Nr. 242; frz. Titel “Namibie, Sur les Traces de Darwin”; Erstausstrahlung: 31.07.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=AB2q4v0rlYo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/244-vom-klassenzimmer-in-die-kalahari-339699\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642269\">thetvdb.com</a></p>\n","243":"<h2>Nicaragua: Fluch der Langustentaucher</h2>\n<p>(Staffel 10 Nr. 12, Fortlaufende Nr. 243; frz. Titel “Nicaragua, la Malédiction des Pêcheurs de Langoustes”; Erstausstrahlung: 28.08.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bO6BiCVyGug\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/245-nicaragua-fluch-der-langustentaucher-339702\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1279332\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642270\">thetvdb.com</a></p>\n","244":"<h2>Uganda: Der Weg zum Fahrradtaxi</h2>\n<p>(Staffel 10 Nr. 13, Fortlaufende Nr. 244; frz. Titel “La Brousse en Vélo-Taxi”; Erstausstrahlung: 04.09.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Z-9fqoYchv4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/246-uganda-der-weg-zum-fahrradtaxi-339709\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642271\">thetvdb.com</a></p>\n","245":"<h2>New York - Die kleinste Oper der Welt</h2>\n<p>(Staffel 10 Nr. 14, Fortlaufende Nr. 245; frz. Titel “New York, le Plus Petit Opéra du Monde”; Erstausstrahlung: 18.09.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=I-VACV5HkOs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/247-new-york-die-kleinste-oper-der-welt-339711\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642272\">thetvdb.com</a></p>\n","246":"<h2>Indien: Das Geschäft mit dem Tempelhaar</h2>\n<p>(Staffel 10 Nr. 15, Fortlaufende Nr. 246; frz. Titel “Inde, les Cheveux du Temple”; Erstausstrahlung: 02.10.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Ka5if339los\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/248-indien-das-geschaeft-mit-dem-tempelhaar-339712\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27406063\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642273\">thetvdb.com</a></p>\n","247":"<h2>Kyushu - Wo Japans grüner Tee wächst</h2>\n<p>(Staffel 10 Nr. 16, Fortlaufende Nr. 247; frz. Titel “Japon, la Voie du Thé”; Erstausstrahlung: 16.10.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=EoXyDIckuRI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/249-kyuchu-wo-japans-gruener-tee-waechst-339721\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1301207\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642274\">thetvdb.com</a></p>\n","248":"<h2>Arganöl - Marokkos weißes Gold</h2>\n<p>(Staffel 10 Nr. 17, Fortlaufende Nr. 248; frz. Titel “L’Huile d’Argan — L’Or Blanc du Maroc”; Erstausstrahlung: 30.10.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hebFHCqfu0c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/250-arganoel-marokkos-weisses-gold-339723\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642275\">thetvdb.com</a></p>\n","249":"<h2>Das Geheimnis der Schweizer Uhren</h2>\n<p>(Staffel 10 Nr. 18, Fortlaufende Nr. 249; frz. Titel “Le Secret des Montres Suisses”; Erstausstrahlung: 06.11.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WhhdUVCFga0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/251-das-geheimnis-der-schweizer-uhren-339729\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1301206\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642276\">thetvdb.com</a></p>\n"})
\ No newline at end of file
@@ -0,0 +1 @@
+popupChunkLoaded(5,{"252":"<h2>Der Weinpriester von Bali</h2>\n<p>(Staffel 10 Nr. 21, Fortlaufende Nr. 252; frz. Titel “Bacchus à Bali”; Erstausstrahlung: 04.12.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-D0iE7FsRGQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/254-der-weinpriester-von-bali-339733\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642279\">thetvdb.com</a></p>\n","250":"<h2>Johana - Make-up und Motorenöl</h2>\n<p>(Staffel 10 Nr. 19, Fortlaufende Nr. 250; frz. Titel “Jamais Sans Ma Jeep”; Erstausstrahlung: 13.11.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=t3FempEGGaw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/252-johana-make-up-und-motorenoel-339726\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642277\">thetvdb.com</a></p>\n","251":"<h2>Rio de la Plata - SOS am Silberfluss</h2>\n<p>(Staffel 10 Nr. 20, Fortlaufende Nr. 251; frz. Titel “Le Dernier Capitaine du Rio de la Plata”; Erstausstrahlung: 27.11.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=IkMvsCA4uo0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/253-rio-de-la-plata-sos-am-silberfluss-339732\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642278\">thetvdb.com</a></p>\n","253":"<h2>Taipeh 101 - Der Himmel über Taiwan</h2>\n<p>(Staffel 10 Nr. 22, Fortlaufende Nr. 253; frz. Titel “Taipei 101, Sous le Ciel de Taiwan”; Erstausstrahlung: 11.12.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=SJKNUloS0O4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/255-taipeh-101-der-himmel-ueber-taiwan-339734\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642280\">thetvdb.com</a></p>\n","254":"<h2>Die einsamen Mönche von Oelenberg</h2>\n<p>(Staffel 10 Nr. 23, Fortlaufende Nr. 254; frz. Titel “Les Moines Blancs de l’Oelenberg”; Erstausstrahlung: 18.12.2008)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=QR5RWf0_ksc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/256-die-einsamen-moenche-von-oelenberg-339735\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642281\">thetvdb.com</a></p>\n","255":"<h2>Arktis - Die Route der Atomeisbrecher</h2>\n<p>(Staffel 11 Nr. 1, Fortlaufende Nr. 255; frz. Titel “Brise-Glace de l’Arctique”; Erstausstrahlung: 18.01.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4VEpfXzy214\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/257-arktis-die-route-der-atomeisbrecher-339736\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1350547\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642283\">thetvdb.com</a></p>\n","256":"<h2>Die besten Hütehunde von Wales</h2>\n<p>(Staffel 11 Nr. 2, Fortlaufende Nr. 256; frz. Titel “Chiens, Graines de Champion”; Erstausstrahlung: 24.01.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=B0wdXJ_U7TY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/258-die-besten-huetehunde-von-wales-339750\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27481079\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642493\">thetvdb.com</a></p>\n","257":"<h2>Idjwi - Afrikas vergessene Insel</h2>\n<p>(Staffel 11 Nr. 3, Fortlaufende Nr. 257; frz. Titel “Idjwi - l’Île Oubliée”; Erstausstrahlung: 31.01.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=y_zW09TMKaQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/259-idjwi-afrikas-vergessene-insel-339737\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1350549\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642284\">thetvdb.com</a></p>\n","258":"<h2>Die Bambusbahn von Kambodscha</h2>\n<p>(Staffel 11 Nr. 4, Fortlaufende Nr. 258; frz. Titel “Cambodge — le Petit Train de Bambous”; Erstausstrahlung: 07.02.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=j3ZqYbPVhq4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/260-die-bambusbahn-von-kambodscha-339738\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642285\">thetvdb.com</a></p>\n","259":"<h2>Nepal: Die Krieger vom Dach der Welt</h2>\n<p>(Staffel 11 Nr. 5, Fortlaufende Nr. 259; frz. Titel “Népal, les Soldats du Toit du Monde”; Erstausstrahlung: 21.02.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=m-7u2kAG2DQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/261-nepal-die-krieger-vom-dach-der-welt-339739\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1348519\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642286\">thetvdb.com</a></p>\n","260":"<h2>Das Whisky-Geheimnis von Islay</h2>\n<p>(Staffel 11 Nr. 6, Fortlaufende Nr. 260; frz. Titel “Islay — Le Secret du Whisky”; Erstausstrahlung: 21.03.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4z_vcFuiwds\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/262-das-whisky-geheimnis-von-islay-339740\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2107879\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642287\">thetvdb.com</a></p>\n","261":"<h2>Biberkrieg in Bayern</h2>\n<p>(Staffel 11 Nr. 7, Fortlaufende Nr. 261; frz. Titel “Bavière — La Guerre aux Castors”; Erstausstrahlung: 18.04.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=L1QY4QuRJs4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/263-biberkrieg-in-bayern-339741\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642288\">thetvdb.com</a></p>\n","262":"<h2>Die Feuerflieger von Valencia</h2>\n<p>(Staffel 11 Nr. 8, Fortlaufende Nr. 262; frz. Titel “Espagne, les Pompiers du Ciel”; Erstausstrahlung: 18.05.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hc_-HyJy6u0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/265-die-feuerflieger-von-valencia-339743\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3825396\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642290\">thetvdb.com</a></p>\n","263":"<h2>Kaviar - Der Schatz aus dem Iran!</h2>\n<p>(Staffel 11 Nr. 9, Fortlaufende Nr. 263; frz. Titel “Le Caviar, Ce Trésor Venu d’Iran”; Erstausstrahlung: 02.05.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=i8lc_XQujbM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/264-kaviar-der-schatz-aus-dem-iran-339742\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642289\">thetvdb.com</a></p>\n","264":"<h2>Georgien: Die Wiege des Weins</h2>\n<p>(Staffel 11 Nr. 10, Fortlaufende Nr. 264; frz. Titel “Géorgie, Pour l’Amour du Vin”; Erstausstrahlung: 24.05.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=iSex9SfaNDg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/266-georgien-die-wiege-des-weins-339744\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642292\">thetvdb.com</a></p>\n","267":"<h2>Sokotra, Schatzinsel in Gefahr</h2>\n<p>(Staffel 11 Nr. 13, Fortlaufende Nr. 267; frz. Titel “Socotra - Paradis Menacé”; Erstausstrahlung: 25.07.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=G-TbiXRVLTM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/269-sokotra-schatzinsel-in-gefahr-339747\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1458179\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642296\">thetvdb.com</a></p>\n","268":"<h2>Jemens verschleierte Zukunft</h2>\n<p>(Staffel 11 Nr. 14, Fortlaufende Nr. 268; frz. Titel “L’Avenir Voilé du Yémen”; Erstausstrahlung: 08.08.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gCIzyjixKpI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/270-jemens-verschleierte-zukunft-339748\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642298\">thetvdb.com</a></p>\n","269":"<h2>Neuseelands Lauf der Extreme</h2>\n<p>(Staffel 11 Nr. 15, Fortlaufende Nr. 269; frz. Titel “Nouvelle-Zélande — Marathon Extrême”; Erstausstrahlung: 22.08.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6TSXVJB4nmQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/271-neuseelands-lauf-der-extreme-339749\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642492\">thetvdb.com</a></p>\n","270":"<h2>Die Narzisseninsel vor Cornwall</h2>\n<p>(Staffel 11 Nr. 16, Fortlaufende Nr. 270; frz. Titel “Scilly, Îles aux Narcisses”; Erstausstrahlung: 12.09.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=2k8K6kPY24U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/272-die-narzisseninsel-vor-cornwall-339751\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642494\">thetvdb.com</a></p>\n","271":"<h2>Die Todesküste von Galicien</h2>\n<p>(Staffel 11 Nr. 17, Fortlaufende Nr. 271; frz. Titel “Galice, Pêcheurs en Danger”; Erstausstrahlung: 13.09.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MMsnMfaXpUA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/273-die-todeskueste-von-galicien-339752\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642495\">thetvdb.com</a></p>\n","272":"<h2>Das Salz der Inka</h2>\n<p>(Staffel 11 Nr. 18, Fortlaufende Nr. 272; frz. Titel “Le Sel des Incas”; Erstausstrahlung: 26.09.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RUfLIGurIAE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/274-das-salz-der-inka-339753\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2077916\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642496\">thetvdb.com</a></p>\n","273":"<h2>Die Holzfäller von British Columbia</h2>\n<p>(Staffel 11 Nr. 19, Fortlaufende Nr. 273; frz. Titel “Les Bûcherons du Canada”; Erstausstrahlung: 10.10.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MpF684mvA5A\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/275-die-holzfaeller-von-british-columbia-339754\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1621646\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642497\">thetvdb.com</a></p>\n","274":"<h2>Die neuen Nomaden von Kirgisistan</h2>\n<p>(Staffel 11 Nr. 20, Fortlaufende Nr. 274; frz. Titel “Nomades du Kyrgyzstan”; Erstausstrahlung: 31.10.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=V5qvHh2phPw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/276-die-neuen-nomaden-von-kirgisistan-339755\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642498\">thetvdb.com</a></p>\n","275":"<h2>Die Meerfrauen von Japan</h2>\n<p>(Staffel 11 Nr. 21, Fortlaufende Nr. 275; frz. Titel “Japon, les Reines de la Mer”; Erstausstrahlung: 01.11.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7Xh5pUZt0yM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/277-die-meerfrauen-von-japan-339756\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642499\">thetvdb.com</a></p>\n","276":"<h2>Paraguays neue Häuser</h2>\n<p>(Staffel 11 Nr. 22, Fortlaufende Nr. 276; frz. Titel “Maisons Végétales au Paraguay”; Erstausstrahlung: 14.11.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=quHXX9_bIjQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/278-paraguays-neue-haeuser-339949\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1514454\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642500\">thetvdb.com</a></p>\n","277":"<h2>Ein Baumhaus in Costa Rica</h2>\n<p>(Staffel 11 Nr. 23, Fortlaufende Nr. 277; frz. Titel “Ma Cabane au Costa Rica”; Erstausstrahlung: 28.11.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JL3N7pLoXFM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/279-ein-baumhaus-in-costa-rica-339951\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642501\">thetvdb.com</a></p>\n","278":"<h2>Ruanda: Land der Frauen</h2>\n<p>(Staffel 11 Nr. 24, Fortlaufende Nr. 278; frz. Titel “Le Rwanda aux Femmes”; Erstausstrahlung: 12.12.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cgNXNRjbB8E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/280-ruanda-land-der-frauen-339952\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642502\">thetvdb.com</a></p>\n","279":"<h2>Saint-Pierre und Miquelon: Archipel in der Isolation</h2>\n<p>(Staffel 11 Nr. 25, Fortlaufende Nr. 279; frz. Titel “Saint-Pierre-et-Miquelon — L’Archipel Perdu”; Erstausstrahlung: 19.12.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=z6mots9SAg0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/281-saint-pierre-und-miquelon-archipel-in-der-isolation-339954\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642503\">thetvdb.com</a></p>\n","280":"<h2>St. Helena: Vergessen im Atlantik</h2>\n<p>(Staffel 11 Nr. 26, Fortlaufende Nr. 280; frz. Titel “L’Exil de Sainte-Hélène”; Erstausstrahlung: 26.12.2009)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=srGhZLAIPCk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/282-saint-helena-vergessen-im-atlantik-339953\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642504\">thetvdb.com</a></p>\n","281":"<h2>Vietnams vermintes Paradies</h2>\n<p>(Staffel 12 Nr. 1, Fortlaufende Nr. 281; frz. Titel “Vietnam, Paradis Miné”; Erstausstrahlung: 09.01.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=56EQyMDFfzM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/283-vietnams-vermintes-paradies-339955\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642507\">thetvdb.com</a></p>\n","282":"<h2>Spitzbergen, eisige Insel</h2>\n<p>(Staffel 12 Nr. 2, Fortlaufende Nr. 282; frz. Titel “Expédition au Spitzberg”; Erstausstrahlung: 30.01.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5WVk0CvsUA0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/284-spitzbergen-eisige-insel-339956\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2128705\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642508\">thetvdb.com</a></p>\n","283":"<h2>Hawaii: Beachboys auf Patrouille</h2>\n<p>(Staffel 12 Nr. 3, Fortlaufende Nr. 283; frz. Titel “Les Beachboys de Hawaii”; Erstausstrahlung: 06.02.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7NHpb3KDYH0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/285-hawaii-beachboys-auf-patrouille-339957\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642509\">thetvdb.com</a></p>\n","284":"<h2>SOS in den Rocky Mountains</h2>\n<p>(Staffel 12 Nr. 4, Fortlaufende Nr. 284; frz. Titel “Sauvetage Dans les Rocheuses”; Erstausstrahlung: 20.02.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=S3N8fPmBOD0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/286-sos-in-den-rocky-mountains-339958\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt10007904\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642510\">thetvdb.com</a></p>\n","285":"<h2>Die letzten Kamelkarawanen der Sahara</h2>\n<p>(Staffel 12 Nr. 5, Fortlaufende Nr. 285; frz. Titel “Les Derniers Caravaniers du Sahara”; Erstausstrahlung: 06.03.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kKr2LCU__Pg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/287-die-letzten-kamelkarawanen-der-sahara-339960\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642511\">thetvdb.com</a></p>\n","286":"<h2>Mit der Lok durch Angola</h2>\n<p>(Staffel 12 Nr. 6, Fortlaufende Nr. 286; frz. Titel “Angola — Le Bonheur Est Dans le Train”; Erstausstrahlung: 27.03.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jbkp_3nRDjQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/288-mit-der-lok-durch-angola-339961\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642512\">thetvdb.com</a></p>\n","287":"<h2>Wilde Pferde im Donaudelta</h2>\n<p>(Staffel 12 Nr. 7, Fortlaufende Nr. 287; frz. Titel “Danuble Bleu et Chevaux Sauvages”; Erstausstrahlung: 10.04.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=nfDk1G85yUA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/289-wilde-pferde-im-donaudelta-339757\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642513\">thetvdb.com</a></p>\n","288":"<h2>Cranberrysaison auf Cap Cod</h2>\n<p>(Staffel 12 Nr. 8, Fortlaufende Nr. 288; frz. Titel “Cap Cod — Le Temps des Cranberries”; Erstausstrahlung: 24.04.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=YZ7wxrTF3uI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/290-cranberrysaison-auf-cap-cod-339950\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642514\">thetvdb.com</a></p>\n","289":"<h2>Indiens Dschungelbuchklinik</h2>\n<p>(Staffel 12 Nr. 9, Fortlaufende Nr. 289; frz. Titel “L’Inde, la Clinique des Tigres”; Erstausstrahlung: 29.05.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Tc7yml23q14\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/291-indiens-dschungelbuchklinik-506720\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642515\">thetvdb.com</a></p>\n","290":"<h2>Unterwegs mit der Irish Coast Guard</h2>\n<p>(Staffel 12 Nr. 10, Fortlaufende Nr. 290; frz. Titel “Irlande, les Sauveteurs de l’Extrême”; Erstausstrahlung: 12.06.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=vdqig1_VkIg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/292-unterwegs-mit-der-irish-coast-guard-339963\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1692109\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642518\">thetvdb.com</a></p>\n","291":"<h2>Jillaroos - Cowgirls im australischen Outback</h2>\n<p>(Staffel 12 Nr. 11, Fortlaufende Nr. 291; frz. Titel “Australie, les Cow-Girls Tiennent les Rênes”; Erstausstrahlung: 04.09.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dzNcn7hvzAc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/293-jillaroos-cowgirls-im-australischen-outback-339965\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16970474\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642517\">thetvdb.com</a></p>\n","292":"<h2>Das Volk der Bishnoi - Tierliebe bis in den Tod</h2>\n<p>(Staffel 12 Nr. 12, Fortlaufende Nr. 292; frz. Titel “Bishnoi, les Femmes Qui Allaitent les Gazelles”; Erstausstrahlung: 11.09.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tcNmq-quVPA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/294-das-volk-der-bishnoi-tierliebe-bis-in-den-tod-339967\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642527\">thetvdb.com</a></p>\n","293":"<h2>Falklandinseln - Pinguine auf dem Vormarsch</h2>\n<p>(Staffel 12 Nr. 13, Fortlaufende Nr. 293; frz. Titel “Les Malouines, Paradis des Manchots”; Erstausstrahlung: 18.09.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=A_eZDMVKVco\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/295-falklandinseln-pinguine-auf-dem-vormarsch-339959\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642516\">thetvdb.com</a></p>\n","295":"<h2>Baikalsee, ein Wintermärchen</h2>\n<p>(Staffel 12 Nr. 15, Fortlaufende Nr. 295; frz. Titel “Les Plongeurs Fous du Lac Baïkal”; Erstausstrahlung: 16.10.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Q32TkfdHpnI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/297-baikalsee-ein-wintermaerchen-339966\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642520\">thetvdb.com</a></p>\n","296":"<h2>Legende auf Schienen - Skandinaviens Kirunabahn</h2>\n<p>(Staffel 12 Nr. 16, Fortlaufende Nr. 296; frz. Titel “Kiruna, le Train du Grand Nord”; Erstausstrahlung: 06.11.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=mGdgh-eQVM4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/298-legende-auf-schienen-skandinaviens-kirunabahn-339964\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642522\">thetvdb.com</a></p>\n","297":"<h2>Sikkim: Das alte Wissen der Schamanen</h2>\n<p>(Staffel 12 Nr. 17, Fortlaufende Nr. 297; frz. Titel “Sikkim, le Chercheur et le Chaman”; Erstausstrahlung: 20.11.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=DW5ajV0yaFw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/299-sikkim-das-alte-wissen-der-schamanen-339968\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2137499\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4777543\">thetvdb.com</a></p>\n","298":"<h2>Die verrückten Karren des Mister Winfield</h2>\n<p>(Staffel 12 Nr. 18, Fortlaufende Nr. 298; frz. Titel “Gene Winfield, le Mécano de Folles Autos”; Erstausstrahlung: 11.12.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Vg9aMMkF7PQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/300-die-verrueckten-karren-des-mister-winfield-339970\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642523\">thetvdb.com</a></p>\n","299":"<h2>Anatolien, das Land wo die Aprikosen blühen</h2>\n<p>(Staffel 12 Nr. 19, Fortlaufende Nr. 299; frz. Titel “Les Abricots d’Anatolie”; Erstausstrahlung: 18.12.2010)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6UNZBLK5xHc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/301-anatolien-das-land-wo-die-aprikosen-bluehen-506722\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642524\">thetvdb.com</a></p>\n"})
\ No newline at end of file
@@ -0,0 +1 @@
+popupChunkLoaded(6,{"317":"<h2>In den Smaragdbergen von Bahia</h2>\n<p>(Staffel 13 Nr. 17, Fortlaufende Nr. 317; frz. Titel “Bahia, Chasseurs d’Émeraudes”; Erstausstrahlung: 16.07.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hjMe94sQCRk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/319-in-den-smaragdbergen-von-bahia-339986\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1945241\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642547\">thetvdb.com</a></p>\n","302":"<h2>Der Affenflüsterer</h2>\n<p>(Staffel 13 Nr. 2, Fortlaufende Nr. 302; frz. Titel “L’Homme Qui Murmurait à l’Oreille des Chimpanzés”; Erstausstrahlung: 08.01.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tsXjqdQkSio\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/304-der-affenfluesterer-339972\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2160477\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642530\">thetvdb.com</a></p>\n","303":"<h2>Sardinien: Stolz und Ehre hoch zu Ross</h2>\n<p>(Staffel 13 Nr. 3, Fortlaufende Nr. 303; frz. Titel “La Sardaigne des Hommes et des Chevaux”; Erstausstrahlung: 15.01.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JlaZDPOEupE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/305-sardinien-stolz-und-ehre-hoch-zu-ross-339973\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642531\">thetvdb.com</a></p>\n","304":"<h2>Die Feuerspringer von Sibirien</h2>\n<p>(Staffel 13 Nr. 4, Fortlaufende Nr. 304; frz. Titel “Sibérie, les Soldats du Feu”; Erstausstrahlung: 22.01.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fh2Pl9u1XOw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/306-die-feuerspringer-von-sibirien-339974\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642532\">thetvdb.com</a></p>\n","305":"<h2>Island: Leben auf dem Pulverfass</h2>\n<p>(Staffel 13 Nr. 5, Fortlaufende Nr. 305; frz. Titel “L’Islande au Plus Près du Volcan”; Erstausstrahlung: 29.01.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=n97-kFfr0xg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/307-island-leben-auf-dem-pulverfass-339975\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642533\">thetvdb.com</a></p>\n","306":"<h2>Polarschule der Nomadenkinder</h2>\n<p>(Staffel 13 Nr. 6, Fortlaufende Nr. 306; frz. Titel “Petits Nomades, Grand Froid”; Erstausstrahlung: 05.02.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pAB_SIM2Big\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/308-polarschule-der-nomadenkinder-339976\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642534\">thetvdb.com</a></p>\n","307":"<h2>Das Perlenimperium von Palawan</h2>\n<p>(Staffel 13 Nr. 7, Fortlaufende Nr. 307; frz. Titel “Palawan, l’Empire des Perles”; Erstausstrahlung: 12.02.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7KKgclOqxAU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/309-das-perlenimperium-von-palawan-339977\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1839712\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642535\">thetvdb.com</a></p>\n","322":"<h2>Palawan - das Dorf der Gefangenen</h2>\n<p>(Staffel 13 Nr. 22, Fortlaufende Nr. 322; frz. Titel “Palawan: L’Enfer des Prisonniers”; Erstausstrahlung: 22.10.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dH7ls3Lqtzw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/324-palawan-das-dorf-der-gefangenen-586293\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2168596\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642553\">thetvdb.com</a></p>\n","308":"<h2>Marokko - die andere Seite des Paradieses</h2>\n<p>(Staffel 13 Nr. 8, Fortlaufende Nr. 308; frz. Titel “Maroc, la Face Cachée du Paradis”; Erstausstrahlung: 19.02.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ATAr5oY041c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/310-marokko-die-andere-seite-des-paradieses-339969\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642536\">thetvdb.com</a></p>\n","309":"<h2>Eine Fähre nach Afrika</h2>\n<p>(Staffel 13 Nr. 9, Fortlaufende Nr. 309; frz. Titel “Gibraltar, un Bateau Pour l’Afrique”; Erstausstrahlung: 26.02.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GwUd8KDdUN4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/311-eine-faehre-nach-afrika-339978\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642538\">thetvdb.com</a></p>\n","310":"<h2>Großglockner, König der Hochalpen</h2>\n<p>(Staffel 13 Nr. 10, Fortlaufende Nr. 310; frz. Titel “Vivre au Pied d’un Géant”; Erstausstrahlung: 09.04.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7SZoha01QG0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/312-grossglockner-koenig-der-hochalpen-339979\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt5037962\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642540\">thetvdb.com</a></p>\n","311":"<h2>Champagner für alle!</h2>\n<p>(Staffel 13 Nr. 11, Fortlaufende Nr. 311; frz. Titel “Champagne, les Bulles du Désir”; Erstausstrahlung: 23.04.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cV-MNXIukmA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/313-champagner-fuer-alle-339980\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2361605\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642541\">thetvdb.com</a></p>\n","312":"<h2>Armenien, die Früchte aus dem Paradies</h2>\n<p>(Staffel 13 Nr. 12, Fortlaufende Nr. 312; frz. Titel “Arménie, les Fruits du Paradis”; Erstausstrahlung: 07.05.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=25Vub7M_rLc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/314-armenien-die-fruechte-aus-dem-paradies-339981\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642542\">thetvdb.com</a></p>\n","313":"<h2>Stilikone Panamahut</h2>\n<p>(Staffel 13 Nr. 13, Fortlaufende Nr. 313; frz. Titel “L’Authentique Panama”; Erstausstrahlung: 21.05.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FLkf0zJdhFY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/315-stilikone-panamahut-339982\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642543\">thetvdb.com</a></p>\n","314":"<h2>Die Halligen mitten im Winter, mitten im Wasser</h2>\n<p>(Staffel 13 Nr. 14, Fortlaufende Nr. 314; frz. Titel “Entre Tempête et Grande Marée: les Halligen”; Erstausstrahlung: 04.06.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qZMtcyipMQc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/316-die-halligen-mitten-im-winter-mitten-im-wasser-506723\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642544\">thetvdb.com</a></p>\n","315":"<h2>Jenny und ihre Flughunde</h2>\n<p>(Staffel 13 Nr. 15, Fortlaufende Nr. 315; frz. Titel “Jenny, Docteur Chauve-Souris”; Erstausstrahlung: 18.06.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=P81A8ljYhNM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/317-jenny-und-ihre-flughunde-339984\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642545\">thetvdb.com</a></p>\n","316":"<h2>Jordanien, Dynastie der Pferde</h2>\n<p>(Staffel 13 Nr. 16, Fortlaufende Nr. 316; frz. Titel “Les Purs-Sangs de Jordanie”; Erstausstrahlung: 02.07.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CTbgWjUewgA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/318-jordanien-dynastie-der-pferde-339985\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1945242\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642546\">thetvdb.com</a></p>\n","318":"<h2>Rum auf Guadeloupe</h2>\n<p>(Staffel 13 Nr. 18, Fortlaufende Nr. 318; frz. Titel “Guadeloupe, le Meilleur Rhum du Monde”; Erstausstrahlung: 30.07.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9N1Qll5w0ng\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/320-rum-auf-guadeloupe-339988\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14617222\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642549\">thetvdb.com</a></p>\n","319":"<h2>Sumatras letzte Orang-Utans</h2>\n<p>(Staffel 13 Nr. 19, Fortlaufende Nr. 319; frz. Titel “Les derniers orangs-outangs de Sumatra”; Erstausstrahlung: 03.09.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=1l8k6nfu5NQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/321-sumatras-letzte-orang-utans-339989\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642550\">thetvdb.com</a></p>\n","320":"<h2>Kalmückien - Die Rückkehr der Mönche</h2>\n<p>(Staffel 13 Nr. 20, Fortlaufende Nr. 320; frz. Titel “Les Moines Bouddhistes de Kalmoukie”; Erstausstrahlung: 24.09.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8f4nujAr3Uc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/322-kalmueckien-die-rueckkehr-der-moenche-339990\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1987522\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642551\">thetvdb.com</a></p>\n","321":"<h2>Auf der Spur des spanischen Luchses</h2>\n<p>(Staffel 13 Nr. 21, Fortlaufende Nr. 321; frz. Titel “Sur la Trace du Lynx Ibérique”; Erstausstrahlung: 15.10.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ou7f1H60z7Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/323-auf-der-spur-des-spanischen-luchses-339991\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642552\">thetvdb.com</a></p>\n","323":"<h2>Der Andenkondor - König der Lüfte</h2>\n<p>(Staffel 13 Nr. 23, Fortlaufende Nr. 323; frz. Titel “Sur les Ailes du Condor des Andes”; Erstausstrahlung: 29.10.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=c0y6PT21TCs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/325-der-andenkondor-koenig-der-luefte-506721\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642554\">thetvdb.com</a></p>\n","324":"<h2>Die Rettungshunde vom Gardasee</h2>\n<p>(Staffel 13 Nr. 24, Fortlaufende Nr. 324; frz. Titel “Les Chiens Sauveteurs du Lac de Garde”; Erstausstrahlung: 29.10.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Xqj1OOEq5M4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/326-die-rettungshunde-vom-gardasee-339992\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4776899\">thetvdb.com</a></p>\n","325":"<h2>Aserbaidschans fahrende Hochzeitmusikanten</h2>\n<p>(Staffel 13 Nr. 25, Fortlaufende Nr. 325; frz. Titel “Le Troubadour d’Azerbaïdjan”; Erstausstrahlung: 12.11.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ikwsm25rULY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/327-aserbaidschans-fahrende-hochzeitmusikanten-339993\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642555\">thetvdb.com</a></p>\n","326":"<h2>Florenz - Fußball bis aufs Blut</h2>\n<p>(Staffel 13 Nr. 26, Fortlaufende Nr. 326; frz. Titel “Florence, le Foot Dans le Sang”; Erstausstrahlung: 19.11.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dpdeqdga-RM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/328-florenz-fussball-bis-aufs-blut-339994\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642556\">thetvdb.com</a></p>\n","327":"<h2>Guano - Schatzinseln und Vogeldreck</h2>\n<p>(Staffel 13 Nr. 27, Fortlaufende Nr. 327; frz. Titel “Guano, sale besogne au paradis des oiseaux”; Erstausstrahlung: 03.12.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hDbmGter130\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/329-guano-schatzinseln-und-vogeldreck-339995\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642557\">thetvdb.com</a></p>\n","328":"<h2>Lamu, die Insel der Esel</h2>\n<p>(Staffel 13 Nr. 28, Fortlaufende Nr. 328; frz. Titel “Lamu, l’Île aux Ânes”; Erstausstrahlung: 17.12.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Z8Xny07TdXQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/330-lamu-die-insel-der-esel-339996\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642558\">thetvdb.com</a></p>\n","329":"<h2>Sark - die Kanalinsel der Queen</h2>\n<p>(Staffel 13 Nr. 29, Fortlaufende Nr. 329; frz. Titel “Sercq, Ilôt Sauvage de la Manche”; Erstausstrahlung: 24.12.2011)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ybpV9JWD6qs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/331-sark-die-kanalinsel-der-queen-339997\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642559\">thetvdb.com</a></p>\n","330":"<h2>Schottland - Kampf, Clan und Königin</h2>\n<p>(Staffel 14 Nr. 1, Fortlaufende Nr. 330; frz. Titel “L’Écosse des Clans”; Erstausstrahlung: 07.01.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=AO5mzpVh6PI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/332-schottland-kampf-clan-und-koenigin-339998\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642562\">thetvdb.com</a></p>\n","331":"<h2>Die scharfen Klingen der Auvergne</h2>\n<p>(Staffel 14 Nr. 2, Fortlaufende Nr. 331; frz. Titel “L’Auvergne, la Guerre des Couteaux”; Erstausstrahlung: 28.01.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Zo2vsTRz4x0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/333-die-scharfen-klingen-der-auvergne-339987\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642563\">thetvdb.com</a></p>\n","332":"<h2>China: Im Reich der Mosuo-Frauen</h2>\n<p>(Staffel 14 Nr. 3, Fortlaufende Nr. 332; frz. Titel “Mosuo, le Pays où les Femmes Sont Reines”; Erstausstrahlung: 11.02.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GhMq7fkeUKI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/334-china-im-reich-der-mosuo-frauen-339999\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt2338236\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642564\">thetvdb.com</a></p>\n","333":"<h2>Majuli - ein Inselvolk trotzt den Fluten</h2>\n<p>(Staffel 14 Nr. 4, Fortlaufende Nr. 333; frz. Titel “Majuli, Terre des Eaux, Terre des Moines”; Erstausstrahlung: 25.02.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ZKUYH2GJDpM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/335-majuli-ein-inselvolk-trotzt-den-fluten-340000\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642565\">thetvdb.com</a></p>\n","334":"<h2>Lappland: Rushhour im hohen Norden</h2>\n<p>(Staffel 14 Nr. 5, Fortlaufende Nr. 334; frz. Titel “La Laponie, le Grand Embouteillage”; Erstausstrahlung: 10.03.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MT5oNZ0Y6JY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/336-lappland-rushhour-im-hohen-norden-340001\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642566\">thetvdb.com</a></p>\n","335":"<h2>Wildererjagd am Mount Kenya</h2>\n<p>(Staffel 14 Nr. 6, Fortlaufende Nr. 335; frz. Titel “Mont Kenya, la Chasse au Braconnage”; Erstausstrahlung: 24.03.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UAGR4vE_i0U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/337-wildererjagd-am-mount-kenya-340002\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642567\">thetvdb.com</a></p>\n","336":"<h2>Tunesien: Die Suche nach dem Tintenfisch</h2>\n<p>(Staffel 14 Nr. 7, Fortlaufende Nr. 336; frz. Titel “Tunisie, les Secrets des Pêcheurs de Poulpes”; Erstausstrahlung: 05.04.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=K--aZyNB-LQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/338-tunesien-die-suche-nach-dem-tintenfisch-340003\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642568\">thetvdb.com</a></p>\n","337":"<h2>Bahamas - unverfälscht!</h2>\n<p>(Staffel 14 Nr. 8, Fortlaufende Nr. 337; frz. Titel “Les Mamas des Bahamas”; Erstausstrahlung: 12.05.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GGxlN3DjKCI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/339-bahamas-unverfaelscht-506699\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642569\">thetvdb.com</a></p>\n","338":"<h2>Slab City - wildes Leben in der Wüste</h2>\n<p>(Staffel 14 Nr. 9, Fortlaufende Nr. 338; frz. Titel “Les Campeurs Sauvages de Slab City”; Erstausstrahlung: 26.05.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=T0K8Qv0eupI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/340-slab-city-wildes-leben-in-der-wueste-506700\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642570\">thetvdb.com</a></p>\n","339":"<h2>Esmeraldas Edelkakao</h2>\n<p>(Staffel 14 Nr. 10, Fortlaufende Nr. 339; frz. Titel “Équateur, l’Autre Pays du Chocolat”; Erstausstrahlung: 09.06.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=IMVYBpL-z4E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/341-esmeraldas-edelkakao-506701\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642571\">thetvdb.com</a></p>\n","340":"<h2>So schmeckt Australien!</h2>\n<p>(Staffel 14 Nr. 11, Fortlaufende Nr. 340; frz. Titel “Le Cuisinier du Bush Australien”; Erstausstrahlung: 23.06.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=G_gFhibEvNA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/342-so-schmeckt-australien-506702\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642572\">thetvdb.com</a></p>\n","341":"<h2>Jerusalem im Morgengrauen</h2>\n<p>(Staffel 14 Nr. 12, Fortlaufende Nr. 341; frz. Titel “Jérusalem à l’Aube”; Erstausstrahlung: 28.07.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=XeHZ3UW7woE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/343-jerusalem-im-morgengrauen-506703\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt3078344\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642573\">thetvdb.com</a></p>\n","342":"<h2>Die letzten Cowboys der Toskana</h2>\n<p>(Staffel 14 Nr. 13, Fortlaufende Nr. 342; frz. Titel “Les Derniers Cowboys de Toscane”; Erstausstrahlung: 01.09.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=We74sUq6TL8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/344-die-letzten-cowboys-der-toskana-506718\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642574\">thetvdb.com</a></p>\n","343":"<h2>Modelsuche in Sibirien</h2>\n<p>(Staffel 14 Nr. 14, Fortlaufende Nr. 343; frz. Titel “Belles de Sibérie”; Erstausstrahlung: 15.09.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ketqT7focbQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/345-modelsuche-in-sibirien-506705\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642577\">thetvdb.com</a></p>\n","344":"<h2>Tanganjikasee: Vom Kanonenboot zum Passagierschiff</h2>\n<p>(Staffel 14 Nr. 15, Fortlaufende Nr. 344; frz. Titel “Le Navire Centenaire du Tanganyika”; Erstausstrahlung: 22.09.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=d9sb8TpPhtE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/346-tanganjikasee-vom-kanonenboot-zum-passagierschiff-506706\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642580\">thetvdb.com</a></p>\n","345":"<h2>Auf dem Floß durch die Schluchten der Tara</h2>\n<p>(Staffel 14 Nr. 16, Fortlaufende Nr. 345; frz. Titel “Le Dernier Radeau du Monténégro”; Erstausstrahlung: 20.10.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=H9eSAANUh54\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/347-auf-dem-floss-durch-die-schluchten-der-tara-506707\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642582\">thetvdb.com</a></p>\n","346":"<h2>Indien: Das größte Schulessen der Welt</h2>\n<p>(Staffel 14 Nr. 17, Fortlaufende Nr. 346; frz. Titel “Cantine à l’Indienne”; Erstausstrahlung: 27.10.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=K7E2T9Imdok\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/348-indien-das-groesste-schulessen-der-welt-506708\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt25786532\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642583\">thetvdb.com</a></p>\n","348":"<h2>Bolivien: Lebensader Todesstraße</h2>\n<p>(Staffel 14 Nr. 19, Fortlaufende Nr. 348; frz. Titel “Bolivie, la Route de la Mort”; Erstausstrahlung: 10.11.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JhplvCSCDkQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/350-bolivien-lebensader-todesstrasse-506710\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642585\">thetvdb.com</a></p>\n","349":"<h2>Die Krabbenfischer von Feuerland</h2>\n<p>(Staffel 14 Nr. 20, Fortlaufende Nr. 349; frz. Titel “Les Pêcheurs de Crabes de la Terre de Feu”; Erstausstrahlung: 17.11.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Y8D9o5YD2dM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/351-die-krabbenfischer-von-feuerland-506711\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642587\">thetvdb.com</a></p>\n"})
\ No newline at end of file
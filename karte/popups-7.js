@@ -0,0 +1 @@
+popupChunkLoaded(7,{"357":"<h2>Bangladesch - Schiff der Hoffnung</h2>\n<p>(Staffel 15 Nr. 7, Fortlaufende Nr. 357; frz. Titel “Bangladesh, l’Hôpital Flottant”; Erstausstrahlung: 23.03.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=4H01x3_OEaY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/359-bangladesch-schiff-der-hoffnung-506731\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642607\">thetvdb.com</a></p>\n","380":"<h2>Kambodscha, Ratte süß-sauer</h2>\n<p>(Staffel 16 Nr. 3, Fortlaufende Nr. 380; frz. Titel “Cambodge, les Chasseurs de Rats”; Erstausstrahlung: 08.02.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Fadu9DpauSQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/382-kambodscha-ratte-suess-sauer-579703\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812752\">thetvdb.com</a></p>\n","364":"<h2>Die Polarbahn</h2>\n<p>(Staffel 15 Nr. 14, Fortlaufende Nr. 364; frz. Titel “Le Grand Nord Sur les Rails”; Erstausstrahlung: 14.09.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=VJ6JS8MWo9Y\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/366-die-polarbahn-532546\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16606786\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642620\">thetvdb.com</a></p>\n","350":"<h2>Die Exzentriker der Düfte</h2>\n<p>(Staffel 14 Nr. 21, Fortlaufende Nr. 350; frz. Titel “Secrets de Parfumeurs”; Erstausstrahlung: 22.12.2012)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qP99-RnEm7U\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/352-die-exzentriker-der-duefte-506712\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19718498\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642589\">thetvdb.com</a></p>\n","351":"<h2>Arktis - Ein Junge wird Jäger</h2>\n<p>(Staffel 15 Nr. 1, Fortlaufende Nr. 351; frz. Titel “Le Petit Chasseur de l’Arctique”; Erstausstrahlung: 19.01.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9ff-GcgySN4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/353-arktis-ein-junge-wird-jaeger-506695\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16757896\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642601\">thetvdb.com</a></p>\n","352":"<h2>Shetland, das Ende des Öls</h2>\n<p>(Staffel 15 Nr. 2, Fortlaufende Nr. 352; frz. Titel “Les Îles Shetland, la Force du Vent”; Erstausstrahlung: 02.02.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ReBwYDvW-VM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/354-shetland-das-ende-des-oels-506713\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4791696\">thetvdb.com</a></p>\n","353":"<h2>Mezcal, Hochprozentiges aus Mexiko</h2>\n<p>(Staffel 15 Nr. 3, Fortlaufende Nr. 353; frz. Titel “Le Mezcal, Eau-de-Vie Mexicaine”; Erstausstrahlung: 09.02.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bpjZIo4bmGw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/355-mezcal-hochprozentiges-aus-mexiko-506714\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642603\">thetvdb.com</a></p>\n","354":"<h2>Atacamawüste - Leben ohne Wasser</h2>\n<p>(Staffel 15 Nr. 4, Fortlaufende Nr. 354; frz. Titel “Désert d’Atacama — La Vie Sans Eau”; Erstausstrahlung: 16.02.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=OJJze1tQhz0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/356-atacamawueste-leben-ohne-wasser-506728\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642604\">thetvdb.com</a></p>\n","355":"<h2>Die letzten Köhler von Rumänien</h2>\n<p>(Staffel 15 Nr. 5, Fortlaufende Nr. 355; frz. Titel “Roumanie, les derniers charbonniers”; Erstausstrahlung: 23.02.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NaYD2IlnDXw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/357-die-letzten-koehler-von-rumaenien-506729\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt1007051\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642605\">thetvdb.com</a></p>\n","358":"<h2>Iquitos - Regenwaldmetropole am Amazonas</h2>\n<p>(Staffel 15 Nr. 8, Fortlaufende Nr. 358; frz. Titel “Iquitos, une Ville Entre Deux Fleuves”; Erstausstrahlung: 30.03.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=zRCocBSf_SI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/360-iquitos-regenwaldmetropole-am-amazonas-506694\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642609\">thetvdb.com</a></p>\n","359":"<h2>Die Marmorberge von Italien</h2>\n<p>(Staffel 15 Nr. 9, Fortlaufende Nr. 359; frz. Titel “Toscane, les Carrières de Marbre”; Erstausstrahlung: 13.04.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bND3Vz0DIb8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/361-die-marmorberge-von-italien-506696\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642610\">thetvdb.com</a></p>\n","360":"<h2>Bretagne - von Bienen und Leuchttürmen</h2>\n<p>(Staffel 15 Nr. 10, Fortlaufende Nr. 360; frz. Titel “Le Phare Breton et les Abeilles”; Erstausstrahlung: 27.04.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FskHAYwU3FM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/362-bretagne-von-bienen-und-leuchttuermen-506697\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642612\">thetvdb.com</a></p>\n","361":"<h2>Thailands Elefanten, raus aus der Stadt!</h2>\n<p>(Staffel 15 Nr. 11, Fortlaufende Nr. 361; frz. Titel “Thaïlande — Le Dernier Voyage d’un Éléphant”; Erstausstrahlung: 15.06.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=m3qxxeiI04M\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/363-thailands-elefanten-raus-aus-der-stadt-506719\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642615\">thetvdb.com</a></p>\n","362":"<h2>Tonga - Paradies der Südsee?</h2>\n<p>(Staffel 15 Nr. 12, Fortlaufende Nr. 362; frz. Titel “Tonga, la Fin du Paradis?”; Erstausstrahlung: 22.06.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=a6-2aXuDLTw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/364-tonga-paradies-der-suedsee-514391\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642617\">thetvdb.com</a></p>\n","363":"<h2>Radio Patagonia</h2>\n<p>(Staffel 15 Nr. 13, Fortlaufende Nr. 363; frz. Titel “Radio Patagonie”; Erstausstrahlung: 06.07.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xWorOwWPUMg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/365-radio-patagonia-514392\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642619\">thetvdb.com</a></p>\n","365":"<h2>Das Koala-Hospital</h2>\n<p>(Staffel 15 Nr. 15, Fortlaufende Nr. 365; frz. Titel “L’hôpital des koalas”; Erstausstrahlung: 21.09.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=f4ODAYWj-MA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/367-das-koala-hospital-534187\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642622\">thetvdb.com</a></p>\n","366":"<h2>Sulawesi - Die letzten Seenomaden</h2>\n<p>(Staffel 15 Nr. 16, Fortlaufende Nr. 366; frz. Titel “Sulawesi, les Nomades de la Mer”; Erstausstrahlung: 28.09.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5ZSLl8Wj_-E\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/368-sulawesi-die-letzten-seenomaden-534189\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642625\">thetvdb.com</a></p>\n","367":"<h2>Taiwan - Fliegende Fische oder Atommüll?</h2>\n<p>(Staffel 15 Nr. 17, Fortlaufende Nr. 367; frz. Titel “Taiwan, une Poubelle Nucléaire?”; Erstausstrahlung: 07.12.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Uz7hFkRtHb4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/369-taiwan-fliegende-fische-oder-atommuell-538387\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4779225\">thetvdb.com</a></p>\n","368":"<h2>Rattenjagd im Südpolarmeer</h2>\n<p>(Staffel 15 Nr. 18, Fortlaufende Nr. 368; frz. Titel “Atlantique Austral, Mission Dératisation!”; Erstausstrahlung: 12.10.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=oGcMkh67AeE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/370-rattenjagd-im-suedpolarmeer-540267\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4642602\">thetvdb.com</a></p>\n","369":"<h2>Costa Rica - Leben wie die Faultiere</h2>\n<p>(Staffel 15 Nr. 19, Fortlaufende Nr. 369; frz. Titel “Costa Rica, le Sanctuaire des Paresseux”; Erstausstrahlung: 19.10.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NpxUVkA3Dfs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/371-costa-rica-leben-wie-die-faultiere-540268\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt5229780\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4791697\">thetvdb.com</a></p>\n","370":"<h2>Der fröhliche Friedhof von Rumänien</h2>\n<p>(Staffel 15 Nr. 20, Fortlaufende Nr. 370; frz. Titel “Roumanie, les Récits d’un Cimetière”; Erstausstrahlung: 26.10.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=kYW3GLZS5tA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/372-der-froehliche-friedhof-von-rumaenien-542626\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23145542\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812703\">thetvdb.com</a></p>\n","371":"<h2>Mustang - Flucht aus den Bergen</h2>\n<p>(Staffel 15 Nr. 21, Fortlaufende Nr. 371; frz. Titel “Sécheresse au Royaume du Mustang”; Erstausstrahlung: 09.11.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=3ti-NbruVhU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/373-mustang-flucht-aus-den-bergen-543725\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812706\">thetvdb.com</a></p>\n","372":"<h2>Chivas, Kolumbiens bunte Busse</h2>\n<p>(Staffel 15 Nr. 22, Fortlaufende Nr. 372; frz. Titel “La Colombie et ses bus multicolores”; Erstausstrahlung: 23.11.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-Min0yF6ccg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/374-chivas-kolumbiens-bunte-busse-556371\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812708\">thetvdb.com</a></p>\n","373":"<h2>Aubrac - Kühe, Käse, Kerle!</h2>\n<p>(Staffel 15 Nr. 23, Fortlaufende Nr. 373; frz. Titel “Aubrac, des Bergers et des Moines”; Erstausstrahlung: 30.11.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FKXxagKURQM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/375-aubrac-kuehe-kaese-kerle-560136\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812709\">thetvdb.com</a></p>\n","374":"<h2>Die Samurai von Fukushima</h2>\n<p>(Staffel 15 Nr. 24, Fortlaufende Nr. 374; frz. Titel “Les Samouraïs de Fukushima”; Erstausstrahlung: 07.12.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jVgE3nypw-c\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/376-die-samurai-von-fukushima-562240\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812710\">thetvdb.com</a></p>\n","375":"<h2>Der gute Mensch von Karachi</h2>\n<p>(Staffel 15 Nr. 25, Fortlaufende Nr. 375; frz. Titel “La Bonne Âme de Karachi”; Erstausstrahlung: 14.12.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pk9M0hHj6e4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/377-der-gute-mensch-von-karachi-562637\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812712\">thetvdb.com</a></p>\n","376":"<h2>Die Austern von Arcachon</h2>\n<p>(Staffel 15 Nr. 26, Fortlaufende Nr. 376; frz. Titel “Arcachon, le Berceau des Huîtres”; Erstausstrahlung: 21.12.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JCjShQJ89x0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/378-die-austern-von-arcachon-564984\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27520865\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812714\">thetvdb.com</a></p>\n","377":"<h2>Thailand, Raketen für die Götter</h2>\n<p>(Staffel 15 Nr. 27, Fortlaufende Nr. 377; frz. Titel “Thaïlande: Des Fusées Pour les Dieux”; Erstausstrahlung: 28.12.2013)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HPDrBToxk24\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/379-thailand-raketen-fuer-die-goetter-567027\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812716\">thetvdb.com</a></p>\n","378":"<h2>Vietnam, Kobra auf dem Teller</h2>\n<p>(Staffel 16 Nr. 1, Fortlaufende Nr. 378; frz. Titel “Vietnam, du Cobra au Menu”; Erstausstrahlung: 04.01.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=k5mRGmiLhBA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/380-vietnam-kobra-auf-dem-teller-569058\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812750\">thetvdb.com</a></p>\n","379":"<h2>Indiens jüngste Polizisten</h2>\n<p>(Staffel 16 Nr. 2, Fortlaufende Nr. 379; frz. Titel “Inde, Policier Dès 6 Ans?”; Erstausstrahlung: 25.01.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=czIONbtfL-I\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/381-indiens-juengste-polizisten-574964\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812751\">thetvdb.com</a></p>\n","381":"<h2>Azoren, das Geschäft mit den Walen</h2>\n<p>(Staffel 16 Nr. 4, Fortlaufende Nr. 381; frz. Titel “Les Açores, le Sort des Baleines”; Erstausstrahlung: 22.02.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=GUO0RvRiuQE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/383-azoren-das-geschaeft-mit-den-walen-581362\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt5225390\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812753\">thetvdb.com</a></p>\n","382":"<h2>Fort McMurray, Kanada im Ölfieber</h2>\n<p>(Staffel 16 Nr. 5, Fortlaufende Nr. 382; frz. Titel “Fort McMurray, la Ruée Vers l’Or Noir”; Erstausstrahlung: 01.03.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=eadcv_oMM9o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/384-fort-mcmurray-kanada-im-oelfieber-584399\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812754\">thetvdb.com</a></p>\n","383":"<h2>Rosa Amélia - Fische, Freunde, Fado</h2>\n<p>(Staffel 16 Nr. 6, Fortlaufende Nr. 383; frz. Titel “Rosa Amélia — La Passionaria des Pêcheurs Portugais”; Erstausstrahlung: 08.03.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=t9HMH3k3Rz0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/385-rosa-amelia-fische-freunde-fado-587214\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812755\">thetvdb.com</a></p>\n","384":"<h2>Schweiz: Das Verschwinden der Gletscher</h2>\n<p>(Staffel 16 Nr. 7, Fortlaufende Nr. 384; frz. Titel “SOS, Glaciers Suisses en Danger!”; Erstausstrahlung: 29.03.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=QNabMUFSr2Y\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/386-schweiz-das-verschwinden-der-gletscher-591624\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4812756\">thetvdb.com</a></p>\n","385":"<h2>Bangkoks Schatztaucher</h2>\n<p>(Staffel 16 Nr. 8, Fortlaufende Nr. 385; frz. Titel “Chasseurs de trésors à Bangkok”; Erstausstrahlung: 26.04.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RKq3lqts3lg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/387-bangkoks-schatztaucher-598991\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5061390\">thetvdb.com</a></p>\n","386":"<h2>Elbsandsteingebirge - Märchenwelt und Meisterwerke</h2>\n<p>(Staffel 16 Nr. 9, Fortlaufende Nr. 386; frz. Titel “Dresde, au Fil de l’Elbe”; Erstausstrahlung: 10.05.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=PEJoGOk3veQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/388-elbsandsteingebirge-maerchenwelt-und-meisterwerke-607545\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5063398\">thetvdb.com</a></p>\n","387":"<h2>Die Goldenen Schildkröten von Madagaskar</h2>\n<p>(Staffel 16 Nr. 10, Fortlaufende Nr. 387; frz. Titel “Madagascar — Le trafic des tortues angonoka”; Erstausstrahlung: 31.05.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Do-ZlyolY9I\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/389-die-goldenen-schildkroeten-von-madagaskar-613998\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078306\">thetvdb.com</a></p>\n","388":"<h2>Hinter den Kulissen von Venedig</h2>\n<p>(Staffel 16 Nr. 11, Fortlaufende Nr. 388; frz. Titel “Venise en Hiver”; Erstausstrahlung: 14.06.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=nuuE8tS-bDo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/390-hinter-den-kulissen-von-venedig-617724\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16985580\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078307\">thetvdb.com</a></p>\n","389":"<h2>Eishockey - Mädchentraum im Himalaya</h2>\n<p>(Staffel 16 Nr. 12, Fortlaufende Nr. 389; frz. Titel “Le Hockey en Himalaya, une passion au féminin”; Erstausstrahlung: 05.07.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ksF9UzJGXeE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/391-eishockey-maedchentraum-im-himalaya-620596\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078310\">thetvdb.com</a></p>\n","390":"<h2>Die Tango-Spelunken von Buenos Aires</h2>\n<p>(Staffel 16 Nr. 13, Fortlaufende Nr. 390; frz. Titel “Buenos Aires, tango pour tous”; Erstausstrahlung: 30.08.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=gPgur58gJIc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/392-die-tango-spelunken-von-buenos-aires-633374\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078313\">thetvdb.com</a></p>\n","391":"<h2>Jadehandel im Goldenen Dreieck</h2>\n<p>(Staffel 16 Nr. 14, Fortlaufende Nr. 391; frz. Titel “Le Commerce du Jade dans le Triangle d’Or”; Erstausstrahlung: 06.09.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=grEeTdeih0Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/393-jadehandel-im-goldenen-dreieck-634962\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/4986446\">thetvdb.com</a></p>\n","392":"<h2>Bolivien: Kleine Käfer, großes Geld!</h2>\n<p>(Staffel 16 Nr. 15, Fortlaufende Nr. 392; frz. Titel “Trafic d’Insectes en Bolivie”; Erstausstrahlung: 20.09.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jOGkfs9xLlk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/394-bolivien-kleine-kaefer-grosses-geld-642257\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150636\">thetvdb.com</a></p>\n","393":"<h2>Åland-Archipel: Warten auf das Eis</h2>\n<p>(Staffel 16 Nr. 16, Fortlaufende Nr. 393; frz. Titel “L’Archipel d’Åland et Ses Postiers”; Erstausstrahlung: 04.10.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cZG6qlbVXCY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/395-aaland-archipel-warten-auf-das-eis-646836\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150637\">thetvdb.com</a></p>\n","394":"<h2>Kamelmilch, Kasachstans Wundermedizin</h2>\n<p>(Staffel 16 Nr. 17, Fortlaufende Nr. 394; frz. Titel “Kazakhstan, les Bienfaits du Lait de Chamelle”; Erstausstrahlung: 18.10.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=5JYKH97ayxI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/396-kamelmilch-kasachstans-wundermedizin-649942\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5027540\">thetvdb.com</a></p>\n","395":"<h2>Königliche Mounties - Kanadas berittene Polizei</h2>\n<p>(Staffel 16 Nr. 18, Fortlaufende Nr. 395; frz. Titel “Une Femme à la Gendarmerie Royale du Canada”; Erstausstrahlung: 01.11.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MKnpMHIWWSI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/397-koenigliche-mounties-kanadas-berittene-polizei-653489\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5041435\">thetvdb.com</a></p>\n","396":"<h2>Peru: Ein Alpaka für Christobal</h2>\n<p>(Staffel 16 Nr. 19, Fortlaufende Nr. 396; frz. Titel “Pérou, un Alpaga Pour Christobal”; Erstausstrahlung: 15.11.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=u27JvFwOKn0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/398-peru-ein-alpaka-fuer-christobal-657325\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5047865\">thetvdb.com</a></p>\n","397":"<h2>Gnadenhof „Gut Aiderbichl“</h2>\n<p>(Staffel 16 Nr. 20, Fortlaufende Nr. 397; frz. Titel “Le Dernier Refuge des Animaux”; Erstausstrahlung: 22.11.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=LkOdAquYeZQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/399-gnadenhof-gut-aiderbichl-659099\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5061387\">thetvdb.com</a></p>\n","398":"<h2>Unter Haien: Riffpatrouille in der Sulu-See</h2>\n<p>(Staffel 16 Nr. 21, Fortlaufende Nr. 398; frz. Titel “Philippines, un Atoll Sous Haute Protection”; Erstausstrahlung: 29.11.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=zDVgKjAc8A0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/400-unter-haien-riffpatrouille-in-der-sulu-see-660707\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5061388\">thetvdb.com</a></p>\n","399":"<h2>Andalusien - Edle Pferde, wilde Stiere</h2>\n<p>(Staffel 16 Nr. 22, Fortlaufende Nr. 399; frz. Titel “Andalousie, la Tradition de la Transhumance”; Erstausstrahlung: 13.12.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=9ZTsCCSztp0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/401-andalusien-edle-pferde-wilde-stiere-663873\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5061389\">thetvdb.com</a></p>\n"})
\ No newline at end of file
@@ -0,0 +1 @@
+popupChunkLoaded(8,{"428":"<h2>Kenias Spürhunde - Rettung für die Elefanten</h2>\n<p>(Staffel 18 Nr. 1, Fortlaufende Nr. 428; frz. Titel “Kenya, les Chiens au Secours des Éléphants”; Erstausstrahlung: 02.01.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=MY6baZRwEL8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/430-kenias-spuerhunde-rettung-fuer-die-elefanten-797294\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5464152\">thetvdb.com</a></p>\n","411":"<h2>Kuba: Eine Generation im Wandel</h2>\n<p>(Staffel 17 Nr. 10, Fortlaufende Nr. 411; frz. Titel “Cuba, les Coiffeurs de La Havane”; Erstausstrahlung: 27.03.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=uONkvisdPJo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/413-kuba-eine-generation-im-wandel-697093\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19718478\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150642\">thetvdb.com</a></p>\n","416":"<h2>Basketball - Die kleinen Barfuß-Spieler von Mexiko</h2>\n<p>(Staffel 17 Nr. 15, Fortlaufende Nr. 416; frz. Titel “Mexique, les Joueurs de Basket aux Pieds Nus”; Erstausstrahlung: 19.09.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=AskLUCcfDuI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/418-basketball-die-kleinen-barfuss-spieler-von-mexiko-759350\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328400\">thetvdb.com</a></p>\n","400":"<h2>Die Eisbergjäger von Neufundland</h2>\n<p>(Staffel 16 Nr. 23, Fortlaufende Nr. 400; frz. Titel “Terre-Neuve, les Chasseurs d’Icebergs”; Erstausstrahlung: 20.12.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Jylj5OMHrWk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/402-die-eisbergjaeger-von-neufundland-665965\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078296\">thetvdb.com</a></p>\n","401":"<h2>Lettland - das Land der Sänger</h2>\n<p>(Staffel 16 Nr. 24, Fortlaufende Nr. 401; frz. Titel “Lettonie, un Pays Qui Chante”; Erstausstrahlung: 27.12.2014)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=F7ljNcCsIhA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/403-lettland-das-land-der-saenger-667601\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5078299\">thetvdb.com</a></p>\n","402":"<h2>Griechenland: Aufbruch am Olymp</h2>\n<p>(Staffel 17 Nr. 1, Fortlaufende Nr. 402; frz. Titel “Vivre Heureux au Pied de l’Olympe”; Erstausstrahlung: 03.01.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6pWfTh6Y4-o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/404-griechenland-aufbruch-am-olymp-670158\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19802432\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5095522\">thetvdb.com</a></p>\n","403":"<h2>Mohair, das Garn der guten Hoffnung</h2>\n<p>(Staffel 17 Nr. 2, Fortlaufende Nr. 403; frz. Titel “Mohair, Toison de l’Espoir”; Erstausstrahlung: 06.01.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=NDsFCWIqsIk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/405-mohair-das-garn-der-guten-hoffnung-671310\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5095523\">thetvdb.com</a></p>\n","404":"<h2>Der Maestro, Neapels legendärer Boxmeister</h2>\n<p>(Staffel 17 Nr. 3, Fortlaufende Nr. 404; frz. Titel “Naples, le Maestro de la Boxe”; Erstausstrahlung: 07.01.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=KVIq8lwVpD4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/406-der-maestro-neapels-legendaerer-boxmeister-671502\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5095524\">thetvdb.com</a></p>\n","405":"<h2>Die Baumkletterer von Kalifornien</h2>\n<p>(Staffel 17 Nr. 4, Fortlaufende Nr. 405; frz. Titel “En Californie, la Mission des Grimpeurs d’Arbres Géants”; Erstausstrahlung: 16.02.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=CP6G2KgHMR4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/407-die-baumkletterer-von-kalifornien-683425\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5095528\">thetvdb.com</a></p>\n","406":"<h2>Kanada: Indianer schreiben Geschichte</h2>\n<p>(Staffel 17 Nr. 5, Fortlaufende Nr. 406; frz. Titel “Canada, Menace Sur la Terre des Indiens”; Erstausstrahlung: 17.02.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=f1L930_UNW0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/408-kanada-indianer-schreiben-geschichte-683467\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5095530\">thetvdb.com</a></p>\n","407":"<h2>Venezuela, die Blitze von Catatumbo</h2>\n<p>(Staffel 17 Nr. 6, Fortlaufende Nr. 407; frz. Titel “Venezuela, le Lac des Mille Éclairs”; Erstausstrahlung: 23.03.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=AVB38wERs3Q\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/409-venezuela-die-blitze-von-catatumbo-695700\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18345186\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150638\">thetvdb.com</a></p>\n","408":"<h2>Tasmanien, Sympathie für den Teufel</h2>\n<p>(Staffel 17 Nr. 7, Fortlaufende Nr. 408; frz. Titel “Tasmanie, Pauvre Petit Diable”; Erstausstrahlung: 24.03.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=iXgcWz3Dqh0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/410-tasmanien-sympathie-fuer-den-teufel-696253\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19495650\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150639\">thetvdb.com</a></p>\n","409":"<h2>Kastanien, das Brot der Korsen</h2>\n<p>(Staffel 17 Nr. 8, Fortlaufende Nr. 409; frz. Titel “La Châtaigne, une Manne en Corse”; Erstausstrahlung: 25.03.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=PZIIed051OE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/411-kastanien-das-brot-der-korsen-696597\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21971752\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150640\">thetvdb.com</a></p>\n","410":"<h2>Paris, Blitz Motorcycles</h2>\n<p>(Staffel 17 Nr. 9, Fortlaufende Nr. 410; frz. Titel “Paris, Blitz Motorcycles”; Erstausstrahlung: 26.03.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RcPiWMzimBk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/412-paris-blitz-motorcycles-696850\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15101596\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5150641\">thetvdb.com</a></p>\n","412":"<h2>Hamburg, die Stadt der Schwäne</h2>\n<p>(Staffel 17 Nr. 11, Fortlaufende Nr. 412; frz. Titel “Hambourg, la Ville des Cygnes”; Erstausstrahlung: 02.05.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=f1K7nBVO7Lk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/414-hamburg-die-stadt-der-schwaene-711415\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16985718\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5221471\">thetvdb.com</a></p>\n","413":"<h2>Camargue, zwischen Himmel und Meer</h2>\n<p>(Staffel 17 Nr. 12, Fortlaufende Nr. 413; frz. Titel “Camargue : la Guerre des Tellines”; Erstausstrahlung: 29.08.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8bnLFaEqSeA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/415-camargue-zwischen-himmel-und-meer-749148\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt23870016\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328397\">thetvdb.com</a></p>\n","414":"<h2>Bhutan, von Kindern und Kranichen</h2>\n<p>(Staffel 17 Nr. 13, Fortlaufende Nr. 414; frz. Titel “La Migration des Grues au Bhoutan”; Erstausstrahlung: 05.09.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jlJuiIMhBqQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/416-bhutan-von-kindern-und-kranichen-754878\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14429918\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328398\">thetvdb.com</a></p>\n","415":"<h2>Bird Island - Allein unter Pinguinen</h2>\n<p>(Staffel 17 Nr. 14, Fortlaufende Nr. 415; frz. Titel “Bird Island — Le Paradis des Oiseaux Dans l’Antarctique”; Erstausstrahlung: 12.09.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Wlc3mjQr5ek\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/417-bird-island-allein-unter-pinguinen-756555\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18413830\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328399\">thetvdb.com</a></p>\n","417":"<h2>Die Spinnenjäger von Venezuela</h2>\n<p>(Staffel 17 Nr. 16, Fortlaufende Nr. 417; frz. Titel “Venezuela, Chasseurs de Mygales”; Erstausstrahlung: 26.09.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wjmhUyOUGvc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/419-die-spinnenjaeger-von-venezuela-767199\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328401\">thetvdb.com</a></p>\n","418":"<h2>Das Terrassenwunder von Peru</h2>\n<p>(Staffel 17 Nr. 17, Fortlaufende Nr. 418; frz. Titel “Pérou, l’Agriculture en Terrasses”; Erstausstrahlung: 03.10.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0-cZ-g6esRw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/420-das-terrassenwunder-von-peru-774025\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328402\">thetvdb.com</a></p>\n","419":"<h2>Kambodscha, Sithas große Waisenfamilie</h2>\n<p>(Staffel 17 Nr. 18, Fortlaufende Nr. 419; frz. Titel “Cambodge, un Espoir Pour les Enfants des Rues”; Erstausstrahlung: 10.10.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=dFjDEa-tVVI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/421-kambodscha-sithas-grosse-waisenfamilie-776869\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5328403\">thetvdb.com</a></p>\n","420":"<h2>Die Oldtimer von Curaçao</h2>\n<p>(Staffel 17 Nr. 19, Fortlaufende Nr. 420; frz. Titel “Curaçao, la Passion des Vieux Tacots”; Erstausstrahlung: 07.11.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RjuudARpaEQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/422-die-oldtimer-von-curacao-786745\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21083548\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5396736\">thetvdb.com</a></p>\n","421":"<h2>Italien - Hochzeit auf Neapolitanisch</h2>\n<p>(Staffel 17 Nr. 20, Fortlaufende Nr. 421; frz. Titel “Mariage à la Napolitaine”; Erstausstrahlung: 14.11.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tuCZYYFJHLM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/423-italien-hochzeit-auf-neapolitanisch-786746\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15108654\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5404473\">thetvdb.com</a></p>\n","422":"<h2>Yoga, Indiens erstaunliche Medizin</h2>\n<p>(Staffel 17 Nr. 21, Fortlaufende Nr. 422; frz. Titel “Yoga, Médecine Traditionelle de l’Inde”; Erstausstrahlung: 21.11.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=uae6n-lyViY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/424-yoga-indiens-erstaunliche-medizin-786747\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5411577\">thetvdb.com</a></p>\n","423":"<h2>David und die Komodowarane</h2>\n<p>(Staffel 17 Nr. 22, Fortlaufende Nr. 423; frz. Titel “Le Dragon de Komodo”; Erstausstrahlung: 28.11.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=6uFzOGhS8UI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/425-david-und-die-komodowarane-788674\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5420198\">thetvdb.com</a></p>\n","424":"<h2>China, Braut ohne Bräutigam</h2>\n<p>(Staffel 17 Nr. 23, Fortlaufende Nr. 424; frz. Titel “En Chine, à la Recherche d’Un Mari”; Erstausstrahlung: 05.12.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=e9nzSo2Tqr8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/426-china-braut-ohne-braeutigam-792366\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5431748\">thetvdb.com</a></p>\n","425":"<h2>Sansibars erstes Frauenorchester</h2>\n<p>(Staffel 17 Nr. 24, Fortlaufende Nr. 425; frz. Titel “Zanzibar, une Affaire de Femmes”; Erstausstrahlung: 13.12.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=PXO6rKXlfnk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/427-sansibars-erstes-frauenorchester-793099\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5440875\">thetvdb.com</a></p>\n","426":"<h2>Die Bergführer vom Mont Blanc</h2>\n<p>(Staffel 17 Nr. 25, Fortlaufende Nr. 426; frz. Titel “La Compagnie des Guides de Chamonix Mont-Blanc”; Erstausstrahlung: 21.12.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=l7mRLjiZ1Tw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/428-die-bergfuehrer-von-chamonix-794734\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt15277042\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5446452\">thetvdb.com</a></p>\n","427":"<h2>Polen, Winter in den Waldkarpaten</h2>\n<p>(Staffel 17 Nr. 26, Fortlaufende Nr. 427; frz. Titel “Pologne, Charme Secret des Basses-Carpates”; Erstausstrahlung: 26.12.2015)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tRxGlm8BqbY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/429-polen-winter-in-den-waldkarpaten-796124\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5455789\">thetvdb.com</a></p>\n","429":"<h2>Valparaíso - Die Stadt der Aufzüge</h2>\n<p>(Staffel 18 Nr. 2, Fortlaufende Nr. 429; frz. Titel “Valparaiso, la VIlle des Ascenseurs”; Erstausstrahlung: 09.01.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=VZw_EvXbp18\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/431-valparaiso-die-stadt-der-aufzuege-798761\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14429858\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5473961\">thetvdb.com</a></p>\n","430":"<h2>Sibirien - Der Kapitän und die Lena</h2>\n<p>(Staffel 18 Nr. 3, Fortlaufende Nr. 430; frz. Titel “Au Fil de la Lena en Sibérie”; Erstausstrahlung: 23.01.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=7g-j259KxH0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/432-sibirien-der-kapitaen-und-die-lena-801600\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt18227954\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5473962\">thetvdb.com</a></p>\n","431":"<h2>Spreewald - Kähne, Köche, Klapperstörche</h2>\n<p>(Staffel 18 Nr. 4, Fortlaufende Nr. 431; frz. Titel “La Forêt Secrète de la Spree”; Erstausstrahlung: 20.02.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FFHcOUH17TE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/433-spreewald-kaehne-koeche-klapperstoerche-807566\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5526195\">thetvdb.com</a></p>\n","432":"<h2>Cocos Island - Die Insel der Haie</h2>\n<p>(Staffel 18 Nr. 5, Fortlaufende Nr. 432; frz. Titel “Cocos — L’Île des Requins”; Erstausstrahlung: 27.02.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=A-aSNeoHaGI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/434-cocos-island-paradies-fuer-haie-807567\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5535287\">thetvdb.com</a></p>\n","433":"<h2>Insekten - Unser Speiseplan für morgen?</h2>\n<p>(Staffel 18 Nr. 6, Fortlaufende Nr. 433; frz. Titel “Les Insectes, la Nourriture de Demain?”; Erstausstrahlung: 19.03.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=OOxmAapp8vY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/435-insekten-unser-speiseplan-fuer-morgen-812256\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5561577\">thetvdb.com</a></p>\n","434":"<h2>Myanmar - Per Zug durch die Zeit</h2>\n<p>(Staffel 18 Nr. 7, Fortlaufende Nr. 434; frz. Titel “Myanmar, un Voyage Inoubliable en Train”; Erstausstrahlung: 09.04.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Rj3NNtFqAjo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/436-myanmar-per-zug-durch-die-zeit-816969\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21842716\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5578061\">thetvdb.com</a></p>\n","435":"<h2>Die Bärenhunde von Nevada</h2>\n<p>(Staffel 18 Nr. 8, Fortlaufende Nr. 435; frz. Titel “Les Chiens Traqueurs d’Ours du Nevada”; Erstausstrahlung: 30.04.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=wf024fhwmvw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/437-die-baerenhunde-von-nevada-821884\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5578064\">thetvdb.com</a></p>\n","436":"<h2>Die Dhaus - Arabiens legendäre Schiffe</h2>\n<p>(Staffel 18 Nr. 9, Fortlaufende Nr. 436; frz. Titel “Les Bateaux Légendaires d’Oman”; Erstausstrahlung: 14.05.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=07X5I9kJvS4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/438-die-dhaus-arabiens-legendaere-schiffe-825806\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5609661\">thetvdb.com</a></p>\n","437":"<h2>Der Waldrapp - Punkvogel aus den Alpen</h2>\n<p>(Staffel 18 Nr. 10, Fortlaufende Nr. 437; frz. Titel “Pour l’Amour des Oiseaux”; Erstausstrahlung: 28.05.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WDNIqAtjJnE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/439-der-waldrapp-punkvogel-aus-den-alpen-828241\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5628778\">thetvdb.com</a></p>\n","438":"<h2>Die Eisfischer vom Chagan-See</h2>\n<p>(Staffel 18 Nr. 11, Fortlaufende Nr. 438; frz. Titel “Chine: Les Pêcheurs de Glace du Lac Chagan”; Erstausstrahlung: 25.06.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=vPLT2RVso_Y\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/440-die-eisfischer-vom-chagan-see-923466\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt25830670\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5658015\">thetvdb.com</a></p>\n","439":"<h2>Pythons - Invasion in Florida</h2>\n<p>(Staffel 18 Nr. 12, Fortlaufende Nr. 439; frz. Titel “Floride, la Guerre des Pythons”; Erstausstrahlung: 16.07.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=VMQIqDPSNHw\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/441-python-invasion-in-florida-940658\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27428146\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5660701\">thetvdb.com</a></p>\n","440":"<h2>Amas Welt - Das neue Ghana</h2>\n<p>(Staffel 18 Nr. 13, Fortlaufende Nr. 440; frz. Titel “Ghana — L’Avenir Est aux Femmes”; Erstausstrahlung: 03.09.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=xLgEiCxyZ3k\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/442-amas-welt-das-neue-ghana-981928\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5714108\">thetvdb.com</a></p>\n","441":"<h2>Tunesien - Die Kunst der Berbertattoos</h2>\n<p>(Staffel 18 Nr. 14, Fortlaufende Nr. 441; frz. Titel “Tunisie, l’Art du Tatouage Berbère”; Erstausstrahlung: 10.09.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0fWMiz2aS_o\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/443-tunesien-die-kunst-der-berbertattoos-983648\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5745112\">thetvdb.com</a></p>\n","442":"<h2>Die Cook Islands - Willkommen im Paradies</h2>\n<p>(Staffel 18 Nr. 15, Fortlaufende Nr. 442; frz. Titel “Les Îles Cook — Bienvenue au Paradis”; Erstausstrahlung: 17.09.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=0Hn3y3DIcl4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/444-die-cook-islands-welcome-to-paradise-985202\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26422173\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5751341\">thetvdb.com</a></p>\n","443":"<h2>Norwegen - Försterinnen auf dem Vormarsch</h2>\n<p>(Staffel 18 Nr. 16, Fortlaufende Nr. 443; frz. Titel “Norvège — Le Bois, une Histoire de Femmes”; Erstausstrahlung: 24.09.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Vge_eMlIxEY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/445-norwegen-foersterinnen-auf-dem-vormarsch-988012\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26472392\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5739071\">thetvdb.com</a></p>\n","444":"<h2>Vietnam - Das Schicksal der Mondbären</h2>\n<p>(Staffel 18 Nr. 17, Fortlaufende Nr. 444; frz. Titel “Vietnam, Au Secours des Ours Noirs d’Asie”; Erstausstrahlung: 01.10.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=bcv3VsOTMdo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/446-vietnam-das-schicksal-der-mondbaeren-989430\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5751342\">thetvdb.com</a></p>\n","445":"<h2>Die letzten Krokodile Venezuelas</h2>\n<p>(Staffel 18 Nr. 18, Fortlaufende Nr. 445; frz. Titel “Venezuela: La Ferme aux Crocodiles”; Erstausstrahlung: 15.10.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=p9sjFVILLlo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/447-die-letzten-krokodile-venezuelas-992799\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5764340\">thetvdb.com</a></p>\n","446":"<h2>Das Elefantenkrankenhaus von Thailand</h2>\n<p>(Staffel 18 Nr. 19, Fortlaufende Nr. 446; frz. Titel “Thaïlande: Le Premier Hôpital Pour Éléphants”; Erstausstrahlung: 29.10.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=stCFbtfBtcI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/448-das-elefantenkrankenhaus-von-thailand-995976\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5822676\">thetvdb.com</a></p>\n","447":"<h2>Die Schlammfußballer von Island</h2>\n<p>(Staffel 18 Nr. 20, Fortlaufende Nr. 447; frz. Titel “Islande, Fous de Foot de Boue”; Erstausstrahlung: 05.11.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=jJRGSboanao\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/449-schlammfussball-in-island-999289\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19495648\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5830614\">thetvdb.com</a></p>\n","448":"<h2>Dänemark - Königin Margrethe und ihr Sommerschloss</h2>\n<p>(Staffel 18 Nr. 21, Fortlaufende Nr. 448; frz. Titel “Danemark, un Été Chez la Reine Margrethe”; Erstausstrahlung: 19.11.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qIrnygvh_I8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/450-daenemark-koenigin-margrethe-und-ihr-sommerschloss-1001793\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5854099\">thetvdb.com</a></p>\n","449":"<h2>Die metallenen Gondeln von Tschiatura</h2>\n<p>(Staffel 18 Nr. 22, Fortlaufende Nr. 449; frz. Titel “Géorgie — Des Téléphériques Qui Défient la Mort”; Erstausstrahlung: 26.11.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-2OmrWF4YiQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/451-die-metallenen-gondeln-von-tschiatura-1002246\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5858780\">thetvdb.com</a></p>\n"})
\ No newline at end of file
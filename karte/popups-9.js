@@ -0,0 +1 @@
+popupChunkLoaded(9,{"481":"<h2>Bisons, die sanften Riesen von Montana</h2>\n<p>(Staffel 20 Nr. 2, Fortlaufende Nr. 481; frz. Titel “Bisons, les Doux Géants du Montana”; Erstausstrahlung: 28.01.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HwOJJFzY5Cc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/483-bisons-die-sanften-riesen-von-montana-1161790\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6529015\">thetvdb.com</a></p>\n","450":"<h2>Die Honigsammler von Yunnan</h2>\n<p>(Staffel 18 Nr. 23, Fortlaufende Nr. 450; frz. Titel “Chine, les Ruches de Maître Xing”; Erstausstrahlung: 03.12.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ddARBEV3fH4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/452-die-honigsammler-von-yunnan-1012644\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5869469\">thetvdb.com</a></p>\n","451":"<h2>Wilde Schweiz - Von Ringern und Schwingern</h2>\n<p>(Staffel 18 Nr. 24, Fortlaufende Nr. 451; frz. Titel “Suisse, les Lutteurs Portent la Culotte”; Erstausstrahlung: 10.12.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=BOZJeflZbeM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/453-wilde-schweiz-von-ringern-und-schwingern-1036481\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5878158\">thetvdb.com</a></p>\n","452":"<h2>St. Bernhard - Von Menschen und Hunden</h2>\n<p>(Staffel 18 Nr. 25, Fortlaufende Nr. 452; frz. Titel “Saint-Bernard et Ses Chiens”; Erstausstrahlung: 17.12.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UBQ1XhTzHic\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/454-st-bernhard-von-menschen-und-hunden-1037887\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt11969464\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5888245\">thetvdb.com</a></p>\n","453":"<h2>Rumänien - Eine Weihnachtsreise ins Donaudelta</h2>\n<p>(Staffel 18 Nr. 26, Fortlaufende Nr. 453; frz. Titel “Delta du Danube, un Noël Pas Comme les Autres”; Erstausstrahlung: 24.12.2016)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=pcjXQq5fnx4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/455-rumaenien-eine-weihnachtsreise-ins-donaudelta-1039858\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5895561\">thetvdb.com</a></p>\n","454":"<h2>Die Liebenden von Santa Cruz del Islote</h2>\n<p>(Staffel 19 Nr. 1, Fortlaufende Nr. 454; frz. Titel “Santa Cruz del Islote — Une Île Minuscule et Insolite”; Erstausstrahlung: 07.01.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=UNPolG8VXFo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/456-die-liebenden-von-santa-cruz-del-islote-1042427\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5904645\">thetvdb.com</a></p>\n","455":"<h2>Marseille - Kopfüber ins Blau</h2>\n<p>(Staffel 19 Nr. 2, Fortlaufende Nr. 455; frz. Titel “Plongeon de Haut Vol Sur Marseille”; Erstausstrahlung: 14.01.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=sVXtF-PwPQY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/457-marseille-kopfueber-ins-blau-1044494\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt6460474\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5927802\">thetvdb.com</a></p>\n","456":"<h2>Kurt und seine Wölfe</h2>\n<p>(Staffel 19 Nr. 3, Fortlaufende Nr. 456; frz. Titel “Kurt, un Homme Parmi les Loups”; Erstausstrahlung: 21.01.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Khp3kDHWSdo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/458-kurt-und-seine-woelfe-1046379\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5927792\">thetvdb.com</a></p>\n","457":"<h2>Pyrenäen - Ein Hirte zwischen Himmel und Erde</h2>\n<p>(Staffel 19 Nr. 4, Fortlaufende Nr. 457; frz. Titel “Brice, un Vacher à l’Assaut des Pyrénées”; Erstausstrahlung: 28.01.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=hxPBgj2j_eg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/459-pyrenaeen-ein-hirte-zwischen-himmel-und-erde-1048641\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5945673\">thetvdb.com</a></p>\n","458":"<h2>Zauberhafte Mosel</h2>\n<p>(Staffel 19 Nr. 5, Fortlaufende Nr. 458; frz. Titel “La Moselle, au Fil de l’Eau”; Erstausstrahlung: 04.02.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fHHJoYzQuz8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/460-zauberhafte-mosel-1048643\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22478580\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5966507\">thetvdb.com</a></p>\n","459":"<h2>Der Kosakenpriester vom Don</h2>\n<p>(Staffel 19 Nr. 6, Fortlaufende Nr. 459; frz. Titel “La Volga au Rythme des Cosaques”; Erstausstrahlung: 18.02.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=RdAzR4VEOHA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/461-der-kosakenpriester-vom-don-1051882\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16971158\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5975719\">thetvdb.com</a></p>\n","460":"<h2>Chile - Die Leuchttürme am Ende der Welt</h2>\n<p>(Staffel 19 Nr. 7, Fortlaufende Nr. 460; frz. Titel “Chili, les Phares du Bout du Monde”; Erstausstrahlung: 25.02.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=u1jaUHMhRwo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/462-chile-die-leuchttuerme-am-ende-der-welt-1052721\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5986947\">thetvdb.com</a></p>\n","461":"<h2>Indien - Heilendes Ayurveda</h2>\n<p>(Staffel 19 Nr. 8, Fortlaufende Nr. 461; frz. Titel “Inde, la Médecine Ayurvédique”; Erstausstrahlung: 04.03.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=EqHxC_ym5uA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/463-indien-heilendes-ayurveda-1055376\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/5987692\">thetvdb.com</a></p>\n","462":"<h2>Spanien - Die Tradition der Menschentürme</h2>\n<p>(Staffel 19 Nr. 9, Fortlaufende Nr. 462; frz. Titel “Catalogne, le Défi des Pyramides Humaines”; Erstausstrahlung: 12.03.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=8N06lkFAtYI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/464-spanien-die-tradition-der-menschentuerme-1057317\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14564776\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6005142\">thetvdb.com</a></p>\n","463":"<h2>Malaysia - Von Frauen und Motorrädern</h2>\n<p>(Staffel 19 Nr. 10, Fortlaufende Nr. 463; frz. Titel “Malaisie, la moto au Féminin”; Erstausstrahlung: 19.03.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=yvXaWlw37fQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/465-malaysia-von-frauen-und-motorraedern-1058938\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16971162\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6010575\">thetvdb.com</a></p>\n","464":"<h2>Eine zweite Art von Frau - Thailand, das Dritte Geschlecht</h2>\n<p>(Staffel 19 Nr. 11, Fortlaufende Nr. 464; frz. Titel “Les Lady Boys en Thaïlande”; Erstausstrahlung: 26.03.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=h2o97Qd26oI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/466-eine-zweite-art-von-frau-thailand-das-dritte-geschlecht-1058939\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6021363\">thetvdb.com</a></p>\n","465":"<h2>Myanmars Bambusbrücke - Ein Dorf packt an!</h2>\n<p>(Staffel 19 Nr. 12, Fortlaufende Nr. 465; frz. Titel “Birmanie: l’Étonnant Pont de Bambou”; Erstausstrahlung: 21.05.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Mx0SpmGP9JM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/467-myanmars-bambusbruecke-ein-dorf-packt-an-1082612\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21308734\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6101743\">thetvdb.com</a></p>\n","466":"<h2>Die Minga - Umzug auf Chilenisch</h2>\n<p>(Staffel 19 Nr. 13, Fortlaufende Nr. 466; frz. Titel “Chili, l'incroyable voyage d'une maison des bois”; Erstausstrahlung: 28.05.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=H8MxGlRHRHA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/468-die-minga-umzug-auf-chilenisch-1088464\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21916070\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/7219669\">thetvdb.com</a></p>\n","467":"<h2>Kuba - Meister der Drehorgeln</h2>\n<p>(Staffel 19 Nr. 14, Fortlaufende Nr. 467; frz. Titel “Cuba — Danse Avec les Orgues de Barbarie”; Erstausstrahlung: 06.08.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tnpfneRKHxY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/469-kuba-meister-der-drehorgeln-1106449\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6241979\">thetvdb.com</a></p>\n","468":"<h2>Sri Lanka - Eine legendäre Eisenbahnstrecke</h2>\n<p>(Staffel 19 Nr. 15, Fortlaufende Nr. 468; frz. Titel “Sri Lanka, Avec Rodrigo à Bord du Train Bleu”; Erstausstrahlung: 20.08.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ldpHfqDbWHQ\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/470-sri-lanka-eine-legendaere-eisenbahnstrecke-1109704\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6270747\">thetvdb.com</a></p>\n","469":"<h2>Die Wassernomaden vom Sambesi</h2>\n<p>(Staffel 19 Nr. 16, Fortlaufende Nr. 469; frz. Titel “Zambie, les Nomades du Fleuve”; Erstausstrahlung: 17.09.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=f0lmD4C0Vs0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/471-wassernomaden-auf-dem-sambesi-1123007\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6328065\">thetvdb.com</a></p>\n","470":"<h2>Mate-Tee - Die Seele Argentiniens</h2>\n<p>(Staffel 19 Nr. 17, Fortlaufende Nr. 470; frz. Titel “Le Maté, l’Élixir des Argentins”; Erstausstrahlung: 01.10.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=fWvRJ-pbYxI\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/472-argentinien-mate-tee-die-seele-des-landes-1132095\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt14840080\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6348729\">thetvdb.com</a></p>\n","471":"<h2>Louisiana - Land unter bei den Shrimpfischern</h2>\n<p>(Staffel 19 Nr. 18, Fortlaufende Nr. 471; frz. Titel “Les Derniers Pêcheurs de Crevettes de Louisiane”; Erstausstrahlung: 22.10.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=tS_0NFzr2l4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/473-louisiana-land-unter-bei-den-shrimpfischern-1134615\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21928474\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6376645\">thetvdb.com</a></p>\n","472":"<h2>Svanetien - Von Lebenden und Toten</h2>\n<p>(Staffel 19 Nr. 19, Fortlaufende Nr. 472; frz. Titel “Géorgie: le Culte des Ancêtres en Svaténie”; Erstausstrahlung: 29.10.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=KZ9v7YAJzR8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/474-svanetien-von-lebenden-und-toten-1137649\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6387570\">thetvdb.com</a></p>\n","473":"<h2>Java - Zauberhaftes Schattentheater</h2>\n<p>(Staffel 19 Nr. 20, Fortlaufende Nr. 473; frz. Titel “Java, la Magie du Théâtre d’Ombres”; Erstausstrahlung: 05.11.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HE8MAIiX9OU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/475-java-zauberhaftes-schattentheater-1139270\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6398275\">thetvdb.com</a></p>\n","474":"<h2>Frisch vermählt in Estland</h2>\n<p>(Staffel 19 Nr. 21, Fortlaufende Nr. 474; frz. Titel “Estonie, les Secrets d’un Mariage Réussi”; Erstausstrahlung: 12.11.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=OzL34KdYfLM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/476-frisch-vermaehlt-in-estland-1140830\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt16453240\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6398624\">thetvdb.com</a></p>\n","475":"<h2>Die Geier sind zurück</h2>\n<p>(Staffel 19 Nr. 22, Fortlaufende Nr. 475; frz. Titel “Les Vautours Sont de Retour”; Erstausstrahlung: 19.11.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=e5A0glDrlkU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/477-die-geier-sind-zurueck-1142429\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt24055100\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6398625\">thetvdb.com</a></p>\n","476":"<h2>Bolivien - Der Kampf um die kleinen Herzen</h2>\n<p>(Staffel 19 Nr. 23, Fortlaufende Nr. 476; frz. Titel “Bolivie, un Médecin Qui a du Cœur”; Erstausstrahlung: 26.11.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Brrl86VTvq4\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/478-bolivien-der-kampf-um-die-kleinen-herzen-1143660\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6398620\">thetvdb.com</a></p>\n","477":"<h2>Sibirien, die Eisstraße ins Polarmeer</h2>\n<p>(Staffel 19 Nr. 24, Fortlaufende Nr. 477; frz. Titel “Sur les Routes de Glace de Sibérie”; Erstausstrahlung: 27.11.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=S7VcirrE2xc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/479-sibirien-die-eisstrasse-ins-polarmeer-1143920\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21842726\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6439596\">thetvdb.com</a></p>\n","478":"<h2>Kolumbien: DC3 Oldtimer versorgen den Regenwald</h2>\n<p>(Staffel 19 Nr. 25, Fortlaufende Nr. 478; frz. Titel “Colombie, les Fous Volants de l’Amazonie”; Erstausstrahlung: 10.12.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=VqPIqn1upqs\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/480-kolumbien-dc3-oldtimer-versorgen-den-regenwald-1148836\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21308740\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6448641\">thetvdb.com</a></p>\n","479":"<h2>Der Thomanerchor - Leben für die Musik</h2>\n<p>(Staffel 19 Nr. 26, Fortlaufende Nr. 479; frz. Titel “Leipzig, les Légendaires Petits Chanteurs”; Erstausstrahlung: 24.12.2017)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=931l1cfsbDg\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/481-der-thomanerchor-leben-fuer-die-musik-1151707\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt26898733\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6468960\">thetvdb.com</a></p>\n","480":"<h2>Friaul, Benvenuti im Musiktal</h2>\n<p>(Staffel 20 Nr. 1, Fortlaufende Nr. 480; frz. Titel “Le Frioul, une Vallée Tout en Musique”; Erstausstrahlung: 14.01.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=_-7XZj09-A0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/482-friaul-benvenuti-im-musiktal-1157017\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt24636846\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6507973\">thetvdb.com</a></p>\n","482":"<h2>Vietnam, die letzten Pangoline</h2>\n<p>(Staffel 20 Nr. 3, Fortlaufende Nr. 482; frz. Titel “Le Vietnam au Chevet des Pangolins”; Erstausstrahlung: 04.02.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=HXALW-m2RxM\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/484-vietnam-die-letzten-pangoline-1163224\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6538679\">thetvdb.com</a></p>\n","483":"<h2>Schottland: Die Seenotretter der Orkney Islands</h2>\n<p>(Staffel 20 Nr. 4, Fortlaufende Nr. 483; frz. Titel “Au Nord de l’Écosse, les Sauveteurs en Mer”; Erstausstrahlung: 11.02.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qzTYfQqZltc\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/485-schottland-die-seenotretter-der-orkney-islands-1164369\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt27170456\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6549630\">thetvdb.com</a></p>\n","484":"<h2>Kanada - Mit der Hebamme durch die Badlands</h2>\n<p>(Staffel 20 Nr. 5, Fortlaufende Nr. 484; frz. Titel “Canada — Les Aventures d’une Sage-Femme dans les Badlands”; Erstausstrahlung: 25.02.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=Gdcj-iqqRs8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/486-kanada-mit-der-hebamme-durch-die-badlands-1169596\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6578381\">thetvdb.com</a></p>\n","485":"<h2>Myanmar - Die Marmorkünstler von Mandalay</h2>\n<p>(Staffel 20 Nr. 6, Fortlaufende Nr. 485; frz. Titel “Birmanie, les Sculpteurs de Marbre de Mandalay”; Erstausstrahlung: 04.03.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=iV3arcWLL-s\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/487-myanmar-die-marmorkuenstler-von-mandalay-1171202\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6596840\">thetvdb.com</a></p>\n","486":"<h2>Der Lachszähler von Kanada</h2>\n<p>(Staffel 20 Nr. 7, Fortlaufende Nr. 486; frz. Titel “Canada, le Vieil Homme et la Rivière”; Erstausstrahlung: 11.03.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=QM_8fpHN6Jo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/488-der-lachszaehler-von-kanada-1173798\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6590788\">thetvdb.com</a></p>\n","487":"<h2>Kreta - Die süßen Früchte des Johannisbrotbaums</h2>\n<p>(Staffel 20 Nr. 8, Fortlaufende Nr. 487; frz. Titel “Le Caroubier, l’Or Noir de la Crète”; Erstausstrahlung: 18.03.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rVaOPVPAC5Y\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/489-kreta-die-suessen-fruechte-des-johannisbrotbaums-1175560\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6597521\">thetvdb.com</a></p>\n","488":"<h2>Der Hundeflüsterer der Queen</h2>\n<p>(Staffel 20 Nr. 9, Fortlaufende Nr. 488; frz. Titel “L’Anglais Qui Murmure à l'Oreille des Chiens”; Erstausstrahlung: 25.03.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=rejyD-Z97PE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/490-der-hundefluesterer-der-queen-1177787\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6615190\">thetvdb.com</a></p>\n","489":"<h2>Italien, eine neue Glocke für Monopoli</h2>\n<p>(Staffel 20 Nr. 10, Fortlaufende Nr. 489; frz. Titel “Les Cloches, Tout un Art en Italie”; Erstausstrahlung: 01.04.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=FLTObV0M5RE\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/491-italien-eine-neue-glocke-fuer-monopoli-1179190\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19718488\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6615191\">thetvdb.com</a></p>\n","490":"<h2>Arapaima, der Riesenfisch vom Amazonas</h2>\n<p>(Staffel 20 Nr. 11, Fortlaufende Nr. 490; frz. Titel “Arapaïma, le Poisson Géant d’Amazonie”; Erstausstrahlung: 13.05.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cr4V6JIH8yU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/492-arapaima-der-riesenfisch-vom-amazonas-1191708\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt20231928\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6689543\">thetvdb.com</a></p>\n","491":"<h2>Die fliegenden Wildesel von Kasachstan</h2>\n<p>(Staffel 20 Nr. 12, Fortlaufende Nr. 491; frz. Titel “SOS ânes sauvages du Kazakhstan”; Erstausstrahlung: 27.05.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=ND0yEWkqnSk\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/493-die-fliegenden-wildesel-von-kasachstan-1194430\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt21073776\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6707145\">thetvdb.com</a></p>\n","492":"<h2>Geliebtes Korsika - Kampf gegen das Feuer</h2>\n<p>(Staffel 20 Nr. 13, Fortlaufende Nr. 492; frz. Titel “Corse, les maquisards du feu”; Erstausstrahlung: 22.06.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=cMm7vvWgVzY\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/494-geliebtes-korsika-kampf-gegen-das-feuer-1202913\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6739140\">thetvdb.com</a></p>\n","493":"<h2>Japan - Leben am Fuß des Vulkans</h2>\n<p>(Staffel 20 Nr. 14, Fortlaufende Nr. 493; frz. Titel “Japon — Vivre à l'Ombre du Volcan Iodake”; Erstausstrahlung: 30.08.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=mztIey-rJi0\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/495-japan-leben-am-fuss-des-vulkans-1221897\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt19802452\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6819062\">thetvdb.com</a></p>\n","494":"<h2>Sucevita - Rumäniens schönste Klosterfresken</h2>\n<p>(Staffel 20 Nr. 15, Fortlaufende Nr. 494; frz. Titel “Roumanie, la Beauté Sacrée des Monastères Peints”; Erstausstrahlung: 08.09.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=QPvUMKZxuwU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/496-sucevita-rumaeniens-schoenste-klosterfresken-1223336\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6821173\">thetvdb.com</a></p>\n","495":"<h2>Moskaus berühmte Sprengstoffhunde</h2>\n<p>(Staffel 20 Nr. 16, Fortlaufende Nr. 495; frz. Titel “Moscou: des chiens renifleurs pour l’aéroport”; Erstausstrahlung: 15.09.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=JlzRmmvY6wU\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/497-moskaus-beruehmte-sprengstoffhunde-1225228\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6829028\">thetvdb.com</a></p>\n","496":"<h2>Neuseeland - Die Tiere vom Ende der Welt</h2>\n<p>(Staffel 20 Nr. 17, Fortlaufende Nr. 496; frz. Titel “Nouvelle-Zélande — Les Animaux du Bout du Monde”; Erstausstrahlung: 29.09.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qGm7J8wCZuo\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/498-neuseeland-die-tiere-vom-ende-der-welt-1230127\">fernsehserien.de</a>, <a href=\"https://www.imdb.com/title/tt22007414\">imdb.com</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6845491\">thetvdb.com</a></p>\n","497":"<h2>Virunga, der Kampf für die Berggorillas</h2>\n<p>(Staffel 20 Nr. 18, Fortlaufende Nr. 497; frz. Titel “Virunga, les Gorilles en Péril”; Erstausstrahlung: 06.10.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=-2VXdo0Vm8A\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/499-virunga-der-kampf-fuer-die-berggorillas-1230128\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6856576\">thetvdb.com</a></p>\n","498":"<h2>Gitarren und Flamenco in Granada</h2>\n<p>(Staffel 20 Nr. 19, Fortlaufende Nr. 498; frz. Titel “L'Andalousie — Au Son des Guitares et du Flamenco”; Erstausstrahlung: 13.10.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=qNy9yMLVPhA\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/500-gitarren-und-flamenco-in-granada-1232369\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6863765\">thetvdb.com</a></p>\n","499":"<h2>Chatuchak - Bangkoks Riesenmarkt</h2>\n<p>(Staffel 20 Nr. 20, Fortlaufende Nr. 499; frz. Titel “Chatuchak, le Plus Grand Marché de Thaïlande”; Erstausstrahlung: 20.10.2018)</p>\n\n<p><strong>Referenzen:</strong> <a href=\"https://www.youtube.com/watch?v=WGYqFDLRHH8\">youtube.com</a>, <a href=\"https://www.fernsehserien.de/arte-360grad-reportage/folgen/501-chatuchak-bangkoks-riesenmarkt-1233630\">fernsehserien.de</a>, <a href=\"https://thetvdb.com/series/272599-show/episodes/6872146\">thetvdb.com</a></p>\n"})
\ No newline at end of file
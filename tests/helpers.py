@@ -0,0 +1,26 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from arte_360_reportage import TvShow
+
+FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "files")
+
+
+class FixtureTestCase(unittest.TestCase):
+    """Runs each test in a temporary directory that holds a copy of
+    ``files/arte-360-reportage.yml``."""
+
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        shutil.copy(os.path.join(FILES, "arte-360-reportage.yml"), self.directory)
+        os.chdir(self.directory)
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def load(self) -> TvShow:
+        return TvShow("arte-360-reportage.yml", use_mirror=False)
@@ -0,0 +1,55 @@
+import unittest
+
+from arte_360_reportage import DatasetDiff, TvShow, Yaml
+from helpers import FixtureTestCase
+
+
+class TestDatasetDiff(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        data = Yaml.load("arte-360-reportage.yml")
+        first, second = [season["episodes"] for season in data["seasons"]]
+        # swap Chandigarh and Brasilia
+        first[1], first[2] = first[2], first[1]
+        del second[3]
+        second[0]["director"] = "Jane Doe"
+        second.append({"title": "Die neue Folge", "air_date": "2000-02-01"})
+        overall_no = 1
+        for season in data["seasons"]:
+            for episode_no, episode in enumerate(season["episodes"], 1):
+                episode["overall_no"] = overall_no
+                episode["season_no"] = season["no"]
+                episode["episode_no"] = episode_no
+                overall_no += 1
+        Yaml.save("new.yml", data)
+        self.diff = DatasetDiff(self.load(), TvShow("new.yml", use_mirror=False))
+
+    def test_added_and_removed(self) -> None:
+        self.assertEqual([e.title for e in self.diff.added], ["Die neue Folge"])
+        self.assertEqual(
+            [e.title for e in self.diff.removed], ["Im Schatten des Vulkans"]
+        )
+
+    def test_changed(self) -> None:
+        self.assertEqual(
+            [(old.overall_no, changes) for old, _, changes in self.diff.changed],
+            [(5, {"director": ("Jonathan Barker", "Jane Doe")})],
+        )
+
+    def test_aligned_by_id(self) -> None:
+        self.assertEqual(len(self.diff.pairs), 7)
+        for old, new in self.diff.pairs:
+            self.assertEqual(old.youtube_video_id, new.youtube_video_id)
+            self.assertEqual(old.title, new.title)
+
+    def test_reordered(self) -> None:
+        # The longest run in the old order keeps Chandigarh, only Brasilia
+        # moved. The removal shifts no episode into the reordered ones.
+        self.assertEqual(
+            [(old.overall_no, new.overall_no) for old, new in self.diff.reordered],
+            [(3, 2)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
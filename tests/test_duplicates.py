@@ -0,0 +1,50 @@
+import unittest
+
+from arte_360_reportage import DuplicateDetector, MinHash
+from helpers import FixtureTestCase
+
+
+class TestMinHash(unittest.TestCase):
+    def test_candidates(self) -> None:
+        sets = [
+            MinHash.shingle_characters(title)
+            for title in (
+                "die ruckkehr der wolfe in die lausitz",
+                "tsunami die todliche welle",
+                "die ruckkehr der wolfe in der lausitz",
+            )
+        ]
+        self.assertEqual(MinHash().candidates(sets), {(0, 2)})
+        self.assertGreater(MinHash.jaccard(sets[0], sets[2]), 0.7)
+        self.assertLess(MinHash.jaccard(sets[0], sets[1]), 0.1)
+
+    def test_deterministic(self) -> None:
+        shingles = MinHash.shingle_words("ein film uber die wolfe in der lausitz")
+        self.assertEqual(MinHash().signature(shingles), MinHash().signature(shingles))
+        self.assertEqual(MinHash.shingle_words("zwei Worte"), set())
+
+    def test_empty_sets_are_skipped(self) -> None:
+        self.assertEqual(MinHash().candidates([set(), set(), {"a"}]), set())
+
+
+class TestDuplicateDetector(FixtureTestCase):
+    def test_find(self) -> None:
+        show = self.load()
+        first = show.episodes[0]
+        duplicate = show.episodes[6]
+        duplicate.data["title"] = first.title.replace("Utopie", "Utopia")
+        # Compare only the German titles of the pair.
+        for episode in (first, duplicate):
+            for key in ("alias", "title_fr", "title_en", "description"):
+                episode.data.pop(key, None)
+
+        found = DuplicateDetector(show.episodes).find()
+        self.assertEqual(len(found), 1)
+        similarity, earlier, later = found[0]
+        self.assertIs(earlier, first)
+        self.assertIs(later, duplicate)
+        self.assertGreater(similarity, 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import argparse
+import asyncio
+import http.server
+import json
+import threading
+import time
+import unittest
+import urllib.parse
+
+from arte_360_reportage import Enricher, RateLimiter, TvShow, parse_enrich_base_url
+from helpers import FixtureTestCase
+
+FERNSEHSERIEN_PAGE = """<html><body>
+<div class="episode-output-inhalt-inner">Stand-in description<br>of {slug}</div>
+<ul><li itemprop="director"><dl><dt itemprop="name">Stand-in Director</dt></dl></li>
+</ul></body></html>"""
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Stand-in for fernsehserien.de, Wikidata and the YouTube Data API"""
+
+    requests: list[str] = []
+
+    failures: dict[str, int] = {}
+    """``{path: number of HTTP 503 responses before the real one}``"""
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        StandInHandler.requests.append(url.path)
+        if StandInHandler.failures.get(url.path, 0) > 0:
+            StandInHandler.failures[url.path] -= 1
+            return self.send_error(503)
+        body = self.body(url)
+        if body is None:
+            return self.send_error(404)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def body(self, url: urllib.parse.SplitResult) -> bytes | None:
+        if url.path.startswith("/fernsehserien/folgen/"):
+            slug = url.path.rsplit("/", 1)[-1]
+            if slug.startswith("3-"):
+                return None
+            return FERNSEHSERIEN_PAGE.format(slug=slug).encode()
+        if url.path.startswith("/wikidata/"):
+            entity_id = url.path.rsplit("/", 1)[-1].removesuffix(".json")
+            value = {"latitude": 13.5, "longitude": 144.8}
+            claim = {"mainsnak": {"datavalue": {"value": value}}}
+            entity = {"claims": {"P625": [claim]}}
+            return json.dumps({"entities": {entity_id: entity}}).encode()
+        if url.path == "/youtube/videos":
+            ids = urllib.parse.parse_qs(url.query)["id"][0].split(",")
+            items = [
+                {
+                    "id": id,
+                    "contentDetails": {"duration": "PT26M3S"},
+                    "snippet": {"description": "Ein Film von Stand-in\nVideo " + id},
+                }
+                for id in ids
+            ]
+            return json.dumps({"items": items}).encode()
+        return None
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_limits(self) -> None:
+        running = 0
+        max_running = 0
+        starts: list[float] = []
+
+        async def task(limiter: RateLimiter) -> None:
+            nonlocal running, max_running
+            async with limiter:
+                starts.append(time.monotonic())
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+
+        async def main() -> None:
+            limiter = RateLimiter(concurrency=2, rate=50)
+            await asyncio.gather(*[task(limiter) for _ in range(6)])
+
+        asyncio.run(main())
+        self.assertEqual(max_running, 2)
+        # 6 requests at 50 per second: the last one starts after 5 intervals
+        self.assertGreaterEqual(starts[-1] - starts[0], 5 / 50 - 0.005)
+
+
+class TestParseEnrichBaseUrl(unittest.TestCase):
+    def test_parse(self) -> None:
+        self.assertEqual(
+            parse_enrich_base_url("youtube=http://127.0.0.1:8001/v3?a=b"),
+            ("youtube", "http://127.0.0.1:8001/v3?a=b"),
+        )
+        for value in ("youtube", "youtube=", "unknown=http://127.0.0.1"):
+            with self.subTest(value=value), self.assertRaises(
+                argparse.ArgumentTypeError
+            ):
+                parse_enrich_base_url(value)
+
+
+class TestEnricher(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        StandInHandler.requests = []
+        StandInHandler.failures = {}
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), StandInHandler
+        )
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def enricher(self, show: TvShow, names: list[str]) -> Enricher:
+        enricher = Enricher(
+            show, names, {name: f"{self.base_url}/{name}" for name in names}
+        )
+        for source in enricher.sources:
+            source.rate = 100
+            source.backoff = 0.01
+        return enricher
+
+    def test_run(self) -> None:
+        slug = "2-traum-staedte-chandigarh-leben-im-beton-339117"
+        StandInHandler.failures = {f"/fernsehserien/folgen/{slug}": 2}
+        show = self.load()
+        # Q17 is the only entity to look up: s2e3 has no location.
+        del show.episodes[5].data["coordinates"]
+        enricher = self.enricher(show, ["fernsehserien", "wikidata", "youtube"])
+        enricher.run()
+
+        fernsehserien = enricher.stats["fernsehserien"]
+        # 8 pages, 2 of them repeated after HTTP 503, 1 not found
+        self.assertEqual(fernsehserien["requests"], 10)
+        self.assertEqual(fernsehserien["retries"], 2)
+        self.assertEqual(fernsehserien["errors"], 1)
+        self.assertEqual(enricher.stats["wikidata"]["requests"], 1)
+        self.assertEqual(enricher.stats["youtube"]["requests"], 1)
+
+        show = self.load()
+        chandigarh = show.episodes[1]
+        self.assertEqual(
+            chandigarh.description_fernsehserien, f"Stand-in description\nof {slug}"
+        )
+        # Only missing values are filled.
+        self.assertEqual(chandigarh.director, "Sylvain Roumette")
+        self.assertIsNone(show.episodes[2].description_fernsehserien)
+        self.assertEqual(show.episodes[5].coordinates, [13.5, 144.8])
+        self.assertEqual(show.episodes[0].duration_sec, 1583)
+        self.assertEqual(
+            show.episodes[0].description_youtube,
+            f"Video {show.episodes[0].youtube_video_id}",
+        )
+
+    def test_retries_exhausted(self) -> None:
+        StandInHandler.failures = {"/youtube/videos": 10}
+        show = self.load()
+        enricher = self.enricher(show, ["youtube"])
+        enricher.run()
+        self.assertEqual(enricher.stats["youtube"]["requests"], 4)
+        self.assertEqual(enricher.stats["youtube"]["retries"], 3)
+        self.assertEqual(enricher.stats["youtube"]["errors"], 1)
+        self.assertIsNone(show.episodes[0].description_youtube)
+
+    def test_dry_run(self) -> None:
+        with open("arte-360-reportage.yml", "rb") as f:
+            before = f.read()
+        show = self.load()
+        del show.episodes[5].data["coordinates"]
+        enricher = self.enricher(show, ["wikidata"])
+        enricher.run(dry_run=True)
+        self.assertEqual(enricher.stats["wikidata"]["filled"], 1)
+        with open("arte-360-reportage.yml", "rb") as f:
+            self.assertEqual(f.read(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+
+from arte_360_reportage import CompactGeoJson, MapLocation
+from helpers import FixtureTestCase
+
+
+class TestCompactGeoJson(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.locations = MapLocation.group(self.load().episodes, None)
+
+    def compact(self, budget: int | None) -> CompactGeoJson:
+        return CompactGeoJson(self.locations, budget=budget)
+
+    def size(self, compact: CompactGeoJson) -> int:
+        return len(compact.dump().encode())
+
+    def assertSizesAddUp(self, compact: CompactGeoJson) -> None:
+        rows = compact.rows()
+        self.assertEqual(
+            sum([row[0] for row in rows.values()]) + compact.overhead(),
+            self.size(compact),
+        )
+        self.assertEqual(
+            sum([sum(row[1:]) for row in rows.values()]), len(self.locations)
+        )
+
+    def test_without_budget(self) -> None:
+        compact = self.compact(None)
+        self.assertEqual(set(compact.levels), {CompactGeoJson.FULL})
+        self.assertEqual(len(json.loads(compact.dump())), len(self.locations))
+        self.assertSizesAddUp(compact)
+
+    def test_largest_first(self) -> None:
+        full = self.compact(None)
+        sizes = [len(json.dumps(f, separators=(",", ":"))) for f in full.features()]
+        compact = self.compact(self.size(full) - 1)
+        levels = [CompactGeoJson.FULL] * len(self.locations)
+        levels[sizes.index(max(sizes))] = CompactGeoJson.SHORT
+        self.assertEqual(compact.levels, levels)
+        self.assertSizesAddUp(compact)
+
+    def test_budgets(self) -> None:
+        grouped = self.compact(0)
+        self.assertEqual(set(grouped.levels), {CompactGeoJson.GROUPED})
+        self.assertSizesAddUp(grouped)
+        full_size = self.size(self.compact(None))
+        grouped_size = self.size(grouped)
+        for budget in range(grouped_size, full_size + 1, 97):
+            with self.subTest(budget=budget):
+                compact = self.compact(budget)
+                self.assertLessEqual(self.size(compact), budget)
+                self.assertSizesAddUp(compact)
+                # reproducible
+                self.assertEqual(self.compact(budget).dump(), compact.dump())
+
+    def test_grouped_features(self) -> None:
+        grouped = self.compact(0)
+        features = json.loads(grouped.dump())
+        colors = {location.color for location in self.locations}
+        self.assertEqual(len(features), len(colors))
+        for feature in features:
+            self.assertEqual(feature["geometry"]["type"], "MultiPoint")
+            self.assertNotIn("title", feature["properties"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import unittest
+
+from arte_360_reportage import ImdbDataset
+from helpers import FILES, FixtureTestCase
+
+
+class TestImdbDataset(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dataset = ImdbDataset("tt0457219", os.path.join(FILES, "imdb"))
+
+    def test_series_id_from_url(self) -> None:
+        self.assertEqual(
+            ImdbDataset.series_id_from_url("https://www.imdb.com/title/tt0457219/"),
+            "tt0457219",
+        )
+
+    def test_episodes(self) -> None:
+        episodes = {e.id: e for e in self.dataset.episodes()}
+        # tt0000100 belongs to another series
+        self.assertEqual(len(episodes), 8)
+        self.assertNotIn("tt0000100", episodes)
+        tsunami = episodes["tt1000006"]
+        self.assertEqual((tsunami.season_no, tsunami.episode_no), (2, 2))
+        self.assertEqual(tsunami.titles, ["Tsunami", "Tsunami - Die tödliche Welle"])
+        special = episodes["tt1000007"]
+        self.assertEqual((special.season_no, special.episode_no), (None, None))
+        self.assertEqual(special.titles, ["Behind the Scenes"])
+
+    def test_reconcile(self) -> None:
+        show = self.load()
+        episode = show.get_episode_by_number(2, 1)
+        assert episode
+        episode.imdb_episode_id = "tt9999999"
+        show.reindex()
+
+        report = self.dataset.reconcile(show)
+        self.assertEqual(
+            [
+                (e["overall_no"], e["imdb_episode_id"], e["method"])
+                for e in report["filled"]
+            ],
+            [
+                (1, "tt1000001", "title"),
+                (2, "tt1000002", "number"),
+                (3, "tt1000003", "title"),
+                (6, "tt1000006", "title"),
+            ],
+        )
+        self.assertEqual(
+            [
+                (e["overall_no"], e["imdb_episode_id"], e.get("current"))
+                for e in report["mismatches"]
+            ],
+            [(5, "tt1000005", "tt9999999"), (2, "tt1000008", None)],
+        )
+        self.assertEqual(report["mismatches"][1]["claimed_by"], "tt1000002")
+        self.assertEqual(
+            [e["imdb_episode_id"] for e in report["unmatched"]],
+            ["tt1000004", "tt1000007"],
+        )
+        # Nothing is changed by reconciling.
+        self.assertEqual([e.imdb_episode_id for e in show.episodes].count(None), 7)
+
+    def test_import_ids(self) -> None:
+        show = self.load()
+        self.dataset.import_ids(show)
+        self.assertEqual(show.episodes[0].imdb_episode_id, "tt1000001")
+        self.assertIs(
+            show.get_episode_by("imdb_episode_id", "tt1000006"), show.episodes[5]
+        )
+        saved = self.load()
+        self.assertEqual(
+            [e.imdb_episode_id for e in saved.episodes],
+            [
+                "tt1000001",
+                "tt1000002",
+                "tt1000003",
+                None,
+                "tt1000005",
+                "tt1000006",
+                None,
+                None,
+            ],
+        )
+
+    def test_import_ids_dry_run(self) -> None:
+        with open("arte-360-reportage.yml", "rb") as f:
+            before = f.read()
+        show = self.load()
+        self.dataset.import_ids(show, dry_run=True)
+        self.assertEqual([e.imdb_episode_id for e in show.episodes], [None] * 8)
+        with open("arte-360-reportage.yml", "rb") as f:
+            self.assertEqual(f.read(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import unittest
+
+from arte_360_reportage import OUTPUTS, watched_files
+from helpers import FixtureTestCase
+
+
+class TestSplitLayout(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.load().convert_layout(True)
+
+    def test_source_filepaths(self) -> None:
+        self.assertEqual(
+            self.load().source_filepaths,
+            [
+                "arte-360-reportage/season-01.yml",
+                "arte-360-reportage/season-02.yml",
+                "arte-360-reportage/dvds.yml",
+                "arte-360-reportage.yml",
+            ],
+        )
+
+    def test_watched_files(self) -> None:
+        files = watched_files(self.load())
+        season = os.path.abspath("arte-360-reportage/season-02.yml")
+        self.assertEqual(files[season], OUTPUTS)
+        self.assertEqual(files[os.path.abspath(".leaflet.html")], ("leaflet",))
+
+    def test_export_removes_obsolete_seasons(self) -> None:
+        show = self.load()
+        show.seasons.pop()
+        show.export_to_yaml()
+        self.assertEqual(
+            sorted(os.listdir("arte-360-reportage")), ["dvds.yml", "season-01.yml"]
+        )
+        show = self.load()
+        self.assertEqual([season.no for season in show.seasons], [1])
+        self.assertNotIn("arte-360-reportage/season-02.yml", show.source_filepaths)
+
+
+if __name__ == "__main__":
+    unittest.main()
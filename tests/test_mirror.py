@@ -0,0 +1,63 @@
+import os
+import unittest
+from unittest import mock
+
+from arte_360_reportage import TvShow
+from helpers import FixtureTestCase
+
+
+class TestJsonMirror(FixtureTestCase):
+    def test_load_mirror(self) -> None:
+        TvShow().export_to_json()
+        show = TvShow()
+        self.assertEqual(show.loaded_from, "arte-360-reportage.json")
+        self.assertEqual(show.episodes[0].overall_no, 1)
+        self.assertEqual(len(show.episodes), 8)
+
+    def test_changed_yaml(self) -> None:
+        TvShow().export_to_json()
+        with open("arte-360-reportage.yml", "a") as f:
+            f.write("\n")
+        self.assertEqual(TvShow().loaded_from, "arte-360-reportage.yml")
+
+    def test_unsaved_changes_are_no_mirror(self) -> None:
+        show = TvShow()
+        show.episodes[0].data["summary"] = "unsaved"
+        show.export_to_json()
+        self.assertFalse(os.path.exists("arte-360-reportage.json.sha1"))
+        show = TvShow()
+        self.assertEqual(show.loaded_from, "arte-360-reportage.yml")
+        self.assertNotEqual(show.episodes[0].summary, "unsaved")
+
+    def test_saved_changes(self) -> None:
+        show = TvShow()
+        show.episodes[0].data["summary"] = "saved"
+        show.export_to_yaml()
+        show.export_to_json()
+        show = TvShow()
+        self.assertEqual(show.loaded_from, "arte-360-reportage.json")
+        self.assertEqual(show.episodes[0].summary, "saved")
+
+    def test_saved_sha1_is_computed_on_export(self) -> None:
+        show = TvShow()
+        self.assertIsNone(show.saved_sha1)
+        show.export_to_json()
+        self.assertIsNotNone(show.saved_sha1)
+        self.assertTrue(os.path.exists("arte-360-reportage.json.sha1"))
+
+    def test_unchanged_export_does_not_parse_again(self) -> None:
+        TvShow().export_to_json()
+        show = TvShow(use_mirror=False)
+        with mock.patch("arte_360_reportage.TvShow", side_effect=AssertionError):
+            show.export_to_json()
+        self.assertEqual(TvShow().loaded_from, "arte-360-reportage.json")
+
+    def test_malformed_checksum_lines(self) -> None:
+        TvShow().export_to_json()
+        with open("arte-360-reportage.json.sha1", "a") as f:
+            f.write("garbage\n\n")
+        self.assertEqual(TvShow().loaded_from, "arte-360-reportage.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import operator
+import unittest
+
+from arte_360_reportage import SpatialIndex
+from helpers import FixtureTestCase
+
+POSITIONS = [
+    (52.52, 13.405),  # Berlin
+    (48.857, 2.352),  # Paris
+    (-33.868, 151.209),  # Sydney
+    (64.2, 179.9),  # Anadyr, east of the antimeridian
+    (65.6, -168.1),  # Wales (Alaska), west of it
+    (-17.8, 178.0),  # Fiji
+    (-21.2, -175.2),  # Tonga
+    (89.9, 10.0),  # next to the North Pole
+    (89.8, 180.0),
+    (0.0, 0.0),
+    (13.5, 144.8),  # Guam
+    (30.0, 31.2),  # Cairo
+]
+
+QUERIES = [
+    (52.0, 13.0),
+    (65.0, -179.95),  # on the antimeridian
+    (-19.0, 179.99),
+    (90.0, 0.0),
+    (0.0, 90.0),
+]
+
+
+def linear_scan(latitude: float, longitude: float) -> list[tuple[int, float]]:
+    distances = [
+        (i, SpatialIndex.haversine(latitude, longitude, lat, lon))
+        for i, (lat, lon) in enumerate(POSITIONS)
+    ]
+    distances.sort(key=operator.itemgetter(1))
+    return distances
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SpatialIndex(POSITIONS)
+
+    def assertResult(
+        self, result: list[tuple[int, float]], expected: list[tuple[int, float]]
+    ) -> None:
+        self.assertEqual([i for i, _ in result], [i for i, _ in expected])
+        for (_, distance), (_, expected_distance) in zip(result, expected):
+            self.assertAlmostEqual(distance, expected_distance, delta=1e-6)
+
+    def test_within(self) -> None:
+        for latitude, longitude in QUERIES:
+            expected = linear_scan(latitude, longitude)
+            for radius in (0, 100, 800, 2500, 20_100):
+                with self.subTest(query=(latitude, longitude), radius=radius):
+                    self.assertResult(
+                        self.index.within(latitude, longitude, radius),
+                        [(i, d) for i, d in expected if d <= radius],
+                    )
+
+    def test_nearest(self) -> None:
+        for latitude, longitude in QUERIES:
+            expected = linear_scan(latitude, longitude)
+            for k in (0, 1, 3, len(POSITIONS), len(POSITIONS) + 5):
+                with self.subTest(query=(latitude, longitude), k=k):
+                    self.assertResult(
+                        self.index.nearest(latitude, longitude, k), expected[:k]
+                    )
+
+    def test_antimeridian(self) -> None:
+        # Anadyr and Wales are about 620 km apart across the antimeridian,
+        # not 12 000 km around the world.
+        found = self.index.within(65.0, -179.95, 700)
+        self.assertEqual([i for i, _ in found], [3, 4])
+        self.assertEqual([i for i, _ in self.index.nearest(-19.0, 179.99, 2)], [5, 6])
+
+
+class TestEpisodesNear(FixtureTestCase):
+    def test_episodes_near(self) -> None:
+        show = self.load()
+        distances: dict[int, float] = {}
+        for episode in show.episodes:
+            if episode.coordinates:
+                latitude, longitude = episode.coordinates
+                distances[episode.overall_no] = SpatialIndex.haversine(
+                    48.857, 2.352, latitude, longitude
+                )
+        expected = sorted(distances, key=lambda no: distances[no])
+        found = show.episodes_near(48.857, 2.352, k=3)
+        self.assertEqual([e.overall_no for e, _ in found], expected[:3])
+        within = show.episodes_near(48.857, 2.352, radius_km=20_100)
+        self.assertEqual([e.overall_no for e, _ in within], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
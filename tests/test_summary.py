@@ -0,0 +1,92 @@
+import unittest
+
+from arte_360_reportage import LocalSummariser, SummaryBatches, TvShow
+from helpers import FixtureTestCase
+
+
+class Interrupt(Exception):
+    pass
+
+
+class InterruptingSummariser(LocalSummariser):
+    """Answers the first ``batches`` prompts and fails on the next one."""
+
+    def __init__(self, batches: int) -> None:
+        super().__init__()
+        self.batches = batches
+
+    def summarise(self, prompt: str) -> str:
+        if self.batches == 0:
+            raise Interrupt()
+        self.batches -= 1
+        return super().summarise(prompt)
+
+
+class TestSummaryBatches(FixtureTestCase):
+    def without_summary(self, show: TvShow) -> list[str]:
+        return [e.stable_id for e in show.episodes if not e.summary]
+
+    def test_write_respects_budget(self) -> None:
+        show = self.load()
+        batches = SummaryBatches(show.episodes, budget=600)
+        batches.write()
+        self.assertEqual(len(batches.pending), 2)
+        ids = [id for name in batches.pending for id in batches.state[name]["ids"]]
+        self.assertEqual(ids, self.without_summary(show))
+        for name in batches.pending:
+            with open(f"{SummaryBatches.DIRECTORY}/{name}.txt") as f:
+                prompt = f.read()
+            self.assertLessEqual(
+                SummaryBatches.estimate_tokens(prompt)
+                + SummaryBatches.ANSWER_TOKENS * len(batches.state[name]["ids"]),
+                600,
+            )
+
+    def test_write_skips_pending(self) -> None:
+        show = self.load()
+        SummaryBatches(show.episodes, budget=600).write()
+        batches = SummaryBatches(show.episodes, budget=600)
+        batches.write()
+        self.assertEqual(len(batches.state), 2)
+
+    def test_run(self) -> None:
+        show = self.load()
+        SummaryBatches(show.episodes, budget=600).write()
+        show.run_summary_batches(LocalSummariser(words=5))
+        self.assertEqual(self.without_summary(show), [])
+        episode = show.get_episode_by_number(2, 1)
+        assert episode and episode.summary
+        self.assertEqual(len(episode.summary.split()), 5)
+        self.assertEqual(self.without_summary(self.load()), [])
+        self.assertEqual(SummaryBatches(show.episodes).pending, [])
+
+    def test_resume_after_interrupt(self) -> None:
+        show = self.load()
+        SummaryBatches(show.episodes, budget=600).write()
+        with self.assertRaises(Interrupt):
+            show.run_summary_batches(InterruptingSummariser(batches=1))
+
+        # The first batch was saved, the second one is still pending.
+        show = self.load()
+        self.assertEqual(len(self.without_summary(show)), 2)
+        batches = SummaryBatches(show.episodes)
+        self.assertEqual(batches.pending, ["batch-002"])
+
+        show.run_summary_batches(LocalSummariser())
+        self.assertEqual(self.without_summary(self.load()), [])
+
+    def test_unsaved_batch_is_pending_again(self) -> None:
+        show = self.load()
+        batches = SummaryBatches(show.episodes, budget=600)
+        batches.write()
+        with self.assertRaises(Interrupt):
+            batches.run(InterruptingSummariser(batches=1))
+        self.assertEqual(batches.pending, ["batch-002"])
+
+        # Nothing was saved, so both batches have to be sent again.
+        batches = SummaryBatches(self.load().episodes)
+        self.assertEqual(batches.pending, ["batch-001", "batch-002"])
+
+
+if __name__ == "__main__":
+    unittest.main()
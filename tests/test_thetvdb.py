@@ -0,0 +1,77 @@
+import os
+import unittest
+
+from arte_360_reportage import TheTvdbDump, TvShow
+from helpers import FILES, FixtureTestCase
+
+
+class TestTheTvdbDump(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dump = TheTvdbDump(
+            272599, [os.path.join(FILES, "thetvdb", "episodes.json")]
+        )
+
+    def load(self) -> TvShow:
+        show = super().load()
+        # Matched by title to the same dump entry as episode 7
+        episode = show.get_episode_by_number(2, 4)
+        assert episode
+        episode.data["alias"] = "Operation Wolkenbruch"
+        return show
+
+    def test_special_without_numbers(self) -> None:
+        special = self.dump.by_id[8000001]
+        self.assertIsNone(special.season_episode)
+        self.assertEqual(len(self.dump.by_season_episode), 7)
+
+    def test_reconcile_fills_an_id_only_once(self) -> None:
+        show = self.load()
+        report = self.dump.reconcile(show)
+        self.assertEqual(
+            report["filled"],
+            [
+                {
+                    "overall_no": 7,
+                    "title": "Operation Wolkenbruch",
+                    "thetvdb_episode_id": 4641915,
+                    "thetvdb_season_episode": "S02E03",
+                }
+            ],
+        )
+        self.assertEqual(
+            report["mismatches"],
+            [
+                {
+                    "overall_no": 8,
+                    "title": "Im Schatten des Vulkans",
+                    "thetvdb_episode_id": 4641915,
+                    "used_by": "Operation Wolkenbruch",
+                }
+            ],
+        )
+        missing = [e["thetvdb_episode_id"] for e in report["missing"]]
+        self.assertEqual(missing, [8000001])
+        self.assertIsNone(show.episodes[6].thetvdb_episode_id)
+
+    def test_import_ids(self) -> None:
+        show = self.load()
+        self.dump.import_ids(show)
+        self.assertEqual(show.episodes[6].thetvdb_episode_id, 4641915)
+        self.assertIsNone(show.episodes[7].thetvdb_episode_id)
+        self.assertIs(
+            show.get_episode_by("thetvdb_episode_id", 4641915), show.episodes[6]
+        )
+        saved = TvShow("arte-360-reportage.yml", use_mirror=False)
+        self.assertEqual(saved.episodes[6].thetvdb_season_episode, "S02E03")
+
+    def test_import_ids_dry_run(self) -> None:
+        show = self.load()
+        self.dump.import_ids(show, dry_run=True)
+        self.assertIsNone(show.episodes[6].thetvdb_episode_id)
+        saved = TvShow("arte-360-reportage.yml", use_mirror=False)
+        self.assertIsNone(saved.episodes[6].thetvdb_episode_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from arte_360_reportage import Utils
+from helpers import FixtureTestCase
+
+
+class TestTitleKey(unittest.TestCase):
+    def test_title_key(self) -> None:
+        for title, key in (
+            ("Die Schöne und das Biest", "die schoene und das biest"),
+            ("die schoene und das biest!", "die schoene und das biest"),
+            ("DIE SCHÖNE UND DAS BIEST", "die schoene und das biest"),
+            ("Die Straße der Fischer", "die strasse der fischer"),
+            ("Grüße aus Äthiopien", "gruesse aus aethiopien"),
+            ("L’Œuvre de Noël à Paris", "l oeuvre de noel a paris"),
+            ("Côte d'Ivoire – la forêt", "cote d ivoire la foret"),
+            ("Les Élèves de Saint-Étienne", "les eleves de saint etienne"),
+            ("GEO Reportage: Tsunami", "tsunami"),
+            ("GEO Reportage - Tsunami", "tsunami"),
+            ("12 - Tsunami (Teil 1)", "tsunami"),
+        ):
+            with self.subTest(title=title):
+                self.assertEqual(Utils.title_key(title), key)
+
+
+class TestGetEpisodeByTitle(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.show = self.load()
+
+    def assertFound(self, title: str | None, overall_no: int | None) -> None:
+        episode = self.show.get_episode_by_title(title)
+        self.assertEqual(episode.overall_no if episode else None, overall_no)
+
+    def test_exact(self) -> None:
+        with mock.patch.object(
+            Utils, "title_key", side_effect=AssertionError
+        ), mock.patch("difflib.get_close_matches", side_effect=AssertionError):
+            self.assertFound("Tsunami - Die tödliche Welle", 6)
+
+    def test_title_key(self) -> None:
+        with mock.patch("difflib.get_close_matches", side_effect=AssertionError):
+            for title, overall_no in (
+                ("GEO Reportage: Tsunami – die toedliche Welle!", 6),
+                ("Brasilia: Metropole vom Reissbrett", 3),
+                ("OPERATION WOLKENBRUCH", 7),
+            ):
+                with self.subTest(title=title):
+                    self.assertFound(title, overall_no)
+
+    def test_fuzzy(self) -> None:
+        self.assertFound("Tsunami - Die todliche Wele", 6)
+
+    def test_not_found(self) -> None:
+        self.assertFound(None, None)
+        self.assertFound("", None)
+        self.assertFound("Xylophon", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
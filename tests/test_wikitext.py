@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+from arte_360_reportage import DeWiki, WikitextCost, WikitextCostEstimator
+from helpers import FixtureTestCase
+
+UNLIMITED = {
+    "post_expand_include_size": 10**9,
+    "template_argument_size": 10**9,
+    "node_count": 10**9,
+}
+
+
+class TestWikitextCostEstimator(unittest.TestCase):
+    def test_template(self) -> None:
+        cost = WikitextCostEstimator().estimate("{{Internetquelle|url=x|titel=ab}}")
+        # 400 bytes of markup plus the arguments; 2 nodes for the template,
+        # 3 per argument and 1 for the text of each argument
+        self.assertEqual(cost, WikitextCost(413, 13, 10))
+
+    def test_nested_template(self) -> None:
+        cost = WikitextCostEstimator().estimate("a{{Foo|{{Bar|x}}}}")
+        # Bar: 500 + 1, Foo: 500 + the output of Bar
+        self.assertEqual(cost.post_expand_include_size, 501 + 1001)
+        self.assertEqual(cost.template_argument_size, 1 + 501)
+        self.assertEqual(cost.node_count, 1 + 5 + 6)
+
+
+class TestWikitextFallback(FixtureTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.show = self.load()
+        self.full = self.show.render_wikitext("de")
+        self.plain = [
+            DeWiki.season_plain(
+                season, [DeWiki.episode_plain(e) for e in season.episodes]
+            )
+            for season in self.show.seasons
+        ]
+        estimator = WikitextCostEstimator()
+        self.full_sizes = [
+            estimator.estimate(s).post_expand_include_size for s in self.full
+        ]
+        self.plain_sizes = [
+            estimator.estimate(s).post_expand_include_size for s in self.plain
+        ]
+
+    def render(self, limit: int, budget: float | None = 1.0) -> list[str]:
+        limits = dict(UNLIMITED, post_expand_include_size=limit)
+        with mock.patch.dict(WikitextCost.LIMITS, limits):
+            return self.show.render_wikitext("de", budget)
+
+    def test_most_expensive_season_only(self) -> None:
+        expensive = self.full_sizes.index(max(self.full_sizes))
+        cheap = 1 - expensive
+        limit = self.plain_sizes[expensive] + self.full_sizes[cheap]
+        result = self.render(limit)
+        self.assertEqual(result[expensive], self.plain[expensive])
+        self.assertEqual(result[cheap], self.full[cheap])
+        # One byte less and the other season has to be plain as well.
+        self.assertEqual(self.render(limit - 1), self.plain)
+
+    def test_within_budget(self) -> None:
+        self.assertEqual(self.render(sum(self.full_sizes)), self.full)
+
+    def test_without_budget(self) -> None:
+        self.assertEqual(self.render(1, None), self.full)
+
+
+if __name__ == "__main__":
+    unittest.main()